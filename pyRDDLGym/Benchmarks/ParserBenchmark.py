@@ -0,0 +1,79 @@
+'''Measures the time to parse every domain/instance pair in Examples/.
+
+For each pair three times are reported:
+    - regen: a new lexer and parser whose tables are both regenerated in
+      memory, which is what every RDDLParser.build() did before the tables
+      were shipped
+    - cold: a new parser built from the shipped tables
+    - warm: the process-wide parser returned by RDDLParser.shared()
+'''
+import glob
+import os
+import sys
+import tempfile
+import time
+
+from ply import yacc
+
+from pyRDDLGym.Core.Parser.parser import RDDLlex
+from pyRDDLGym.Core.Parser.parser import RDDLParser
+from pyRDDLGym.Core.Parser.RDDLReader import RDDLReader
+
+EXAMPLES_DIR = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'Examples')
+
+
+def example_files():
+    for domain in sorted(glob.glob(
+            os.path.join(EXAMPLES_DIR, '**', 'domain.rddl'), recursive=True)):
+        path = os.path.dirname(domain)
+        for instance in sorted(glob.glob(os.path.join(path, 'instance*.rddl'))):
+            yield domain, instance
+
+
+def time_parse(text, parser_fn, repeats):
+    best = float('inf')
+    for _ in range(repeats):
+        start = time.perf_counter()
+        parser_fn().parse(text)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def regen_parser():
+    
+    # an unoptimized lexer neither reads nor writes the shipped lextab, and
+    # the parser looks for its tables in an empty directory
+    lexer = RDDLlex()
+    lexer.build(optimize=False, lextab=None, errorlog=yacc.NullLogger())
+    parser = RDDLParser(lexer=lexer, verbose=False)
+    with tempfile.TemporaryDirectory() as outputdir:
+        parser.build(tabmodule='_no_parsetab', outputdir=outputdir,
+                     write_tables=False, errorlog=yacc.NullLogger())
+    return parser
+
+
+def cold_parser():
+    parser = RDDLParser(lexer=None, verbose=False)
+    parser.build()
+    return parser
+
+
+def main(repeats=3):
+    RDDLParser.shared()
+    totals = [0.0, 0.0, 0.0]
+    print(f'{"file":<40} {"regen":>10} {"cold":>10} {"warm":>10}')
+    for domain, instance in example_files():
+        text = RDDLReader(domain, instance).rddltxt
+        times = [time_parse(text, regen_parser, repeats),
+                 time_parse(text, cold_parser, repeats),
+                 time_parse(text, RDDLParser.shared, repeats)]
+        totals = [total + t for (total, t) in zip(totals, times)]
+        name = os.path.relpath(instance, EXAMPLES_DIR)
+        print(f'{name:<40} ' + ' '.join(f'{1000 * t:8.2f}ms' for t in times))
+    print(f'{"total":<40} ' + ' '.join(f'{1000 * t:8.2f}ms' for t in totals))
+    
+
+if __name__ == "__main__":
+    repeats = int(sys.argv[1]) if len(sys.argv) > 1 else 3
+    main(repeats)
@@ -0,0 +1,295 @@
+'''Measures the cost of every stage of the pipeline, from parsing to
+simulation and planning, for every domain/instance pair in EXP_DICT.
+
+For each pair the following are reported (times in seconds):
+    - parse: reading and parsing the domain and instance
+    - model: building the lifted model
+    - levels: computing the call graph and levels with RDDLLevelAnalysis
+    - tensors: compiling the object/tensor layout with RDDLTensors
+    - numpy: steps per second of RDDLSimulator, interpreted and compiled
+    - jax: compile time, first step (trace and compile) and steps per second
+      of JaxRDDLSimulator
+    - planner: compile time, first iteration (trace and compile) and
+      iterations per second of JaxRDDLBackpropPlanner
+    - memory: peak memory allocated by python while building the model and
+      while building each numpy simulator and running it (each traced in a
+      separate, untimed run), and peak resident set size of the process
+
+Each pair runs in a new process, so that peak memory and jax caches are not
+shared between pairs. All random streams are seeded, and a stage that fails
+records its error instead of aborting the run. The results are written as
+JSON, and two result files are compared with compare(), e.g.
+
+    python -m pyRDDLGym.Benchmarks.SimulatorBenchmark run out.json
+    python -m pyRDDLGym.Benchmarks.SimulatorBenchmark compare old.json out.json
+'''
+import json
+import multiprocessing
+import os
+import platform
+import re
+import subprocess
+import sys
+import time
+import tracemalloc
+
+import numpy as np
+
+import pyRDDLGym
+from pyRDDLGym.Examples.ExampleManager import EXP_DICT, ExampleManager
+
+
+def example_instances(names=None):
+    for name in (names or EXP_DICT):
+        env_info = ExampleManager.GetEnvInfo(name)
+        instances = sorted(env_info.list_instances(),
+                           key=lambda file: int(re.search(r'\d+', file).group()))
+        for instance in instances:
+            yield name, env_info.get_domain(), env_info.path_to_env + instance
+
+
+def _timed(fn):
+    start = time.perf_counter()
+    result = fn()
+    return result, time.perf_counter() - start
+
+
+def _peak_traced_mb(fn):
+    tracemalloc.start()
+    try:
+        fn()
+        return tracemalloc.get_traced_memory()[1] / 1024 ** 2
+    finally:
+        tracemalloc.stop()
+
+
+def _peak_rss_mb():
+    try:
+        import resource
+    except ImportError:
+        return None
+    rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return rss / 1024 ** 2 if sys.platform == 'darwin' else rss / 1024
+
+
+# ===========================================================================
+# stages
+# ===========================================================================
+
+def build_model(domain, instance):
+    from pyRDDLGym.Core.Compiler.RDDLLevelAnalysis import RDDLLevelAnalysis
+    from pyRDDLGym.Core.Compiler.RDDLLiftedModel import RDDLLiftedModel
+    from pyRDDLGym.Core.Parser.parser import RDDLParser
+    from pyRDDLGym.Core.Parser.RDDLReader import RDDLReader
+    from pyRDDLGym.Core.Simulator.RDDLTensors import RDDLTensors
+
+    def _parse():
+        return RDDLParser.shared().parse(RDDLReader(domain, instance).rddltxt)
+
+    def _build():
+        model = RDDLLiftedModel(_parse())
+        RDDLLevelAnalysis(model).compute_levels()
+        RDDLTensors(model)
+
+    result = {}
+    RDDLParser.shared()
+    ast, result['parse'] = _timed(_parse)
+    model, result['model'] = _timed(lambda: RDDLLiftedModel(ast))
+    static = RDDLLevelAnalysis(model)
+    _, result['levels'] = _timed(static.compute_levels)
+    _, result['tensors'] = _timed(lambda: RDDLTensors(model))
+    result['build_peak_traced_mb'] = _peak_traced_mb(_build)
+    return model, result
+
+
+def _run_steps(sim, steps):
+    sim.reset()
+    start = time.perf_counter()
+    for _ in range(steps):
+        _, _, done = sim.step({})
+        if done:
+            sim.reset()
+    return steps / (time.perf_counter() - start)
+
+
+def bench_numpy(model, steps, seed, compiled):
+    from pyRDDLGym.Core.Simulator.RDDLRandom import RDDLRandom
+    from pyRDDLGym.Core.Simulator.RDDLSimulator import RDDLSimulator
+
+    def _build():
+        return RDDLSimulator(
+            model, rng=RDDLRandom(seed).generator(), compiled=compiled)
+
+    sim, build = _timed(_build)
+    result = {'build': build, 'steps_per_sec': _run_steps(sim, steps)}
+    result['peak_traced_mb'] = _peak_traced_mb(
+        lambda: _run_steps(_build(), steps))
+    return result
+
+
+def bench_jax(model, steps, seed):
+    import jax
+    from pyRDDLGym.Core.Jax.JaxRDDLSimulator import JaxRDDLSimulator
+
+    sim, build = _timed(lambda: JaxRDDLSimulator(
+        model, jax.random.PRNGKey(seed)))
+    sim.reset()
+    _, first_step = _timed(lambda: sim.step({}))
+    return {'build': build, 'first_step': first_step,
+            'steps_per_sec': _run_steps(sim, steps)}
+
+
+def bench_planner(model, iterations, seed, batch_size=32):
+    import jax
+    from pyRDDLGym.Core.Jax.JaxRDDLBackpropPlanner import JaxRDDLBackpropPlanner
+
+    planner, build = _timed(lambda: JaxRDDLBackpropPlanner(
+        model, jax.random.PRNGKey(seed), batch_size))
+    callbacks = planner.optimize(iterations + 1)
+    _, first_iteration = _timed(lambda: next(callbacks))
+    start = time.perf_counter()
+    for _ in callbacks:
+        pass
+    return {'build': build, 'first_iteration': first_iteration,
+            'iterations_per_sec': iterations / (time.perf_counter() - start)}
+
+
+def _attempt(result, key, fn, *args):
+    try:
+        result[key] = fn(*args)
+    except Exception as e:
+        result[key] = {'error': f'{type(e).__name__}: {e}'}
+
+
+def bench_instance(args):
+    name, domain, instance, steps, iterations, seed = args
+    np.random.seed(seed)
+    result = {'domain': name, 'instance': os.path.basename(instance)}
+    try:
+        model, result['build'] = build_model(domain, instance)
+    except Exception as e:
+        result['build'] = {'error': f'{type(e).__name__}: {e}'}
+        return result
+    _attempt(result, 'numpy', bench_numpy, model, steps, seed, False)
+    _attempt(result, 'numpy_compiled', bench_numpy, model, steps, seed, True)
+    _attempt(result, 'jax', bench_jax, model, steps, seed)
+    _attempt(result, 'planner', bench_planner, model, iterations, seed)
+    result['peak_rss_mb'] = _peak_rss_mb()
+    return result
+
+
+# ===========================================================================
+# running and comparing
+# ===========================================================================
+
+def metadata(seed, steps, iterations):
+    try:
+        commit = subprocess.run(
+            ['git', 'rev-parse', 'HEAD'], capture_output=True, text=True,
+            cwd=os.path.dirname(os.path.abspath(__file__))).stdout.strip()
+    except OSError:
+        commit = ''
+    try:
+        import jax
+        jax_version = jax.__version__
+    except ImportError:
+        jax_version = None
+    return {'pyRDDLGym': pyRDDLGym.__version__,
+            'commit': commit or None,
+            'python': platform.python_version(),
+            'numpy': np.__version__,
+            'jax': jax_version,
+            'platform': platform.platform(),
+            'processor': platform.processor(),
+            'seed': seed,
+            'steps': steps,
+            'iterations': iterations}
+
+
+def run(path=None, names=None, steps=200, iterations=20, seed=42):
+    '''Runs the benchmark and returns its results, which are also written to
+    the given JSON file if it is not None.
+
+    :param path: the JSON file to write
+    :param names: the domains of EXP_DICT to run, or None to run all
+    :param steps: the number of steps of each simulator
+    :param iterations: the number of iterations of the planner
+    :param seed: the seed of all random streams
+    '''
+    tasks = [(name, domain, instance, steps, iterations, seed)
+             for (name, domain, instance) in example_instances(names)]
+    results = []
+    context = multiprocessing.get_context('spawn')
+    for task in tasks:
+        with context.Pool(1) as pool:
+            result = pool.apply(bench_instance, (task,))
+        results.append(result)
+        print(summarize(result))
+    output = {'metadata': metadata(seed, steps, iterations), 'results': results}
+    if path is not None:
+        with open(path, 'w') as file:
+            json.dump(output, file, indent=2)
+    return output
+
+
+def summarize(result):
+    def fmt(section, key):
+        value = result.get(section, {}).get(key, None)
+        return f'{value:10.1f}' if value is not None else f'{"-":>10}'
+
+    name = f'{result["domain"]}/{result["instance"]}'
+    return f'{name:<45} ' + ' '.join([
+        fmt('numpy', 'steps_per_sec'),
+        fmt('numpy_compiled', 'steps_per_sec'),
+        fmt('jax', 'steps_per_sec'),
+        fmt('planner', 'iterations_per_sec')])
+
+
+def _flatten(result, prefix=''):
+    for key, value in result.items():
+        if isinstance(value, dict):
+            yield from _flatten(value, f'{prefix}{key}.')
+        elif isinstance(value, (int, float)) and not isinstance(value, bool):
+            yield f'{prefix}{key}', value
+
+
+def compare(old, new, tolerance=0.1):
+    '''Compares two benchmark results (as dicts or paths of JSON files) and
+    returns a list of (instance, measure, old, new) for all measures that
+    became worse by more than the given relative tolerance. Rates (per_sec)
+    are worse when lower, all other measures are worse when higher.
+    '''
+    if isinstance(old, str):
+        with open(old) as file:
+            old = json.load(file)
+    if isinstance(new, str):
+        with open(new) as file:
+            new = json.load(file)
+
+    def index(output):
+        return {(result['domain'], result['instance']): dict(_flatten(result))
+                for result in output['results']}
+
+    old, new = index(old), index(new)
+    regressions = []
+    for key, measures in new.items():
+        for measure, value in measures.items():
+            base = old.get(key, {}).get(measure, None)
+            if base is None or base <= 0:
+                continue
+            change = (value - base) / base
+            if measure.endswith('per_sec'):
+                change = -change
+            if change > tolerance:
+                regressions.append(('/'.join(key), measure, base, value))
+    return regressions
+
+
+if __name__ == "__main__":
+    if len(sys.argv) >= 4 and sys.argv[1] == 'compare':
+        for (instance, measure, base, value) in compare(sys.argv[2], sys.argv[3]):
+            print(f'{instance:<45} {measure:<30} {base:12.4f} -> {value:12.4f}')
+    else:
+        path = sys.argv[2] if len(sys.argv) > 2 else 'benchmark.json'
+        names = sys.argv[3:] or None
+        run(path, names)
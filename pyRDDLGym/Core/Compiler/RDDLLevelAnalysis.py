@@ -1,4 +1,4 @@
-from typing import Dict, Set
+from typing import Dict, List, Set
 import warnings
 
 from pyRDDLGym.Core.ErrorHandling.RDDLException import RDDLInvalidDependencyInCPFError
@@ -135,7 +135,10 @@ class RDDLLevelAnalysis:
     # topological sort
     # ===========================================================================
     
-    def compute_levels(self) -> Dict[int, Set[str]]:
+    def compute_levels(self) -> Dict[int, List[str]]:
+        '''Returns a dict mapping every level to the sorted list of the CPFs
+        at that level, in increasing order of levels. The order is the same in
+        every process, so that the random draws of the CPFs are too.'''
         graph = self.build_call_graph()
         order = RDDLLevelAnalysis._topological_sort(graph)
         
@@ -148,7 +151,7 @@ class RDDLLevelAnalysis:
                         level = max(level, levels[child] + 1)
                 result.setdefault(level, set()).add(var)
                 levels[var] = level
-        return result
+        return {level: sorted(result[level]) for level in sorted(result)}
     
     @staticmethod
     def _topological_sort(graph):
@@ -0,0 +1,155 @@
+import hashlib
+import os
+import pickle
+import sys
+import tempfile
+import warnings
+from typing import Dict, List, Tuple
+
+import pyRDDLGym
+from pyRDDLGym.Core import Parser
+from pyRDDLGym.Core.Compiler import RDDLLevelAnalysis as level_module
+from pyRDDLGym.Core.Compiler import RDDLLiftedModel as lifted_module
+from pyRDDLGym.Core.Compiler import RDDLModel as model_module
+from pyRDDLGym.Core.Compiler.RDDLLevelAnalysis import RDDLLevelAnalysis
+from pyRDDLGym.Core.Compiler.RDDLLiftedModel import RDDLLiftedModel
+from pyRDDLGym.Core.Parser.parser import RDDLParser
+from pyRDDLGym.Core.Parser.RDDLReader import RDDLReader
+from pyRDDLGym.Core.Simulator import RDDLTensors as tensors_module
+from pyRDDLGym.Core.Simulator.RDDLTensors import RDDLTensors
+
+CachedModel = Tuple[RDDLLiftedModel, Dict[int, List[str]], RDDLTensors]
+
+
+class RDDLModelCache:
+    '''Persistent on-disk cache of parsed and analyzed RDDL models. Each entry
+    holds the lifted model (including its AST), the level ordering of the CPFs
+    and the tensor representation with the initial values, and is keyed by a
+    hash of the domain and instance text, the pyRDDLGym version, the cache
+    format and the source code of the modules whose objects are pickled, so
+    that editing either file or changing the parser or compiler invalidates
+    it.
+    '''
+
+    ENV_VAR = 'PYRDDLGYM_CACHE_DIR'
+    DEFAULT_DIR = os.path.join('~', '.cache', 'pyRDDLGym')
+    
+    # bump when the layout of an entry changes
+    FORMAT = 2
+    
+    # modules that define the classes of the pickled objects
+    SOURCE_MODULES = (level_module, lifted_module, model_module, tensors_module)
+    
+    _source_digest = None
+
+    def __init__(self, cache_dir: str=None) -> None:
+        '''Creates a new cache that stores its entries in the given directory.
+
+        :param cache_dir: the cache directory, or None to use the directory in
+        the PYRDDLGYM_CACHE_DIR environment variable or ~/.cache/pyRDDLGym
+        '''
+        if cache_dir is None:
+            cache_dir = os.environ.get(
+                RDDLModelCache.ENV_VAR, RDDLModelCache.DEFAULT_DIR)
+        self.cache_dir = os.path.expanduser(cache_dir)
+
+    @staticmethod
+    def key(domain_text: str, instance_text: str,
+            allow_synchronous_state: bool=True) -> str:
+        '''Returns the cache key of the given domain and instance text.'''
+        digest = hashlib.sha256()
+        header = (f'pyRDDLGym={pyRDDLGym.__version__};'
+                  f'format={RDDLModelCache.FORMAT};'
+                  f'source={RDDLModelCache.source_digest()};'
+                  f'python={sys.version_info[0]}.{sys.version_info[1]};'
+                  f'sync={allow_synchronous_state};')
+        for text in (header, domain_text, instance_text):
+            digest.update(text.encode('utf-8'))
+            digest.update(b'\0')
+        return digest.hexdigest()
+
+    @staticmethod
+    def source_digest() -> str:
+        '''Returns a hash of the source code of the parser and of the modules
+        whose objects are stored in the cache.'''
+        if RDDLModelCache._source_digest is None:
+            parser_dir = os.path.dirname(Parser.__file__)
+            paths = [os.path.join(parser_dir, name)
+                     for name in sorted(os.listdir(parser_dir))
+                     if name.endswith('.py')]
+            paths.extend(module.__file__
+                         for module in RDDLModelCache.SOURCE_MODULES)
+            digest = hashlib.sha256()
+            for path in paths:
+                with open(path, 'rb') as file:
+                    digest.update(file.read())
+                digest.update(b'\0')
+            RDDLModelCache._source_digest = digest.hexdigest()
+        return RDDLModelCache._source_digest
+
+    def path(self, key: str) -> str:
+        return os.path.join(self.cache_dir, key + '.pkl')
+
+    def load(self, domain: str, instance: str=None,
+             allow_synchronous_state: bool=True) -> CachedModel:
+        '''Returns the model, level ordering and tensors of the given domain
+        and instance files, reading them from the cache if possible, and
+        otherwise building them and writing them to the cache.
+
+        :param domain: the path of the domain file
+        :param instance: the path of the instance file, or None if the
+        instance is in the domain file
+        :param allow_synchronous_state: whether state-fluent can be synchronous
+        '''
+        with open(domain) as file:
+            domain_text = file.read()
+        instance_text = ''
+        if instance is not None:
+            with open(instance) as file:
+                instance_text = file.read()
+        path = self.path(RDDLModelCache.key(
+            domain_text, instance_text, allow_synchronous_state))
+
+        # warm start: skip parsing and analysis entirely
+        if os.path.isfile(path):
+            try:
+                with open(path, 'rb') as file:
+                    return pickle.load(file)
+            except (OSError, EOFError, pickle.UnpicklingError,
+                    AttributeError, ImportError) as error:
+                warnings.warn(
+                    f'Could not load cached model <{path}>, rebuilding it: '
+                    f'{type(error).__name__}: {error}', stacklevel=2)
+
+        # cold start: parse and analyze, then write the entry
+        reader = RDDLReader(domain, instance)
+        model = RDDLLiftedModel(RDDLParser.shared().parse(reader.rddltxt))
+        levels = RDDLLevelAnalysis(model, allow_synchronous_state).compute_levels()
+        tensors = RDDLTensors(model)
+        entry = (model, levels, tensors)
+        self._write(path, entry)
+        return entry
+
+    def _write(self, path, entry):
+
+        # write to a temporary file and rename it, so that concurrent workers
+        # never observe a partially written entry
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            fd, temp_path = tempfile.mkstemp(dir=self.cache_dir, suffix='.tmp')
+            try:
+                with os.fdopen(fd, 'wb') as file:
+                    pickle.dump(entry, file, protocol=pickle.HIGHEST_PROTOCOL)
+                os.replace(temp_path, path)
+            except Exception:
+                os.remove(temp_path)
+                raise
+        except (OSError, pickle.PicklingError):
+            pass
+
+    def clear(self) -> None:
+        '''Removes all entries from the cache.'''
+        if os.path.isdir(self.cache_dir):
+            for name in os.listdir(self.cache_dir):
+                if name.endswith('.pkl'):
+                    os.remove(os.path.join(self.cache_dir, name))
@@ -0,0 +1,370 @@
+import copy
+import numpy as np
+
+from pyRDDLGym.Core.ErrorHandling.RDDLException import RDDLNotImplementedError
+from pyRDDLGym.Core.ErrorHandling.RDDLException import RDDLUndefinedVariableError
+
+from pyRDDLGym.Core.Compiler.RDDLLevelAnalysis import VALID_DEPENDENCIES
+from pyRDDLGym.Core.Compiler.RDDLLiftedModel import RDDLLiftedModel
+from pyRDDLGym.Core.Parser.expr import Expression, ExpressionTable
+from pyRDDLGym.Core.Simulator.RDDLSimulator import RDDLSimulator
+
+
+class RDDLOptimizer:
+    '''Rewrites the expressions of a lifted RDDL model before simulation:
+
+    1. constant folding: every maximal subtree that depends only on constants
+    and non-fluents is evaluated once, and replaced by a constant or by a new
+    non-fluent holding the precomputed tensor
+    2. common subexpression elimination: deterministic subtrees that occur more
+    than once in the CPFs and reward are hoisted into new interm-fluents, which
+    are evaluated once per step and read wherever the subtree occurred.
+
+    The new variables are named FOLDED_PREFIX<i> and CSE_PREFIX<i>; these
+    cannot clash with RDDL identifiers. The input model is not modified.
+    '''
+
+    FOLDED_PREFIX = '$fold'
+    CSE_PREFIX = '$cse'
+
+    # subtrees smaller than this are not worth a CPF evaluation of their own
+    MIN_HOIST_SIZE = 3
+
+    def __init__(self, rddl: RDDLLiftedModel,
+                 fold: bool=True, cse: bool=True) -> None:
+        '''Creates a new optimizer for the given lifted RDDL model.
+
+        :param rddl: the lifted RDDL model
+        :param fold: whether to fold constant and non-fluent subtrees
+        :param cse: whether to hoist repeated subtrees into interm-fluents
+        '''
+        if rddl.is_grounded:
+            raise RDDLNotImplementedError(
+                'Expression optimization only works on lifted domains for now.')
+        self.rddl = rddl
+        self.fold = fold
+        self.cse = cse
+        self.stats = {}
+
+        self._table = ExpressionTable()
+        self._sizes = {}
+        self._free = {}
+        self._non_fluent = {}
+        self._hoistable = {}
+
+    def optimize(self) -> RDDLLiftedModel:
+        '''Returns a copy of the model with its expressions rewritten. The
+        savings are written to the stats dict.'''
+        rddl = self.rddl
+        model = copy.copy(rddl)
+        model.param_types = rddl.param_types.copy()
+        model.variable_types = rddl.variable_types.copy()
+        model.variable_ranges = rddl.variable_ranges.copy()
+        model.nonfluents = rddl.nonfluents.copy()
+        model.interm = rddl.interm.copy()
+        self._model = model
+        self._sim = RDDLSimulator(rddl)
+
+        # all expressions share nodes through a single table
+        cpfs = {name: (objects, self._intern(expr))
+                for (name, (objects, expr)) in rddl.cpfs.items()}
+        reward = self._intern(rddl.reward)
+        constraints = [[self._intern(expr) for expr in exprs]
+                       for exprs in (rddl.terminals,
+                                     rddl.preconditions,
+                                     rddl.invariants)]
+        nodes_before = self._count_nodes(cpfs, reward)
+
+        folded = hoisted = 0
+        if self.fold:
+            self._folded = {}
+            cpfs = {name: (objects, self._fold(expr, objects))
+                    for (name, (objects, expr)) in cpfs.items()}
+            reward = self._fold(reward, [])
+            constraints = [[self._fold(expr, []) for expr in exprs]
+                           for exprs in constraints]
+            folded = len(self._folded)
+        if self.cse:
+            cpfs, reward, hoisted = self._eliminate(cpfs, reward)
+
+        model.cpfs = cpfs
+        model.reward = reward
+        model.terminals, model.preconditions, model.invariants = constraints
+        self.stats = {
+            'folded': folded,
+            'hoisted': hoisted,
+            'nodes_before': nodes_before,
+            'nodes_after': self._count_nodes(cpfs, reward)
+        }
+        del self._model, self._sim
+        return model
+
+    def summary(self) -> str:
+        '''Returns a readable report of the savings of the last optimization.'''
+        stats = self.stats
+        return (f'folded {stats["folded"]} non-fluent subtree(s), '
+                f'hoisted {stats["hoisted"]} repeated subtree(s), '
+                f'nodes evaluated per step: '
+                f'{stats["nodes_before"]} -> {stats["nodes_after"]}')
+
+    # ===========================================================================
+    # expression traversal
+    # ===========================================================================
+
+    @staticmethod
+    def _map_atoms(atom, fn):
+        if isinstance(atom, Expression):
+            return fn(atom)
+        elif isinstance(atom, tuple):
+            return tuple(RDDLOptimizer._map_atoms(arg, fn) for arg in atom)
+        elif isinstance(atom, list):
+            return [RDDLOptimizer._map_atoms(arg, fn) for arg in atom]
+        else:
+            return atom
+
+    @staticmethod
+    def _children(expr):
+        if expr.op_code == Expression.CONSTANT or expr.op_code == Expression.PVAR:
+            return []
+        children = []
+        RDDLOptimizer._map_atoms(expr.args, children.append)
+        return children
+
+    def _rebuild(self, expr, fn):
+        if not RDDLOptimizer._children(expr):
+            return self._table((expr[0], expr[1]))
+        return self._table((expr[0], RDDLOptimizer._map_atoms(expr[1], fn)))
+
+    def _intern(self, expr):
+        return self._rebuild(expr, self._intern)
+
+    @staticmethod
+    def _scope(expr, objects):
+        if expr.op_code == Expression.AGGREGATION:
+            * pvars, _ = expr.args
+            return objects + [p[1] for p in pvars]
+        return objects
+
+    def _size(self, expr):
+        size = self._sizes.get(id(expr), None)
+        if size is None:
+            size = 1 + sum(map(self._size, RDDLOptimizer._children(expr)))
+            self._sizes[id(expr)] = size
+        return size
+
+    def _count_nodes(self, cpfs, reward):
+        return sum(self._size(expr) for (_, expr) in cpfs.values()) + \
+            self._size(reward)
+
+    def _free_variables(self, expr):
+        free = self._free.get(id(expr), None)
+        if free is None:
+            if expr.op_code == Expression.PVAR:
+                _, params = expr.args
+                free = frozenset(p for p in (params or [])
+                                 if isinstance(p, str) and p.startswith('?'))
+            else:
+                free = frozenset().union(
+                    *map(self._free_variables, RDDLOptimizer._children(expr)))
+                if expr.op_code == Expression.AGGREGATION:
+                    * pvars, _ = expr.args
+                    free = free.difference(p[1][0] for p in pvars)
+            self._free[id(expr)] = free
+        return free
+
+    def _free_objects(self, expr, objects):
+        types = dict(objects)
+        return [(var, types[var]) for var in sorted(self._free_variables(expr))]
+
+    def _pvar_type(self, expr):
+        var = self.rddl.parse(expr.args[0])[0]
+        return self.rddl.variable_types.get(var, None)
+
+    def _is_non_fluent(self, expr):
+        result = self._non_fluent.get(id(expr), None)
+        if result is None:
+            if expr.op_code == Expression.PVAR \
+            or expr.op_code == Expression.CONSTANT:
+                try:
+                    result = self.rddl.is_non_fluent_expression(expr)
+                except RDDLUndefinedVariableError:
+                    result = False
+            elif expr.op_code == Expression.RANDOMVAR:
+                result = False
+            else:
+                result = all(map(self._is_non_fluent,
+                                 RDDLOptimizer._children(expr)))
+            self._non_fluent[id(expr)] = result
+        return result
+
+    def _is_hoistable(self, expr):
+
+        # deterministic and can be the body of an interm-fluent CPF
+        result = self._hoistable.get(id(expr), None)
+        if result is None:
+            if expr.op_code == Expression.PVAR:
+                valid = VALID_DEPENDENCIES['interm-fluent']
+                result = self._pvar_type(expr) in valid.union({'non-fluent'})
+            elif expr.op_code == Expression.RANDOMVAR:
+                result = False
+            else:
+                result = all(map(self._is_hoistable,
+                                 RDDLOptimizer._children(expr)))
+            self._hoistable[id(expr)] = result
+        return result
+
+    # ===========================================================================
+    # new variables
+    # ===========================================================================
+
+    @staticmethod
+    def _range_of(value):
+        dtype = np.asarray(value).dtype
+        if np.issubdtype(dtype, np.bool_):
+            return 'bool'
+        elif np.issubdtype(dtype, np.integer):
+            return 'int'
+        else:
+            return 'real'
+
+    def _new_variable(self, prefix, vtype, objects, prange):
+        model = self._model
+        index = 0
+        while f'{prefix}{index}' in model.variable_types:
+            index += 1
+        var = f'{prefix}{index}'
+        model.param_types[var] = [ptype for (_, ptype) in objects]
+        model.variable_types[var] = vtype
+        model.variable_ranges[var] = prange
+        return var
+
+    def _pvar(self, var, objects):
+        params = [name for (name, _) in objects] or None
+        return self._table(('pvar_expr', (var, params)))
+
+    # ===========================================================================
+    # constant folding
+    # ===========================================================================
+
+    def _fold(self, expr, objects):
+        if expr.op_code != Expression.CONSTANT \
+        and expr.op_code != Expression.PVAR \
+        and self._is_non_fluent(expr):
+            folded = self._fold_subtree(expr, objects)
+            if folded is not None:
+                return folded
+        scope = RDDLOptimizer._scope(expr, objects)
+        return self._rebuild(expr, lambda arg: self._fold(arg, scope))
+
+    def _fold_subtree(self, expr, objects):
+        free = self._free_objects(expr, objects)
+        key = (id(expr), tuple(free))
+        if key in self._folded:
+            return self._folded[key]
+
+        # subtrees whose evaluation fails are left to fail at run time
+        try:
+            value = self._sim._sample(expr, free, self._sim.subs)
+        except Exception:
+            return None
+
+        value = np.asarray(value)
+        prange = RDDLOptimizer._range_of(value)
+        if value.ndim == 0:
+            value = value.item()
+            head = 'boolean' if prange == 'bool' else 'number'
+            folded = self._table((head, value))
+        else:
+            var = self._new_variable(
+                RDDLOptimizer.FOLDED_PREFIX, 'non-fluent', free, prange)
+            model = self._model
+            ptypes = model.param_types[var]
+            for (name, item) in zip(model.grounded_names(var, ptypes),
+                                    value.ravel(order='C')):
+                model.nonfluents[name] = item.item()
+            folded = self._pvar(var, free)
+        self._folded[key] = folded
+        return folded
+
+    # ===========================================================================
+    # common subexpression elimination
+    # ===========================================================================
+
+    def _collect(self, expr, objects, conditional, counts):
+
+        # only occurrences evaluated on every step are counted, so hoisting
+        # never evaluates a subtree that would otherwise have been skipped
+        children = RDDLOptimizer._children(expr)
+        if not conditional and self._size(expr) >= RDDLOptimizer.MIN_HOIST_SIZE \
+        and self._is_hoistable(expr):
+            key = (id(expr), tuple(self._free_objects(expr, objects)))
+            entry = counts.get(key, None)
+            if entry is None:
+                counts[key] = [1, expr]
+            else:
+                entry[0] += 1
+
+        scope = RDDLOptimizer._scope(expr, objects)
+        _, op = expr.etype
+        for (i, arg) in enumerate(children):
+            if expr.op_code == Expression.CONTROL:
+                arg_conditional = conditional or i > 0
+            elif expr.op_code == Expression.BOOLEAN and op in ('^', '|'):
+                arg_conditional = True
+            else:
+                arg_conditional = conditional
+            self._collect(arg, scope, arg_conditional, counts)
+
+    def _replace(self, expr, objects, node, free, pvar):
+        if self._size(expr) < self._size(node):
+            return expr
+        if expr is node and self._free_objects(expr, objects) == free:
+            return pvar
+        scope = RDDLOptimizer._scope(expr, objects)
+        return self._rebuild(
+            expr, lambda arg: self._replace(arg, scope, node, free, pvar))
+
+    def _eliminate(self, cpfs, reward):
+
+        # derived-fluents cannot depend on interm-fluents
+        roots = {name: (objects, expr)
+                 for (name, (objects, expr)) in cpfs.items()
+                 if self.rddl.variable_types[name] != 'derived-fluent'}
+        roots[None] = ([], reward)
+
+        hoisted, rejected = 0, set()
+        while True:
+            counts = {}
+            for (objects, expr) in roots.values():
+                self._collect(expr, objects, False, counts)
+            candidates = [(self._size(expr), key, expr)
+                          for (key, (count, expr)) in counts.items()
+                          if count > 1 and key not in rejected]
+            if not candidates:
+                break
+
+            # hoist the largest repeated subtree first
+            _, key, expr = max(candidates, key=lambda item: item[0])
+            free = list(key[1])
+            try:
+                value = self._sim._sample(expr, free, self._sim.subs)
+            except Exception:
+                rejected.add(key)
+                continue
+            var = self._new_variable(
+                RDDLOptimizer.CSE_PREFIX, 'interm-fluent', free,
+                RDDLOptimizer._range_of(value))
+            model = self._model
+            for name in model.grounded_names(var, model.param_types[var]):
+                model.interm[name] = None
+
+            pvar = self._pvar(var, free)
+            roots = {name: (objects, self._replace(root, objects, expr, free, pvar))
+                     for (name, (objects, root)) in roots.items()}
+            roots[var] = (free, expr)
+            hoisted += 1
+
+        reward = roots.pop(None)[1]
+        cpfs = {name: roots.get(name, cpf) for (name, cpf) in cpfs.items()}
+        cpfs.update((name, roots[name]) for name in roots if name not in cpfs)
+        return cpfs, reward, hoisted
@@ -1,6 +1,6 @@
 import copy
 import gym
-from gym.spaces import Discrete, Dict, Box
+from gym.spaces import Discrete, Dict, Box, MultiBinary
 import numpy as np
 import pygame
 
@@ -8,8 +8,10 @@ from pyRDDLGym.Core.ErrorHandling.RDDLException import RDDLInvalidNumberOfArgume
 from pyRDDLGym.Core.ErrorHandling.RDDLException import RDDLTypeError
 
 from pyRDDLGym.Core.Compiler.RDDLLiftedModel import RDDLLiftedModel
+from pyRDDLGym.Core.Compiler.RDDLOptimizer import RDDLOptimizer
 from pyRDDLGym.Core.Parser.parser import RDDLParser
 from pyRDDLGym.Core.Parser.RDDLReader import RDDLReader
+from pyRDDLGym.Core.Simulator.RDDLRandom import RDDLRandom
 from pyRDDLGym.Core.Simulator.RDDLSimulator import RDDLSimulatorWConstraints
 from pyRDDLGym.Visualizer.TextViz import TextVisualizer
 
@@ -17,22 +19,38 @@ from pyRDDLGym.Visualizer.TextViz import TextVisualizer
 class RDDLEnv(gym.Env):
     
     def __init__(self, domain, instance=None, enforce_action_constraints=False,
-                 debug=False):
+                 debug=False, compiled=False, fluent_format='grounded',
+                 cache=None, optimize=False, preallocate=False,
+                 incremental=False, seed=None, profiler=None):
         super(RDDLEnv, self).__init__()
         self.enforce_action_constraints = enforce_action_constraints
+        self.fluent_format = fluent_format
         
-        # read and parse domain and instance
-        reader = RDDLReader(domain, instance)
-        domain = reader.rddltxt
+        # read and parse domain and instance, or load them from the cache
+        levels, tensors = None, None
+        if cache is None:
+            reader = RDDLReader(domain, instance)
+            domain = reader.rddltxt
 
-        # parse RDDL file
-        parser = RDDLParser(lexer=None, verbose=False)
-        parser.build()
-        rddl = parser.parse(domain)
+            # parse RDDL file
+            rddl = RDDLParser.shared().parse(domain)
+            self.model = RDDLLiftedModel(rddl)
+        else:
+            self.model, levels, tensors = cache.load(domain, instance)
+        
+        # fold constants and hoist repeated subexpressions of the model
+        model = self.model
+        if optimize:
+            model = RDDLOptimizer(self.model).optimize()
+            levels, tensors = None, None
 
         # define the model sampler
-        self.model = RDDLLiftedModel(rddl)
-        self.sampler = RDDLSimulatorWConstraints(self.model, debug=debug)
+        self.sampler = RDDLSimulatorWConstraints(
+            model, rng=RDDLRandom(seed).generator(),
+            debug=debug, compiled=compiled,
+            fluent_format=fluent_format, levels=levels, tensors=tensors,
+            preallocate=preallocate, incremental=incremental,
+            profiler=profiler)
         bounds = self.sampler.bounds
 
         # set roll-out parameters
@@ -47,57 +65,31 @@ class RDDLEnv(gym.Env):
         self.defaultAction = copy.deepcopy(self.model.actions)
 
         # define the actions bounds
-        action_space = Dict()
-        for act in self.model.actions:
-            act_range = self.model.actionsranges[act]
-            if act_range == 'real':
-                action_space[act] = Box(low=bounds[act][0], 
-                                        high=bounds[act][1],
-                                        dtype=np.float32)
-            elif act_range == 'bool':
-                action_space[act] = Discrete(2)
-            elif act_range == 'int':
-                high = bounds[act][1]
-                if high == np.inf:
-                    high = np.iinfo(np.int32).max
-                low = bounds[act][0]
-                if low == -np.inf:
-                    low = np.iinfo(np.int32).min
-                action_space[act] = Discrete(int(high - low + 1), start=int(low))
-            else:
-                raise RDDLTypeError(
-                    f'Unknown action value type <{act_range}> in environment.')
-        self.action_space = action_space
+        if fluent_format == 'grounded':
+            self.action_space = RDDLEnv.build_space(
+                self.model.actions, self.model.actionsranges, bounds, 'action')
+        else:
+            self.action_space = self._build_tensor_space(
+                self.sampler.action_layout)
+            self.defaultAction = self.sampler.noop_actions
+            if fluent_format == 'flat':
+                self.defaultAction = RDDLEnv._flatten(
+                    self.defaultAction, self.sampler.action_layout)
 
         # define the states bounds
         if self.sampler.isPOMDP:
             search_dict = self.model.observ
             ranges = self.model.observranges
+            layout = self.sampler.observ_layout
         else:
             search_dict = self.model.states
             ranges = self.model.statesranges
-            
-        state_space = Dict()
-        for state in search_dict:
-            state_range = ranges[state]
-            if state_range == 'real':
-                state_space[state] = Box(low=bounds[state][0],
-                                         high=bounds[state][1],
-                                         dtype=np.float32)
-            elif state_range == 'bool':
-                state_space[state] = Discrete(2)
-            elif state_range == 'int':
-                high = bounds[state][1]
-                if high == np.inf:
-                    high = np.iinfo(np.int32).max
-                low = bounds[state][0]
-                if low == -np.inf:
-                    low = np.iinfo(np.int32).min
-                state_space[state] = Discrete(int(high - low + 1), start=int(low))
-            else:
-                raise RDDLTypeError(
-                    f'Unknown state value type <{state_range}> in environment.')
-        self.observation_space = state_space
+            layout = self.sampler.state_layout
+        if fluent_format == 'grounded':
+            self.observation_space = RDDLEnv.build_space(
+                search_dict, ranges, bounds, 'state')
+        else:
+            self.observation_space = self._build_tensor_space(layout)
 
         # set the visualizer
         # the next line should be changed for the default behaviour - TextVix
@@ -109,6 +101,100 @@ class RDDLEnv(gym.Env):
         self.to_render = False
         self.image_size = None
 
+    @staticmethod
+    def build_space(fluents, ranges, bounds, kind):
+        '''Builds a gym Dict space for the given grounded fluents.
+        
+        :param fluents: the grounded fluent names
+        :param ranges: a dict mapping each fluent to its RDDL range
+        :param bounds: a dict mapping each fluent to its [lower, upper] bounds
+        :param kind: the kind of fluent (action or state) for error messages
+        '''
+        space = Dict()
+        for fluent in fluents:
+            fluent_range = ranges[fluent]
+            if fluent_range == 'real':
+                space[fluent] = Box(low=bounds[fluent][0],
+                                    high=bounds[fluent][1],
+                                    dtype=np.float32)
+            elif fluent_range == 'bool':
+                space[fluent] = Discrete(2)
+            elif fluent_range == 'int':
+                high = bounds[fluent][1]
+                if high == np.inf:
+                    high = np.iinfo(np.int32).max
+                low = bounds[fluent][0]
+                if low == -np.inf:
+                    low = np.iinfo(np.int32).min
+                space[fluent] = Discrete(int(high - low + 1), start=int(low))
+            else:
+                raise RDDLTypeError(
+                    f'Unknown {kind} value type <{fluent_range}> in environment.')
+        return space
+    
+    def _build_tensor_space(self, layout):
+        bounds, tensors = self.sampler.bounds, self.sampler.tensors
+        lows, highs, space = {}, {}, Dict()
+        for var, (_, _, shape) in layout.items():
+            if self.model.is_grounded:
+                names = [var]
+            else:
+                names = tensors.grounded[var]
+            
+            # every space has exactly the shape of the tensor, which is () for
+            # a fluent without parameters
+            shape = tuple(shape)
+            low = np.reshape([bounds[name][0] for name in names], shape)
+            high = np.reshape([bounds[name][1] for name in names], shape)
+            prange = self.model.variable_ranges[var]
+            if prange == 'real':
+                space[var] = Box(low=low, high=high, shape=shape,
+                                 dtype=np.float64)
+            elif prange == 'bool':
+                low, high = np.zeros(shape), np.ones(shape)
+                space[var] = MultiBinary(shape)
+            elif prange == 'int':
+                info = np.iinfo(np.int32)
+                low = np.asarray(np.clip(low, info.min, info.max))
+                high = np.asarray(np.clip(high, info.min, info.max))
+                space[var] = Box(low=low.astype(np.int64),
+                                 high=high.astype(np.int64),
+                                 shape=shape, dtype=np.int64)
+            else:
+                raise RDDLTypeError(
+                    f'Unknown value type <{prange}> of <{var}> in environment.')
+            lows[var], highs[var] = low, high
+            
+        if self.fluent_format == 'flat':
+            space = Box(low=RDDLEnv._flatten(lows, layout),
+                        high=RDDLEnv._flatten(highs, layout),
+                        dtype=np.float64)
+        return space
+    
+    @staticmethod
+    def _flatten(values, layout):
+        size = max((stop for (_, stop, _) in layout.values()), default=0)
+        vector = np.zeros((size,), dtype=np.float64)
+        for var, (start, stop, _) in layout.items():
+            vector[start:stop] = np.ravel(values[var])
+        return vector
+    
+    def _count_actions(self, actions):
+        default = self.defaultAction
+        if self.fluent_format == 'flat':
+            return np.count_nonzero(np.asarray(actions) != default)
+        elif self.fluent_format == 'tensor':
+            return sum(np.count_nonzero(np.asarray(value) != default[var])
+                       for (var, value) in actions.items() if var in default)
+        else:
+            return len(actions)
+        
+    def _grounded_state(self):
+        if self.fluent_format == 'grounded':
+            return self.state
+        else:
+            return self.sampler.states
+        
     def set_visualizer(self, viz, movie_gen=None, movie_per_episode=False):
         self._visualizer = viz(self.model)
         self._movie_generator = movie_gen
@@ -121,7 +207,7 @@ class RDDLEnv(gym.Env):
             return self.state, 0.0, self.done, {}
 
         # make sure the action length is of currect size
-        action_length = len(actions)
+        action_length = self._count_actions(actions)
         if (action_length > self.max_allowed_actions):
             raise RDDLInvalidNumberOfArgumentsError(
                 f'Invalid action, expected at most '
@@ -130,13 +216,25 @@ class RDDLEnv(gym.Env):
         
         # set full action vector
         # values are clipped to be inside the feasible action space
-        clipped_actions = copy.deepcopy(self.defaultAction)
-        for act in actions:
-            if str(self.action_space[act]) == 'Discrete(2)':
-                if self.model.actionsranges[act] == 'bool':
-                    clipped_actions[act] = bool(actions[act])
-            else:
-                clipped_actions[act] = actions[act]
+        if self.fluent_format == 'grounded':
+            clipped_actions = copy.deepcopy(self.defaultAction)
+            for act in actions:
+                if str(self.action_space[act]) == 'Discrete(2)':
+                    if self.model.actionsranges[act] == 'bool':
+                        clipped_actions[act] = bool(actions[act])
+                else:
+                    clipped_actions[act] = actions[act]
+        elif self.fluent_format == 'tensor':
+            
+            # bool tensors can be passed as integers, as sampled by MultiBinary
+            clipped_actions = {}
+            ranges = self.model.variable_ranges
+            for var, value in actions.items():
+                if ranges.get(var, None) == 'bool':
+                    value = np.asarray(value).astype(bool)
+                clipped_actions[var] = value
+        else:
+            clipped_actions = actions
                 
         # check action constraints
         if self.enforce_action_constraints:
@@ -144,7 +242,10 @@ class RDDLEnv(gym.Env):
         
         # sample next state and reward
         obs, reward, self.done = self.sampler.step(clipped_actions)
-        state = self.sampler.states
+        if self.fluent_format == 'grounded':
+            state = self.sampler.states
+        else:
+            state = self.sampler.state
 
         # check if the state invariants are satisfied
         if not self.done:
@@ -164,9 +265,12 @@ class RDDLEnv(gym.Env):
         self.total_reward = 0
         self.currentH = 0
         obs, self.done = self.sampler.reset()
-        self.state = self.sampler.states
+        if self.fluent_format == 'grounded':
+            self.state = self.sampler.states
+        else:
+            self.state = self.sampler.state
 
-        image = self._visualizer.render(self.state)
+        image = self._visualizer.render(self._grounded_state())
         if self._movie_generator is not None:
             if self._movie_per_episode:
                 self._movie_generator.save_gif(
@@ -176,13 +280,48 @@ class RDDLEnv(gym.Env):
         self.image_size = image.size
         return obs
 
+    def snapshot(self):
+        '''Returns the current state of the environment (the state of its
+        simulator and the current step), which can later be passed to restore
+        to continue from this state, e.g. to branch from it in tree search.'''
+        return (self.sampler.snapshot(), self.currentH, self.done)
+
+    def restore(self, snapshot, rng=True):
+        '''Returns the environment to the state captured by snapshot.
+
+        :param snapshot: a snapshot returned by this environment (or a clone)
+        :param rng: whether to also restore the random stream of the simulator
+        '''
+        sampler_state, self.currentH, self.done = snapshot
+        self.sampler.restore(sampler_state, rng=rng)
+        if self.fluent_format == 'grounded':
+            self.state = self.sampler.states
+        else:
+            self.state = self.sampler.state
+
+    def clone(self):
+        '''Returns a new environment in the current state of this one, whose
+        simulator is a clone of this one's (see RDDLSimulator.clone). The
+        clone does not render to a window or record movies.'''
+        env = copy.copy(self)
+        env.sampler = self.sampler.clone()
+        if self.state is not None:
+            if self.fluent_format == 'grounded':
+                env.state = env.sampler.states
+            else:
+                env.state = env.sampler.state
+        env.to_render = False
+        env.window = None
+        env._movie_generator = None
+        return env
+
     def pilImageToSurface(self, pilImage):
         return pygame.image.fromstring(
             pilImage.tobytes(), pilImage.size, pilImage.mode).convert()
 
     def render(self, to_display=True):
         if self._visualizer is not None:
-            image = self._visualizer.render(self.state)
+            image = self._visualizer.render(self._grounded_state())
             if to_display:
                 if not self.to_render:
                     self.to_render = True
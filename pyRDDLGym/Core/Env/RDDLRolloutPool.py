@@ -0,0 +1,251 @@
+import copy
+import multiprocessing
+from multiprocessing import shared_memory
+import numpy as np
+import os
+import pickle
+import queue
+from typing import Dict, Iterator
+
+from pyRDDLGym.Core.ErrorHandling.RDDLException import RDDLInvalidNumberOfArgumentsError
+
+from pyRDDLGym.Core.Compiler.RDDLLevelAnalysis import RDDLLevelAnalysis
+from pyRDDLGym.Core.Compiler.RDDLLiftedModel import RDDLLiftedModel
+from pyRDDLGym.Core.Parser.parser import RDDLParser
+from pyRDDLGym.Core.Parser.RDDLReader import RDDLReader
+from pyRDDLGym.Core.Simulator.RDDLRandom import RDDLRandom
+from pyRDDLGym.Core.Simulator.RDDLSimulator import RDDLSimulatorWConstraints
+from pyRDDLGym.Core.Simulator.RDDLTensors import RDDLTensors
+from pyRDDLGym.Policies.Agents import BaseAgent
+
+
+class RDDLRolloutPool:
+    '''Runs episodes of a RDDL environment in a pool of worker processes.
+
+    The model is parsed and analyzed once in the parent process, and the
+    non-fluent and initial state tensors are copied once into a single block
+    of shared memory. Every worker attaches to this block and uses read-only
+    views into it as the initial values of its simulator, so these tensors
+    are held in memory only once regardless of the number of workers.
+    Episodes are sent to the workers through a queue, and their results are
+    returned as soon as they complete.
+
+    Episodes are numbered in the order they are submitted, and the random
+    stream of each episode depends only on the seed and its number, so the
+    results do not depend on the number of workers or on which worker runs
+    an episode (as long as the agent is itself deterministic or seeded).
+    '''
+
+    ALIGNMENT = 64
+
+    def __init__(self, domain, instance=None, num_workers: int=None,
+                 enforce_action_constraints: bool=False, cache=None,
+                 seed=None, **simulator_args) -> None:
+        '''Creates a new pool of workers for the given domain and instance.
+
+        :param domain: the path of the domain file
+        :param instance: the path of the instance file
+        :param num_workers: the number of worker processes, or None to use
+        the number of CPUs
+        :param enforce_action_constraints: whether to check the action
+        preconditions at every step
+        :param cache: a RDDLModelCache to load the model from
+        :param seed: the seed of the random streams of all episodes
+        :param simulator_args: other arguments passed to the simulator of
+        every worker (e.g. compiled, preallocate, incremental)
+        '''
+        if num_workers is None:
+            num_workers = os.cpu_count() or 1
+        self.num_workers = num_workers
+        self.enforce_action_constraints = enforce_action_constraints
+        self.seed_sequence = np.random.SeedSequence(seed)
+
+        # parse and analyze the model once
+        if cache is None:
+            reader = RDDLReader(domain, instance)
+            rddl = RDDLParser.shared().parse(reader.rddltxt)
+            self.model = RDDLLiftedModel(rddl)
+            levels = RDDLLevelAnalysis(self.model).compute_levels()
+            tensors = RDDLTensors(self.model)
+        else:
+            self.model, levels, tensors = cache.load(domain, instance)
+        self.horizon = self.model.horizon
+
+        # copy the immutable tensors to shared memory, and send the rest of
+        # the model to the workers once, when they start
+        self._shm, layout = RDDLRolloutPool._share(self.model, tensors)
+        stub = copy.copy(tensors)
+        stub.init_values = {name: (None if name in layout else value)
+                            for name, value in tensors.init_values.items()}
+        payload = pickle.dumps(
+            (self.model, levels, stub, layout, self._shm.name,
+             enforce_action_constraints, simulator_args),
+            protocol=pickle.HIGHEST_PROTOCOL)
+
+        context = multiprocessing.get_context()
+        self._tasks = context.Queue()
+        self._results = context.Queue()
+        self._workers = [
+            context.Process(target=_worker,
+                            args=(payload, self._tasks, self._results),
+                            daemon=True)
+            for _ in range(num_workers)]
+        for worker in self._workers:
+            worker.start()
+        self._episodes = 0
+        self._closed = False
+
+    @staticmethod
+    def _share(rddl, tensors):
+        layout, size = {}, 0
+        for name, value in tensors.init_values.items():
+            var = rddl.parse(name)[0]
+            if rddl.variable_types[var] in ('non-fluent', 'state-fluent') \
+            and isinstance(value, np.ndarray) and value.size > 0:
+                offset = -size % RDDLRolloutPool.ALIGNMENT + size
+                layout[name] = (offset, value.shape, value.dtype.str)
+                size = offset + value.nbytes
+
+        shm = shared_memory.SharedMemory(create=True, size=max(size, 1))
+        for name, (offset, shape, dtype) in layout.items():
+            view = np.ndarray(shape, dtype=dtype, buffer=shm.buf, offset=offset)
+            view[...] = tensors.init_values[name]
+        return shm, layout
+
+    # ===========================================================================
+    # running episodes
+    # ===========================================================================
+
+    def rollouts(self, agent: BaseAgent, episodes: int) -> Iterator[Dict]:
+        '''Runs the given number of episodes with the given agent, and yields
+        the result of every episode as soon as it completes (i.e. not
+        necessarily in order). Every result is a dict with the number of the
+        episode, its total reward and its number of steps.
+
+        :param agent: the agent whose sample_action chooses the actions from
+        the current state, which is sent (pickled) to every worker
+        :param episodes: the number of episodes to run
+        '''
+        if self._closed:
+            raise RuntimeError('Rollout pool is closed.')
+        agent = pickle.dumps(agent, protocol=pickle.HIGHEST_PROTOCOL)
+        entropy = self.seed_sequence.entropy
+        for _ in range(episodes):
+            number = self._episodes
+            self._episodes += 1
+            seed = np.random.SeedSequence(entropy, spawn_key=(number,))
+            self._tasks.put((number, seed, agent))
+
+        for _ in range(episodes):
+            while True:
+                try:
+                    number, result = self._results.get(timeout=1.0)
+                    break
+                except queue.Empty:
+                    if not all(worker.is_alive() for worker in self._workers):
+                        self.close()
+                        raise RuntimeError('A rollout worker died.')
+            if isinstance(result, Exception):
+                raise result
+            yield result
+
+    def run(self, agent: BaseAgent, episodes: int) -> Dict[int, Dict]:
+        '''Runs the given number of episodes with the given agent, and returns
+        a dict mapping the number of each episode to its result.'''
+        return {result['episode']: result
+                for result in self.rollouts(agent, episodes)}
+
+    def close(self) -> None:
+        '''Stops the workers and releases the shared memory.'''
+        if self._closed:
+            return
+        self._closed = True
+        for _ in self._workers:
+            self._tasks.put(None)
+        for worker in self._workers:
+            worker.join(timeout=5.0)
+            if worker.is_alive():
+                worker.terminate()
+        self._shm.close()
+        self._shm.unlink()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    def __del__(self):
+        if hasattr(self, '_closed'):
+            self.close()
+
+
+def _attach(payload):
+    (model, levels, tensors, layout, shm_name,
+     enforce_action_constraints, simulator_args) = pickle.loads(payload)
+    shm = shared_memory.SharedMemory(name=shm_name)
+    init_values = {}
+    for name, value in tensors.init_values.items():
+        if name in layout:
+            offset, shape, dtype = layout[name]
+            value = np.ndarray(shape, dtype=dtype, buffer=shm.buf, offset=offset)
+            value.flags.writeable = False
+        init_values[name] = value
+    tensors.init_values = init_values
+    sampler = RDDLSimulatorWConstraints(
+        model, levels=levels, tensors=tensors, **simulator_args)
+    return shm, sampler, enforce_action_constraints
+
+
+def _episode(model, sampler, agent, enforce_action_constraints):
+    ranges = model.actionsranges
+    max_actions = model.max_allowed_actions
+    total_reward, steps = 0.0, 0
+    obs, done = sampler.reset()
+    while not done and steps < model.horizon:
+        actions = agent.sample_action(obs)
+        if len(actions) > max_actions:
+            raise RDDLInvalidNumberOfArgumentsError(
+                f'Invalid action, expected at most {max_actions} entries, '
+                f'but got {len(actions)}.')
+        actions = {act: (bool(value) if ranges[act] == 'bool' else value)
+                   for (act, value) in actions.items()}
+        if enforce_action_constraints:
+            sampler.check_action_preconditions(actions)
+        obs, reward, done = sampler.step(actions)
+        if not done:
+            sampler.check_state_invariants()
+        total_reward += reward
+        steps += 1
+    return total_reward, steps
+
+
+def _worker(payload, tasks, results):
+
+    # the shared memory stays mapped until the worker exits, since the
+    # simulator holds views into it
+    shm, sampler, enforce_action_constraints = _attach(payload)
+    agents = {}
+    while True:
+        task = tasks.get()
+        if task is None:
+            break
+        number, seed, agent = task
+        try:
+            if agent not in agents:
+                agents.clear()
+                agents[agent] = pickle.loads(agent)
+            sampler.rng = RDDLRandom(seed).generator()
+            total_reward, steps = _episode(
+                sampler.rddl, sampler, agents[agent], enforce_action_constraints)
+            result = {'episode': number,
+                      'total_reward': total_reward,
+                      'steps': steps,
+                      'worker': os.getpid()}
+        except Exception as e:
+            result = e
+            try:
+                pickle.dumps(e)
+            except Exception:
+                result = RuntimeError(f'{type(e).__name__}: {e}')
+        results.put((number, result))
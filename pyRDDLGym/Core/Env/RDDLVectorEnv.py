@@ -0,0 +1,128 @@
+import numpy as np
+from gym.vector import VectorEnv
+
+from pyRDDLGym.Core.ErrorHandling.RDDLException import RDDLInvalidNumberOfArgumentsError
+
+from pyRDDLGym.Core.Compiler.RDDLLiftedModel import RDDLLiftedModel
+from pyRDDLGym.Core.Compiler.RDDLOptimizer import RDDLOptimizer
+from pyRDDLGym.Core.Env.RDDLEnv import RDDLEnv
+from pyRDDLGym.Core.Parser.parser import RDDLParser
+from pyRDDLGym.Core.Parser.RDDLReader import RDDLReader
+from pyRDDLGym.Core.Simulator.BatchedRDDLSimulator import BatchedRDDLSimulatorWConstraints
+from pyRDDLGym.Core.Simulator.RDDLRandom import RDDLRandom
+
+
+class RDDLVectorEnv(VectorEnv):
+    '''Runs num_envs independent copies of a RDDL environment, which are all
+    stepped together by a single batched simulator. Observations, rewards and
+    dones carry a leading axis of size num_envs. Environments that are done
+    are automatically reset at the end of the same call to step, which then
+    returns their initial observation and reports the terminal observation
+    in infos['final_observation'], as in gym's SyncVectorEnv.
+    '''
+
+    def __init__(self, domain, instance=None, num_envs=1,
+                 enforce_action_constraints=False, debug=False, cache=None,
+                 optimize=False, seed=None):
+        self.enforce_action_constraints = enforce_action_constraints
+
+        # read and parse domain and instance, or load them from the cache
+        levels, tensors = None, None
+        if cache is None:
+            reader = RDDLReader(domain, instance)
+            domain = reader.rddltxt
+            rddl = RDDLParser.shared().parse(domain)
+            self.model = RDDLLiftedModel(rddl)
+        else:
+            self.model, levels, tensors = cache.load(domain, instance)
+
+        # fold constants and hoist repeated subexpressions of the model
+        model = self.model
+        if optimize:
+            model = RDDLOptimizer(self.model).optimize()
+            levels, tensors = None, None
+
+        # define the batched model sampler
+        self.sampler = BatchedRDDLSimulatorWConstraints(
+            model, num_envs, rng=RDDLRandom(seed).generator(),
+            debug=debug, levels=levels, tensors=tensors)
+        bounds = self.sampler.bounds
+
+        # set roll-out parameters
+        self.horizon = self.model.horizon
+        self.discount = self.model.discount
+        self.max_allowed_actions = self.model.max_allowed_actions
+
+        # define the spaces of a single environment
+        action_space = RDDLEnv.build_space(
+            self.model.actions, self.model.actionsranges, bounds, 'action')
+        if self.sampler.isPOMDP:
+            search_dict = self.model.observ
+            ranges = self.model.observranges
+        else:
+            search_dict = self.model.states
+            ranges = self.model.statesranges
+        observation_space = RDDLEnv.build_space(
+            search_dict, ranges, bounds, 'state')
+        super(RDDLVectorEnv, self).__init__(
+            num_envs, observation_space, action_space)
+
+        self.currentH = np.zeros((num_envs,), dtype=int)
+        self.dones = np.zeros((num_envs,), dtype=bool)
+        self.obs = None
+
+    def reset(self):
+        self.currentH[:] = 0
+        self.obs, self.dones = self.sampler.reset()
+        return self.obs
+
+    def step(self, actions):
+
+        # make sure the action length is of correct size
+        action_length = len(actions)
+        if action_length > self.max_allowed_actions:
+            raise RDDLInvalidNumberOfArgumentsError(
+                f'Invalid action, expected at most '
+                f'{self.max_allowed_actions} entries, '
+                f'but got {action_length}.')
+
+        # boolean actions can be passed as integers
+        batch_actions = {}
+        for act, value in actions.items():
+            if self.model.actionsranges.get(act, None) == 'bool':
+                value = np.asarray(value).astype(bool)
+            batch_actions[act] = value
+
+        # check action constraints
+        if self.enforce_action_constraints:
+            self.sampler.check_action_preconditions(batch_actions)
+
+        # sample next state and reward
+        obs, rewards, terminated = self.sampler.step(batch_actions)
+
+        # check if the state invariants are satisfied
+        self.sampler.check_state_invariants(mask=np.logical_not(terminated))
+
+        # update step horizon
+        self.currentH += 1
+        dones = np.logical_or(terminated, self.currentH >= self.horizon)
+        infos = {'terminated': terminated}
+
+        # environments that finished start a new episode right away
+        if np.any(dones):
+            infos['final_observation'] = {var: np.copy(value)
+                                          for (var, value) in obs.items()}
+            infos['_final_observation'] = dones.copy()
+            obs, _ = self.sampler.reset(mask=dones)
+            self.currentH[dones] = 0
+        self.dones = dones
+        self.obs = obs
+        return obs, rewards, dones.copy(), infos
+
+    @property
+    def numConcurrentActions(self):
+        return self.max_allowed_actions
+
+    @property
+    def non_fluents(self):
+        return self.model.nonfluents
@@ -1,4 +1,5 @@
 import abc
+from collections.abc import MutableMapping
 import copy
 import itertools
 import warnings
@@ -10,7 +11,7 @@ from pyRDDLGym.Core.ErrorHandling.RDDLException import RDDLUndefinedVariableErro
 from pyRDDLGym.Core.ErrorHandling.RDDLException import RDDLValueOutOfRangeError
 
 from pyRDDLGym.Core.Compiler.RDDLModel import RDDLModel
-from pyRDDLGym.Core.Parser.expr import Expression
+from pyRDDLGym.Core.Parser.expr import Expression, ExpressionTable
 
 PRIME = '\''
 
@@ -26,6 +27,47 @@ AGGREG_OP_TO_STRING_DICT = dict(
 )
 
 
+class LazyGroundedCPFs(MutableMapping):
+    '''Mapping from grounded CPF names to ([], expression), in which each CPF
+    is grounded the first time it is requested and then kept.
+    '''
+    
+    def __init__(self, grounder) -> None:
+        self._grounder = grounder
+        self._cpfs = {}
+        self._pending = {}
+    
+    def defer(self, name, cpf, variable, variable_args) -> None:
+        '''Registers the grounding of the lifted cpf for the given variable.'''
+        self._cpfs[name] = None
+        self._pending[name] = (cpf, variable, variable_args)
+    
+    def is_grounded(self, name) -> bool:
+        return name in self._cpfs and name not in self._pending
+    
+    def __getitem__(self, name):
+        value = self._cpfs[name]
+        pending = self._pending.pop(name, None)
+        if pending is not None:
+            expr = self._grounder._ground_cpf_expr(*pending)
+            value = self._cpfs[name] = ([], expr)
+        return value
+    
+    def __setitem__(self, name, value) -> None:
+        self._pending.pop(name, None)
+        self._cpfs[name] = value
+    
+    def __delitem__(self, name) -> None:
+        self._pending.pop(name, None)
+        del self._cpfs[name]
+    
+    def __iter__(self):
+        return iter(self._cpfs)
+    
+    def __len__(self) -> int:
+        return len(self._cpfs)
+
+
 class Grounder(metaclass=abc.ABCMeta):
 
     @abc.abstractmethod
@@ -35,9 +77,23 @@ class Grounder(metaclass=abc.ABCMeta):
 
 class RDDLGrounder(Grounder):
 
-    def __init__(self, RDDL_AST) -> None:
+    def __init__(self, RDDL_AST, intern: bool=False, lazy: bool=False) -> None:
+        '''Creates a new grounder for the given RDDL AST.
+        
+        :param RDDL_AST: the RDDL AST to ground
+        :param intern: whether identical grounded subtrees share one node
+        :param lazy: whether each CPF is grounded only when it is first looked
+        up in the cpfs of the grounded model, in which case every grounded
+        subtree is also memoized by the objects bound to its free variables,
+        so that e.g. the grounding of an aggregation is shared by all ground
+        atoms whose CPF contains it
+        '''
         super(RDDLGrounder, self).__init__()
         self.AST = RDDL_AST
+        self.lazy = lazy
+        self._expression = ExpressionTable() if intern else Expression
+        self._free_variables = {}
+        self._grounded = {}
         self.objects = {}
         self.objects_rev = {}
         self.pvar_to_type = {pvar.name: pvar.range for pvar in self.AST.domain.pvariables}
@@ -52,7 +108,7 @@ class RDDLGrounder(Grounder):
         self.dynamicstate = {}
         self.actions = {}
         self.actionsranges = {}
-        self.cpfs = {}
+        self.cpfs = LazyGroundedCPFs(self) if lazy else {}
         self.cpforder = {0: []}
         self.gvar_to_cpforder = {}
         self.derived = {}
@@ -215,10 +271,6 @@ class RDDLGrounder(Grounder):
                 self.cpforder[level] = [pvariable.name]
 
     def _ground_pvariables_and_cpf(self):
-        all_grounded_state_cpfs = []
-        all_grounded_interim_cpfs = []
-        all_grounded_derived_cpfs = []
-        all_grounded_observ_cpfs = []
         for pvariable in self.AST.domain.pvariables:
             name = pvariable.name
             vtype = self.pvar_to_type[name]
@@ -259,15 +311,12 @@ class RDDLGrounder(Grounder):
                         'CPF <{}> is missing a valid definition.'.format(name))
     
                 for g in grounded:
-                    grounded_cpf = self._ground_single_cpf(
-                        cpf, g, grounded_name_to_params_dict[g])
-                    all_grounded_state_cpfs.append(grounded_cpf)
                     next_state = g + PRIME  # update to grounded version, satisfied single-variables too (i.e. not a type)
                     self.states[g] = pvariable.default
                     self.statesranges[g] = pvariable.range
                     self.nextstates[g] = next_state
                     self.prevstates[next_state] = g
-                    self.cpfs[next_state] = ([], grounded_cpf.expr)
+                    self._add_cpf(next_state, cpf, g, grounded_name_to_params_dict[g])
                     self.cpforder[0].append(g)
                     self.gvar_to_cpforder[g] = 0
                     self.gvar_to_type[g] = vtype
@@ -284,11 +333,8 @@ class RDDLGrounder(Grounder):
                     raise RDDLMissingCPFDefinitionError(
                         'CPF <{}> is missing a valid definition.'.format(name))
                 for g in grounded:
-                    grounded_cpf = self._ground_single_cpf(
-                        cpf, g, grounded_name_to_params_dict[g])
-                    all_grounded_derived_cpfs.append(grounded_cpf)
                     self.derived[g] = pvariable.default
-                    self.cpfs[g] = ([], grounded_cpf.expr)
+                    self._add_cpf(g, cpf, g, grounded_name_to_params_dict[g])
                     level = pvariable.level
                     if level is None:
                         level = 1
@@ -309,11 +355,8 @@ class RDDLGrounder(Grounder):
                     raise RDDLMissingCPFDefinitionError(
                         'CPF <{}> is missing a valid definition.'.format(name))
                 for g in grounded:
-                    grounded_cpf = self._ground_single_cpf(
-                        cpf, g, grounded_name_to_params_dict[g])
-                    all_grounded_interim_cpfs.append(grounded_cpf)
                     self.interm[g] = pvariable.default
-                    self.cpfs[g] = ([], grounded_cpf.expr)
+                    self._add_cpf(g, cpf, g, grounded_name_to_params_dict[g])
                     level = pvariable.level
                     if level is None:
                         level = 1
@@ -334,20 +377,30 @@ class RDDLGrounder(Grounder):
                     raise RDDLMissingCPFDefinitionError(
                         'CPF <{}> is missing a valid definition.'.format(name))
                 for g in grounded:
-                    grounded_cpf = self._ground_single_cpf(
-                        cpf, g, grounded_name_to_params_dict[g])
-                    all_grounded_observ_cpfs.append(grounded_cpf)
                     self.observ[g] = pvariable.default
                     self.observranges[g] = pvariable.range
-                    self.cpfs[g] = ([], grounded_cpf.expr)
+                    self._add_cpf(g, cpf, g, grounded_name_to_params_dict[g])
                     self.cpforder[0].append(g)
                     self.gvar_to_type[g] = vtype
                     self.gvar_to_cpforder[g] = 0
 
-        # self.AST.domain.cpfs = (self.AST.domain.cpfs[0], all_grounded_state_cpfs
-        #                        )  # replacing the previous lifted entries
-        # self.AST.domain.derived_cpfs = all_grounded_derived_cpfs
-        # self.AST.domain.intermediate_cpfs = all_grounded_interim_cpfs
+    def _add_cpf(self, name, cpf, variable, variable_args):
+        if self.lazy:
+            self.cpfs.defer(name, cpf, variable, variable_args)
+        else:
+            grounded_cpf = self._ground_single_cpf(cpf, variable, variable_args)
+            self.cpfs[name] = ([], grounded_cpf.expr)
+
+    def _ground_cpf_expr(self, cpf, variable, variable_args):
+        """Grounds the expression of a cpf without copying the cpf."""
+        args = cpf.pvar[1][1]
+        if args is None:
+            return self._scan_expr_tree(cpf.expr, {})
+        if len(args) != len(variable_args):
+            raise RDDLInvalidNumberOfArgumentsError(
+                f'Ground instance <{variable}> is of arity {len(variable_args)} but '
+                f'was expected to be of arity {len(args)} according to declaration.')
+        return self._scan_expr_tree(cpf.expr, dict(zip(args, variable_args)))
 
     def _ground_single_cpf(self, cpf, variable, variable_args):
         """Map arguments to actual objects."""
@@ -386,11 +439,11 @@ class RDDLGrounder(Grounder):
 
         new_children = []
         for instance_idx in range(len(instances_list)):
-            updated_dict = copy.deepcopy(original_dict)
+            updated_dict = original_dict.copy()
             updated_dict.update(dict(zip(new_variables_list, instances_list[instance_idx])))
             new_children.append(self._scan_expr_tree(expression, updated_dict))
         # --end for loop through instances
-        new_expr = Expression((operation_string, tuple(new_children)))
+        new_expr = self._expression((operation_string, tuple(new_children)))
         return new_expr
 
     def _scan_expr_tree_pvar(self, expr: Expression, dic) -> Expression:
@@ -408,7 +461,7 @@ class RDDLGrounder(Grounder):
                 variation_list.append(dic[arg])
             variation_list = [variation_list]
             new_name = self._generate_grounded_names(expr.args[0], variation_list)[0]
-            expr = Expression(('pvar_expr', (new_name, None)))
+            expr = self._expression(('pvar_expr', (new_name, None)))
         else:
             raise RDDLInvalidExpressionError(f'Malformed expression <{str(expr)}>.')
         return expr
@@ -417,7 +470,7 @@ class RDDLGrounder(Grounder):
         new_children = []
         for child in expr.args:
             new_children.append(self._scan_expr_tree(child, dic))
-        return Expression((expr.etype[1], tuple(new_children)))
+        return self._expression((expr.etype[1], tuple(new_children)))
 
     def _scan_expr_tree_control(self, expr, dic):
         children_list = [
@@ -426,13 +479,13 @@ class RDDLGrounder(Grounder):
             self._scan_expr_tree(expr.args[2], dic)
         ]
         # TODO: add default case when no "else". For now, we are safe, as else is expected in rddl
-        return Expression(('if', tuple(children_list)))
+        return self._expression(('if', tuple(children_list)))
 
     def _scan_expr_tree_func(self, expr, dic):
         new_children = []
         for child in expr.args:
             new_children.append(self._scan_expr_tree(child, dic))
-        return Expression((expr.etype[0], (expr.etype[1], new_children)))  # Only one arg for abs.
+        return self._expression((expr.etype[0], (expr.etype[1], new_children)))  # Only one arg for abs.
 
     def _scan_expr_tree_aggregation(self, expr, dic):
         """Ground out an aggregation expression."""
@@ -465,15 +518,8 @@ class RDDLGrounder(Grounder):
                     instances_def_args[2 * x + 1]
                     for x in range(int(len(instances_def_args) / 2))
                 ]
-                instance_tuples = [
-                    tuple([x]) for x in self.objects[object_type_list[0]]
-                ]
-                for var_idx in range(1, len(var_key_strings_list)):
-                    instance_tuples = [
-                        tuple(list(instance_tuples[i]) + [self.objects[object_type_list[var_idx]][j]])
-                        for i in range(len(instance_tuples))
-                        for j in range(len(self.objects[object_type_list[var_idx]]))
-                    ]
+                instance_tuples = list(itertools.product(
+                    *(self.objects[otype] for otype in object_type_list)))
                 object_instances_list = instance_tuples
                 expr = self.do_aggregate_expression_grounding(
                     dic, var_key_strings_list, object_instances_list,
@@ -483,14 +529,48 @@ class RDDLGrounder(Grounder):
                     num_instances = len(instance_tuples)  # Needed if this is an "Avg" operation.
                     # Then the 'expr' becomes lhs argument and
                     # we add a "\ |set_size|" operation.
-                    children_list = [expr, Expression(('number', num_instances))]
+                    children_list = [expr, self._expression(('number', num_instances))]
                     # Note "expr" would have been an aggregate sum already,
                     # the "aggreg_recursive_operation_string" is set for that.
-                    expr = Expression(('/', tuple(children_list)))
+                    expr = self._expression(('/', tuple(children_list)))
             return expr
 
+    def _expr_free_variables(self, expr):
+        """Returns the sorted parameters that occur free in a lifted expression."""
+        key = id(expr)
+        free = self._free_variables.get(key, None)
+        if free is None:
+            free = set()
+            etype = expr.etype[0]
+            if etype == 'pvar':
+                free.update(expr.args[1] or ())
+            elif etype != 'constant':
+                bound = set()
+                for arg in expr.args:
+                    if isinstance(arg, Expression):
+                        free.update(self._expr_free_variables(arg))
+                    elif isinstance(arg, tuple) and arg and arg[0] == 'typed_var':
+                        bound.add(arg[1][0])
+                free.difference_update(bound)
+            free = self._free_variables[key] = tuple(sorted(free))
+        return free
+
     def _scan_expr_tree(self, expr: Expression, dic) -> Expression:
         """Main dispatch method for recursively grounding the expression tree."""
+        
+        # in lazy mode a lifted subtree is grounded once for each assignment
+        # of objects to its free parameters
+        if self.lazy and isinstance(expr, Expression):
+            key = (id(expr), tuple((var, dic[var]) 
+                                   for var in self._expr_free_variables(expr)
+                                   if var in dic))
+            grounded = self._grounded.get(key, None)
+            if grounded is None:
+                grounded = self._grounded[key] = self._scan_expr_tree_dispatch(expr, dic)
+            return grounded
+        return self._scan_expr_tree_dispatch(expr, dic)
+    
+    def _scan_expr_tree_dispatch(self, expr: Expression, dic) -> Expression:
         scan_expr_tree_noop = lambda expr, _: expr
         dispatch_dict = {
             'noop': scan_expr_tree_noop,
@@ -517,7 +597,7 @@ class RDDLGrounder(Grounder):
                 new_children.append(self._scan_expr_tree(child, dic))
             # If we reached here the expression is either a +,*, or comparator (>,<),
             # or aggregator (sum, product).
-            return Expression((expr.etype[1], tuple(new_children)))
+            return self._expression((expr.etype[1], tuple(new_children)))
 
     def _ground_constraints(self) -> None:
         if hasattr(self.AST.domain, 'terminals'):
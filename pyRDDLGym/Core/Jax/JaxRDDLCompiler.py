@@ -12,6 +12,7 @@ from pyRDDLGym.Core.Compiler.RDDLDecompiler import RDDLDecompiler
 from pyRDDLGym.Core.Compiler.RDDLLiftedModel import RDDLLiftedModel
 from pyRDDLGym.Core.Compiler.RDDLLevelAnalysis import RDDLLevelAnalysis
 from pyRDDLGym.Core.Parser.expr import Expression
+from pyRDDLGym.Core.Simulator.RDDLContraction import RDDLContraction
 from pyRDDLGym.Core.Simulator.RDDLTensors import RDDLTensors
 
 
@@ -510,6 +511,13 @@ class JaxRDDLCompiler:
                         f'in outer scope.\n' + 
                         JaxRDDLCompiler._print_stack_trace(expr))
                         
+        # sums over products of deterministic factors are contracted directly
+        if self.ARITHMETIC_OPS['*'] is jnp.multiply \
+        and valid_ops[op] in (jnp.sum, jnp.mean):
+            contraction = RDDLContraction(self.rddl).plan(expr, objects)
+            if contraction is not None:
+                return self._jax_contraction(contraction, expr, objects)
+                        
         jax_expr = self._jax(arg, new_objects)
         jax_op = valid_ops[op]        
         
@@ -528,6 +536,32 @@ class JaxRDDLCompiler:
         )
                 
         return _f
+    
+    def _jax_contraction(self, contraction, expr, objects):
+        ERR = JaxRDDLCompiler.ERROR_CODES['NORMAL']
+        jax_factors = [self._jax(factor, f_objects)
+                       for factor, f_objects in zip(contraction.factors,
+                                                    contraction.factor_objects)]
+        
+        def _f(x, key):
+            vals, err = [], ERR
+            for jax_factor in jax_factors:
+                val, key, err_factor = jax_factor(x, key)
+                vals.append(val)
+                err |= err_factor
+            sample = contraction.contract(vals, gnp=jnp)
+            return sample, key, err
+        
+        # debug compiler info
+        self.tensors.write_debug_message(
+            f'compiling static graph for contraction:'
+                f'\n\toperator       ={contraction.op} {expr.args[:-1]}'
+                f'\n\tfactor objects ={contraction.factor_objects}'
+                f'\n\toutput objects ={objects}'
+                f'\n\tsubscripts     ={contraction.subscripts}\n'
+        )
+        
+        return _f
                
     def _jax_functional(self, expr, objects):
         _, op = expr.etype
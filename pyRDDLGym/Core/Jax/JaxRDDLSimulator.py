@@ -9,6 +9,7 @@ from pyRDDLGym.Core.ErrorHandling.RDDLException import RDDLStateInvariantNotSati
 from pyRDDLGym.Core.Compiler.RDDLLiftedModel import RDDLLiftedModel
 from pyRDDLGym.Core.Jax.JaxRDDLCompiler import JaxRDDLCompiler
 from pyRDDLGym.Core.Parser.expr import Value
+from pyRDDLGym.Core.Simulator.RDDLProfiler import RDDLProfiler
 from pyRDDLGym.Core.Simulator.RDDLSimulator import RDDLSimulator
 
 Args = Dict[str, Value]
@@ -19,6 +20,7 @@ class JaxRDDLSimulator(RDDLSimulator):
     def __init__(self, rddl: RDDLLiftedModel,
                  key: jax.random.PRNGKey,
                  raise_error: bool=False,
+                 profiler: RDDLProfiler=None,
                  **compiler_args) -> None:
         
         # jax compilation will only work on lifted domains for now
@@ -29,6 +31,8 @@ class JaxRDDLSimulator(RDDLSimulator):
         self.rddl = rddl
         self.key = key
         self.raise_error = raise_error
+        self.profiler = profiler
+        self.validation = None
         
         # static analysis and compilation
         compiled = JaxRDDLCompiler(rddl, **compiler_args)
@@ -58,7 +62,22 @@ class JaxRDDLSimulator(RDDLSimulator):
                                for var, ftype in rddl.variable_types.items()
                                if ftype == 'observ-fluent']
         self._pomdp = bool(self.observ_fluents)
+
+        # states and observations are returned as grounded dicts
+        self.fluent_format = 'grounded'
+        self.state_layout = self.tensors.layout(self.next_states.values())
+        self.observ_layout = self.tensors.layout(self.observ_fluents)
+        self.action_layout = self.tensors.layout(self.noop_actions)
+        self._state_buffer = RDDLSimulator._allocate(self.state_layout)
+        self._observ_buffer = RDDLSimulator._allocate(self.observ_layout)
         
+        # jax arrays are immutable, so values are never written in place, and
+        # the random stream is the key
+        self._buffers = None
+        self.incremental = None
+        self.rng = None
+        self._samplers = {}
+
     def handle_error_code(self, error, msg) -> None:
         if self.raise_error:
             errors = JaxRDDLCompiler.get_error_messages(error)
@@ -67,43 +86,90 @@ class JaxRDDLSimulator(RDDLSimulator):
                 errors = '\n'.join(f'{i + 1}. {s}' for i, s in enumerate(errors))
                 raise RDDLInvalidExpressionError(message + errors)
     
+    def _get_rng_state(self):
+        return self.key
+    
+    def _set_rng_state(self, state):
+        self.key = state
+    
+    def _record(self, category, name, start, value=None):
+        
+        # jax dispatches asynchronously, so wait for the result to be ready
+        if value is not None:
+            value = jax.block_until_ready(value)
+        self.profiler.record(category, name, start, value)
+        
     def check_state_invariants(self) -> None:
         '''Throws an exception if the state invariants are not satisfied.'''
+        profiler = self.profiler
+        if profiler is not None:
+            phase_start = profiler.now()
         for i, invariant in enumerate(self.invariants):
+            if profiler is not None:
+                start = profiler.now()
             sample, self.key, error = invariant(self.subs, self.key)
+            if profiler is not None:
+                self._record('invariant', f'invariant {i + 1}', start, sample)
             self.handle_error_code(error, f'invariant {i + 1}')
             
             if not bool(sample):
                 raise RDDLStateInvariantNotSatisfiedError(
                     f'Invariant {i + 1} is not satisfied.')
+        if profiler is not None:
+            self._record('phase', 'invariants', phase_start)
     
     def check_action_preconditions(self, actions: Args) -> None:
         '''Throws an exception if the action preconditions are not satisfied.'''
+        profiler = self.profiler
+        if profiler is not None:
+            phase_start = profiler.now()
         actions = self._process_actions(actions)
         subs = self.subs
         subs.update(actions)
         
         for i, precond in enumerate(self.preconds):
+            if profiler is not None:
+                start = profiler.now()
             sample, self.key, error = precond(self.subs, self.key)
+            if profiler is not None:
+                self._record('precondition', f'precondition {i + 1}', start, sample)
             self.handle_error_code(error, f'precondition {i + 1}')
             
             if not bool(sample):
                 raise RDDLActionPreconditionNotSatisfiedError(
                     f'Precondition {i + 1} is not satisfied.')
+        if profiler is not None:
+            self._record('phase', 'preconditions', phase_start)
     
     def check_terminal_states(self) -> bool:
         '''return True if a terminal state has been reached.'''
+        profiler = self.profiler
+        if profiler is not None:
+            phase_start = profiler.now()
+        done = False
         for i, terminal in enumerate(self.terminals):
+            if profiler is not None:
+                start = profiler.now()
             sample, self.key, error = terminal(self.subs, self.key)
+            if profiler is not None:
+                self._record('termination', f'termination {i + 1}', start, sample)
             self.handle_error_code(error, f'termination {i + 1}')           
              
             if bool(sample):
-                return True
-        return False
+                done = True
+                break
+        if profiler is not None:
+            self._record('phase', 'termination', phase_start)
+        return done
     
     def sample_reward(self) -> float:
         '''Samples the current reward given the current state and action.'''
+        profiler = self.profiler
+        if profiler is not None:
+            start = profiler.now()
         reward, self.key, error = self.reward(self.subs, self.key)
+        if profiler is not None:
+            self._record('phase', 'reward', start, reward)
         self.handle_error_code(error, 'reward function')
         return float(reward)
     
@@ -112,19 +178,37 @@ class JaxRDDLSimulator(RDDLSimulator):
         
         :param actions: a dict mapping current action fluents to their values
         '''
+        profiler = self.profiler
+        if profiler is not None:
+            step_start = start = profiler.now()
         actions = self._process_actions(actions)
         subs = self.subs
         subs.update(actions)
+        if profiler is not None:
+            self._record('phase', 'actions', start)
+            cpfs_start = profiler.now()
         
-        for cpfs in self.levels.values():
+        for level, cpfs in self.levels.items():
+            if profiler is not None:
+                level_start = profiler.now()
             for cpf in cpfs:
+                if profiler is not None:
+                    start = profiler.now()
                 subs[cpf], self.key, error = self.cpfs[cpf](subs, self.key)
+                if profiler is not None:
+                    self._record('cpf', cpf, start, subs[cpf])
                 self.handle_error_code(error, f'CPF <{cpf}>')            
+            if profiler is not None:
+                self._record('level', f'level {level}', level_start)
+        if profiler is not None:
+            self._record('phase', 'cpfs', cpfs_start)
         reward = self.sample_reward()
         
         for next_state, state in self.next_states.items():
             subs[state] = subs[next_state]
         
+        if profiler is not None:
+            start = profiler.now()
         self.state = {}
         for var in self.next_states.values():
             self.state.update(self.tensors.expand(var, subs[var]))
@@ -135,7 +219,11 @@ class JaxRDDLSimulator(RDDLSimulator):
                 obs.update(self.tensors.expand(var, subs[var]))
         else:
             obs = self.state
+        if profiler is not None:
+            self._record('phase', 'expand', start)
         
         done = self.check_terminal_states()        
+        if profiler is not None:
+            self._record('phase', 'step', step_start)
         return obs, reward, done
         
@@ -1,51 +1,134 @@
-
+import io
+import os
 import re
 
+from pyRDDLGym.Core.ErrorHandling.RDDLException import RDDLParseError
+
+
 class RDDLReader(object):
+    '''Reads a RDDL domain and instance, strips comments and redundant empty
+    lines, and checks that the domain, non-fluents and instance blocks are
+    present. The input is processed line by line in a single linear pass.
 
-    comment = r'\/\/.*?\n'
-    comment_ws = r'(\s*?\n\s*?)+'
-    domain_block = r'(?s)domain.*?\{.*?pvariables.*?cpfs.*?reward.*?;.*?\}[^;]'
-    nonfluent_in_domain = r'(?s)\{\s*?non-fluent,.*?\};'
-    nonfluent_block = r'(?s)non-fluents[^=]*?\{.*?\}[^;]'
-    instance_block = r'(?s)instance.*?\{.*\}[^;]'
+    The domain and instance can each be given as a path to a file (a string
+    or a path-like object), an open text file object, or any iterable of
+    strings (e.g. a generator) whose concatenation is the RDDL text. Use
+    RDDLReader.from_text to read RDDL text that is already in memory.
+    '''
+
+    comment = '//'
+    token = re.compile(r'[{}]|[A-Za-z][\w\-]*')
 
     def __init__(self, dom, inst=None):
-        with open(dom) as file:
-            dom_txt = file.read()
-        dom_txt = self._removeComments(dom_txt)
-        dom_txt = dom_txt + '\n'
+        self._pieces = []
+        self._depth = 0
+        self._header = []
+        self._block = None
+        self._prev_token = None
+        self._blocks = set()
+        self._domain_sections = set()
+        self._domain_nonfluents = False
 
+        self._read(dom)
+        self._pieces.append('\n')
         if inst is not None:
-            with open(inst) as file:
-                inst_txt = file.read()
-            inst_txt = self._removeComments(inst_txt)
-            dom_txt = dom_txt + '\n\n' + inst_txt + '\n'
+            self._pieces.append('\n\n')
+            self._read(inst)
+            self._pieces.append('\n')
 
         # inspect rddl if three block are present - domain, non-fluent, instance
-        m = re.search(self.domain_block, dom_txt)
-        if m is None:
-            raise Exception("Syntax Error in domain block")
-
-        domaintxt = m.group(0)
-        m = re.search(self.nonfluent_in_domain, domaintxt)
-        if m is not None:
-            m = re.search(self.nonfluent_block, dom_txt)
-            if m is None:
-                raise Exception("Syntax Error in non-fluents block")
+        sections = self._domain_sections
+        if 'domain' not in self._blocks \
+        or not {'pvariables', 'reward'}.issubset(sections) \
+        or not {'cpfs', 'cdfs'}.intersection(sections):
+            raise RDDLParseError("Syntax Error in domain block")
+        if self._domain_nonfluents and 'non-fluents' not in self._blocks:
+            raise RDDLParseError("Syntax Error in non-fluents block")
+        if 'instance' not in self._blocks:
+            raise RDDLParseError("Syntax Error in instance block")
 
-        m = re.search(self.instance_block, dom_txt)
-        if m is None:
-            raise Exception("Syntax Error in instance block")
+        self.dom_txt = ''.join(self._pieces)
+        del self._pieces
 
-        self.dom_txt = dom_txt
+    @staticmethod
+    def from_text(dom_txt, inst_txt=None):
+        '''Reads a RDDL domain and instance from strings in memory.'''
+        if inst_txt is not None:
+            inst_txt = io.StringIO(inst_txt)
+        return RDDLReader(io.StringIO(dom_txt), inst_txt)
 
     @property
     def rddltxt(self):
         return self.dom_txt
 
+    @staticmethod
+    def _lines(source):
+        if isinstance(source, (str, os.PathLike)):
+            with open(source) as file:
+                yield from file
+        elif hasattr(source, 'readline'):
+            yield from source
+        else:
+            partial = ''
+            for chunk in source:
+                lines = (partial + chunk).split('\n')
+                partial = lines.pop()
+                for line in lines:
+                    yield line + '\n'
+            if partial:
+                yield partial
+
+    def _read(self, source):
+
+        # a run of whitespace spanning one or more line breaks is replaced by
+        # a single line break, and comments are removed up to the line break
+        pieces = self._pieces
+        pending_newline = False
+        for line in RDDLReader._lines(source):
+            index = line.find(self.comment)
+            if index >= 0:
+                line = line[:index] + '\n'
+            if line.endswith('\n'):
+                line = line[:-1].rstrip()
+                if not line:
+                    pending_newline = True
+                    continue
+                if pending_newline:
+                    pieces.append('\n')
+                pieces.append(line)
+                pending_newline = True
+            else:
+                if pending_newline:
+                    pieces.append('\n')
+                pieces.append(line)
+                pending_newline = False
+            self._scan(line)
+        if pending_newline:
+            pieces.append('\n')
+
+    def _scan(self, line):
+
+        # inside the non-fluents and instance blocks only braces matter
+        if self._depth > 0 and self._block != 'domain' \
+        and '{' not in line and '}' not in line:
+            return
 
-    def _removeComments(self, txt):
-        txt = re.sub(self.comment, '\n', txt)
-        txt = re.sub(self.comment_ws, '\n', txt)
-        return txt
+        for token in self.token.findall(line):
+            if token == '{':
+                if self._depth == 0 and self._header:
+                    self._block = self._header[0]
+                    self._blocks.add(self._block)
+                self._depth += 1
+            elif token == '}':
+                self._depth = max(self._depth - 1, 0)
+                if self._depth == 0:
+                    self._block = None
+                    self._header = []
+            elif self._depth == 0:
+                self._header.append(token)
+            elif self._block == 'domain':
+                if self._depth == 1:
+                    self._domain_sections.add(token)
+                if token == 'non-fluent' and self._prev_token == '{':
+                    self._domain_nonfluents = True
+            self._prev_token = token
@@ -8,84 +8,86 @@ Value = Union[bool, int, float]
 ExprArg = Union['Expression', Tuple, str]
 
 
+# maps the head symbol of an expression tuple to its type and an integer code
+_ARITHMETIC = ('arithmetic', 3)
+_BOOLEAN = ('boolean', 4)
+_RELATIONAL = ('relational', 5)
+_AGGREGATION = ('aggregation', 7)
+_CONTROL = ('control', 8)
+EXPRESSION_TYPES = {
+    'number': ('constant', 0),
+    'boolean': ('constant', 0),
+    'pvar_expr': ('pvar', 1),
+    'randomvar': ('randomvar', 2),
+    '+': _ARITHMETIC, '-': _ARITHMETIC, '*': _ARITHMETIC, '/': _ARITHMETIC,
+    '^': _BOOLEAN, '&': _BOOLEAN, '|': _BOOLEAN, '~': _BOOLEAN,
+    '=>': _BOOLEAN, '<=>': _BOOLEAN,
+    '>=': _RELATIONAL, '<=': _RELATIONAL, '<': _RELATIONAL, '>': _RELATIONAL,
+    '==': _RELATIONAL, '~=': _RELATIONAL,
+    'func': ('func', 6),
+    'sum': _AGGREGATION, 'prod': _AGGREGATION, 'avg': _AGGREGATION,
+    'max': _AGGREGATION, 'min': _AGGREGATION,
+    'forall': _AGGREGATION, 'exists': _AGGREGATION,
+    'if': _CONTROL, 'switch': _CONTROL
+}
+AGGREGATION_NAMES = {'max': 'maximum', 'min': 'minimum'}
+
+
 class Expression(object):
     '''Expression class represents a RDDL expression.
     Note:
         This class is intended to be solely used by the parser and compiler.
         Do not attempt to directly use this class to build an Expression object.
+        Expressions are immutable: the type, op code and arguments are resolved
+        once on construction, and no other attributes can be attached.
     Args:
         expr: Expression object or nested tuple of Expressions.
     '''
+    
+    CONSTANT = 0
+    PVAR = 1
+    RANDOMVAR = 2
+    ARITHMETIC = 3
+    BOOLEAN = 4
+    RELATIONAL = 5
+    FUNC = 6
+    AGGREGATION = 7
+    CONTROL = 8
+    UNKNOWN = -1
+    
+    __slots__ = ('_expr', 'etype', 'args', 'op_code')
 
     def __init__(self, expr: Union['Expression', Tuple]) -> None:
+        if isinstance(expr, Expression):
+            expr = expr._expr
         self._expr = expr
+        head = expr[0]
+        etype, self.op_code = EXPRESSION_TYPES.get(head, ('UNKOWN', -1))
+        if etype == 'constant':
+            self.etype = (etype, str(type(expr[1])))
+            self.args = expr[1]
+        elif etype in ('pvar', 'randomvar', 'func'):
+            if etype == 'pvar':
+                self.args = expr[1]
+            else:
+                self.args = expr[1][1]
+            self.etype = (etype, expr[1][0])
+        elif etype == 'aggregation':
+            self.etype = (etype, AGGREGATION_NAMES.get(head, head))
+            self.args = expr[1]
+        elif etype == 'UNKOWN':
+            self.etype = ('UNKOWN', 'UNKOWN')
+            self.args = []
+        else:
+            self.etype = (etype, head)
+            self.args = expr[1]
+    
+    def __reduce__(self):
+        return (Expression, (self._expr,))
 
     def __getitem__(self, i):
         return self._expr[i]
 
-    @property
-    def etype(self) -> Tuple[str, str]:
-        '''Returns the expression's type.'''
-        if self._expr[0] in ['number', 'boolean']:
-            return ('constant', str(type(self._expr[1])))
-        elif self._expr[0] == 'pvar_expr':
-            return ('pvar', self._expr[1][0])
-        elif self._expr[0] == 'randomvar':
-            return ('randomvar', self._expr[1][0])
-        elif self._expr[0] in ['+', '-', '*', '/']:
-            return ('arithmetic', self._expr[0])
-        elif self._expr[0] in ['^', '&', '|', '~', '=>', '<=>']:
-            return ('boolean', self._expr[0])
-        elif self._expr[0] in ['>=', '<=', '<', '>', '==', '~=']:
-            return ('relational', self._expr[0])
-        elif self._expr[0] == 'func':
-            return ('func', self._expr[1][0])
-        elif self._expr[0] == 'sum':
-            return ('aggregation', 'sum')
-        elif self._expr[0] == 'prod':
-            return ('aggregation', 'prod')
-        elif self._expr[0] == 'avg':
-            return ('aggregation', 'avg')
-        elif self._expr[0] == 'max':
-            return ('aggregation', 'maximum')
-        elif self._expr[0] == 'min':
-            return ('aggregation', 'minimum')
-        elif self._expr[0] == 'forall':
-            return ('aggregation', 'forall')
-        elif self._expr[0] == 'exists':
-            return ('aggregation', 'exists')
-        elif self._expr[0] == 'if':
-            return ('control', 'if')
-        elif self._expr[0] == 'switch':
-            return ('control', 'switch')
-        else:
-            return ('UNKOWN', 'UNKOWN')
-
-    @property
-    def args(self) -> Union[Value, Sequence[ExprArg]]:
-        '''Returns the expression's arguments.'''
-        if self._expr[0] in ['number', 'boolean']:
-            return self._expr[1]
-        elif self._expr[0] == 'pvar_expr':
-            return self._expr[1]
-        elif self._expr[0] == 'randomvar':
-            return self._expr[1][1]
-        elif self._expr[0] in ['+', '-', '*', '/']:
-            return self._expr[1]
-        elif self._expr[0] in ['^', '&', '|', '~', '=>', '<=>']:
-            return self._expr[1]
-        elif self._expr[0] in ['>=', '<=', '<', '>', '==', '~=']:
-            return self._expr[1]
-        elif self._expr[0] == 'func':
-            return self._expr[1][1]
-        elif self._expr[0] in ['sum', 'prod', 'avg', 'max', 'min', 'forall', 'exists']:
-            return self._expr[1]
-        # elif self._expr[0] == 'if':
-        elif self._expr[0] in ['if', 'switch']:
-            return self._expr[1]
-        else:
-            return []
-
     def is_constant_expression(self) -> bool:
         '''Returns True if constant expression. False, othersize.'''
         return self.etype[0] == 'constant'
@@ -183,3 +185,35 @@ class Expression(object):
         functor = pvar_expr[0]
         arity = len(pvar_expr[1]) if pvar_expr[1] is not None else 0
         return '{}/{}'.format(functor, arity)
+
+
+class ExpressionTable(object):
+    '''Hash-consing table of expressions: calling the table on an expression
+    tuple whose sub-expressions were also built by the table returns a single
+    shared Expression node for all structurally identical subtrees.
+    '''
+    
+    def __init__(self) -> None:
+        self._nodes = {}
+    
+    def __len__(self) -> int:
+        return len(self._nodes)
+    
+    def __call__(self, expr: Tuple) -> Expression:
+        try:
+            key = ExpressionTable._key(expr)
+            node = self._nodes.get(key, None)
+        except TypeError:
+            return Expression(expr)
+        if node is None:
+            node = self._nodes[key] = Expression(expr)
+        return node
+    
+    @staticmethod
+    def _key(atom):
+        if isinstance(atom, Expression):
+            return id(atom)
+        elif isinstance(atom, (tuple, list)):
+            return (type(atom),) + tuple(map(ExpressionTable._key, atom))
+        else:
+            return (type(atom), atom)
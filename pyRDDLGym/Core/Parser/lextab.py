@@ -0,0 +1,10 @@
+# lextab.py. This file automatically created by PLY (version 3.11). Don't edit!
+_tabversion   = '3.10'
+_lextokens    = set(('ACTION', 'ACTION_PRECONDITIONS', 'AMPERSAND', 'AND', 'ASSIGN_EQUAL', 'BERNOULLI', 'BETA', 'BINOMIAL', 'BOOL', 'CASE', 'CAUCHY', 'CDFS', 'COLON', 'COMMA', 'COMP_EQUAL', 'CPFS', 'DEFAULT', 'DERIVED_FLUENT', 'DIRAC_DELTA', 'DIRICHLET', 'DISCOUNT', 'DISCRETE', 'DIV', 'DOLLAR_SIGN', 'DOMAIN', 'DOT', 'DOUBLE', 'ELSE', 'ENUM_VAL', 'EQUIV', 'EXISTS', 'EXPONENTIAL', 'FALSE', 'FORALL', 'GAMMA', 'GEOMETRIC', 'GOMPERTZ', 'GREATER', 'GREATEREQ', 'GUMBEL', 'HORIZON', 'IDENT', 'IF', 'IMPLY', 'INIT_STATE', 'INSTANCE', 'INT', 'INTEGER', 'INTERMEDIATE', 'KRON_DELTA', 'LAPLACE', 'LBRACK', 'LCURLY', 'LESS', 'LESSEQ', 'LEVEL', 'LPAREN', 'MAX_NONDEF_ACTIONS', 'MINUS', 'MULTINOMIAL', 'NEGATIVEBINOMIAL', 'NEG_INF', 'NEQ', 'NON_FLUENT', 'NON_FLUENTS', 'NORMAL', 'NOT', 'OBJECT', 'OBJECTS', 'OBSERVATION', 'OR', 'OTHERWISE', 'PARETO', 'PLUS', 'POISSON', 'POS_INF', 'PVARIABLES', 'QUESTION', 'RBRACK', 'RCURLY', 'REAL', 'REQUIREMENTS', 'REWARD', 'RPAREN', 'SEMI', 'STATE', 'STATE_ACTION_CONSTRAINTS', 'STATE_INVARIANTS', 'STUDENT', 'SWITCH', 'TERMINAL', 'TERMINATE_WHEN', 'TERMINATION', 'THEN', 'TIMES', 'TRUE', 'TYPES', 'UNDERSCORE', 'UNIFORM', 'VAR', 'WEIBULL'))
+_lexreflags   = 64
+_lexliterals  = ''
+_lexstateinfo = {'INITIAL': 'inclusive'}
+_lexstatere   = {'INITIAL': [("(?P<t_newline>\\n+)|(?P<t_COMMENT>//[^\\r\\n]*)|(?P<t_IDENT>([A-Za-z])(([A-Za-z]|[0-9]|\\-|\\_)*([A-Za-z]|[0-9]))?(\\')?)|(?P<t_VAR>\\?([A-Za-z]|[0-9]|\\-|\\_)*([A-Za-z]|[0-9]))|(?P<t_ENUM_VAL>\\@([A-Za-z]|[0-9]|\\-|\\_)*([A-Za-z]|[0-9]))|(?P<t_DOUBLE>[0-9]*\\.[0-9]+)|(?P<t_INTEGER>[0-9]+)|(?P<t_EQUIV><=>)|(?P<t_AMPERSAND>\\&)|(?P<t_AND>\\^)|(?P<t_COMMA>\\,)|(?P<t_COMP_EQUAL>==)|(?P<t_DOLLAR_SIGN>\\$)|(?P<t_DOT>\\.)|(?P<t_GREATEREQ>>=)|(?P<t_IMPLY>=>)|(?P<t_LBRACK>\\[)|(?P<t_LCURLY>\\{)|(?P<t_LESSEQ><=)|(?P<t_LPAREN>\\()|(?P<t_NEQ>~=)|(?P<t_OR>\\|)|(?P<t_PLUS>\\+)|(?P<t_QUESTION>\\?)|(?P<t_RBRACK>\\])|(?P<t_RCURLY>\\})|(?P<t_RPAREN>\\))|(?P<t_TIMES>\\*)|(?P<t_UNDERSCORE>\\_)|(?P<t_ASSIGN_EQUAL>=)|(?P<t_COLON>:)|(?P<t_DIV>/)|(?P<t_GREATER>>)|(?P<t_LESS><)|(?P<t_MINUS>-)|(?P<t_NOT>~)|(?P<t_SEMI>;)", [None, ('t_newline', 'newline'), ('t_COMMENT', 'COMMENT'), ('t_IDENT', 'IDENT'), None, None, None, None, None, ('t_VAR', 'VAR'), None, None, ('t_ENUM_VAL', 'ENUM_VAL'), None, None, ('t_DOUBLE', 'DOUBLE'), ('t_INTEGER', 'INTEGER'), (None, 'EQUIV'), (None, 'AMPERSAND'), (None, 'AND'), (None, 'COMMA'), (None, 'COMP_EQUAL'), (None, 'DOLLAR_SIGN'), (None, 'DOT'), (None, 'GREATEREQ'), (None, 'IMPLY'), (None, 'LBRACK'), (None, 'LCURLY'), (None, 'LESSEQ'), (None, 'LPAREN'), (None, 'NEQ'), (None, 'OR'), (None, 'PLUS'), (None, 'QUESTION'), (None, 'RBRACK'), (None, 'RCURLY'), (None, 'RPAREN'), (None, 'TIMES'), (None, 'UNDERSCORE'), (None, 'ASSIGN_EQUAL'), (None, 'COLON'), (None, 'DIV'), (None, 'GREATER'), (None, 'LESS'), (None, 'MINUS'), (None, 'NOT'), (None, 'SEMI')])]}
+_lexstateignore = {'INITIAL': ' \t'}
+_lexstateerrorf = {'INITIAL': 't_error'}
+_lexstateeoff = {}
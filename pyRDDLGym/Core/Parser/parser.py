@@ -6,6 +6,7 @@ import logging
 
 import os
 import tempfile
+import threading
 
 from ply import lex, yacc
 
@@ -14,7 +15,7 @@ from pyRDDLGym.Core.Parser.domain import Domain
 from pyRDDLGym.Core.Parser.nonfluents import NonFluents
 from pyRDDLGym.Core.Parser.instance import Instance
 from pyRDDLGym.Core.Parser.pvariable import PVariable
-from pyRDDLGym.Core.Parser.expr import Expression
+from pyRDDLGym.Core.Parser.expr import Expression, ExpressionTable
 from pyRDDLGym.Core.Parser.cpf import CPF
 from pyRDDLGym.Core.ErrorHandling.RDDLException import RDDLParseError
 
@@ -26,6 +27,11 @@ double = digit + r'*\.' + digit + r'+'
 variable = r'\?(' + alpha + r'|' + digit + r'|\-|\_)*(' + alpha + r'|' + digit + r')'
 enum_value = r'\@(' + alpha + r'|' + digit + r'|\-|\_)*(' + alpha + r'|' + digit + r')'
 
+# the lexer and LALR tables are generated ahead of time and shipped with the
+# package; to regenerate them after changing the grammar, run this module
+LEXTAB = 'pyRDDLGym.Core.Parser.lextab'
+PARSETAB = 'pyRDDLGym.Core.Parser.parsetab'
+
 
 class RDDLlex(object):
 
@@ -208,6 +214,8 @@ class RDDLlex(object):
         t.lexer.skip(1)
 
     def build(self, **kwargs):
+        kwargs.setdefault('optimize', True)
+        kwargs.setdefault('lextab', LEXTAB)
         self._lexer = lex.lex(object=self, **kwargs)
 
     def input(self, data):
@@ -228,12 +236,15 @@ class RDDLlex(object):
 
 class RDDLParser(object):
 
-    def __init__(self, lexer=None, verbose=False):
+    def __init__(self, lexer=None, verbose=False, intern=False):
         if lexer is None:
-            self.lexer = RDDLlex()
-            self.lexer.build()
+            lexer = RDDLlex()
+            lexer.build()
+        self.lexer = lexer
 
         self._verbose = verbose
+        self._intern = intern
+        self._expression = Expression
 
         self.tokens = self.lexer.tokens
 
@@ -255,6 +266,7 @@ class RDDLParser(object):
         )
         self.parsing_logfile = None
         self.debugging = False
+        self._lock = threading.Lock()
 
     def p_rddl(self, p):
         '''rddl : rddl_block'''
@@ -550,7 +562,7 @@ class RDDLParser(object):
                 | aggregation_expr
                 | control_expr
                 | randomvar_expr'''
-        p[0] = Expression(p[1])
+        p[0] = self._expression(p[1])
 
     def p_pvar_expr(self, p):
         '''pvar_expr : IDENT LPAREN term_list RPAREN
@@ -957,9 +969,35 @@ class RDDLParser(object):
         raise RDDLParseError(exception_str)
 
     def build(self, **kwargs):
+        kwargs.setdefault('tabmodule', PARSETAB)
+        kwargs.setdefault('write_tables', False)
+        kwargs.setdefault('debug', False)
         self._parser = yacc.yacc(module=self, **kwargs)
+    
+    _shared = None
+    _shared_lock = threading.Lock()
+    
+    @staticmethod
+    def shared() -> 'RDDLParser':
+        '''Returns a process-wide parser that is built once on first use and
+        can be reused to parse any number of RDDL files.'''
+        with RDDLParser._shared_lock:
+            if RDDLParser._shared is None:
+                parser = RDDLParser(lexer=None, verbose=False)
+                parser.build()
+                RDDLParser._shared = parser
+            return RDDLParser._shared
 
     def parse(self, input):
+        with self._lock:
+            return self._parse(input)
+    
+    def _parse(self, input):
+        
+        # identical subtrees share one node within each parsed file
+        if self._intern:
+            self._expression = ExpressionTable()
+        self.lexer._lexer.lineno = 1
         self._input = input
         if self.debugging:
             self.parsing_logfile = os.path.join(tempfile.gettempdir(), 'rddl_parse.log')
@@ -971,3 +1009,17 @@ class RDDLParser(object):
     def _print_verbose(self, p_name):
         if self._verbose:
             print('>> Parsed `{}` ...'.format(p_name))
+
+
+if __name__ == '__main__':
+    
+    # regenerates the lexer and LALR tables shipped with the package
+    outputdir = os.path.dirname(os.path.abspath(__file__))
+    for name in ('lextab.py', 'parsetab.py'):
+        path = os.path.join(outputdir, name)
+        if os.path.exists(path):
+            os.remove(path)
+    lexer = RDDLlex()
+    lexer.build(outputdir=outputdir)
+    parser = RDDLParser(lexer=None, verbose=False)
+    parser.build(write_tables=True, outputdir=outputdir)
@@ -0,0 +1,249 @@
+
+# parsetab.py
+# This file is automatically generated. Do not edit.
+# pylint: disable=W,C,R
+_tabversion = '3.10'
+
+_lr_method = 'LALR'
+
+_lr_signature = 'leftIFleftASSIGN_EQUALleftEXISTSleftFORALLleftAGG_OPERleftEQUIVleftIMPLYleftORleftANDAMPERSANDleftNOTleftCOMP_EQUALNEQLESSLESSEQGREATERGREATEREQleftPLUSMINUSleftTIMESDIVrightUMINUSACTION ACTION_PRECONDITIONS AMPERSAND AND ASSIGN_EQUAL BERNOULLI BETA BINOMIAL BOOL CASE CAUCHY CDFS COLON COMMA COMP_EQUAL CPFS DEFAULT DERIVED_FLUENT DIRAC_DELTA DIRICHLET DISCOUNT DISCRETE DIV DOLLAR_SIGN DOMAIN DOT DOUBLE ELSE ENUM_VAL EQUIV EXISTS EXPONENTIAL FALSE FORALL GAMMA GEOMETRIC GOMPERTZ GREATER GREATEREQ GUMBEL HORIZON IDENT IF IMPLY INIT_STATE INSTANCE INT INTEGER INTERMEDIATE KRON_DELTA LAPLACE LBRACK LCURLY LESS LESSEQ LEVEL LPAREN MAX_NONDEF_ACTIONS MINUS MULTINOMIAL NEGATIVEBINOMIAL NEG_INF NEQ NON_FLUENT NON_FLUENTS NORMAL NOT OBJECT OBJECTS OBSERVATION OR OTHERWISE PARETO PLUS POISSON POS_INF PVARIABLES QUESTION RBRACK RCURLY REAL REQUIREMENTS REWARD RPAREN SEMI STATE STATE_ACTION_CONSTRAINTS STATE_INVARIANTS STUDENT SWITCH TERMINAL TERMINATE_WHEN TERMINATION THEN TIMES TRUE TYPES UNDERSCORE UNIFORM VAR WEIBULLrddl : rddl_blockrddl_block : rddl_block domain_block\n                      | rddl_block instance_block\n                      | rddl_block nonfluent_block\n                      | emptydomain_block : DOMAIN IDENT LCURLY req_section domain_list RCURLYreq_section : REQUIREMENTS ASSIGN_EQUAL LCURLY string_list RCURLY SEMI\n                       | REQUIREMENTS LCURLY string_list RCURLY SEMI\n                       | emptydomain_list : domain_list type_section\n                       | domain_list pvar_section\n                       | domain_list cpf_section\n                       | domain_list reward_section\n                       | domain_list termination_section\n                       | domain_list action_precond_section\n                       | domain_list state_action_constraint_section\n                       | domain_list state_invariant_section\n                       | emptytype_section : TYPES LCURLY type_list RCURLY SEMItype_list : type_list type_def\n                     | emptytype_def : IDENT COLON OBJECT SEMI\n                    | IDENT COLON LCURLY enum_list RCURLY SEMIenum_list : enum_list COMMA ENUM_VAL\n                     | ENUM_VAL\n                     | emptypvar_section : PVARIABLES LCURLY pvar_list RCURLY SEMIpvar_list : pvar_list pvar_def\n                     | emptypvar_def : nonfluent_def\n                    | statefluent_def\n                    | actionfluent_def\n                    | intermfluent_def\n                    | derivedfluent_def\n                    | observfluent_defnonfluent_def : IDENT param_list LCURLY NON_FLUENT COMMA type_spec COMMA DEFAULT ASSIGN_EQUAL range_const RCURLY SEMIstatefluent_def : IDENT param_list LCURLY STATE COMMA type_spec COMMA DEFAULT ASSIGN_EQUAL range_const RCURLY SEMIactionfluent_def : IDENT param_list LCURLY ACTION COMMA type_spec COMMA DEFAULT ASSIGN_EQUAL range_const RCURLY SEMIintermfluent_def : IDENT param_list LCURLY INTERMEDIATE COMMA type_spec COMMA LEVEL ASSIGN_EQUAL range_const RCURLY SEMI\n                            | IDENT param_list LCURLY INTERMEDIATE COMMA type_spec RCURLY SEMIderivedfluent_def : IDENT param_list LCURLY DERIVED_FLUENT COMMA type_spec COMMA LEVEL ASSIGN_EQUAL range_const RCURLY SEMI\n                             | IDENT param_list LCURLY DERIVED_FLUENT COMMA type_spec RCURLY SEMIobservfluent_def : IDENT param_list LCURLY OBSERVATION COMMA type_spec RCURLY SEMIcpf_section : cpf_header LCURLY cpf_list RCURLY SEMIcpf_header : CPFS\n                      | CDFScpf_list : cpf_list cpf_def\n                    | emptycpf_def : pvar_expr ASSIGN_EQUAL expr SEMIreward_section : REWARD ASSIGN_EQUAL expr SEMItermination_section  : TERMINATION LCURLY termination_list RCURLY SEMI\n                                |  TERMINATION LCURLY RCURLY SEMItermination_list : termination_list termination_cond_def\n                            | termination_cond_deftermination_cond_def : expr SEMIaction_precond_section : ACTION_PRECONDITIONS LCURLY action_precond_list RCURLY SEMI\n                                  | ACTION_PRECONDITIONS LCURLY RCURLY SEMIaction_precond_list : action_precond_list action_precond_def\n                               | action_precond_defaction_precond_def : expr SEMIstate_action_constraint_section : STATE_ACTION_CONSTRAINTS LCURLY state_cons_list RCURLY SEMI\n                                           | STATE_ACTION_CONSTRAINTS LCURLY RCURLY SEMIstate_cons_list : state_cons_list state_cons_def\n                           | state_cons_defstate_cons_def : expr SEMIstate_invariant_section : STATE_INVARIANTS LCURLY state_invariant_list RCURLY SEMI\n                                   | STATE_INVARIANTS LCURLY RCURLY SEMIstate_invariant_list : state_invariant_list state_invariant_def\n                                | state_invariant_defstate_invariant_def : expr SEMIterm_list : term_list COMMA term\n                     | term\n                     | emptyterm : VAR\n                | ENUM_VAL\n                | pvar_exprexpr : pvar_expr\n                | group_expr\n                | function_expr\n                | relational_expr\n                | boolean_expr\n                | quantifier_expr\n                | numerical_expr\n                | aggregation_expr\n                | control_expr\n                | randomvar_exprpvar_expr : IDENT LPAREN term_list RPAREN\n                     | IDENT\n                     | ENUM_VALgroup_expr : LBRACK expr RBRACK\n                      | LPAREN expr RPARENfunction_expr : IDENT LBRACK expr_list RBRACKrelational_expr : expr COMP_EQUAL expr\n                           | expr NEQ expr\n                           | expr GREATER expr\n                           | expr GREATEREQ expr\n                           | expr LESS expr\n                           | expr LESSEQ exprboolean_expr : expr AND expr\n                        | expr AMPERSAND expr\n                        | expr OR expr\n                        | expr IMPLY expr\n                        | expr EQUIV expr\n                        | NOT expr %prec UMINUS\n                        | bool_typequantifier_expr : FORALL UNDERSCORE LCURLY typed_var_list RCURLY expr %prec FORALL\n                           | EXISTS UNDERSCORE LCURLY typed_var_list RCURLY expr %prec EXISTSnumerical_expr : expr PLUS expr\n                          | expr MINUS expr\n                          | expr TIMES expr\n                          | expr DIV expr\n                          | MINUS expr %prec UMINUS\n                          | PLUS expr %prec UMINUS\n                          | INTEGER\n                          | DOUBLEaggregation_expr : IDENT UNDERSCORE LCURLY typed_var_list RCURLY expr %prec AGG_OPERcontrol_expr : IF LPAREN expr RPAREN THEN expr ELSE expr %prec IF\n                        | SWITCH LPAREN expr RPAREN LCURLY case_list RCURLYrandomvar_expr : BERNOULLI LPAREN expr RPAREN\n                          | DIRAC_DELTA LPAREN expr RPAREN\n                          | KRON_DELTA LPAREN expr RPAREN\n                          | UNIFORM LPAREN expr COMMA expr RPAREN\n                          | NORMAL LPAREN expr COMMA expr RPAREN\n                          | EXPONENTIAL LPAREN expr RPAREN\n                          | DISCRETE LPAREN IDENT COMMA lconst_case_list RPAREN\n                          | DIRICHLET LPAREN IDENT COMMA expr RPAREN\n                          | POISSON LPAREN expr RPAREN\n                          | WEIBULL LPAREN expr COMMA expr RPAREN\n                          | GAMMA   LPAREN expr COMMA expr RPAREN\n                          | BINOMIAL   LPAREN expr COMMA expr RPAREN\n                          | NEGATIVEBINOMIAL   LPAREN expr COMMA expr RPAREN\n                          | BETA   LPAREN expr COMMA expr RPAREN\n                          | GEOMETRIC LPAREN expr RPAREN\n                          | PARETO   LPAREN expr COMMA expr RPAREN\n                          | STUDENT LPAREN expr RPAREN\n                          | GUMBEL   LPAREN expr COMMA expr RPAREN\n                          | LAPLACE LPAREN expr COMMA expr RPAREN\n                          | CAUCHY LPAREN expr COMMA expr RPAREN\n                          | GOMPERTZ LPAREN expr COMMA expr RPARENtyped_var_list : typed_var_list COMMA typed_var\n                          | typed_vartyped_var : VAR COLON IDENTexpr_list : expr_list COMMA expr\n                     | exprcase_list : case_list COMMA case_def\n                     | case_defcase_def : CASE term COLON expr\n                    | DEFAULT COLON exprlconst_case_list : lconst COLON expr\n                            | lconst COLON OTHERWISE\n                            | lconst_case_list COMMA lconst COLON exprlconst : IDENT\n                  | ENUM_VALparam_list : COLON\n                      | LPAREN param_list2 RPAREN COLONparam_list2 : type_spec\n                       | param_list2 COMMA type_spectype_spec : IDENT\n                     | INT\n                     | REAL\n                     | BOOLrange_const : bool_type\n                       | double_type\n                       | int_type\n                       | ENUM_VAL\n                       | IDENTbool_type : TRUE\n                     | FALSEdouble_type : DOUBLE\n                       | MINUS DOUBLE\n                       | POS_INF\n                       | NEG_INFint_type : INTEGER\n                    | MINUS INTEGERpos_int_type_or_pos_inf : INTEGER\n                                   | POS_INFinstance_block : INSTANCE IDENT LCURLY instance_list RCURLYinstance_list : instance_list domain_section\n                         | instance_list nonfluents_section\n                         | instance_list objects_section\n                         | instance_list init_state_section\n                         | instance_list max_nondef_actions_section\n                         | instance_list horizon_spec_section\n                         | instance_list discount_section\n                         | emptydomain_section : DOMAIN ASSIGN_EQUAL IDENT SEMInonfluents_section : NON_FLUENTS ASSIGN_EQUAL IDENT SEMIobjects_section : OBJECTS LCURLY objects_list RCURLY SEMIinit_state_section : INIT_STATE LCURLY pvar_inst_list RCURLY SEMImax_nondef_actions_section : MAX_NONDEF_ACTIONS ASSIGN_EQUAL pos_int_type_or_pos_inf SEMIhorizon_spec_section : HORIZON ASSIGN_EQUAL pos_int_type_or_pos_inf SEMI\n                                | HORIZON ASSIGN_EQUAL TERMINATE_WHEN LPAREN expr RPARENdiscount_section : DISCOUNT ASSIGN_EQUAL DOUBLE SEMInonfluent_block : NON_FLUENTS IDENT LCURLY nonfluent_list RCURLYnonfluent_list : nonfluent_list domain_section\n                          | nonfluent_list objects_section\n                          | nonfluent_list init_non_fluent_section\n                          | emptyinit_non_fluent_section : NON_FLUENTS LCURLY pvar_inst_list RCURLY SEMIobjects_list : objects_list objects_def\n                        | objects_def\n                        | emptyobjects_def : IDENT COLON LCURLY object_const_list RCURLY SEMIobject_const_list : object_const_list COMMA IDENT\n                             | IDENTpvar_inst_list : pvar_inst_list pvar_inst_def\n                          | pvar_inst_defpvar_inst_def : IDENT LPAREN lconst_list RPAREN SEMI\n                         | IDENT SEMI\n                         | NOT IDENT LPAREN lconst_list RPAREN SEMI\n                         | NOT IDENT SEMI\n                         | IDENT LPAREN lconst_list RPAREN ASSIGN_EQUAL range_const SEMI\n                         | IDENT ASSIGN_EQUAL range_const SEMIlconst_list : lconst_list COMMA lconst\n                       | lconststring_list : string_list COMMA IDENT\n                       | IDENT\n                       | emptyempty :'
+    
+_lr_action_items = {'DOMAIN':([0,2,3,4,5,6,14,15,19,20,21,22,27,28,29,30,31,32,33,34,43,44,45,46,47,179,180,190,191,193,277,279,298,370,],[-219,7,-5,-2,-3,-4,-219,-219,35,-185,35,-198,-177,-178,-179,-180,-181,-182,-183,-184,-194,-195,-196,-197,-6,-186,-187,-190,-191,-193,-188,-189,-199,-192,]),'INSTANCE':([0,2,3,4,5,6,27,43,47,],[-219,8,-5,-2,-3,-4,-177,-194,-6,]),'NON_FLUENTS':([0,2,3,4,5,6,14,15,19,20,21,22,27,28,29,30,31,32,33,34,43,44,45,46,47,179,180,190,191,193,277,279,298,370,],[-219,9,-5,-2,-3,-4,-219,-219,36,-185,42,-198,-177,-178,-179,-180,-181,-182,-183,-184,-194,-195,-196,-197,-6,-186,-187,-190,-191,-193,-188,-189,-199,-192,]),'$end':([0,1,2,3,4,5,6,27,43,47,],[-219,0,-1,-5,-2,-3,-4,-177,-194,-6,]),'IDENT':([7,8,9,26,66,70,71,72,73,77,78,79,80,81,82,83,84,85,88,91,92,93,95,96,98,105,106,107,108,109,110,111,124,126,127,131,132,160,162,164,166,168,170,172,174,182,185,186,187,188,192,196,199,200,201,202,203,204,205,208,212,213,214,215,216,217,218,219,220,221,222,223,224,225,226,227,228,237,238,239,240,241,242,243,244,245,246,247,248,249,250,251,252,253,254,255,256,257,258,259,261,263,265,267,269,271,273,275,278,295,296,304,306,365,366,382,384,395,396,398,399,401,402,403,404,405,407,409,410,411,412,414,415,416,419,430,431,434,436,437,438,439,456,459,462,463,464,465,466,467,478,482,484,496,497,505,509,523,525,530,532,533,536,537,538,539,540,551,552,553,554,555,],[10,11,12,68,68,89,90,94,97,97,-219,-219,-219,123,123,123,123,123,178,94,-201,-202,97,-207,189,97,197,-21,206,-29,210,-48,123,123,123,123,123,123,-54,123,-59,123,-64,123,-69,-200,-206,280,-209,284,123,-20,-28,-30,-31,-32,-33,-34,-35,-47,123,123,123,123,123,123,123,123,123,123,123,123,123,123,123,210,123,123,123,123,123,123,123,123,123,343,344,123,123,123,123,123,123,123,123,123,123,123,123,123,-53,-55,-58,-60,-63,-65,-68,-70,362,280,-211,376,123,280,-213,210,123,123,123,280,123,123,123,123,123,123,123,123,123,123,123,457,-208,284,-22,376,-49,123,472,123,123,123,-203,-210,376,376,376,376,376,376,210,280,123,-212,-23,123,123,123,123,-40,-42,-43,284,284,284,284,284,-36,-37,-38,-39,-41,]),'LCURLY':([10,11,12,17,25,37,38,42,56,57,58,60,61,62,63,64,65,183,229,233,234,300,302,303,391,468,],[13,14,15,26,66,72,73,77,78,79,80,82,83,84,85,-45,-46,278,330,333,334,372,373,-154,440,-155,]),'REQUIREMENTS':([13,],[17,]),'RCURLY':([13,14,15,16,18,19,20,21,22,23,24,26,28,29,30,31,32,33,34,44,45,46,48,49,50,51,52,53,54,55,66,67,68,69,72,78,79,80,82,83,84,85,86,91,92,93,95,96,105,106,107,108,109,110,111,113,114,115,116,117,118,119,120,121,122,123,125,128,133,134,158,159,160,162,164,166,168,170,172,174,177,178,179,180,182,185,187,190,191,193,196,199,200,201,202,203,204,205,208,211,232,235,236,261,262,263,265,266,267,269,270,271,273,274,275,276,277,279,284,286,287,288,289,290,292,293,294,296,298,299,301,305,307,308,309,310,311,312,313,314,315,316,317,318,319,320,321,331,332,358,359,360,361,362,363,366,367,368,370,372,376,377,378,379,381,383,385,386,388,389,392,393,394,397,400,406,408,415,419,420,421,422,431,456,457,459,470,471,472,473,474,476,477,480,481,483,485,486,487,488,489,490,491,492,493,494,495,496,497,498,502,503,504,506,521,522,524,530,532,533,534,541,542,543,544,545,551,552,553,554,555,],[-219,-219,-219,-219,-9,27,-185,43,-198,47,-18,-219,-178,-179,-180,-181,-182,-183,-184,-195,-196,-197,-10,-11,-12,-13,-14,-15,-16,-17,-219,87,-217,-218,-219,-219,-219,-219,161,165,169,173,176,181,-201,-202,184,-207,194,195,-21,198,-29,207,-48,-77,-78,-79,-80,-81,-82,-83,-84,-85,-86,-88,-89,-105,-114,-115,-167,-168,260,-54,264,-59,268,-64,272,-69,-8,-216,-186,-187,-200,-206,-209,-190,-191,-193,-20,-28,-30,-31,-32,-33,-34,-35,-47,-50,-104,-113,-112,-53,-52,-55,-58,-57,-60,-63,-62,-65,-68,-67,-70,-7,-188,-189,-166,-162,-163,-164,-165,-169,-171,-172,-173,-211,-199,-19,-27,-44,-93,-94,-95,-96,-97,-98,-99,-100,-101,-102,-103,-108,-109,-110,-111,-91,-90,-51,-56,-61,-66,-205,413,-213,-170,-174,-192,-219,-158,-159,-160,-161,-87,-92,434,-141,437,438,-119,-120,-121,-124,-127,-133,-135,-208,-22,460,-25,-26,-49,-203,-204,-210,-116,-140,-142,-106,-107,506,-146,-122,-123,-125,-126,-128,-129,-130,-131,-132,-134,-136,-137,-138,-139,-212,-23,-24,517,519,520,-118,-117,-145,-148,-40,-42,-43,-147,546,547,548,549,550,-36,-37,-38,-39,-41,]),'TYPES':([13,16,18,23,24,48,49,50,51,52,53,54,55,177,211,262,266,270,274,276,299,301,305,358,359,360,361,],[-219,-219,-9,56,-18,-10,-11,-12,-13,-14,-15,-16,-17,-8,-50,-52,-57,-62,-67,-7,-19,-27,-44,-51,-56,-61,-66,]),'PVARIABLES':([13,16,18,23,24,48,49,50,51,52,53,54,55,177,211,262,266,270,274,276,299,301,305,358,359,360,361,],[-219,-219,-9,57,-18,-10,-11,-12,-13,-14,-15,-16,-17,-8,-50,-52,-57,-62,-67,-7,-19,-27,-44,-51,-56,-61,-66,]),'REWARD':([13,16,18,23,24,48,49,50,51,52,53,54,55,177,211,262,266,270,274,276,299,301,305,358,359,360,361,],[-219,-219,-9,59,-18,-10,-11,-12,-13,-14,-15,-16,-17,-8,-50,-52,-57,-62,-67,-7,-19,-27,-44,-51,-56,-61,-66,]),'TERMINATION':([13,16,18,23,24,48,49,50,51,52,53,54,55,177,211,262,266,270,274,276,299,301,305,358,359,360,361,],[-219,-219,-9,60,-18,-10,-11,-12,-13,-14,-15,-16,-17,-8,-50,-52,-57,-62,-67,-7,-19,-27,-44,-51,-56,-61,-66,]),'ACTION_PRECONDITIONS':([13,16,18,23,24,48,49,50,51,52,53,54,55,177,211,262,266,270,274,276,299,301,305,358,359,360,361,],[-219,-219,-9,61,-18,-10,-11,-12,-13,-14,-15,-16,-17,-8,-50,-52,-57,-62,-67,-7,-19,-27,-44,-51,-56,-61,-66,]),'STATE_ACTION_CONSTRAINTS':([13,16,18,23,24,48,49,50,51,52,53,54,55,177,211,262,266,270,274,276,299,301,305,358,359,360,361,],[-219,-219,-9,62,-18,-10,-11,-12,-13,-14,-15,-16,-17,-8,-50,-52,-57,-62,-67,-7,-19,-27,-44,-51,-56,-61,-66,]),'STATE_INVARIANTS':([13,16,18,23,24,48,49,50,51,52,53,54,55,177,211,262,266,270,274,276,299,301,305,358,359,360,361,],[-219,-219,-9,63,-18,-10,-11,-12,-13,-14,-15,-16,-17,-8,-50,-52,-57,-62,-67,-7,-19,-27,-44,-51,-56,-61,-66,]),'CPFS':([13,16,18,23,24,48,49,50,51,52,53,54,55,177,211,262,266,270,274,276,299,301,305,358,359,360,361,],[-219,-219,-9,64,-18,-10,-11,-12,-13,-14,-15,-16,-17,-8,-50,-52,-57,-62,-67,-7,-19,-27,-44,-51,-56,-61,-66,]),'CDFS':([13,16,18,23,24,48,49,50,51,52,53,54,55,177,211,262,266,270,274,276,299,301,305,358,359,360,361,],[-219,-219,-9,65,-18,-10,-11,-12,-13,-14,-15,-16,-17,-8,-50,-52,-57,-62,-67,-7,-19,-27,-44,-51,-56,-61,-66,]),'OBJECTS':([14,15,19,20,21,22,28,29,30,31,32,33,34,44,45,46,179,180,190,191,193,277,279,298,370,],[-219,-219,37,-185,37,-198,-178,-179,-180,-181,-182,-183,-184,-195,-196,-197,-186,-187,-190,-191,-193,-188,-189,-199,-192,]),'INIT_STATE':([14,19,20,28,29,30,31,32,33,34,179,180,190,191,193,277,279,370,],[-219,38,-185,-178,-179,-180,-181,-182,-183,-184,-186,-187,-190,-191,-193,-188,-189,-192,]),'MAX_NONDEF_ACTIONS':([14,19,20,28,29,30,31,32,33,34,179,180,190,191,193,277,279,370,],[-219,39,-185,-178,-179,-180,-181,-182,-183,-184,-186,-187,-190,-191,-193,-188,-189,-192,]),'HORIZON':([14,19,20,28,29,30,31,32,33,34,179,180,190,191,193,277,279,370,],[-219,40,-185,-178,-179,-180,-181,-182,-183,-184,-186,-187,-190,-191,-193,-188,-189,-192,]),'DISCOUNT':([14,19,20,28,29,30,31,32,33,34,179,180,190,191,193,277,279,370,],[-219,41,-185,-178,-179,-180,-181,-182,-183,-184,-186,-187,-190,-191,-193,-188,-189,-192,]),'ASSIGN_EQUAL':([17,35,36,39,40,41,59,97,125,209,210,364,381,526,527,528,529,531,],[25,70,71,74,75,76,81,188,-89,306,-88,416,-87,536,537,538,539,540,]),'COMMA':([26,66,67,68,69,86,113,114,115,116,117,118,119,120,121,122,123,125,128,133,134,158,159,178,210,227,232,235,236,280,281,282,283,307,308,309,310,311,312,313,314,315,316,317,318,319,320,321,322,323,324,325,326,327,328,329,331,332,340,341,343,344,346,347,348,349,350,352,354,355,356,357,362,363,369,372,374,375,376,377,378,379,381,383,385,386,388,389,392,393,394,397,400,406,408,417,420,421,422,423,424,425,426,427,428,432,433,443,457,469,470,471,472,473,474,476,477,480,481,483,485,486,487,488,489,490,491,492,493,494,495,498,499,500,501,502,503,506,511,512,521,522,524,534,535,],[-219,-219,88,-217,-218,88,-77,-78,-79,-80,-81,-82,-83,-84,-85,-86,-88,-89,-105,-114,-115,-167,-168,-216,-88,-219,-104,-113,-112,-152,365,-215,-153,-93,-94,-95,-96,-97,-98,-99,-100,-101,-102,-103,-108,-109,-110,-111,382,-72,-73,-74,-75,-76,384,-144,-91,-90,395,396,398,399,401,402,403,404,405,407,409,410,411,412,-205,414,365,-219,430,-156,-158,-159,-160,-161,-87,-92,435,-141,435,435,-119,-120,-121,-124,-127,-133,-135,-214,461,-25,-26,462,463,464,465,466,467,-71,-143,482,-204,-157,-116,-140,-142,-106,-107,507,-146,-122,-123,-125,-126,-128,-129,-130,-131,-132,-134,-136,-137,-138,-139,-24,513,514,515,516,518,-118,-149,-150,-117,-145,-148,-147,-151,]),'NOT':([73,77,81,82,83,84,85,95,96,105,124,126,127,131,132,160,162,164,166,168,170,172,174,185,187,192,212,213,214,215,216,217,218,219,220,221,222,223,224,225,226,228,237,238,239,240,241,242,243,244,247,248,249,250,251,252,253,254,255,256,257,258,259,261,263,265,267,269,271,273,275,296,306,366,384,395,396,399,401,402,403,404,405,407,409,410,411,412,415,434,437,438,439,459,484,496,505,509,523,525,],[98,98,127,127,127,127,127,98,-207,98,127,127,127,127,127,127,-54,127,-59,127,-64,127,-69,-206,-209,127,127,127,127,127,127,127,127,127,127,127,127,127,127,127,127,127,127,127,127,127,127,127,127,127,127,127,127,127,127,127,127,127,127,127,127,127,127,-53,-55,-58,-60,-63,-65,-68,-70,-211,127,-213,127,127,127,127,127,127,127,127,127,127,127,127,127,127,-208,127,127,127,127,-210,127,-212,127,127,127,127,]),'INTEGER':([74,75,81,82,83,84,85,124,126,127,131,132,160,162,164,166,168,170,172,174,188,192,212,213,214,215,216,217,218,219,220,221,222,223,224,225,226,228,237,238,239,240,241,242,243,244,247,248,249,250,251,252,253,254,255,256,257,258,259,261,263,265,267,269,271,273,275,291,306,384,395,396,399,401,402,403,404,405,407,409,410,411,412,416,434,437,438,439,484,505,509,523,525,536,537,538,539,540,],[100,100,133,133,133,133,133,133,133,133,133,133,133,-54,133,-59,133,-64,133,-69,294,133,133,133,133,133,133,133,133,133,133,133,133,133,133,133,133,133,133,133,133,133,133,133,133,133,133,133,133,133,133,133,133,133,133,133,133,133,133,-53,-55,-58,-60,-63,-65,-68,-70,368,133,133,133,133,133,133,133,133,133,133,133,133,133,133,133,294,133,133,133,133,133,133,133,133,133,294,294,294,294,294,]),'POS_INF':([74,75,188,416,536,537,538,539,540,],[101,101,292,292,292,292,292,292,292,]),'TERMINATE_WHEN':([75,],[103,]),'DOUBLE':([76,81,82,83,84,85,124,126,127,131,132,160,162,164,166,168,170,172,174,188,192,212,213,214,215,216,217,218,219,220,221,222,223,224,225,226,228,237,238,239,240,241,242,243,244,247,248,249,250,251,252,253,254,255,256,257,258,259,261,263,265,267,269,271,273,275,291,306,384,395,396,399,401,402,403,404,405,407,409,410,411,412,416,434,437,438,439,484,505,509,523,525,536,537,538,539,540,],[104,134,134,134,134,134,134,134,134,134,134,134,-54,134,-59,134,-64,134,-69,290,134,134,134,134,134,134,134,134,134,134,134,134,134,134,134,134,134,134,134,134,134,134,134,134,134,134,134,134,134,134,134,134,134,134,134,134,134,134,-53,-55,-58,-60,-63,-65,-68,-70,367,134,134,134,134,134,134,134,134,134,134,134,134,134,134,134,290,134,134,134,134,134,134,134,134,134,290,290,290,290,290,]),'ENUM_VAL':([80,81,82,83,84,85,110,111,124,126,127,131,132,160,162,164,166,168,170,172,174,186,188,192,208,212,213,214,215,216,217,218,219,220,221,222,223,224,225,226,227,228,237,238,239,240,241,242,243,244,247,248,249,250,251,252,253,254,255,256,257,258,259,261,263,265,267,269,271,273,275,295,306,365,372,382,384,395,396,398,399,401,402,403,404,405,407,409,410,411,412,416,431,434,437,438,439,461,478,482,484,505,509,523,525,536,537,538,539,540,],[-219,125,125,125,125,125,125,-48,125,125,125,125,125,125,-54,125,-59,125,-64,125,-69,283,289,125,-47,125,125,125,125,125,125,125,125,125,125,125,125,125,125,125,326,125,125,125,125,125,125,125,125,125,125,125,125,125,125,125,125,125,125,125,125,125,125,-53,-55,-58,-60,-63,-65,-68,-70,283,125,283,421,326,125,125,125,283,125,125,125,125,125,125,125,125,125,125,125,289,-49,125,125,125,125,498,326,283,125,125,125,125,125,289,289,289,289,289,]),'LBRACK':([81,82,83,84,85,123,124,126,127,131,132,160,162,164,166,168,170,172,174,192,212,213,214,215,216,217,218,219,220,221,222,223,224,225,226,228,237,238,239,240,241,242,243,244,247,248,249,250,251,252,253,254,255,256,257,258,259,261,263,265,267,269,271,273,275,306,384,395,396,399,401,402,403,404,405,407,409,410,411,412,434,437,438,439,484,505,509,523,525,],[126,126,126,126,126,228,126,126,126,126,126,126,-54,126,-59,126,-64,126,-69,126,126,126,126,126,126,126,126,126,126,126,126,126,126,126,126,126,126,126,126,126,126,126,126,126,126,126,126,126,126,126,126,126,126,126,126,126,126,-53,-55,-58,-60,-63,-65,-68,-70,126,126,126,126,126,126,126,126,126,126,126,126,126,126,126,126,126,126,126,126,126,126,126,126,]),'LPAREN':([81,82,83,84,85,97,103,123,124,126,127,131,132,135,136,137,138,139,140,141,142,143,144,145,146,147,148,149,150,151,152,153,154,155,156,157,160,162,164,166,168,170,172,174,189,192,206,210,212,213,214,215,216,217,218,219,220,221,222,223,224,225,226,228,237,238,239,240,241,242,243,244,247,248,249,250,251,252,253,254,255,256,257,258,259,261,263,265,267,269,271,273,275,306,384,395,396,399,401,402,403,404,405,407,409,410,411,412,434,437,438,439,484,505,509,523,525,],[124,124,124,124,124,186,192,227,124,124,124,124,124,237,238,239,240,241,242,243,244,245,246,247,248,249,250,251,252,253,254,255,256,257,258,259,124,-54,124,-59,124,-64,124,-69,295,124,304,227,124,124,124,124,124,124,124,124,124,124,124,124,124,124,124,124,124,124,124,124,124,124,124,124,124,124,124,124,124,124,124,124,124,124,124,124,124,-53,-55,-58,-60,-63,-65,-68,-70,124,124,124,124,124,124,124,124,124,124,124,124,124,124,124,124,124,124,124,124,124,124,124,124,]),'FORALL':([81,82,83,84,85,124,126,127,131,132,160,162,164,166,168,170,172,174,192,212,213,214,215,216,217,218,219,220,221,222,223,224,225,226,228,237,238,239,240,241,242,243,244,247,248,249,250,251,252,253,254,255,256,257,258,259,261,263,265,267,269,271,273,275,306,384,395,396,399,401,402,403,404,405,407,409,410,411,412,434,437,438,439,484,505,509,523,525,],[129,129,129,129,129,129,129,129,129,129,129,-54,129,-59,129,-64,129,-69,129,129,129,129,129,129,129,129,129,129,129,129,129,129,129,129,129,129,129,129,129,129,129,129,129,129,129,129,129,129,129,129,129,129,129,129,129,129,-53,-55,-58,-60,-63,-65,-68,-70,129,129,129,129,129,129,129,129,129,129,129,129,129,129,129,129,129,129,129,129,129,129,129,129,]),'EXISTS':([81,82,83,84,85,124,126,127,131,132,160,162,164,166,168,170,172,174,192,212,213,214,215,216,217,218,219,220,221,222,223,224,225,226,228,237,238,239,240,241,242,243,244,247,248,249,250,251,252,253,254,255,256,257,258,259,261,263,265,267,269,271,273,275,306,384,395,396,399,401,402,403,404,405,407,409,410,411,412,434,437,438,439,484,505,509,523,525,],[130,130,130,130,130,130,130,130,130,130,130,-54,130,-59,130,-64,130,-69,130,130,130,130,130,130,130,130,130,130,130,130,130,130,130,130,130,130,130,130,130,130,130,130,130,130,130,130,130,130,130,130,130,130,130,130,130,130,-53,-55,-58,-60,-63,-65,-68,-70,130,130,130,130,130,130,130,130,130,130,130,130,130,130,130,130,130,130,130,130,130,130,130,130,]),'MINUS':([81,82,83,84,85,112,113,114,115,116,117,118,119,120,121,122,123,124,125,126,127,128,131,132,133,134,158,159,160,162,163,164,166,167,168,170,171,172,174,175,188,192,212,213,214,215,216,217,218,219,220,221,222,223,224,225,226,228,230,231,232,235,236,237,238,239,240,241,242,243,244,247,248,249,250,251,252,253,254,255,256,257,258,259,261,263,265,267,269,271,273,275,297,306,307,308,309,310,311,312,313,314,315,316,317,318,319,320,321,329,331,332,335,336,337,338,339,340,341,342,345,346,347,348,349,350,351,352,353,354,355,356,357,380,381,383,384,392,393,394,395,396,397,399,400,401,402,403,404,405,406,407,408,409,410,411,412,416,433,434,437,438,439,441,442,445,446,447,448,449,450,451,452,453,454,455,470,473,474,475,480,481,483,484,485,486,487,488,489,490,491,492,493,494,495,505,506,509,511,521,523,524,525,534,535,536,537,538,539,540,],[132,132,132,132,132,224,-77,-78,-79,-80,-81,-82,-83,-84,-85,-86,-88,132,-89,132,132,-105,132,132,-114,-115,-167,-168,132,-54,224,132,-59,224,132,-64,224,132,-69,224,291,132,132,132,132,132,132,132,132,132,132,132,132,132,132,132,132,132,224,224,-104,-113,-112,132,132,132,132,132,132,132,132,132,132,132,132,132,132,132,132,132,132,132,132,132,-53,-55,-58,-60,-63,-65,-68,-70,224,132,224,224,224,224,224,224,224,224,224,224,224,-108,-109,-110,-111,224,-91,-90,224,224,224,224,224,224,224,224,224,224,224,224,224,224,224,224,224,224,224,224,224,224,-87,-92,132,-119,-120,-121,132,132,-124,132,-127,132,132,132,132,132,-133,132,-135,132,132,132,132,291,224,132,132,132,132,224,224,224,224,224,224,224,224,224,224,224,224,224,224,224,224,224,-122,-123,-125,132,-126,-128,-129,-130,-131,-132,-134,-136,-137,-138,-139,132,-118,132,224,224,132,224,132,224,224,291,291,291,291,291,]),'PLUS':([81,82,83,84,85,112,113,114,115,116,117,118,119,120,121,122,123,124,125,126,127,128,131,132,133,134,158,159,160,162,163,164,166,167,168,170,171,172,174,175,192,212,213,214,215,216,217,218,219,220,221,222,223,224,225,226,228,230,231,232,235,236,237,238,239,240,241,242,243,244,247,248,249,250,251,252,253,254,255,256,257,258,259,261,263,265,267,269,271,273,275,297,306,307,308,309,310,311,312,313,314,315,316,317,318,319,320,321,329,331,332,335,336,337,338,339,340,341,342,345,346,347,348,349,350,351,352,353,354,355,356,357,380,381,383,384,392,393,394,395,396,397,399,400,401,402,403,404,405,406,407,408,409,410,411,412,433,434,437,438,439,441,442,445,446,447,448,449,450,451,452,453,454,455,470,473,474,475,480,481,483,484,485,486,487,488,489,490,491,492,493,494,495,505,506,509,511,521,523,524,525,534,535,],[131,131,131,131,131,223,-77,-78,-79,-80,-81,-82,-83,-84,-85,-86,-88,131,-89,131,131,-105,131,131,-114,-115,-167,-168,131,-54,223,131,-59,223,131,-64,223,131,-69,223,131,131,131,131,131,131,131,131,131,131,131,131,131,131,131,131,131,223,223,-104,-113,-112,131,131,131,131,131,131,131,131,131,131,131,131,131,131,131,131,131,131,131,131,131,-53,-55,-58,-60,-63,-65,-68,-70,223,131,223,223,223,223,223,223,223,223,223,223,223,-108,-109,-110,-111,223,-91,-90,223,223,223,223,223,223,223,223,223,223,223,223,223,223,223,223,223,223,223,223,223,223,-87,-92,131,-119,-120,-121,131,131,-124,131,-127,131,131,131,131,131,-133,131,-135,131,131,131,131,223,131,131,131,131,223,223,223,223,223,223,223,223,223,223,223,223,223,223,223,223,223,-122,-123,-125,131,-126,-128,-129,-130,-131,-132,-134,-136,-137,-138,-139,131,-118,131,223,223,131,223,131,223,223,]),'IF':([81,82,83,84,85,124,126,127,131,132,160,162,164,166,168,170,172,174,192,212,213,214,215,216,217,218,219,220,221,222,223,224,225,226,228,237,238,239,240,241,242,243,244,247,248,249,250,251,252,253,254,255,256,257,258,259,261,263,265,267,269,271,273,275,306,384,395,396,399,401,402,403,404,405,407,409,410,411,412,434,437,438,439,484,505,509,523,525,],[135,135,135,135,135,135,135,135,135,135,135,-54,135,-59,135,-64,135,-69,135,135,135,135,135,135,135,135,135,135,135,135,135,135,135,135,135,135,135,135,135,135,135,135,135,135,135,135,135,135,135,135,135,135,135,135,135,135,-53,-55,-58,-60,-63,-65,-68,-70,135,135,135,135,135,135,135,135,135,135,135,135,135,135,135,135,135,135,135,135,135,135,135,135,]),'SWITCH':([81,82,83,84,85,124,126,127,131,132,160,162,164,166,168,170,172,174,192,212,213,214,215,216,217,218,219,220,221,222,223,224,225,226,228,237,238,239,240,241,242,243,244,247,248,249,250,251,252,253,254,255,256,257,258,259,261,263,265,267,269,271,273,275,306,384,395,396,399,401,402,403,404,405,407,409,410,411,412,434,437,438,439,484,505,509,523,525,],[136,136,136,136,136,136,136,136,136,136,136,-54,136,-59,136,-64,136,-69,136,136,136,136,136,136,136,136,136,136,136,136,136,136,136,136,136,136,136,136,136,136,136,136,136,136,136,136,136,136,136,136,136,136,136,136,136,136,-53,-55,-58,-60,-63,-65,-68,-70,136,136,136,136,136,136,136,136,136,136,136,136,136,136,136,136,136,136,136,136,136,136,136,136,]),'BERNOULLI':([81,82,83,84,85,124,126,127,131,132,160,162,164,166,168,170,172,174,192,212,213,214,215,216,217,218,219,220,221,222,223,224,225,226,228,237,238,239,240,241,242,243,244,247,248,249,250,251,252,253,254,255,256,257,258,259,261,263,265,267,269,271,273,275,306,384,395,396,399,401,402,403,404,405,407,409,410,411,412,434,437,438,439,484,505,509,523,525,],[137,137,137,137,137,137,137,137,137,137,137,-54,137,-59,137,-64,137,-69,137,137,137,137,137,137,137,137,137,137,137,137,137,137,137,137,137,137,137,137,137,137,137,137,137,137,137,137,137,137,137,137,137,137,137,137,137,137,-53,-55,-58,-60,-63,-65,-68,-70,137,137,137,137,137,137,137,137,137,137,137,137,137,137,137,137,137,137,137,137,137,137,137,137,]),'DIRAC_DELTA':([81,82,83,84,85,124,126,127,131,132,160,162,164,166,168,170,172,174,192,212,213,214,215,216,217,218,219,220,221,222,223,224,225,226,228,237,238,239,240,241,242,243,244,247,248,249,250,251,252,253,254,255,256,257,258,259,261,263,265,267,269,271,273,275,306,384,395,396,399,401,402,403,404,405,407,409,410,411,412,434,437,438,439,484,505,509,523,525,],[138,138,138,138,138,138,138,138,138,138,138,-54,138,-59,138,-64,138,-69,138,138,138,138,138,138,138,138,138,138,138,138,138,138,138,138,138,138,138,138,138,138,138,138,138,138,138,138,138,138,138,138,138,138,138,138,138,138,-53,-55,-58,-60,-63,-65,-68,-70,138,138,138,138,138,138,138,138,138,138,138,138,138,138,138,138,138,138,138,138,138,138,138,138,]),'KRON_DELTA':([81,82,83,84,85,124,126,127,131,132,160,162,164,166,168,170,172,174,192,212,213,214,215,216,217,218,219,220,221,222,223,224,225,226,228,237,238,239,240,241,242,243,244,247,248,249,250,251,252,253,254,255,256,257,258,259,261,263,265,267,269,271,273,275,306,384,395,396,399,401,402,403,404,405,407,409,410,411,412,434,437,438,439,484,505,509,523,525,],[139,139,139,139,139,139,139,139,139,139,139,-54,139,-59,139,-64,139,-69,139,139,139,139,139,139,139,139,139,139,139,139,139,139,139,139,139,139,139,139,139,139,139,139,139,139,139,139,139,139,139,139,139,139,139,139,139,139,-53,-55,-58,-60,-63,-65,-68,-70,139,139,139,139,139,139,139,139,139,139,139,139,139,139,139,139,139,139,139,139,139,139,139,139,]),'UNIFORM':([81,82,83,84,85,124,126,127,131,132,160,162,164,166,168,170,172,174,192,212,213,214,215,216,217,218,219,220,221,222,223,224,225,226,228,237,238,239,240,241,242,243,244,247,248,249,250,251,252,253,254,255,256,257,258,259,261,263,265,267,269,271,273,275,306,384,395,396,399,401,402,403,404,405,407,409,410,411,412,434,437,438,439,484,505,509,523,525,],[140,140,140,140,140,140,140,140,140,140,140,-54,140,-59,140,-64,140,-69,140,140,140,140,140,140,140,140,140,140,140,140,140,140,140,140,140,140,140,140,140,140,140,140,140,140,140,140,140,140,140,140,140,140,140,140,140,140,-53,-55,-58,-60,-63,-65,-68,-70,140,140,140,140,140,140,140,140,140,140,140,140,140,140,140,140,140,140,140,140,140,140,140,140,]),'NORMAL':([81,82,83,84,85,124,126,127,131,132,160,162,164,166,168,170,172,174,192,212,213,214,215,216,217,218,219,220,221,222,223,224,225,226,228,237,238,239,240,241,242,243,244,247,248,249,250,251,252,253,254,255,256,257,258,259,261,263,265,267,269,271,273,275,306,384,395,396,399,401,402,403,404,405,407,409,410,411,412,434,437,438,439,484,505,509,523,525,],[141,141,141,141,141,141,141,141,141,141,141,-54,141,-59,141,-64,141,-69,141,141,141,141,141,141,141,141,141,141,141,141,141,141,141,141,141,141,141,141,141,141,141,141,141,141,141,141,141,141,141,141,141,141,141,141,141,141,-53,-55,-58,-60,-63,-65,-68,-70,141,141,141,141,141,141,141,141,141,141,141,141,141,141,141,141,141,141,141,141,141,141,141,141,]),'EXPONENTIAL':([81,82,83,84,85,124,126,127,131,132,160,162,164,166,168,170,172,174,192,212,213,214,215,216,217,218,219,220,221,222,223,224,225,226,228,237,238,239,240,241,242,243,244,247,248,249,250,251,252,253,254,255,256,257,258,259,261,263,265,267,269,271,273,275,306,384,395,396,399,401,402,403,404,405,407,409,410,411,412,434,437,438,439,484,505,509,523,525,],[142,142,142,142,142,142,142,142,142,142,142,-54,142,-59,142,-64,142,-69,142,142,142,142,142,142,142,142,142,142,142,142,142,142,142,142,142,142,142,142,142,142,142,142,142,142,142,142,142,142,142,142,142,142,142,142,142,142,-53,-55,-58,-60,-63,-65,-68,-70,142,142,142,142,142,142,142,142,142,142,142,142,142,142,142,142,142,142,142,142,142,142,142,142,]),'DISCRETE':([81,82,83,84,85,124,126,127,131,132,160,162,164,166,168,170,172,174,192,212,213,214,215,216,217,218,219,220,221,222,223,224,225,226,228,237,238,239,240,241,242,243,244,247,248,249,250,251,252,253,254,255,256,257,258,259,261,263,265,267,269,271,273,275,306,384,395,396,399,401,402,403,404,405,407,409,410,411,412,434,437,438,439,484,505,509,523,525,],[143,143,143,143,143,143,143,143,143,143,143,-54,143,-59,143,-64,143,-69,143,143,143,143,143,143,143,143,143,143,143,143,143,143,143,143,143,143,143,143,143,143,143,143,143,143,143,143,143,143,143,143,143,143,143,143,143,143,-53,-55,-58,-60,-63,-65,-68,-70,143,143,143,143,143,143,143,143,143,143,143,143,143,143,143,143,143,143,143,143,143,143,143,143,]),'DIRICHLET':([81,82,83,84,85,124,126,127,131,132,160,162,164,166,168,170,172,174,192,212,213,214,215,216,217,218,219,220,221,222,223,224,225,226,228,237,238,239,240,241,242,243,244,247,248,249,250,251,252,253,254,255,256,257,258,259,261,263,265,267,269,271,273,275,306,384,395,396,399,401,402,403,404,405,407,409,410,411,412,434,437,438,439,484,505,509,523,525,],[144,144,144,144,144,144,144,144,144,144,144,-54,144,-59,144,-64,144,-69,144,144,144,144,144,144,144,144,144,144,144,144,144,144,144,144,144,144,144,144,144,144,144,144,144,144,144,144,144,144,144,144,144,144,144,144,144,144,-53,-55,-58,-60,-63,-65,-68,-70,144,144,144,144,144,144,144,144,144,144,144,144,144,144,144,144,144,144,144,144,144,144,144,144,]),'POISSON':([81,82,83,84,85,124,126,127,131,132,160,162,164,166,168,170,172,174,192,212,213,214,215,216,217,218,219,220,221,222,223,224,225,226,228,237,238,239,240,241,242,243,244,247,248,249,250,251,252,253,254,255,256,257,258,259,261,263,265,267,269,271,273,275,306,384,395,396,399,401,402,403,404,405,407,409,410,411,412,434,437,438,439,484,505,509,523,525,],[145,145,145,145,145,145,145,145,145,145,145,-54,145,-59,145,-64,145,-69,145,145,145,145,145,145,145,145,145,145,145,145,145,145,145,145,145,145,145,145,145,145,145,145,145,145,145,145,145,145,145,145,145,145,145,145,145,145,-53,-55,-58,-60,-63,-65,-68,-70,145,145,145,145,145,145,145,145,145,145,145,145,145,145,145,145,145,145,145,145,145,145,145,145,]),'WEIBULL':([81,82,83,84,85,124,126,127,131,132,160,162,164,166,168,170,172,174,192,212,213,214,215,216,217,218,219,220,221,222,223,224,225,226,228,237,238,239,240,241,242,243,244,247,248,249,250,251,252,253,254,255,256,257,258,259,261,263,265,267,269,271,273,275,306,384,395,396,399,401,402,403,404,405,407,409,410,411,412,434,437,438,439,484,505,509,523,525,],[146,146,146,146,146,146,146,146,146,146,146,-54,146,-59,146,-64,146,-69,146,146,146,146,146,146,146,146,146,146,146,146,146,146,146,146,146,146,146,146,146,146,146,146,146,146,146,146,146,146,146,146,146,146,146,146,146,146,-53,-55,-58,-60,-63,-65,-68,-70,146,146,146,146,146,146,146,146,146,146,146,146,146,146,146,146,146,146,146,146,146,146,146,146,]),'GAMMA':([81,82,83,84,85,124,126,127,131,132,160,162,164,166,168,170,172,174,192,212,213,214,215,216,217,218,219,220,221,222,223,224,225,226,228,237,238,239,240,241,242,243,244,247,248,249,250,251,252,253,254,255,256,257,258,259,261,263,265,267,269,271,273,275,306,384,395,396,399,401,402,403,404,405,407,409,410,411,412,434,437,438,439,484,505,509,523,525,],[147,147,147,147,147,147,147,147,147,147,147,-54,147,-59,147,-64,147,-69,147,147,147,147,147,147,147,147,147,147,147,147,147,147,147,147,147,147,147,147,147,147,147,147,147,147,147,147,147,147,147,147,147,147,147,147,147,147,-53,-55,-58,-60,-63,-65,-68,-70,147,147,147,147,147,147,147,147,147,147,147,147,147,147,147,147,147,147,147,147,147,147,147,147,]),'BINOMIAL':([81,82,83,84,85,124,126,127,131,132,160,162,164,166,168,170,172,174,192,212,213,214,215,216,217,218,219,220,221,222,223,224,225,226,228,237,238,239,240,241,242,243,244,247,248,249,250,251,252,253,254,255,256,257,258,259,261,263,265,267,269,271,273,275,306,384,395,396,399,401,402,403,404,405,407,409,410,411,412,434,437,438,439,484,505,509,523,525,],[148,148,148,148,148,148,148,148,148,148,148,-54,148,-59,148,-64,148,-69,148,148,148,148,148,148,148,148,148,148,148,148,148,148,148,148,148,148,148,148,148,148,148,148,148,148,148,148,148,148,148,148,148,148,148,148,148,148,-53,-55,-58,-60,-63,-65,-68,-70,148,148,148,148,148,148,148,148,148,148,148,148,148,148,148,148,148,148,148,148,148,148,148,148,]),'NEGATIVEBINOMIAL':([81,82,83,84,85,124,126,127,131,132,160,162,164,166,168,170,172,174,192,212,213,214,215,216,217,218,219,220,221,222,223,224,225,226,228,237,238,239,240,241,242,243,244,247,248,249,250,251,252,253,254,255,256,257,258,259,261,263,265,267,269,271,273,275,306,384,395,396,399,401,402,403,404,405,407,409,410,411,412,434,437,438,439,484,505,509,523,525,],[149,149,149,149,149,149,149,149,149,149,149,-54,149,-59,149,-64,149,-69,149,149,149,149,149,149,149,149,149,149,149,149,149,149,149,149,149,149,149,149,149,149,149,149,149,149,149,149,149,149,149,149,149,149,149,149,149,149,-53,-55,-58,-60,-63,-65,-68,-70,149,149,149,149,149,149,149,149,149,149,149,149,149,149,149,149,149,149,149,149,149,149,149,149,]),'BETA':([81,82,83,84,85,124,126,127,131,132,160,162,164,166,168,170,172,174,192,212,213,214,215,216,217,218,219,220,221,222,223,224,225,226,228,237,238,239,240,241,242,243,244,247,248,249,250,251,252,253,254,255,256,257,258,259,261,263,265,267,269,271,273,275,306,384,395,396,399,401,402,403,404,405,407,409,410,411,412,434,437,438,439,484,505,509,523,525,],[150,150,150,150,150,150,150,150,150,150,150,-54,150,-59,150,-64,150,-69,150,150,150,150,150,150,150,150,150,150,150,150,150,150,150,150,150,150,150,150,150,150,150,150,150,150,150,150,150,150,150,150,150,150,150,150,150,150,-53,-55,-58,-60,-63,-65,-68,-70,150,150,150,150,150,150,150,150,150,150,150,150,150,150,150,150,150,150,150,150,150,150,150,150,]),'GEOMETRIC':([81,82,83,84,85,124,126,127,131,132,160,162,164,166,168,170,172,174,192,212,213,214,215,216,217,218,219,220,221,222,223,224,225,226,228,237,238,239,240,241,242,243,244,247,248,249,250,251,252,253,254,255,256,257,258,259,261,263,265,267,269,271,273,275,306,384,395,396,399,401,402,403,404,405,407,409,410,411,412,434,437,438,439,484,505,509,523,525,],[151,151,151,151,151,151,151,151,151,151,151,-54,151,-59,151,-64,151,-69,151,151,151,151,151,151,151,151,151,151,151,151,151,151,151,151,151,151,151,151,151,151,151,151,151,151,151,151,151,151,151,151,151,151,151,151,151,151,-53,-55,-58,-60,-63,-65,-68,-70,151,151,151,151,151,151,151,151,151,151,151,151,151,151,151,151,151,151,151,151,151,151,151,151,]),'PARETO':([81,82,83,84,85,124,126,127,131,132,160,162,164,166,168,170,172,174,192,212,213,214,215,216,217,218,219,220,221,222,223,224,225,226,228,237,238,239,240,241,242,243,244,247,248,249,250,251,252,253,254,255,256,257,258,259,261,263,265,267,269,271,273,275,306,384,395,396,399,401,402,403,404,405,407,409,410,411,412,434,437,438,439,484,505,509,523,525,],[152,152,152,152,152,152,152,152,152,152,152,-54,152,-59,152,-64,152,-69,152,152,152,152,152,152,152,152,152,152,152,152,152,152,152,152,152,152,152,152,152,152,152,152,152,152,152,152,152,152,152,152,152,152,152,152,152,152,-53,-55,-58,-60,-63,-65,-68,-70,152,152,152,152,152,152,152,152,152,152,152,152,152,152,152,152,152,152,152,152,152,152,152,152,]),'STUDENT':([81,82,83,84,85,124,126,127,131,132,160,162,164,166,168,170,172,174,192,212,213,214,215,216,217,218,219,220,221,222,223,224,225,226,228,237,238,239,240,241,242,243,244,247,248,249,250,251,252,253,254,255,256,257,258,259,261,263,265,267,269,271,273,275,306,384,395,396,399,401,402,403,404,405,407,409,410,411,412,434,437,438,439,484,505,509,523,525,],[153,153,153,153,153,153,153,153,153,153,153,-54,153,-59,153,-64,153,-69,153,153,153,153,153,153,153,153,153,153,153,153,153,153,153,153,153,153,153,153,153,153,153,153,153,153,153,153,153,153,153,153,153,153,153,153,153,153,-53,-55,-58,-60,-63,-65,-68,-70,153,153,153,153,153,153,153,153,153,153,153,153,153,153,153,153,153,153,153,153,153,153,153,153,]),'GUMBEL':([81,82,83,84,85,124,126,127,131,132,160,162,164,166,168,170,172,174,192,212,213,214,215,216,217,218,219,220,221,222,223,224,225,226,228,237,238,239,240,241,242,243,244,247,248,249,250,251,252,253,254,255,256,257,258,259,261,263,265,267,269,271,273,275,306,384,395,396,399,401,402,403,404,405,407,409,410,411,412,434,437,438,439,484,505,509,523,525,],[154,154,154,154,154,154,154,154,154,154,154,-54,154,-59,154,-64,154,-69,154,154,154,154,154,154,154,154,154,154,154,154,154,154,154,154,154,154,154,154,154,154,154,154,154,154,154,154,154,154,154,154,154,154,154,154,154,154,-53,-55,-58,-60,-63,-65,-68,-70,154,154,154,154,154,154,154,154,154,154,154,154,154,154,154,154,154,154,154,154,154,154,154,154,]),'LAPLACE':([81,82,83,84,85,124,126,127,131,132,160,162,164,166,168,170,172,174,192,212,213,214,215,216,217,218,219,220,221,222,223,224,225,226,228,237,238,239,240,241,242,243,244,247,248,249,250,251,252,253,254,255,256,257,258,259,261,263,265,267,269,271,273,275,306,384,395,396,399,401,402,403,404,405,407,409,410,411,412,434,437,438,439,484,505,509,523,525,],[155,155,155,155,155,155,155,155,155,155,155,-54,155,-59,155,-64,155,-69,155,155,155,155,155,155,155,155,155,155,155,155,155,155,155,155,155,155,155,155,155,155,155,155,155,155,155,155,155,155,155,155,155,155,155,155,155,155,-53,-55,-58,-60,-63,-65,-68,-70,155,155,155,155,155,155,155,155,155,155,155,155,155,155,155,155,155,155,155,155,155,155,155,155,]),'CAUCHY':([81,82,83,84,85,124,126,127,131,132,160,162,164,166,168,170,172,174,192,212,213,214,215,216,217,218,219,220,221,222,223,224,225,226,228,237,238,239,240,241,242,243,244,247,248,249,250,251,252,253,254,255,256,257,258,259,261,263,265,267,269,271,273,275,306,384,395,396,399,401,402,403,404,405,407,409,410,411,412,434,437,438,439,484,505,509,523,525,],[156,156,156,156,156,156,156,156,156,156,156,-54,156,-59,156,-64,156,-69,156,156,156,156,156,156,156,156,156,156,156,156,156,156,156,156,156,156,156,156,156,156,156,156,156,156,156,156,156,156,156,156,156,156,156,156,156,156,-53,-55,-58,-60,-63,-65,-68,-70,156,156,156,156,156,156,156,156,156,156,156,156,156,156,156,156,156,156,156,156,156,156,156,156,]),'GOMPERTZ':([81,82,83,84,85,124,126,127,131,132,160,162,164,166,168,170,172,174,192,212,213,214,215,216,217,218,219,220,221,222,223,224,225,226,228,237,238,239,240,241,242,243,244,247,248,249,250,251,252,253,254,255,256,257,258,259,261,263,265,267,269,271,273,275,306,384,395,396,399,401,402,403,404,405,407,409,410,411,412,434,437,438,439,484,505,509,523,525,],[157,157,157,157,157,157,157,157,157,157,157,-54,157,-59,157,-64,157,-69,157,157,157,157,157,157,157,157,157,157,157,157,157,157,157,157,157,157,157,157,157,157,157,157,157,157,157,157,157,157,157,157,157,157,157,157,157,157,-53,-55,-58,-60,-63,-65,-68,-70,157,157,157,157,157,157,157,157,157,157,157,157,157,157,157,157,157,157,157,157,157,157,157,157,]),'TRUE':([81,82,83,84,85,124,126,127,131,132,160,162,164,166,168,170,172,174,188,192,212,213,214,215,216,217,218,219,220,221,222,223,224,225,226,228,237,238,239,240,241,242,243,244,247,248,249,250,251,252,253,254,255,256,257,258,259,261,263,265,267,269,271,273,275,306,384,395,396,399,401,402,403,404,405,407,409,410,411,412,416,434,437,438,439,484,505,509,523,525,536,537,538,539,540,],[158,158,158,158,158,158,158,158,158,158,158,-54,158,-59,158,-64,158,-69,158,158,158,158,158,158,158,158,158,158,158,158,158,158,158,158,158,158,158,158,158,158,158,158,158,158,158,158,158,158,158,158,158,158,158,158,158,158,158,-53,-55,-58,-60,-63,-65,-68,-70,158,158,158,158,158,158,158,158,158,158,158,158,158,158,158,158,158,158,158,158,158,158,158,158,158,158,158,158,158,158,]),'FALSE':([81,82,83,84,85,124,126,127,131,132,160,162,164,166,168,170,172,174,188,192,212,213,214,215,216,217,218,219,220,221,222,223,224,225,226,228,237,238,239,240,241,242,243,244,247,248,249,250,251,252,253,254,255,256,257,258,259,261,263,265,267,269,271,273,275,306,384,395,396,399,401,402,403,404,405,407,409,410,411,412,416,434,437,438,439,484,505,509,523,525,536,537,538,539,540,],[159,159,159,159,159,159,159,159,159,159,159,-54,159,-59,159,-64,159,-69,159,159,159,159,159,159,159,159,159,159,159,159,159,159,159,159,159,159,159,159,159,159,159,159,159,159,159,159,159,159,159,159,159,159,159,159,159,159,159,-53,-55,-58,-60,-63,-65,-68,-70,159,159,159,159,159,159,159,159,159,159,159,159,159,159,159,159,159,159,159,159,159,159,159,159,159,159,159,159,159,159,]),'SEMI':([87,89,90,97,99,100,101,102,104,112,113,114,115,116,117,118,119,120,121,122,123,125,128,133,134,158,159,161,163,165,167,169,171,173,175,176,181,184,189,194,195,198,207,232,235,236,260,264,268,272,284,285,286,287,288,289,290,292,293,294,307,308,309,310,311,312,313,314,315,316,317,318,319,320,321,331,332,364,367,368,371,380,381,383,392,393,394,397,400,406,408,413,418,458,460,470,473,474,480,481,483,485,486,487,488,489,490,491,492,493,494,495,506,517,519,520,521,546,547,548,549,550,],[177,179,180,187,190,-175,-176,191,193,211,-77,-78,-79,-80,-81,-82,-83,-84,-85,-86,-88,-89,-105,-114,-115,-167,-168,262,263,266,267,270,271,274,275,276,277,279,296,298,299,301,305,-104,-113,-112,358,359,360,361,-166,366,-162,-163,-164,-165,-169,-171,-172,-173,-93,-94,-95,-96,-97,-98,-99,-100,-101,-102,-103,-108,-109,-110,-111,-91,-90,415,-170,-174,419,431,-87,-92,-119,-120,-121,-124,-127,-133,-135,456,459,496,497,-116,-106,-107,-122,-123,-125,-126,-128,-129,-130,-131,-132,-134,-136,-137,-138,-139,-118,530,532,533,-117,551,552,553,554,555,]),'COLON':([94,197,206,210,280,283,325,326,327,381,387,429,444,479,508,510,],[183,300,303,-88,-152,-153,-74,-75,-76,-87,436,468,484,509,523,525,]),'COMP_EQUAL':([112,113,114,115,116,117,118,119,120,121,122,123,125,128,133,134,158,159,163,167,171,175,230,231,232,235,236,297,307,308,309,310,311,312,313,314,315,316,317,318,319,320,321,329,331,332,335,336,337,338,339,340,341,342,345,346,347,348,349,350,351,352,353,354,355,356,357,380,381,383,392,393,394,397,400,406,408,433,441,442,445,446,447,448,449,450,451,452,453,454,455,470,473,474,475,480,481,483,485,486,487,488,489,490,491,492,493,494,495,506,511,521,524,534,535,],[212,-77,-78,-79,-80,-81,-82,-83,-84,-85,-86,-88,-89,-105,-114,-115,-167,-168,212,212,212,212,212,212,-104,-113,-112,212,-93,-94,-95,-96,-97,-98,212,212,212,212,212,-108,-109,-110,-111,212,-91,-90,212,212,212,212,212,212,212,212,212,212,212,212,212,212,212,212,212,212,212,212,212,212,-87,-92,-119,-120,-121,-124,-127,-133,-135,212,212,212,212,212,212,212,212,212,212,212,212,212,212,212,212,212,212,-122,-123,-125,-126,-128,-129,-130,-131,-132,-134,-136,-137,-138,-139,-118,212,212,212,212,212,]),'NEQ':([112,113,114,115,116,117,118,119,120,121,122,123,125,128,133,134,158,159,163,167,171,175,230,231,232,235,236,297,307,308,309,310,311,312,313,314,315,316,317,318,319,320,321,329,331,332,335,336,337,338,339,340,341,342,345,346,347,348,349,350,351,352,353,354,355,356,357,380,381,383,392,393,394,397,400,406,408,433,441,442,445,446,447,448,449,450,451,452,453,454,455,470,473,474,475,480,481,483,485,486,487,488,489,490,491,492,493,494,495,506,511,521,524,534,535,],[213,-77,-78,-79,-80,-81,-82,-83,-84,-85,-86,-88,-89,-105,-114,-115,-167,-168,213,213,213,213,213,213,-104,-113,-112,213,-93,-94,-95,-96,-97,-98,213,213,213,213,213,-108,-109,-110,-111,213,-91,-90,213,213,213,213,213,213,213,213,213,213,213,213,213,213,213,213,213,213,213,213,213,213,-87,-92,-119,-120,-121,-124,-127,-133,-135,213,213,213,213,213,213,213,213,213,213,213,213,213,213,213,213,213,213,-122,-123,-125,-126,-128,-129,-130,-131,-132,-134,-136,-137,-138,-139,-118,213,213,213,213,213,]),'GREATER':([112,113,114,115,116,117,118,119,120,121,122,123,125,128,133,134,158,159,163,167,171,175,230,231,232,235,236,297,307,308,309,310,311,312,313,314,315,316,317,318,319,320,321,329,331,332,335,336,337,338,339,340,341,342,345,346,347,348,349,350,351,352,353,354,355,356,357,380,381,383,392,393,394,397,400,406,408,433,441,442,445,446,447,448,449,450,451,452,453,454,455,470,473,474,475,480,481,483,485,486,487,488,489,490,491,492,493,494,495,506,511,521,524,534,535,],[214,-77,-78,-79,-80,-81,-82,-83,-84,-85,-86,-88,-89,-105,-114,-115,-167,-168,214,214,214,214,214,214,-104,-113,-112,214,-93,-94,-95,-96,-97,-98,214,214,214,214,214,-108,-109,-110,-111,214,-91,-90,214,214,214,214,214,214,214,214,214,214,214,214,214,214,214,214,214,214,214,214,214,214,-87,-92,-119,-120,-121,-124,-127,-133,-135,214,214,214,214,214,214,214,214,214,214,214,214,214,214,214,214,214,214,-122,-123,-125,-126,-128,-129,-130,-131,-132,-134,-136,-137,-138,-139,-118,214,214,214,214,214,]),'GREATEREQ':([112,113,114,115,116,117,118,119,120,121,122,123,125,128,133,134,158,159,163,167,171,175,230,231,232,235,236,297,307,308,309,310,311,312,313,314,315,316,317,318,319,320,321,329,331,332,335,336,337,338,339,340,341,342,345,346,347,348,349,350,351,352,353,354,355,356,357,380,381,383,392,393,394,397,400,406,408,433,441,442,445,446,447,448,449,450,451,452,453,454,455,470,473,474,475,480,481,483,485,486,487,488,489,490,491,492,493,494,495,506,511,521,524,534,535,],[215,-77,-78,-79,-80,-81,-82,-83,-84,-85,-86,-88,-89,-105,-114,-115,-167,-168,215,215,215,215,215,215,-104,-113,-112,215,-93,-94,-95,-96,-97,-98,215,215,215,215,215,-108,-109,-110,-111,215,-91,-90,215,215,215,215,215,215,215,215,215,215,215,215,215,215,215,215,215,215,215,215,215,215,-87,-92,-119,-120,-121,-124,-127,-133,-135,215,215,215,215,215,215,215,215,215,215,215,215,215,215,215,215,215,215,-122,-123,-125,-126,-128,-129,-130,-131,-132,-134,-136,-137,-138,-139,-118,215,215,215,215,215,]),'LESS':([112,113,114,115,116,117,118,119,120,121,122,123,125,128,133,134,158,159,163,167,171,175,230,231,232,235,236,297,307,308,309,310,311,312,313,314,315,316,317,318,319,320,321,329,331,332,335,336,337,338,339,340,341,342,345,346,347,348,349,350,351,352,353,354,355,356,357,380,381,383,392,393,394,397,400,406,408,433,441,442,445,446,447,448,449,450,451,452,453,454,455,470,473,474,475,480,481,483,485,486,487,488,489,490,491,492,493,494,495,506,511,521,524,534,535,],[216,-77,-78,-79,-80,-81,-82,-83,-84,-85,-86,-88,-89,-105,-114,-115,-167,-168,216,216,216,216,216,216,-104,-113,-112,216,-93,-94,-95,-96,-97,-98,216,216,216,216,216,-108,-109,-110,-111,216,-91,-90,216,216,216,216,216,216,216,216,216,216,216,216,216,216,216,216,216,216,216,216,216,216,-87,-92,-119,-120,-121,-124,-127,-133,-135,216,216,216,216,216,216,216,216,216,216,216,216,216,216,216,216,216,216,-122,-123,-125,-126,-128,-129,-130,-131,-132,-134,-136,-137,-138,-139,-118,216,216,216,216,216,]),'LESSEQ':([112,113,114,115,116,117,118,119,120,121,122,123,125,128,133,134,158,159,163,167,171,175,230,231,232,235,236,297,307,308,309,310,311,312,313,314,315,316,317,318,319,320,321,329,331,332,335,336,337,338,339,340,341,342,345,346,347,348,349,350,351,352,353,354,355,356,357,380,381,383,392,393,394,397,400,406,408,433,441,442,445,446,447,448,449,450,451,452,453,454,455,470,473,474,475,480,481,483,485,486,487,488,489,490,491,492,493,494,495,506,511,521,524,534,535,],[217,-77,-78,-79,-80,-81,-82,-83,-84,-85,-86,-88,-89,-105,-114,-115,-167,-168,217,217,217,217,217,217,-104,-113,-112,217,-93,-94,-95,-96,-97,-98,217,217,217,217,217,-108,-109,-110,-111,217,-91,-90,217,217,217,217,217,217,217,217,217,217,217,217,217,217,217,217,217,217,217,217,217,217,-87,-92,-119,-120,-121,-124,-127,-133,-135,217,217,217,217,217,217,217,217,217,217,217,217,217,217,217,217,217,217,-122,-123,-125,-126,-128,-129,-130,-131,-132,-134,-136,-137,-138,-139,-118,217,217,217,217,217,]),'AND':([112,113,114,115,116,117,118,119,120,121,122,123,125,128,133,134,158,159,163,167,171,175,230,231,232,235,236,297,307,308,309,310,311,312,313,314,315,316,317,318,319,320,321,329,331,332,335,336,337,338,339,340,341,342,345,346,347,348,349,350,351,352,353,354,355,356,357,380,381,383,392,393,394,397,400,406,408,433,441,442,445,446,447,448,449,450,451,452,453,454,455,470,473,474,475,480,481,483,485,486,487,488,489,490,491,492,493,494,495,506,511,521,524,534,535,],[218,-77,-78,-79,-80,-81,-82,-83,-84,-85,-86,-88,-89,-105,-114,-115,-167,-168,218,218,218,218,218,218,-104,-113,-112,218,-93,-94,-95,-96,-97,-98,-99,-100,218,218,218,-108,-109,-110,-111,218,-91,-90,218,218,218,218,218,218,218,218,218,218,218,218,218,218,218,218,218,218,218,218,218,218,-87,-92,-119,-120,-121,-124,-127,-133,-135,218,218,218,218,218,218,218,218,218,218,218,218,218,218,218,218,218,218,-122,-123,-125,-126,-128,-129,-130,-131,-132,-134,-136,-137,-138,-139,-118,218,218,218,218,218,]),'AMPERSAND':([112,113,114,115,116,117,118,119,120,121,122,123,125,128,133,134,158,159,163,167,171,175,230,231,232,235,236,297,307,308,309,310,311,312,313,314,315,316,317,318,319,320,321,329,331,332,335,336,337,338,339,340,341,342,345,346,347,348,349,350,351,352,353,354,355,356,357,380,381,383,392,393,394,397,400,406,408,433,441,442,445,446,447,448,449,450,451,452,453,454,455,470,473,474,475,480,481,483,485,486,487,488,489,490,491,492,493,494,495,506,511,521,524,534,535,],[219,-77,-78,-79,-80,-81,-82,-83,-84,-85,-86,-88,-89,-105,-114,-115,-167,-168,219,219,219,219,219,219,-104,-113,-112,219,-93,-94,-95,-96,-97,-98,-99,-100,219,219,219,-108,-109,-110,-111,219,-91,-90,219,219,219,219,219,219,219,219,219,219,219,219,219,219,219,219,219,219,219,219,219,219,-87,-92,-119,-120,-121,-124,-127,-133,-135,219,219,219,219,219,219,219,219,219,219,219,219,219,219,219,219,219,219,-122,-123,-125,-126,-128,-129,-130,-131,-132,-134,-136,-137,-138,-139,-118,219,219,219,219,219,]),'OR':([112,113,114,115,116,117,118,119,120,121,122,123,125,128,133,134,158,159,163,167,171,175,230,231,232,235,236,297,307,308,309,310,311,312,313,314,315,316,317,318,319,320,321,329,331,332,335,336,337,338,339,340,341,342,345,346,347,348,349,350,351,352,353,354,355,356,357,380,381,383,392,393,394,397,400,406,408,433,441,442,445,446,447,448,449,450,451,452,453,454,455,470,473,474,475,480,481,483,485,486,487,488,489,490,491,492,493,494,495,506,511,521,524,534,535,],[220,-77,-78,-79,-80,-81,-82,-83,-84,-85,-86,-88,-89,-105,-114,-115,-167,-168,220,220,220,220,220,220,-104,-113,-112,220,-93,-94,-95,-96,-97,-98,-99,-100,-101,220,220,-108,-109,-110,-111,220,-91,-90,220,220,220,220,220,220,220,220,220,220,220,220,220,220,220,220,220,220,220,220,220,220,-87,-92,-119,-120,-121,-124,-127,-133,-135,220,220,220,220,220,220,220,220,220,220,220,220,220,220,220,220,220,220,-122,-123,-125,-126,-128,-129,-130,-131,-132,-134,-136,-137,-138,-139,-118,220,220,220,220,220,]),'IMPLY':([112,113,114,115,116,117,118,119,120,121,122,123,125,128,133,134,158,159,163,167,171,175,230,231,232,235,236,297,307,308,309,310,311,312,313,314,315,316,317,318,319,320,321,329,331,332,335,336,337,338,339,340,341,342,345,346,347,348,349,350,351,352,353,354,355,356,357,380,381,383,392,393,394,397,400,406,408,433,441,442,445,446,447,448,449,450,451,452,453,454,455,470,473,474,475,480,481,483,485,486,487,488,489,490,491,492,493,494,495,506,511,521,524,534,535,],[221,-77,-78,-79,-80,-81,-82,-83,-84,-85,-86,-88,-89,-105,-114,-115,-167,-168,221,221,221,221,221,221,-104,-113,-112,221,-93,-94,-95,-96,-97,-98,-99,-100,-101,-102,221,-108,-109,-110,-111,221,-91,-90,221,221,221,221,221,221,221,221,221,221,221,221,221,221,221,221,221,221,221,221,221,221,-87,-92,-119,-120,-121,-124,-127,-133,-135,221,221,221,221,221,221,221,221,221,221,221,221,221,221,221,221,221,221,-122,-123,-125,-126,-128,-129,-130,-131,-132,-134,-136,-137,-138,-139,-118,221,221,221,221,221,]),'EQUIV':([112,113,114,115,116,117,118,119,120,121,122,123,125,128,133,134,158,159,163,167,171,175,230,231,232,235,236,297,307,308,309,310,311,312,313,314,315,316,317,318,319,320,321,329,331,332,335,336,337,338,339,340,341,342,345,346,347,348,349,350,351,352,353,354,355,356,357,380,381,383,392,393,394,397,400,406,408,433,441,442,445,446,447,448,449,450,451,452,453,454,455,470,473,474,475,480,481,483,485,486,487,488,489,490,491,492,493,494,495,506,511,521,524,534,535,],[222,-77,-78,-79,-80,-81,-82,-83,-84,-85,-86,-88,-89,-105,-114,-115,-167,-168,222,222,222,222,222,222,-104,-113,-112,222,-93,-94,-95,-96,-97,-98,-99,-100,-101,-102,-103,-108,-109,-110,-111,222,-91,-90,222,222,222,222,222,222,222,222,222,222,222,222,222,222,222,222,222,222,222,222,222,222,-87,-92,-119,-120,-121,-124,-127,-133,-135,222,222,222,222,222,222,222,222,222,222,222,222,222,222,222,222,222,222,-122,-123,-125,-126,-128,-129,-130,-131,-132,-134,-136,-137,-138,-139,-118,222,222,222,222,222,]),'TIMES':([112,113,114,115,116,117,118,119,120,121,122,123,125,128,133,134,158,159,163,167,171,175,230,231,232,235,236,297,307,308,309,310,311,312,313,314,315,316,317,318,319,320,321,329,331,332,335,336,337,338,339,340,341,342,345,346,347,348,349,350,351,352,353,354,355,356,357,380,381,383,392,393,394,397,400,406,408,433,441,442,445,446,447,448,449,450,451,452,453,454,455,470,473,474,475,480,481,483,485,486,487,488,489,490,491,492,493,494,495,506,511,521,524,534,535,],[225,-77,-78,-79,-80,-81,-82,-83,-84,-85,-86,-88,-89,-105,-114,-115,-167,-168,225,225,225,225,225,225,-104,-113,-112,225,225,225,225,225,225,225,225,225,225,225,225,225,225,-110,-111,225,-91,-90,225,225,225,225,225,225,225,225,225,225,225,225,225,225,225,225,225,225,225,225,225,225,-87,-92,-119,-120,-121,-124,-127,-133,-135,225,225,225,225,225,225,225,225,225,225,225,225,225,225,225,225,225,225,-122,-123,-125,-126,-128,-129,-130,-131,-132,-134,-136,-137,-138,-139,-118,225,225,225,225,225,]),'DIV':([112,113,114,115,116,117,118,119,120,121,122,123,125,128,133,134,158,159,163,167,171,175,230,231,232,235,236,297,307,308,309,310,311,312,313,314,315,316,317,318,319,320,321,329,331,332,335,336,337,338,339,340,341,342,345,346,347,348,349,350,351,352,353,354,355,356,357,380,381,383,392,393,394,397,400,406,408,433,441,442,445,446,447,448,449,450,451,452,453,454,455,470,473,474,475,480,481,483,485,486,487,488,489,490,491,492,493,494,495,506,511,521,524,534,535,],[226,-77,-78,-79,-80,-81,-82,-83,-84,-85,-86,-88,-89,-105,-114,-115,-167,-168,226,226,226,226,226,226,-104,-113,-112,226,226,226,226,226,226,226,226,226,226,226,226,226,226,-110,-111,226,-91,-90,226,226,226,226,226,226,226,226,226,226,226,226,226,226,226,226,226,226,226,226,226,226,-87,-92,-119,-120,-121,-124,-127,-133,-135,226,226,226,226,226,226,226,226,226,226,226,226,226,226,226,226,226,226,-122,-123,-125,-126,-128,-129,-130,-131,-132,-134,-136,-137,-138,-139,-118,226,226,226,226,226,]),'RPAREN':([113,114,115,116,117,118,119,120,121,122,123,125,128,133,134,158,159,210,227,230,232,235,236,280,281,282,283,297,307,308,309,310,311,312,313,314,315,316,317,318,319,320,321,322,323,324,325,326,327,331,332,335,336,337,338,339,342,345,351,353,369,374,375,376,377,378,379,381,383,392,393,394,397,400,406,408,417,432,441,442,443,445,446,447,448,449,450,451,452,453,454,455,469,470,473,474,480,481,483,485,486,487,488,489,490,491,492,493,494,495,506,511,512,521,535,],[-77,-78,-79,-80,-81,-82,-83,-84,-85,-86,-88,-89,-105,-114,-115,-167,-168,-88,-219,331,-104,-113,-112,-152,364,-215,-153,370,-93,-94,-95,-96,-97,-98,-99,-100,-101,-102,-103,-108,-109,-110,-111,381,-72,-73,-74,-75,-76,-91,-90,390,391,392,393,394,397,400,406,408,418,429,-156,-158,-159,-160,-161,-87,-92,-119,-120,-121,-124,-127,-133,-135,-214,-71,480,481,483,485,486,487,488,489,490,491,492,493,494,495,-157,-116,-106,-107,-122,-123,-125,-126,-128,-129,-130,-131,-132,-134,-136,-137,-138,-139,-118,-149,-150,-117,-151,]),'RBRACK':([113,114,115,116,117,118,119,120,121,122,123,125,128,133,134,158,159,231,232,235,236,307,308,309,310,311,312,313,314,315,316,317,318,319,320,321,328,329,331,332,381,383,392,393,394,397,400,406,408,433,470,473,474,480,481,483,485,486,487,488,489,490,491,492,493,494,495,506,521,],[-77,-78,-79,-80,-81,-82,-83,-84,-85,-86,-88,-89,-105,-114,-115,-167,-168,332,-104,-113,-112,-93,-94,-95,-96,-97,-98,-99,-100,-101,-102,-103,-108,-109,-110,-111,383,-144,-91,-90,-87,-92,-119,-120,-121,-124,-127,-133,-135,-143,-116,-106,-107,-122,-123,-125,-126,-128,-129,-130,-131,-132,-134,-136,-137,-138,-139,-118,-117,]),'ELSE':([113,114,115,116,117,118,119,120,121,122,123,125,128,133,134,158,159,232,235,236,307,308,309,310,311,312,313,314,315,316,317,318,319,320,321,331,332,381,383,392,393,394,397,400,406,408,470,473,474,475,480,481,483,485,486,487,488,489,490,491,492,493,494,495,506,521,],[-77,-78,-79,-80,-81,-82,-83,-84,-85,-86,-88,-89,-105,-114,-115,-167,-168,-104,-113,-112,-93,-94,-95,-96,-97,-98,-99,-100,-101,-102,-103,-108,-109,-110,-111,-91,-90,-87,-92,-119,-120,-121,-124,-127,-133,-135,-116,-106,-107,505,-122,-123,-125,-126,-128,-129,-130,-131,-132,-134,-136,-137,-138,-139,-118,-117,]),'UNDERSCORE':([123,129,130,],[229,233,234,]),'NEG_INF':([188,416,536,537,538,539,540,],[293,293,293,293,293,293,293,]),'VAR':([227,330,333,334,382,435,478,],[325,387,387,387,325,387,325,]),'OBJECT':([300,],[371,]),'INT':([304,430,462,463,464,465,466,467,],[377,377,377,377,377,377,377,377,]),'REAL':([304,430,462,463,464,465,466,467,],[378,378,378,378,378,378,378,378,]),'BOOL':([304,430,462,463,464,465,466,467,],[379,379,379,379,379,379,379,379,]),'NON_FLUENT':([373,],[423,]),'STATE':([373,],[424,]),'ACTION':([373,],[425,]),'INTERMEDIATE':([373,],[426,]),'DERIVED_FLUENT':([373,],[427,]),'OBSERVATION':([373,],[428,]),'THEN':([390,],[439,]),'CASE':([440,507,],[478,478,]),'DEFAULT':([440,507,513,514,515,],[479,479,526,527,528,]),'OTHERWISE':([484,],[512,]),'LEVEL':([516,518,],[529,531,]),}
+
+_lr_action = {}
+for _k, _v in _lr_action_items.items():
+   for _x,_y in zip(_v[0],_v[1]):
+      if not _x in _lr_action:  _lr_action[_x] = {}
+      _lr_action[_x][_k] = _y
+del _lr_action_items
+
+_lr_goto_items = {'rddl':([0,],[1,]),'rddl_block':([0,],[2,]),'empty':([0,13,14,15,16,26,66,72,78,79,80,227,372,],[3,18,20,22,24,69,69,93,107,109,111,324,422,]),'domain_block':([2,],[4,]),'instance_block':([2,],[5,]),'nonfluent_block':([2,],[6,]),'req_section':([13,],[16,]),'instance_list':([14,],[19,]),'nonfluent_list':([15,],[21,]),'domain_list':([16,],[23,]),'domain_section':([19,21,],[28,44,]),'nonfluents_section':([19,],[29,]),'objects_section':([19,21,],[30,45,]),'init_state_section':([19,],[31,]),'max_nondef_actions_section':([19,],[32,]),'horizon_spec_section':([19,],[33,]),'discount_section':([19,],[34,]),'init_non_fluent_section':([21,],[46,]),'type_section':([23,],[48,]),'pvar_section':([23,],[49,]),'cpf_section':([23,],[50,]),'reward_section':([23,],[51,]),'termination_section':([23,],[52,]),'action_precond_section':([23,],[53,]),'state_action_constraint_section':([23,],[54,]),'state_invariant_section':([23,],[55,]),'cpf_header':([23,],[58,]),'string_list':([26,66,],[67,86,]),'objects_list':([72,],[91,]),'objects_def':([72,91,],[92,182,]),'pvar_inst_list':([73,77,],[95,105,]),'pvar_inst_def':([73,77,95,105,],[96,96,185,185,]),'pos_int_type_or_pos_inf':([74,75,],[99,102,]),'type_list':([78,],[106,]),'pvar_list':([79,],[108,]),'cpf_list':([80,],[110,]),'expr':([81,82,83,84,85,124,126,127,131,132,160,164,168,172,192,212,213,214,215,216,217,218,219,220,221,222,223,224,225,226,228,237,238,239,240,241,242,243,244,247,248,249,250,251,252,253,254,255,256,257,258,259,306,384,395,396,399,401,402,403,404,405,407,409,410,411,412,434,437,438,439,484,505,509,523,525,],[112,163,167,171,175,230,231,232,235,236,163,167,171,175,297,307,308,309,310,311,312,313,314,315,316,317,318,319,320,321,329,335,336,337,338,339,340,341,342,345,346,347,348,349,350,351,352,353,354,355,356,357,380,433,441,442,445,446,447,448,449,450,451,452,453,454,455,470,473,474,475,511,521,524,534,535,]),'pvar_expr':([81,82,83,84,85,110,124,126,127,131,132,160,164,168,172,192,212,213,214,215,216,217,218,219,220,221,222,223,224,225,226,227,228,237,238,239,240,241,242,243,244,247,248,249,250,251,252,253,254,255,256,257,258,259,306,382,384,395,396,399,401,402,403,404,405,407,409,410,411,412,434,437,438,439,478,484,505,509,523,525,],[113,113,113,113,113,209,113,113,113,113,113,113,113,113,113,113,113,113,113,113,113,113,113,113,113,113,113,113,113,113,113,327,113,113,113,113,113,113,113,113,113,113,113,113,113,113,113,113,113,113,113,113,113,113,113,327,113,113,113,113,113,113,113,113,113,113,113,113,113,113,113,113,113,113,327,113,113,113,113,113,]),'group_expr':([81,82,83,84,85,124,126,127,131,132,160,164,168,172,192,212,213,214,215,216,217,218,219,220,221,222,223,224,225,226,228,237,238,239,240,241,242,243,244,247,248,249,250,251,252,253,254,255,256,257,258,259,306,384,395,396,399,401,402,403,404,405,407,409,410,411,412,434,437,438,439,484,505,509,523,525,],[114,114,114,114,114,114,114,114,114,114,114,114,114,114,114,114,114,114,114,114,114,114,114,114,114,114,114,114,114,114,114,114,114,114,114,114,114,114,114,114,114,114,114,114,114,114,114,114,114,114,114,114,114,114,114,114,114,114,114,114,114,114,114,114,114,114,114,114,114,114,114,114,114,114,114,114,]),'function_expr':([81,82,83,84,85,124,126,127,131,132,160,164,168,172,192,212,213,214,215,216,217,218,219,220,221,222,223,224,225,226,228,237,238,239,240,241,242,243,244,247,248,249,250,251,252,253,254,255,256,257,258,259,306,384,395,396,399,401,402,403,404,405,407,409,410,411,412,434,437,438,439,484,505,509,523,525,],[115,115,115,115,115,115,115,115,115,115,115,115,115,115,115,115,115,115,115,115,115,115,115,115,115,115,115,115,115,115,115,115,115,115,115,115,115,115,115,115,115,115,115,115,115,115,115,115,115,115,115,115,115,115,115,115,115,115,115,115,115,115,115,115,115,115,115,115,115,115,115,115,115,115,115,115,]),'relational_expr':([81,82,83,84,85,124,126,127,131,132,160,164,168,172,192,212,213,214,215,216,217,218,219,220,221,222,223,224,225,226,228,237,238,239,240,241,242,243,244,247,248,249,250,251,252,253,254,255,256,257,258,259,306,384,395,396,399,401,402,403,404,405,407,409,410,411,412,434,437,438,439,484,505,509,523,525,],[116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,]),'boolean_expr':([81,82,83,84,85,124,126,127,131,132,160,164,168,172,192,212,213,214,215,216,217,218,219,220,221,222,223,224,225,226,228,237,238,239,240,241,242,243,244,247,248,249,250,251,252,253,254,255,256,257,258,259,306,384,395,396,399,401,402,403,404,405,407,409,410,411,412,434,437,438,439,484,505,509,523,525,],[117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,]),'quantifier_expr':([81,82,83,84,85,124,126,127,131,132,160,164,168,172,192,212,213,214,215,216,217,218,219,220,221,222,223,224,225,226,228,237,238,239,240,241,242,243,244,247,248,249,250,251,252,253,254,255,256,257,258,259,306,384,395,396,399,401,402,403,404,405,407,409,410,411,412,434,437,438,439,484,505,509,523,525,],[118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,]),'numerical_expr':([81,82,83,84,85,124,126,127,131,132,160,164,168,172,192,212,213,214,215,216,217,218,219,220,221,222,223,224,225,226,228,237,238,239,240,241,242,243,244,247,248,249,250,251,252,253,254,255,256,257,258,259,306,384,395,396,399,401,402,403,404,405,407,409,410,411,412,434,437,438,439,484,505,509,523,525,],[119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,]),'aggregation_expr':([81,82,83,84,85,124,126,127,131,132,160,164,168,172,192,212,213,214,215,216,217,218,219,220,221,222,223,224,225,226,228,237,238,239,240,241,242,243,244,247,248,249,250,251,252,253,254,255,256,257,258,259,306,384,395,396,399,401,402,403,404,405,407,409,410,411,412,434,437,438,439,484,505,509,523,525,],[120,120,120,120,120,120,120,120,120,120,120,120,120,120,120,120,120,120,120,120,120,120,120,120,120,120,120,120,120,120,120,120,120,120,120,120,120,120,120,120,120,120,120,120,120,120,120,120,120,120,120,120,120,120,120,120,120,120,120,120,120,120,120,120,120,120,120,120,120,120,120,120,120,120,120,120,]),'control_expr':([81,82,83,84,85,124,126,127,131,132,160,164,168,172,192,212,213,214,215,216,217,218,219,220,221,222,223,224,225,226,228,237,238,239,240,241,242,243,244,247,248,249,250,251,252,253,254,255,256,257,258,259,306,384,395,396,399,401,402,403,404,405,407,409,410,411,412,434,437,438,439,484,505,509,523,525,],[121,121,121,121,121,121,121,121,121,121,121,121,121,121,121,121,121,121,121,121,121,121,121,121,121,121,121,121,121,121,121,121,121,121,121,121,121,121,121,121,121,121,121,121,121,121,121,121,121,121,121,121,121,121,121,121,121,121,121,121,121,121,121,121,121,121,121,121,121,121,121,121,121,121,121,121,]),'randomvar_expr':([81,82,83,84,85,124,126,127,131,132,160,164,168,172,192,212,213,214,215,216,217,218,219,220,221,222,223,224,225,226,228,237,238,239,240,241,242,243,244,247,248,249,250,251,252,253,254,255,256,257,258,259,306,384,395,396,399,401,402,403,404,405,407,409,410,411,412,434,437,438,439,484,505,509,523,525,],[122,122,122,122,122,122,122,122,122,122,122,122,122,122,122,122,122,122,122,122,122,122,122,122,122,122,122,122,122,122,122,122,122,122,122,122,122,122,122,122,122,122,122,122,122,122,122,122,122,122,122,122,122,122,122,122,122,122,122,122,122,122,122,122,122,122,122,122,122,122,122,122,122,122,122,122,]),'bool_type':([81,82,83,84,85,124,126,127,131,132,160,164,168,172,188,192,212,213,214,215,216,217,218,219,220,221,222,223,224,225,226,228,237,238,239,240,241,242,243,244,247,248,249,250,251,252,253,254,255,256,257,258,259,306,384,395,396,399,401,402,403,404,405,407,409,410,411,412,416,434,437,438,439,484,505,509,523,525,536,537,538,539,540,],[128,128,128,128,128,128,128,128,128,128,128,128,128,128,286,128,128,128,128,128,128,128,128,128,128,128,128,128,128,128,128,128,128,128,128,128,128,128,128,128,128,128,128,128,128,128,128,128,128,128,128,128,128,128,128,128,128,128,128,128,128,128,128,128,128,128,128,128,286,128,128,128,128,128,128,128,128,128,286,286,286,286,286,]),'termination_list':([82,],[160,]),'termination_cond_def':([82,160,],[162,261,]),'action_precond_list':([83,],[164,]),'action_precond_def':([83,164,],[166,265,]),'state_cons_list':([84,],[168,]),'state_cons_def':([84,168,],[170,269,]),'state_invariant_list':([85,],[172,]),'state_invariant_def':([85,172,],[174,273,]),'type_def':([106,],[196,]),'pvar_def':([108,],[199,]),'nonfluent_def':([108,],[200,]),'statefluent_def':([108,],[201,]),'actionfluent_def':([108,],[202,]),'intermfluent_def':([108,],[203,]),'derivedfluent_def':([108,],[204,]),'observfluent_def':([108,],[205,]),'cpf_def':([110,],[208,]),'lconst_list':([186,295,],[281,369,]),'lconst':([186,295,365,398,482,],[282,282,417,444,510,]),'range_const':([188,416,536,537,538,539,540,],[285,458,541,542,543,544,545,]),'double_type':([188,416,536,537,538,539,540,],[287,287,287,287,287,287,287,]),'int_type':([188,416,536,537,538,539,540,],[288,288,288,288,288,288,288,]),'param_list':([206,],[302,]),'term_list':([227,],[322,]),'term':([227,382,478,],[323,432,508,]),'expr_list':([228,],[328,]),'object_const_list':([278,],[363,]),'param_list2':([304,],[374,]),'type_spec':([304,430,462,463,464,465,466,467,],[375,469,499,500,501,502,503,504,]),'typed_var_list':([330,333,334,],[385,388,389,]),'typed_var':([330,333,334,435,],[386,386,386,471,]),'enum_list':([372,],[420,]),'lconst_case_list':([398,],[443,]),'case_list':([440,],[476,]),'case_def':([440,507,],[477,522,]),}
+
+_lr_goto = {}
+for _k, _v in _lr_goto_items.items():
+   for _x, _y in zip(_v[0], _v[1]):
+       if not _x in _lr_goto: _lr_goto[_x] = {}
+       _lr_goto[_x][_k] = _y
+del _lr_goto_items
+_lr_productions = [
+  ("S' -> rddl","S'",1,None,None,None),
+  ('rddl -> rddl_block','rddl',1,'p_rddl','parser.py',270),
+  ('rddl_block -> rddl_block domain_block','rddl_block',2,'p_rddl_block','parser.py',274),
+  ('rddl_block -> rddl_block instance_block','rddl_block',2,'p_rddl_block','parser.py',275),
+  ('rddl_block -> rddl_block nonfluent_block','rddl_block',2,'p_rddl_block','parser.py',276),
+  ('rddl_block -> empty','rddl_block',1,'p_rddl_block','parser.py',277),
+  ('domain_block -> DOMAIN IDENT LCURLY req_section domain_list RCURLY','domain_block',6,'p_domain_block','parser.py',286),
+  ('req_section -> REQUIREMENTS ASSIGN_EQUAL LCURLY string_list RCURLY SEMI','req_section',6,'p_req_section','parser.py',291),
+  ('req_section -> REQUIREMENTS LCURLY string_list RCURLY SEMI','req_section',5,'p_req_section','parser.py',292),
+  ('req_section -> empty','req_section',1,'p_req_section','parser.py',293),
+  ('domain_list -> domain_list type_section','domain_list',2,'p_domain_list','parser.py',301),
+  ('domain_list -> domain_list pvar_section','domain_list',2,'p_domain_list','parser.py',302),
+  ('domain_list -> domain_list cpf_section','domain_list',2,'p_domain_list','parser.py',303),
+  ('domain_list -> domain_list reward_section','domain_list',2,'p_domain_list','parser.py',304),
+  ('domain_list -> domain_list termination_section','domain_list',2,'p_domain_list','parser.py',305),
+  ('domain_list -> domain_list action_precond_section','domain_list',2,'p_domain_list','parser.py',306),
+  ('domain_list -> domain_list state_action_constraint_section','domain_list',2,'p_domain_list','parser.py',307),
+  ('domain_list -> domain_list state_invariant_section','domain_list',2,'p_domain_list','parser.py',308),
+  ('domain_list -> empty','domain_list',1,'p_domain_list','parser.py',309),
+  ('type_section -> TYPES LCURLY type_list RCURLY SEMI','type_section',5,'p_type_section','parser.py',318),
+  ('type_list -> type_list type_def','type_list',2,'p_type_list','parser.py',323),
+  ('type_list -> empty','type_list',1,'p_type_list','parser.py',324),
+  ('type_def -> IDENT COLON OBJECT SEMI','type_def',4,'p_type_def','parser.py',332),
+  ('type_def -> IDENT COLON LCURLY enum_list RCURLY SEMI','type_def',6,'p_type_def','parser.py',333),
+  ('enum_list -> enum_list COMMA ENUM_VAL','enum_list',3,'p_enum_list','parser.py',340),
+  ('enum_list -> ENUM_VAL','enum_list',1,'p_enum_list','parser.py',341),
+  ('enum_list -> empty','enum_list',1,'p_enum_list','parser.py',342),
+  ('pvar_section -> PVARIABLES LCURLY pvar_list RCURLY SEMI','pvar_section',5,'p_pvar_section','parser.py',352),
+  ('pvar_list -> pvar_list pvar_def','pvar_list',2,'p_pvar_list','parser.py',357),
+  ('pvar_list -> empty','pvar_list',1,'p_pvar_list','parser.py',358),
+  ('pvar_def -> nonfluent_def','pvar_def',1,'p_pvar_def','parser.py',366),
+  ('pvar_def -> statefluent_def','pvar_def',1,'p_pvar_def','parser.py',367),
+  ('pvar_def -> actionfluent_def','pvar_def',1,'p_pvar_def','parser.py',368),
+  ('pvar_def -> intermfluent_def','pvar_def',1,'p_pvar_def','parser.py',369),
+  ('pvar_def -> derivedfluent_def','pvar_def',1,'p_pvar_def','parser.py',370),
+  ('pvar_def -> observfluent_def','pvar_def',1,'p_pvar_def','parser.py',371),
+  ('nonfluent_def -> IDENT param_list LCURLY NON_FLUENT COMMA type_spec COMMA DEFAULT ASSIGN_EQUAL range_const RCURLY SEMI','nonfluent_def',12,'p_nonfluent_def','parser.py',375),
+  ('statefluent_def -> IDENT param_list LCURLY STATE COMMA type_spec COMMA DEFAULT ASSIGN_EQUAL range_const RCURLY SEMI','statefluent_def',12,'p_statefluent_def','parser.py',384),
+  ('actionfluent_def -> IDENT param_list LCURLY ACTION COMMA type_spec COMMA DEFAULT ASSIGN_EQUAL range_const RCURLY SEMI','actionfluent_def',12,'p_actionfluent_def','parser.py',391),
+  ('intermfluent_def -> IDENT param_list LCURLY INTERMEDIATE COMMA type_spec COMMA LEVEL ASSIGN_EQUAL range_const RCURLY SEMI','intermfluent_def',12,'p_intermfluent_def','parser.py',398),
+  ('intermfluent_def -> IDENT param_list LCURLY INTERMEDIATE COMMA type_spec RCURLY SEMI','intermfluent_def',8,'p_intermfluent_def','parser.py',399),
+  ('derivedfluent_def -> IDENT param_list LCURLY DERIVED_FLUENT COMMA type_spec COMMA LEVEL ASSIGN_EQUAL range_const RCURLY SEMI','derivedfluent_def',12,'p_derivedfluent_def','parser.py',406),
+  ('derivedfluent_def -> IDENT param_list LCURLY DERIVED_FLUENT COMMA type_spec RCURLY SEMI','derivedfluent_def',8,'p_derivedfluent_def','parser.py',407),
+  ('observfluent_def -> IDENT param_list LCURLY OBSERVATION COMMA type_spec RCURLY SEMI','observfluent_def',8,'p_observfluent_def','parser.py',414),
+  ('cpf_section -> cpf_header LCURLY cpf_list RCURLY SEMI','cpf_section',5,'p_cpf_section','parser.py',418),
+  ('cpf_header -> CPFS','cpf_header',1,'p_cpf_header','parser.py',424),
+  ('cpf_header -> CDFS','cpf_header',1,'p_cpf_header','parser.py',425),
+  ('cpf_list -> cpf_list cpf_def','cpf_list',2,'p_cpf_list','parser.py',429),
+  ('cpf_list -> empty','cpf_list',1,'p_cpf_list','parser.py',430),
+  ('cpf_def -> pvar_expr ASSIGN_EQUAL expr SEMI','cpf_def',4,'p_cpf_def','parser.py',438),
+  ('reward_section -> REWARD ASSIGN_EQUAL expr SEMI','reward_section',4,'p_reward_section','parser.py',442),
+  ('termination_section -> TERMINATION LCURLY termination_list RCURLY SEMI','termination_section',5,'p_termination_section','parser.py',447),
+  ('termination_section -> TERMINATION LCURLY RCURLY SEMI','termination_section',4,'p_termination_section','parser.py',448),
+  ('termination_list -> termination_list termination_cond_def','termination_list',2,'p_termination_list','parser.py',456),
+  ('termination_list -> termination_cond_def','termination_list',1,'p_termination_list','parser.py',457),
+  ('termination_cond_def -> expr SEMI','termination_cond_def',2,'p_termination_cond_def','parser.py',465),
+  ('action_precond_section -> ACTION_PRECONDITIONS LCURLY action_precond_list RCURLY SEMI','action_precond_section',5,'p_action_precond_section','parser.py',469),
+  ('action_precond_section -> ACTION_PRECONDITIONS LCURLY RCURLY SEMI','action_precond_section',4,'p_action_precond_section','parser.py',470),
+  ('action_precond_list -> action_precond_list action_precond_def','action_precond_list',2,'p_action_precond_list','parser.py',478),
+  ('action_precond_list -> action_precond_def','action_precond_list',1,'p_action_precond_list','parser.py',479),
+  ('action_precond_def -> expr SEMI','action_precond_def',2,'p_action_precond_def','parser.py',487),
+  ('state_action_constraint_section -> STATE_ACTION_CONSTRAINTS LCURLY state_cons_list RCURLY SEMI','state_action_constraint_section',5,'p_state_action_constraint_section','parser.py',491),
+  ('state_action_constraint_section -> STATE_ACTION_CONSTRAINTS LCURLY RCURLY SEMI','state_action_constraint_section',4,'p_state_action_constraint_section','parser.py',492),
+  ('state_cons_list -> state_cons_list state_cons_def','state_cons_list',2,'p_state_cons_list','parser.py',500),
+  ('state_cons_list -> state_cons_def','state_cons_list',1,'p_state_cons_list','parser.py',501),
+  ('state_cons_def -> expr SEMI','state_cons_def',2,'p_state_cons_def','parser.py',509),
+  ('state_invariant_section -> STATE_INVARIANTS LCURLY state_invariant_list RCURLY SEMI','state_invariant_section',5,'p_state_invariant_section','parser.py',513),
+  ('state_invariant_section -> STATE_INVARIANTS LCURLY RCURLY SEMI','state_invariant_section',4,'p_state_invariant_section','parser.py',514),
+  ('state_invariant_list -> state_invariant_list state_invariant_def','state_invariant_list',2,'p_state_invariant_list','parser.py',522),
+  ('state_invariant_list -> state_invariant_def','state_invariant_list',1,'p_state_invariant_list','parser.py',523),
+  ('state_invariant_def -> expr SEMI','state_invariant_def',2,'p_state_invariant_def','parser.py',531),
+  ('term_list -> term_list COMMA term','term_list',3,'p_term_list','parser.py',535),
+  ('term_list -> term','term_list',1,'p_term_list','parser.py',536),
+  ('term_list -> empty','term_list',1,'p_term_list','parser.py',537),
+  ('term -> VAR','term',1,'p_term','parser.py',547),
+  ('term -> ENUM_VAL','term',1,'p_term','parser.py',548),
+  ('term -> pvar_expr','term',1,'p_term','parser.py',549),
+  ('expr -> pvar_expr','expr',1,'p_expr','parser.py',553),
+  ('expr -> group_expr','expr',1,'p_expr','parser.py',554),
+  ('expr -> function_expr','expr',1,'p_expr','parser.py',555),
+  ('expr -> relational_expr','expr',1,'p_expr','parser.py',556),
+  ('expr -> boolean_expr','expr',1,'p_expr','parser.py',557),
+  ('expr -> quantifier_expr','expr',1,'p_expr','parser.py',558),
+  ('expr -> numerical_expr','expr',1,'p_expr','parser.py',559),
+  ('expr -> aggregation_expr','expr',1,'p_expr','parser.py',560),
+  ('expr -> control_expr','expr',1,'p_expr','parser.py',561),
+  ('expr -> randomvar_expr','expr',1,'p_expr','parser.py',562),
+  ('pvar_expr -> IDENT LPAREN term_list RPAREN','pvar_expr',4,'p_pvar_expr','parser.py',566),
+  ('pvar_expr -> IDENT','pvar_expr',1,'p_pvar_expr','parser.py',567),
+  ('pvar_expr -> ENUM_VAL','pvar_expr',1,'p_pvar_expr','parser.py',568),
+  ('group_expr -> LBRACK expr RBRACK','group_expr',3,'p_group_expr','parser.py',575),
+  ('group_expr -> LPAREN expr RPAREN','group_expr',3,'p_group_expr','parser.py',576),
+  ('function_expr -> IDENT LBRACK expr_list RBRACK','function_expr',4,'p_function_expr','parser.py',580),
+  ('relational_expr -> expr COMP_EQUAL expr','relational_expr',3,'p_relational_expr','parser.py',584),
+  ('relational_expr -> expr NEQ expr','relational_expr',3,'p_relational_expr','parser.py',585),
+  ('relational_expr -> expr GREATER expr','relational_expr',3,'p_relational_expr','parser.py',586),
+  ('relational_expr -> expr GREATEREQ expr','relational_expr',3,'p_relational_expr','parser.py',587),
+  ('relational_expr -> expr LESS expr','relational_expr',3,'p_relational_expr','parser.py',588),
+  ('relational_expr -> expr LESSEQ expr','relational_expr',3,'p_relational_expr','parser.py',589),
+  ('boolean_expr -> expr AND expr','boolean_expr',3,'p_boolean_expr','parser.py',593),
+  ('boolean_expr -> expr AMPERSAND expr','boolean_expr',3,'p_boolean_expr','parser.py',594),
+  ('boolean_expr -> expr OR expr','boolean_expr',3,'p_boolean_expr','parser.py',595),
+  ('boolean_expr -> expr IMPLY expr','boolean_expr',3,'p_boolean_expr','parser.py',596),
+  ('boolean_expr -> expr EQUIV expr','boolean_expr',3,'p_boolean_expr','parser.py',597),
+  ('boolean_expr -> NOT expr','boolean_expr',2,'p_boolean_expr','parser.py',598),
+  ('boolean_expr -> bool_type','boolean_expr',1,'p_boolean_expr','parser.py',599),
+  ('quantifier_expr -> FORALL UNDERSCORE LCURLY typed_var_list RCURLY expr','quantifier_expr',6,'p_quantifier_expr','parser.py',608),
+  ('quantifier_expr -> EXISTS UNDERSCORE LCURLY typed_var_list RCURLY expr','quantifier_expr',6,'p_quantifier_expr','parser.py',609),
+  ('numerical_expr -> expr PLUS expr','numerical_expr',3,'p_numerical_expr','parser.py',613),
+  ('numerical_expr -> expr MINUS expr','numerical_expr',3,'p_numerical_expr','parser.py',614),
+  ('numerical_expr -> expr TIMES expr','numerical_expr',3,'p_numerical_expr','parser.py',615),
+  ('numerical_expr -> expr DIV expr','numerical_expr',3,'p_numerical_expr','parser.py',616),
+  ('numerical_expr -> MINUS expr','numerical_expr',2,'p_numerical_expr','parser.py',617),
+  ('numerical_expr -> PLUS expr','numerical_expr',2,'p_numerical_expr','parser.py',618),
+  ('numerical_expr -> INTEGER','numerical_expr',1,'p_numerical_expr','parser.py',619),
+  ('numerical_expr -> DOUBLE','numerical_expr',1,'p_numerical_expr','parser.py',620),
+  ('aggregation_expr -> IDENT UNDERSCORE LCURLY typed_var_list RCURLY expr','aggregation_expr',6,'p_aggregation_expr','parser.py',629),
+  ('control_expr -> IF LPAREN expr RPAREN THEN expr ELSE expr','control_expr',8,'p_control_expr','parser.py',633),
+  ('control_expr -> SWITCH LPAREN expr RPAREN LCURLY case_list RCURLY','control_expr',7,'p_control_expr','parser.py',634),
+  ('randomvar_expr -> BERNOULLI LPAREN expr RPAREN','randomvar_expr',4,'p_randomvar_expr','parser.py',644),
+  ('randomvar_expr -> DIRAC_DELTA LPAREN expr RPAREN','randomvar_expr',4,'p_randomvar_expr','parser.py',645),
+  ('randomvar_expr -> KRON_DELTA LPAREN expr RPAREN','randomvar_expr',4,'p_randomvar_expr','parser.py',646),
+  ('randomvar_expr -> UNIFORM LPAREN expr COMMA expr RPAREN','randomvar_expr',6,'p_randomvar_expr','parser.py',647),
+  ('randomvar_expr -> NORMAL LPAREN expr COMMA expr RPAREN','randomvar_expr',6,'p_randomvar_expr','parser.py',648),
+  ('randomvar_expr -> EXPONENTIAL LPAREN expr RPAREN','randomvar_expr',4,'p_randomvar_expr','parser.py',649),
+  ('randomvar_expr -> DISCRETE LPAREN IDENT COMMA lconst_case_list RPAREN','randomvar_expr',6,'p_randomvar_expr','parser.py',650),
+  ('randomvar_expr -> DIRICHLET LPAREN IDENT COMMA expr RPAREN','randomvar_expr',6,'p_randomvar_expr','parser.py',651),
+  ('randomvar_expr -> POISSON LPAREN expr RPAREN','randomvar_expr',4,'p_randomvar_expr','parser.py',652),
+  ('randomvar_expr -> WEIBULL LPAREN expr COMMA expr RPAREN','randomvar_expr',6,'p_randomvar_expr','parser.py',653),
+  ('randomvar_expr -> GAMMA LPAREN expr COMMA expr RPAREN','randomvar_expr',6,'p_randomvar_expr','parser.py',654),
+  ('randomvar_expr -> BINOMIAL LPAREN expr COMMA expr RPAREN','randomvar_expr',6,'p_randomvar_expr','parser.py',655),
+  ('randomvar_expr -> NEGATIVEBINOMIAL LPAREN expr COMMA expr RPAREN','randomvar_expr',6,'p_randomvar_expr','parser.py',656),
+  ('randomvar_expr -> BETA LPAREN expr COMMA expr RPAREN','randomvar_expr',6,'p_randomvar_expr','parser.py',657),
+  ('randomvar_expr -> GEOMETRIC LPAREN expr RPAREN','randomvar_expr',4,'p_randomvar_expr','parser.py',658),
+  ('randomvar_expr -> PARETO LPAREN expr COMMA expr RPAREN','randomvar_expr',6,'p_randomvar_expr','parser.py',659),
+  ('randomvar_expr -> STUDENT LPAREN expr RPAREN','randomvar_expr',4,'p_randomvar_expr','parser.py',660),
+  ('randomvar_expr -> GUMBEL LPAREN expr COMMA expr RPAREN','randomvar_expr',6,'p_randomvar_expr','parser.py',661),
+  ('randomvar_expr -> LAPLACE LPAREN expr COMMA expr RPAREN','randomvar_expr',6,'p_randomvar_expr','parser.py',662),
+  ('randomvar_expr -> CAUCHY LPAREN expr COMMA expr RPAREN','randomvar_expr',6,'p_randomvar_expr','parser.py',663),
+  ('randomvar_expr -> GOMPERTZ LPAREN expr COMMA expr RPAREN','randomvar_expr',6,'p_randomvar_expr','parser.py',664),
+  ('typed_var_list -> typed_var_list COMMA typed_var','typed_var_list',3,'p_typed_var_list','parser.py',674),
+  ('typed_var_list -> typed_var','typed_var_list',1,'p_typed_var_list','parser.py',675),
+  ('typed_var -> VAR COLON IDENT','typed_var',3,'p_typed_var','parser.py',683),
+  ('expr_list -> expr_list COMMA expr','expr_list',3,'p_expr_list','parser.py',687),
+  ('expr_list -> expr','expr_list',1,'p_expr_list','parser.py',688),
+  ('case_list -> case_list COMMA case_def','case_list',3,'p_case_list','parser.py',696),
+  ('case_list -> case_def','case_list',1,'p_case_list','parser.py',697),
+  ('case_def -> CASE term COLON expr','case_def',4,'p_case_def','parser.py',705),
+  ('case_def -> DEFAULT COLON expr','case_def',3,'p_case_def','parser.py',706),
+  ('lconst_case_list -> lconst COLON expr','lconst_case_list',3,'p_lconst_case_list','parser.py',713),
+  ('lconst_case_list -> lconst COLON OTHERWISE','lconst_case_list',3,'p_lconst_case_list','parser.py',714),
+  ('lconst_case_list -> lconst_case_list COMMA lconst COLON expr','lconst_case_list',5,'p_lconst_case_list','parser.py',715),
+  ('lconst -> IDENT','lconst',1,'p_lconst','parser.py',723),
+  ('lconst -> ENUM_VAL','lconst',1,'p_lconst','parser.py',724),
+  ('param_list -> COLON','param_list',1,'p_param_list','parser.py',729),
+  ('param_list -> LPAREN param_list2 RPAREN COLON','param_list',4,'p_param_list','parser.py',730),
+  ('param_list2 -> type_spec','param_list2',1,'p_param_list2','parser.py',737),
+  ('param_list2 -> param_list2 COMMA type_spec','param_list2',3,'p_param_list2','parser.py',738),
+  ('type_spec -> IDENT','type_spec',1,'p_type_spec','parser.py',756),
+  ('type_spec -> INT','type_spec',1,'p_type_spec','parser.py',757),
+  ('type_spec -> REAL','type_spec',1,'p_type_spec','parser.py',758),
+  ('type_spec -> BOOL','type_spec',1,'p_type_spec','parser.py',759),
+  ('range_const -> bool_type','range_const',1,'p_range_const','parser.py',763),
+  ('range_const -> double_type','range_const',1,'p_range_const','parser.py',764),
+  ('range_const -> int_type','range_const',1,'p_range_const','parser.py',765),
+  ('range_const -> ENUM_VAL','range_const',1,'p_range_const','parser.py',766),
+  ('range_const -> IDENT','range_const',1,'p_range_const','parser.py',767),
+  ('bool_type -> TRUE','bool_type',1,'p_bool_type','parser.py',771),
+  ('bool_type -> FALSE','bool_type',1,'p_bool_type','parser.py',772),
+  ('double_type -> DOUBLE','double_type',1,'p_double_type','parser.py',776),
+  ('double_type -> MINUS DOUBLE','double_type',2,'p_double_type','parser.py',777),
+  ('double_type -> POS_INF','double_type',1,'p_double_type','parser.py',778),
+  ('double_type -> NEG_INF','double_type',1,'p_double_type','parser.py',779),
+  ('int_type -> INTEGER','int_type',1,'p_int_type','parser.py',783),
+  ('int_type -> MINUS INTEGER','int_type',2,'p_int_type','parser.py',784),
+  ('pos_int_type_or_pos_inf -> INTEGER','pos_int_type_or_pos_inf',1,'p_pos_int_type_or_pos_inf','parser.py',788),
+  ('pos_int_type_or_pos_inf -> POS_INF','pos_int_type_or_pos_inf',1,'p_pos_int_type_or_pos_inf','parser.py',789),
+  ('instance_block -> INSTANCE IDENT LCURLY instance_list RCURLY','instance_block',5,'p_instance_block','parser.py',793),
+  ('instance_list -> instance_list domain_section','instance_list',2,'p_instance_list','parser.py',798),
+  ('instance_list -> instance_list nonfluents_section','instance_list',2,'p_instance_list','parser.py',799),
+  ('instance_list -> instance_list objects_section','instance_list',2,'p_instance_list','parser.py',800),
+  ('instance_list -> instance_list init_state_section','instance_list',2,'p_instance_list','parser.py',801),
+  ('instance_list -> instance_list max_nondef_actions_section','instance_list',2,'p_instance_list','parser.py',802),
+  ('instance_list -> instance_list horizon_spec_section','instance_list',2,'p_instance_list','parser.py',803),
+  ('instance_list -> instance_list discount_section','instance_list',2,'p_instance_list','parser.py',804),
+  ('instance_list -> empty','instance_list',1,'p_instance_list','parser.py',805),
+  ('domain_section -> DOMAIN ASSIGN_EQUAL IDENT SEMI','domain_section',4,'p_domain_section','parser.py',814),
+  ('nonfluents_section -> NON_FLUENTS ASSIGN_EQUAL IDENT SEMI','nonfluents_section',4,'p_nonfluents_section','parser.py',818),
+  ('objects_section -> OBJECTS LCURLY objects_list RCURLY SEMI','objects_section',5,'p_objects_section','parser.py',823),
+  ('init_state_section -> INIT_STATE LCURLY pvar_inst_list RCURLY SEMI','init_state_section',5,'p_init_state_section','parser.py',828),
+  ('max_nondef_actions_section -> MAX_NONDEF_ACTIONS ASSIGN_EQUAL pos_int_type_or_pos_inf SEMI','max_nondef_actions_section',4,'p_max_nondef_actions_section','parser.py',833),
+  ('horizon_spec_section -> HORIZON ASSIGN_EQUAL pos_int_type_or_pos_inf SEMI','horizon_spec_section',4,'p_horizon_spec_section','parser.py',838),
+  ('horizon_spec_section -> HORIZON ASSIGN_EQUAL TERMINATE_WHEN LPAREN expr RPAREN','horizon_spec_section',6,'p_horizon_spec_section','parser.py',839),
+  ('discount_section -> DISCOUNT ASSIGN_EQUAL DOUBLE SEMI','discount_section',4,'p_discount_section','parser.py',847),
+  ('nonfluent_block -> NON_FLUENTS IDENT LCURLY nonfluent_list RCURLY','nonfluent_block',5,'p_nonfluent_block','parser.py',852),
+  ('nonfluent_list -> nonfluent_list domain_section','nonfluent_list',2,'p_nonfluent_list','parser.py',857),
+  ('nonfluent_list -> nonfluent_list objects_section','nonfluent_list',2,'p_nonfluent_list','parser.py',858),
+  ('nonfluent_list -> nonfluent_list init_non_fluent_section','nonfluent_list',2,'p_nonfluent_list','parser.py',859),
+  ('nonfluent_list -> empty','nonfluent_list',1,'p_nonfluent_list','parser.py',860),
+  ('init_non_fluent_section -> NON_FLUENTS LCURLY pvar_inst_list RCURLY SEMI','init_non_fluent_section',5,'p_init_non_fluent_section','parser.py',869),
+  ('objects_list -> objects_list objects_def','objects_list',2,'p_objects_list','parser.py',874),
+  ('objects_list -> objects_def','objects_list',1,'p_objects_list','parser.py',875),
+  ('objects_list -> empty','objects_list',1,'p_objects_list','parser.py',876),
+  ('objects_def -> IDENT COLON LCURLY object_const_list RCURLY SEMI','objects_def',6,'p_objects_def','parser.py',884),
+  ('object_const_list -> object_const_list COMMA IDENT','object_const_list',3,'p_object_const_list','parser.py',888),
+  ('object_const_list -> IDENT','object_const_list',1,'p_object_const_list','parser.py',889),
+  ('pvar_inst_list -> pvar_inst_list pvar_inst_def','pvar_inst_list',2,'p_pvar_inst_list','parser.py',897),
+  ('pvar_inst_list -> pvar_inst_def','pvar_inst_list',1,'p_pvar_inst_list','parser.py',898),
+  ('pvar_inst_def -> IDENT LPAREN lconst_list RPAREN SEMI','pvar_inst_def',5,'p_pvar_inst_def','parser.py',906),
+  ('pvar_inst_def -> IDENT SEMI','pvar_inst_def',2,'p_pvar_inst_def','parser.py',907),
+  ('pvar_inst_def -> NOT IDENT LPAREN lconst_list RPAREN SEMI','pvar_inst_def',6,'p_pvar_inst_def','parser.py',908),
+  ('pvar_inst_def -> NOT IDENT SEMI','pvar_inst_def',3,'p_pvar_inst_def','parser.py',909),
+  ('pvar_inst_def -> IDENT LPAREN lconst_list RPAREN ASSIGN_EQUAL range_const SEMI','pvar_inst_def',7,'p_pvar_inst_def','parser.py',910),
+  ('pvar_inst_def -> IDENT ASSIGN_EQUAL range_const SEMI','pvar_inst_def',4,'p_pvar_inst_def','parser.py',911),
+  ('lconst_list -> lconst_list COMMA lconst','lconst_list',3,'p_lconst_list','parser.py',926),
+  ('lconst_list -> lconst','lconst_list',1,'p_lconst_list','parser.py',927),
+  ('string_list -> string_list COMMA IDENT','string_list',3,'p_string_list','parser.py',935),
+  ('string_list -> IDENT','string_list',1,'p_string_list','parser.py',936),
+  ('string_list -> empty','string_list',1,'p_string_list','parser.py',937),
+  ('empty -> <empty>','empty',0,'p_empty','parser.py',947),
+]
@@ -0,0 +1,252 @@
+import numpy as np
+from typing import Dict, Tuple, Union
+
+from pyRDDLGym.Core.ErrorHandling.RDDLException import RDDLActionPreconditionNotSatisfiedError
+from pyRDDLGym.Core.ErrorHandling.RDDLException import RDDLInvalidActionError
+from pyRDDLGym.Core.ErrorHandling.RDDLException import RDDLNotImplementedError
+from pyRDDLGym.Core.ErrorHandling.RDDLException import RDDLStateInvariantNotSatisfiedError
+from pyRDDLGym.Core.ErrorHandling.RDDLException import RDDLValueOutOfRangeError
+
+from pyRDDLGym.Core.Compiler.RDDLModel import RDDLModel
+from pyRDDLGym.Core.Simulator.NumpyRDDLCompiler import NumpyRDDLCompiler
+from pyRDDLGym.Core.Simulator.RDDLSimulator import RDDLSimulator
+from pyRDDLGym.Core.Simulator.RDDLSimulator import RDDLSimulatorWConstraints
+from pyRDDLGym.Core.Simulator.RDDLValidation import validated
+
+BatchArgs = Dict[str, Union[np.ndarray, bool, int, float]]
+
+
+class BatchedRDDLSimulator(RDDLSimulator):
+    '''Simulates a batch of independent trajectories of a lifted RDDL domain
+    at once. All fluent tensors carry a leading batch axis, so that every CPF,
+    the reward, the termination conditions and the constraints are evaluated
+    for all trajectories in a single numpy call. Non-fluents are shared.
+    '''
+
+    def __init__(self, rddl: RDDLModel, batch_size: int, *args, **kwargs) -> None:
+        '''Creates a new batched simulator for the given RDDL model.
+
+        :param rddl: the RDDL model
+        :param batch_size: the number of trajectories to simulate at once
+        :param *args: other arguments to pass to the RDDLSimulator
+        :param **kwargs: other keyword arguments to pass to the RDDLSimulator
+        '''
+        if rddl.is_grounded:
+            raise RDDLNotImplementedError(
+                'Batched simulation only works on lifted domains for now.')
+        if kwargs.get('preallocate', False) or kwargs.get('incremental', False):
+            raise RDDLNotImplementedError(
+                'Batched simulation does not support preallocated buffers '
+                'or incremental evaluation.')
+        if batch_size < 1:
+            raise RDDLValueOutOfRangeError(
+                f'Batch size {batch_size} is not positive.')
+        fluent_format = kwargs.get('fluent_format', 'grounded')
+        if fluent_format != 'grounded':
+            raise RDDLValueOutOfRangeError(
+                f'Fluent format <{fluent_format}> is not supported by batched '
+                f'simulation, must be grounded.')
+
+        # expressions are always compiled with numpy, which can defer checks
+        checked = kwargs.pop('checked', True)
+        super().__init__(rddl, *args, **kwargs)
+        self.batch_size = batch_size
+        if not checked:
+            self._defer_validation()
+
+        # compile expressions with batched random sampling
+        self.compiler = NumpyRDDLCompiler(self, batch_size=batch_size)
+        self.compiler.compile()
+        if not checked:
+            self._find_static_cpfs()
+
+        # only fluents carry a batch axis, non-fluents are shared
+        self.batch_shapes = {}
+        for name, value in self.init_values.items():
+            if rddl.variable_types[name] != 'non-fluent':
+                self.batch_shapes[name] = (batch_size,) + np.shape(value)
+        self.batch_init_values = {
+            name: np.broadcast_to(self.init_values[name], shape)
+            for name, shape in self.batch_shapes.items()
+        }
+        self.noop_actions = {
+            name: self.batch_init_values[name] for name in self.noop_actions
+        }
+        self.subs = self.init_values.copy()
+        self.subs.update(self.batch_init_values)
+
+    # ===========================================================================
+    # batched tensor utilities
+    # ===========================================================================
+
+    def _to_batch(self, name, value):
+        shape = self.batch_shapes[name]
+        if np.shape(value) != shape:
+            value = np.broadcast_to(value, shape)
+        return value
+
+    def _expand_batch(self, names):
+        values = {}
+        for var in names:
+            values.update(self.tensors.expand(var, self.subs[var], batched=True))
+        return values
+
+    def _check_batch(self, sample, msg, expr):
+        self._check_value_type(sample, bool, msg, expr)
+        return np.broadcast_to(sample, (self.batch_size,))
+
+    @staticmethod
+    def _failed_indices(satisfied, mask):
+        failed = np.logical_not(satisfied)
+        if mask is not None:
+            failed = np.logical_and(failed, mask)
+        return np.flatnonzero(failed)
+
+    # ===========================================================================
+    # main sampling routines
+    # ===========================================================================
+
+    def _process_actions(self, actions):
+        new_actions = {action: np.copy(value)
+                       for action, value in self.noop_actions.items()}
+
+        for action, value in actions.items():
+            if action not in self.rddl.actions:
+                raise RDDLInvalidActionError(
+                    f'<{action}> is not a valid action-fluent.')
+
+            var, objects = self.rddl.parse(action)
+            tensor = new_actions[var]
+            value = np.asarray(value)
+            RDDLSimulator._check_type(
+                value, tensor.dtype, f'Action-fluent <{action}>', '')
+            coords = (slice(None),) + self.tensors.coordinates(objects, '')
+            tensor[coords] = value
+
+        return new_actions
+
+    @validated
+    def check_state_invariants(self, mask: np.ndarray=None) -> None:
+        '''Throws an exception if the state invariants are not satisfied in
+        any trajectory of the batch (optionally only those where mask is True).
+        '''
+        for i, invariant in enumerate(self.rddl.invariants):
+            sample = self.compiler.invariants[i](self.subs, self.rng)
+            sample = self._check_batch(sample, f'Invariant {i + 1}', invariant)
+            failed = BatchedRDDLSimulator._failed_indices(sample, mask)
+            if failed.size:
+                raise RDDLStateInvariantNotSatisfiedError(
+                    f'Invariant {i + 1} is not satisfied in batch '
+                    f'element(s) {failed.tolist()}.\n' +
+                    RDDLSimulator._print_stack_trace(invariant))
+
+    @validated
+    def check_action_preconditions(self, actions: BatchArgs,
+                                   mask: np.ndarray=None) -> None:
+        '''Throws an exception if the action preconditions are not satisfied
+        in any trajectory of the batch (optionally only those where mask is
+        True).
+        '''
+        actions = self._process_actions(actions)
+        self.subs.update(actions)
+
+        for i, precond in enumerate(self.rddl.preconditions):
+            sample = self.compiler.preconditions[i](self.subs, self.rng)
+            sample = self._check_batch(sample, f'Precondition {i + 1}', precond)
+            failed = BatchedRDDLSimulator._failed_indices(sample, mask)
+            if failed.size:
+                raise RDDLActionPreconditionNotSatisfiedError(
+                    f'Precondition {i + 1} is not satisfied in batch '
+                    f'element(s) {failed.tolist()}.\n' +
+                    RDDLSimulator._print_stack_trace(precond))
+
+    @validated
+    def check_terminal_states(self) -> np.ndarray:
+        '''Returns a boolean array indicating which trajectories of the batch
+        have reached a terminal state.'''
+        done = np.zeros((self.batch_size,), dtype=bool)
+        for i, terminal in enumerate(self.rddl.terminals):
+            sample = self.compiler.termination[i](self.subs, self.rng)
+            sample = self._check_batch(sample, f'Termination {i + 1}', terminal)
+            done = np.logical_or(done, sample)
+        return done
+
+    @validated
+    def sample_reward(self) -> np.ndarray:
+        '''Samples the current reward of every trajectory of the batch.'''
+        sample = self.compiler.reward(self.subs, self.rng)
+        sample = np.broadcast_to(sample, (self.batch_size,))
+        return np.asarray(sample, dtype=float)
+
+    @validated
+    def reset(self, mask: np.ndarray=None) -> Tuple[BatchArgs, np.ndarray]:
+        '''Resets the state variables to their initial values.
+
+        :param mask: a boolean array indicating which trajectories of the
+        batch to reset, or None to reset all of them; if given, observations
+        of partially observed domains hold the initial values of the
+        observ-fluents in the trajectories that were reset and the last
+        observation in all others
+        '''
+        subs = self.subs
+        for name, value in self.batch_init_values.items():
+            if mask is None:
+                subs[name] = value
+            else:
+                where = np.reshape(mask, (-1,) + (1,) * (value.ndim - 1))
+                subs[name] = np.where(where, value, subs[name])
+
+        self.state = self._expand_batch(self.next_states.values())
+        if self._pomdp and mask is None:
+            obs = {var: None for var in self.observ_fluents}
+        elif self._pomdp:
+            obs = self._expand_batch(self.observ_fluents)
+        else:
+            obs = self.state
+
+        done = self.check_terminal_states()
+        return obs, done
+
+    @validated
+    def step(self, actions: BatchArgs) -> Tuple[BatchArgs, np.ndarray, np.ndarray]:
+        '''Samples and returns the next state of every trajectory of the batch.
+
+        :param actions: a dict mapping current action fluents to their values,
+        which are either scalars shared by all trajectories or arrays whose
+        leading axis is the batch
+        '''
+        actions = self._process_actions(actions)
+        subs = self.subs
+        subs.update(actions)
+
+        rddl, cpfs = self.rddl, self.compiler.cpfs
+        static_cpfs = self._static_cpfs
+        for level in self.levels.values():
+            for cpf in level:
+                sample = cpfs[cpf](subs, self.rng)
+                if cpf not in static_cpfs:
+                    dtype = self.tensors.NUMPY_TYPES[rddl.variable_ranges[cpf]]
+                    self._check_value_type(
+                        sample, dtype, f'CPF <{cpf}>', rddl.cpfs[cpf][1])
+                subs[cpf] = self._to_batch(cpf, sample)
+        reward = self.sample_reward()
+
+        for next_state, state in self.next_states.items():
+            subs[state] = subs[next_state]
+        self.state = self._expand_batch(self.next_states.values())
+
+        if self._pomdp:
+            obs = self._expand_batch(self.observ_fluents)
+        else:
+            obs = self.state
+
+        done = self.check_terminal_states()
+        return obs, reward, done
+
+
+class BatchedRDDLSimulatorWConstraints(BatchedRDDLSimulator,
+                                       RDDLSimulatorWConstraints):
+    '''A batched simulator that also extracts the bounds of the state and
+    action fluents from the constraints, as in RDDLSimulatorWConstraints.
+    '''
+    pass
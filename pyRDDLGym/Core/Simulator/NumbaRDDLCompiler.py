@@ -0,0 +1,319 @@
+import math
+import numpy as np
+
+from pyRDDLGym.Core.ErrorHandling.RDDLException import RDDLNotImplementedError
+
+from pyRDDLGym.Core.Simulator.NumpyRDDLCompiler import NumpyRDDLCompiler
+from pyRDDLGym.Core.Simulator.RDDLTensors import RDDLTensors
+
+try:
+    import numba
+except ImportError:
+    numba = None
+
+
+class _Unsupported(Exception):
+    pass
+
+
+def _sgn(x):
+    return int(x > 0) - int(x < 0)
+
+
+def _round(x):
+    return int(np.round(x))
+
+
+class NumbaRDDLCompiler(NumpyRDDLCompiler):
+    '''Compiles the CPFs of a lifted RDDL model into loop nests over the
+    object index space of each CPF, which are compiled with numba.njit.
+
+    Every element of a CPF is evaluated as a scalar expression, in which
+    aggregations become nested loops with an accumulator and if-then-else
+    evaluates only the branch that is taken, so that no temporary arrays
+    are created. CPFs that sample random variables (other than KronDelta and
+    DiracDelta) or use expressions that have no scalar form (such as gamma)
+    keep their numpy closures, as do the reward and constraints.
+
+    The generated source of each kernel is kept in the sources dict, and the
+    numba kernels can be replaced by plain Python functions (jit=False) for
+    debugging. Sums and means are accumulated in loop order, so real values
+    may differ from numpy in the last digits, and numba kernels do not raise
+    on invalid operations such as division by zero.
+    '''
+
+    ARITHMETIC = {'+': '+', '-': '-', '*': '*', '/': '/'}
+    RELATIONAL = {'>=': '>=', '<=': '<=', '<': '<', '>': '>',
+                  '==': '==', '~=': '!='}
+    UNARY = {
+        'abs': 'abs({})',
+        'sgn': '_sgn({})',
+        'round': '_round({})',
+        'floor': 'int(math.floor({}))',
+        'ceil': 'int(math.ceil({}))',
+        'cos': 'math.cos({})',
+        'sin': 'math.sin({})',
+        'tan': 'math.tan({})',
+        'acos': 'math.acos({})',
+        'asin': 'math.asin({})',
+        'atan': 'math.atan({})',
+        'cosh': 'math.cosh({})',
+        'sinh': 'math.sinh({})',
+        'tanh': 'math.tanh({})',
+        'exp': 'math.exp({})',
+        'ln': 'math.log({})',
+        'sqrt': 'math.sqrt({})'
+    }
+    BINARY = {
+        'div': 'int(({}) // ({}))',
+        'mod': 'int(({}) % ({}))',
+        'min': 'min({}, {})',
+        'max': 'max({}, {})',
+        'pow': '({}) ** ({})',
+        'log': 'math.log({}) / math.log({})'
+    }
+
+    def __init__(self, simulator, jit: bool=True) -> None:
+        '''Creates a new compiler for the model of the given simulator.
+
+        :param simulator: the RDDLSimulator whose model is compiled
+        :param jit: whether to compile the kernels with numba (which must then
+        be installed), or run them as plain Python functions
+        '''
+        if jit and numba is None:
+            raise RDDLNotImplementedError(
+                'The numba backend requires the numba package.')
+        super().__init__(simulator)
+        self.jit = jit
+        self.sources = {}
+
+    def compile(self) -> None:
+        super().compile()
+        if self.rddl.is_grounded:
+            return
+        for cpfs in self.levels.values():
+            for cpf in cpfs:
+                objects, expr = self.rddl.cpfs[cpf]
+                try:
+                    self.cpfs[cpf] = self._lower_cpf(cpf, objects, expr)
+                except _Unsupported:
+                    pass
+
+    # ===========================================================================
+    # code generation
+    # ===========================================================================
+
+    def _lower_cpf(self, cpf, objects, expr):
+        self._inputs = {}
+        self._temps = 0
+
+        # one loop per free variable of the CPF
+        indices = {var: f'i{i}' for (i, (var, _)) in enumerate(objects)}
+        body, value = self._lower(expr, indices)
+        lines, indent = [], '    '
+        for i, _ in enumerate(objects):
+            lines.append(f'{indent}for i{i} in range(out.shape[{i}]):')
+            indent += '    '
+        lines.extend(indent + line for line in body)
+        out_index = ', '.join(indices.values()) if objects else '0'
+        lines.append(f'{indent}out[{out_index}] = {value}')
+
+        name = 'cpf_' + ''.join(c if c.isalnum() else '_' for c in cpf)
+        args = ', '.join(['out'] + list(self._inputs.values()))
+        source = f'def {name}({args}):\n' + '\n'.join(lines) + '\n'
+        self.sources[cpf] = source
+
+        namespace = {'math': math, 'np': np, '_sgn': _sgn, '_round': _round}
+        if self.jit:
+            namespace['_sgn'] = numba.njit(_sgn)
+            namespace['_round'] = numba.njit(_round)
+        exec(compile(source, f'<{name}>', 'exec'), namespace)
+        kernel = namespace[name]
+        if self.jit:
+            kernel = numba.njit(kernel)
+
+        # scalar fluents are passed as arrays of one element
+        inputs = [(var, (1,) if not self.rddl.param_types[var] else None)
+                  for var in self._inputs]
+        prange = self.rddl.variable_ranges[cpf]
+        dtype = RDDLTensors.NUMPY_TYPES[prange]
+        shape = self._sample_shape(objects)
+        scalar = not objects
+        if scalar:
+            shape = (1,)
+        
+        # the kernel writes into the buffer of the CPF, if there is one
+        name = self._out(cpf)
+
+        def _f(subs, rng):
+            args = [np.asarray(subs[var]) if reshape is None
+                    else np.reshape(subs[var], reshape)
+                    for (var, reshape) in inputs]
+            buffer = None if name is None else subs[name]
+            if buffer is not None and buffer.dtype == dtype:
+                kernel(np.reshape(buffer, shape), *args)
+                return buffer
+            out = np.empty(shape, dtype=dtype)
+            kernel(out, *args)
+            return out[0] if scalar else out
+
+        return _f
+
+    def _input(self, var):
+        name = self._inputs.get(var, None)
+        if name is None:
+            name = self._inputs[var] = f'a{len(self._inputs)}'
+        return name
+
+    def _temp(self):
+        self._temps += 1
+        return f't{self._temps}'
+
+    def _lower(self, expr, indices):
+        '''Returns the statements that evaluate the expression for one element
+        of the loop nest, and the expression that holds its value.'''
+        etype, op = expr.etype
+        args = expr.args
+
+        if etype == 'constant':
+            if isinstance(args, np.generic):
+                args = args.item()
+            if not isinstance(args, (bool, int, float)) \
+            or not math.isfinite(args):
+                raise _Unsupported()
+            return [], repr(args)
+
+        elif etype == 'pvar':
+            var, params = args
+            name = self._input(var)
+            if not params:
+                return [], f'{name}[0]'
+            if any(param not in indices for param in params):
+                raise _Unsupported()
+            return [], f'{name}[{", ".join(indices[p] for p in params)}]'
+
+        elif etype == 'arithmetic':
+            if len(args) == 1 and op == '-':
+                body, value = self._lower(args[0], indices)
+                return body, f'(-{value})'
+            elif len(args) == 2 and op in NumbaRDDLCompiler.ARITHMETIC:
+                return self._lower_binary(args, indices,
+                                          '({} ' + op + ' {})')
+
+        elif etype == 'relational':
+            if len(args) == 2 and op in NumbaRDDLCompiler.RELATIONAL:
+                symbol = NumbaRDDLCompiler.RELATIONAL[op]
+                return self._lower_binary(args, indices,
+                                          '({} ' + symbol + ' {})')
+
+        elif etype == 'boolean':
+            if len(args) == 1 and op == '~':
+                body, value = self._lower(args[0], indices)
+                return body, f'(not {value})'
+            elif len(args) == 2:
+                if op == '^' or op == '|':
+                    return self._lower_and_or(args, op, indices)
+                pattern = {'~': '({} != {})',
+                           '=>': '((not {}) or {})',
+                           '<=>': '({} == {})'}.get(op, None)
+                if pattern is not None:
+                    return self._lower_binary(args, indices, pattern)
+
+        elif etype == 'aggregation':
+            return self._lower_aggregation(expr, indices)
+
+        elif etype == 'func':
+            if not isinstance(args, (tuple, list)):
+                args = (args,)
+            if op in NumbaRDDLCompiler.UNARY and len(args) == 1:
+                body, value = self._lower(args[0], indices)
+                return body, NumbaRDDLCompiler.UNARY[op].format(value)
+            elif op in NumbaRDDLCompiler.BINARY and len(args) == 2:
+                return self._lower_binary(
+                    args, indices, NumbaRDDLCompiler.BINARY[op])
+
+        elif etype == 'control':
+            return self._lower_if(args, indices)
+
+        elif etype == 'randomvar':
+            if op in ('KronDelta', 'DiracDelta') and len(args) == 1:
+                return self._lower(args[0], indices)
+
+        raise _Unsupported()
+
+    def _lower_binary(self, args, indices, pattern):
+        lhs, rhs = args
+        body1, value1 = self._lower(lhs, indices)
+        body2, value2 = self._lower(rhs, indices)
+        return body1 + body2, pattern.format(value1, value2)
+
+    def _lower_and_or(self, args, op, indices):
+
+        # the right operand is evaluated only if needed
+        lhs, rhs = args
+        body1, value1 = self._lower(lhs, indices)
+        body2, value2 = self._lower(rhs, indices)
+        temp = self._temp()
+        condition = temp if op == '^' else f'not {temp}'
+        body = body1 + [f'{temp} = {value1}', f'if {condition}:']
+        body += ['    ' + line for line in body2]
+        body += [f'    {temp} = {value2}']
+        return body, temp
+
+    def _lower_if(self, args, indices):
+        pred, arg1, arg2 = args
+        body, value = self._lower(pred, indices)
+        body1, value1 = self._lower(arg1, indices)
+        body2, value2 = self._lower(arg2, indices)
+        temp = self._temp()
+        body = body + [f'if {value}:']
+        body += ['    ' + line for line in body1]
+        body += [f'    {temp} = {value1}', 'else:']
+        body += ['    ' + line for line in body2]
+        body += [f'    {temp} = {value2}']
+        return body, temp
+
+    def _lower_aggregation(self, expr, indices):
+        _, op = expr.etype
+        * pvars, arg = expr.args
+
+        # one nested loop per iteration variable
+        indices = indices.copy()
+        loops = []
+        for _, (var, ptype) in pvars:
+            index = self._temp()
+            indices[var] = index
+            count = len(self.rddl.objects[ptype])
+            loops.append(f'for {index} in range({count}):')
+        count = int(np.prod([len(self.rddl.objects[ptype])
+                             for _, (_, ptype) in pvars]))
+        body, value = self._lower(arg, indices)
+
+        acc = self._temp()
+        if op == 'sum' or op == 'avg':
+            init, update = [f'{acc} = 0'], [f'{acc} += {value}']
+        elif op == 'prod':
+            init, update = [f'{acc} = 1'], [f'{acc} *= {value}']
+        elif op == 'forall':
+            init, update = [f'{acc} = True'], [f'{acc} = {acc} and {value}']
+        elif op == 'exists':
+            init, update = [f'{acc} = False'], [f'{acc} = {acc} or {value}']
+        elif op == 'min' or op == 'max':
+            first, item = self._temp(), self._temp()
+            compare = '<' if op == 'min' else '>'
+            init = [f'{acc} = 0', f'{first} = True']
+            update = [f'{item} = {value}',
+                      f'if {first} or {item} {compare} {acc}:',
+                      f'    {acc} = {item}',
+                      f'    {first} = False']
+        else:
+            raise _Unsupported()
+
+        lines, indent = list(init), ''
+        for loop in loops:
+            lines.append(indent + loop)
+            indent += '    '
+        lines.extend(indent + line for line in body + update)
+        if op == 'avg':
+            lines.append(f'{acc} = {acc} / {count}')
+        return lines, acc
@@ -0,0 +1,1171 @@
+import itertools
+import numpy as np
+
+from pyRDDLGym.Core.ErrorHandling.RDDLException import RDDLInvalidObjectError
+from pyRDDLGym.Core.ErrorHandling.RDDLException import RDDLNotImplementedError
+from pyRDDLGym.Core.ErrorHandling.RDDLException import RDDLUndefinedVariableError
+
+from pyRDDLGym.Core.Simulator.RDDLChunking import RDDLChunking
+from pyRDDLGym.Core.Simulator.RDDLTensors import RDDLTensors
+from pyRDDLGym.Core.Simulator.RDDLValidation import RDDLValidation
+
+numeric = RDDLTensors.numeric
+
+
+class NumpyRDDLCompiler:
+    '''Compiles the expressions of a RDDL model into trees of pre-bound numpy
+    closures. Dispatch on the expression type, operator lookup and structural
+    checks (arity, operator validity, variable definitions) are performed once
+    at compile time, so evaluating a compiled expression at every step only
+    performs the numerical work and the checks that depend on the values.
+
+    Every compiled expression is a function _f(subs, rng) that takes the dict
+    of current fluent values and a random number generator and returns a numpy
+    array (or scalar for grounded domains).
+    
+    If the simulator preallocates buffers, the last operation of a CPF (an
+    arithmetic operation, function, if-then-else or aggregation) writes its
+    result into the buffer of the CPF in subs, if the result has the type of
+    the buffer, and returns the buffer.
+    
+    If a batch size is given, fluent values in subs may carry a leading batch
+    axis, and all random variables are sampled independently for each element
+    of the batch.
+    '''
+
+    def __init__(self, simulator, batch_size: int=None) -> None:
+        '''Creates a new compiler for the model of the given simulator.
+
+        :param simulator: the RDDLSimulator whose model, tensors, operations
+        and error checks are used to compile expressions
+        :param batch_size: the size of the leading batch axis of the fluent
+        values, or None if they are not batched
+        '''
+        self.sim = simulator
+        self.rddl = simulator.rddl
+        self.tensors = simulator.tensors
+        self.levels = simulator.levels
+        self.batch_shape = () if batch_size is None else (batch_size,)
+        
+        # a function step(subs, rng) that evaluates all CPFs and returns the
+        # reward, if the compiler provides one
+        self.step = None
+        
+        # the number of objects of the chunked variables of the expression being
+        # compiled, and the first object of their chunk being evaluated
+        self._chunk_sizes = {}
+        self._chunk_offsets = {}
+        
+        # the number of leading objects of the masked branch being compiled,
+        # and the coordinates at which it is evaluated
+        self._mask_axes = 0
+        self._mask_index = [None]
+
+    # ===========================================================================
+    # main compilation subroutines
+    # ===========================================================================
+
+    def compile(self) -> None:
+        self.invariants = self._compile_constraints(self.rddl.invariants)
+        self.preconditions = self._compile_constraints(self.rddl.preconditions)
+        self.termination = self._compile_constraints(self.rddl.terminals)
+        self.cpfs = self._compile_cpfs()
+        self.reward = self._compile(self.rddl.reward, [])
+
+    def _compile_constraints(self, constraints):
+        return [self._compile(c, []) for c in constraints]
+
+    def _compile_cpfs(self):
+        np_cpfs = {}
+        for cpfs in self.levels.values():
+            for cpf in cpfs:
+                objects, expr = self.rddl.cpfs[cpf]
+                np_cpfs[cpf] = self._compile(expr, objects, self._out(cpf))
+        return np_cpfs
+    
+    def _out(self, cpf):
+        
+        # the previous value of an interm or observ fluent tracked incrementally
+        # is compared to its new value, so it is not overwritten in place
+        sim = self.sim
+        if sim._buffers is None:
+            return None
+        if sim.incremental is not None and cpf not in sim.next_states:
+            return None
+        return cpf
+
+    # ===========================================================================
+    # expression compilation
+    # ===========================================================================
+
+    def _compile(self, expr, objects, out=None):
+        etype, _ = expr.etype
+        if etype == 'constant':
+            return self._compile_constant(expr, objects)
+        elif etype == 'pvar':
+            return self._compile_pvar(expr, objects)
+        elif etype == 'arithmetic':
+            return self._compile_arithmetic(expr, objects, out)
+        elif etype == 'relational':
+            return self._compile_relational(expr, objects)
+        elif etype == 'boolean':
+            return self._compile_logical(expr, objects)
+        elif etype == 'aggregation':
+            return self._compile_aggregation(expr, objects, out)
+        elif etype == 'func':
+            return self._compile_func(expr, objects, out)
+        elif etype == 'control':
+            return self._compile_control(expr, objects, out)
+        elif etype == 'randomvar':
+            return self._compile_random(expr, objects)
+        else:
+            raise RDDLNotImplementedError(
+                f'Internal error: expression {expr} is not recognized.')
+
+    @staticmethod
+    def _is_simple(expr):
+        return expr.is_constant_expression() or expr.is_pvariable_expression()
+    
+    def static_type(self, expr):
+        '''Returns the type of the values of the given expression if it does
+        not depend on the branches taken when evaluating it, or None.'''
+        etype, op = expr.etype
+        if etype == 'relational' or etype == 'boolean':
+            return bool
+        elif etype == 'aggregation' and (op == 'forall' or op == 'exists'):
+            return bool
+        elif etype == 'pvar':
+            prange = self.rddl.variable_ranges.get(expr.args[0], None)
+            return RDDLTensors.NUMPY_TYPES.get(prange, None)
+        elif etype == 'constant' and not self.rddl.is_grounded:
+            return np.result_type(expr.args).type
+        return None
+    
+    def _check_by_dtype(self, check, valid=None, args=()):
+        
+        # an unchecked simulator checks the type of a value once per dtype,
+        # and not at all if the types of the arguments are known statically
+        if self.sim.validation is None:
+            return check
+        if args and all(np.can_cast(self.static_type(arg) or object, valid)
+                        for arg in args):
+            return RDDLValidation.skip
+        return RDDLValidation.by_dtype(check)
+    
+    def _check_deferred(self, check):
+        
+        # an unchecked simulator records failed checks until the end of the step
+        validation = self.sim.validation
+        if validation is None:
+            return check
+        deferred = {'_check_positive': validation.positive,
+                    '_check_bounds': validation.bounds,
+                    '_check_range': validation.in_range}
+        return deferred[check.__name__](check)
+    
+    @staticmethod
+    def _buffer(subs, out, dtype):
+        
+        # a value is only written into a buffer of the same type, so that its
+        # type is checked as if it had been allocated
+        if out is None:
+            return None
+        buffer = subs[out]
+        if buffer.dtype != dtype:
+            return None
+        return buffer
+    
+    @staticmethod
+    def _result_type(cache, np_op, dtypes, **kwargs):
+        
+        # the type of the result of an operation on arguments of the given 
+        # types, found once by applying the operation to ones of these types
+        args = [np.ones((1,) * len(kwargs.get('axis', ())), dtype=dtype) 
+                for dtype in dtypes]
+        with np.errstate(all='ignore'):
+            dtype = cache[dtypes] = np.result_type(np_op(*args, **kwargs))
+        return dtype
+    
+    def _sample_shape(self, objects):
+        
+        # a masked branch has as many elements as its coordinates, so samples
+        # take the shape of their parameters
+        if self._mask_axes:
+            return None
+        return self.batch_shape + self._chunk_shape(objects)
+    
+    def _chunk_shape(self, objects):
+        return tuple(self._chunk_sizes.get(var, len(self.rddl.objects[ptype]))
+                     for (var, ptype) in objects)
+
+    # ===========================================================================
+    # leaves
+    # ===========================================================================
+
+    def _compile_constant(self, expr, objects):
+        if self.rddl.is_grounded:
+            value = np.asarray(expr.args)
+        elif self._mask_axes:
+            index = self._mask_index
+            shape = self._chunk_shape(objects[self._mask_axes:])
+            value = expr.args
+            
+            def _f(subs, rng):
+                return np.full(shape=(len(index[0][0]),) + shape, 
+                               fill_value=value)
+            
+            return _f
+        
+        else:
+            value = np.full(shape=self._chunk_shape(objects),
+                            fill_value=expr.args)
+
+        def _f(subs, rng):
+            return value
+
+        return _f
+
+    def _compile_pvar(self, expr, objects):
+        sim = self.sim
+        _, name = expr.etype
+        args = expr.args
+        sim._check_arity(args, 2, f'Variable <{name}>', expr)
+
+        # check the variable is valid
+        var, pvars = args
+        if var not in sim.init_values:
+            raise RDDLUndefinedVariableError(
+                f'Variable <{var}> is not defined in the instance.\n' +
+                sim._print_stack_trace(expr))
+
+        if self.rddl.is_grounded:
+
+            def _f(subs, rng):
+                return np.asarray(subs[var])
+
+            return _f
+
+        # argument is reshaped to match the free variables "objects"
+        transform = self.tensors.map(
+            var, pvars, objects, msg=sim._print_stack_trace(expr))
+        
+        # only the objects at the coordinates of a masked branch are read
+        if self._mask_axes:
+            index = self._mask_index
+            num_batch = len(self.batch_shape)
+            num_objects = len(objects)
+            
+            def _f(subs, rng):
+                value = transform(subs[var])
+                lead = np.ndim(value) - num_objects
+                return value[index[0][num_batch - lead:]]
+            
+            return _f
+        
+        # only the objects of the chunk being evaluated are read
+        chunked = [(i, free, self._chunk_sizes[free])
+                   for (i, (free, _)) in enumerate(objects)
+                   if free in self._chunk_sizes]
+        if chunked:
+            offsets = self._chunk_offsets
+            index = [slice(None)] * len(objects)
+            
+            def _f(subs, rng):
+                for (i, free, size) in chunked:
+                    start = offsets[free]
+                    index[i] = slice(start, start + size)
+                return transform(subs[var])[(Ellipsis,) + tuple(index)]
+            
+            return _f
+
+        def _f(subs, rng):
+            return transform(subs[var])
+
+        return _f
+
+    # ===========================================================================
+    # arithmetic
+    # ===========================================================================
+
+    def _compile_arithmetic(self, expr, objects, out=None):
+        sim = self.sim
+        _, op = expr.etype
+        valid_ops = sim.ARITHMETIC_OPS
+        sim._check_op(op, valid_ops, 'Arithmetic', expr)
+
+        args = expr.args
+        n = len(args)
+        if n == 1 and op == '-':
+            arg, = args
+            np_arg = self._compile(arg, objects)
+            if out is not None:
+                minus_one = np.int64(-1)
+                return self._compile_ufunc(
+                    np.multiply, [lambda subs, rng: minus_one, np_arg], out)
+
+            def _f(subs, rng):
+                return -1 * np_arg(subs, rng)
+
+            return _f
+
+        elif n == 2:
+            if op == '*':
+                return self._compile_product(args, objects, out)
+            else:
+                lhs, rhs = args
+                np_lhs = self._compile(lhs, objects)
+                np_rhs = self._compile(rhs, objects)
+                np_op = valid_ops[op]
+                if out is not None:
+                    return self._compile_ufunc(np_op, [np_lhs, np_rhs], out)
+
+                def _f(subs, rng):
+                    lhs = numeric(np_lhs(subs, rng))
+                    rhs = numeric(np_rhs(subs, rng))
+                    return np_op(lhs, rhs)
+
+                return _f
+
+        elif self.rddl.is_grounded and n > 0:
+            if op == '*':
+                return self._compile_product_grounded(args, objects)
+            elif op == '+':
+                np_args = [self._compile(arg, objects) for arg in args]
+
+                def _f(subs, rng):
+                    samples = [np_arg(subs, rng) for np_arg in np_args]
+                    return np.sum(samples, axis=0)
+
+                return _f
+
+        sim._check_arity(args, 2, 'Arithmetic operator', expr)
+
+    def _compile_product(self, args, objects, out=None):
+        lhs, rhs = args
+        if NumpyRDDLCompiler._is_simple(rhs):
+            lhs, rhs = rhs, lhs
+        np_lhs = self._compile(lhs, objects)
+        np_rhs = self._compile(rhs, objects)
+        
+        if out is not None:
+            return self._compile_ufunc(np.multiply, [np_lhs, np_rhs], out, 
+                                       zero=True)
+
+        def _f(subs, rng):
+            lhs = numeric(np_lhs(subs, rng))
+            if not np.any(lhs):
+                return lhs
+            return lhs * np_rhs(subs, rng)
+
+        return _f
+    
+    def _compile_ufunc(self, np_op, np_args, out, zero=False):
+        
+        # an elementwise operation written into the buffer of a CPF (a product
+        # whose first factor is zero is returned without the second factor)
+        result_type, dtypes = NumpyRDDLCompiler._result_type, {}
+        
+        def _f(subs, rng):
+            args = []
+            for np_arg in np_args:
+                arg = numeric(np_arg(subs, rng))
+                if zero and not args and not np.any(arg):
+                    return arg
+                args.append(arg)
+            key = tuple(arg.dtype for arg in args)
+            dtype = dtypes.get(key, None)
+            if dtype is None:
+                dtype = result_type(dtypes, np_op, key)
+            result = subs[out]
+            if result.dtype != dtype:
+                return np_op(*args)
+            return np_op(*args, out=result)
+        
+        return _f
+
+    def _compile_product_grounded(self, args, objects):
+
+        # go through simple expressions first, complex expressions last
+        simple = [arg for arg in args if NumpyRDDLCompiler._is_simple(arg)]
+        compound = [arg for arg in args if not NumpyRDDLCompiler._is_simple(arg)]
+        np_args = [self._compile(arg, objects) for arg in simple + compound]
+
+        def _f(subs, rng):
+            prod = 1
+            for np_arg in np_args:
+                prod *= np_arg(subs, rng).item()
+                if prod == 0:
+                    break
+            return np.asarray(prod)
+
+        return _f
+
+    # ===========================================================================
+    # boolean
+    # ===========================================================================
+
+    def _compile_relational(self, expr, objects):
+        sim = self.sim
+        _, op = expr.etype
+        args = expr.args
+        valid_ops = sim.RELATIONAL_OPS
+        sim._check_op(op, valid_ops, 'Relational', expr)
+        sim._check_arity(args, 2, f'Relational operator {op}', expr)
+
+        lhs, rhs = args
+        np_lhs = self._compile(lhs, objects)
+        np_rhs = self._compile(rhs, objects)
+        np_op = valid_ops[op]
+
+        def _f(subs, rng):
+            lhs = numeric(np_lhs(subs, rng))
+            rhs = numeric(np_rhs(subs, rng))
+            return np_op(lhs, rhs)
+
+        return _f
+
+    def _compile_logical(self, expr, objects):
+        sim = self.sim
+        _, op = expr.etype
+        args = expr.args
+        valid_ops = sim.LOGICAL_OPS
+        sim._check_op(op, valid_ops, 'Logical', expr)
+        check_type = self._check_by_dtype(sim._check_type, bool, args)
+
+        n = len(args)
+        if n == 1 and op == '~':
+            arg, = args
+            np_arg = self._compile(arg, objects)
+            msg = f'Argument of logical operator {op}'
+
+            def _f(subs, rng):
+                arg = np_arg(subs, rng)
+                check_type(arg, bool, msg, expr)
+                return np.logical_not(arg)
+
+            return _f
+
+        elif n == 2:
+            if op == '^' or op == '|':
+                return self._compile_and_or(args, op, expr, objects)
+            else:
+                lhs, rhs = args
+                np_lhs = self._compile(lhs, objects)
+                np_rhs = self._compile(rhs, objects)
+                np_op = valid_ops[op]
+                msg1 = f'Argument 1 of logical operator {op}'
+                msg2 = f'Argument 2 of logical operator {op}'
+
+                def _f(subs, rng):
+                    lhs = np_lhs(subs, rng)
+                    rhs = np_rhs(subs, rng)
+                    check_type(lhs, bool, msg1, expr)
+                    check_type(rhs, bool, msg2, expr)
+                    return np_op(lhs, rhs)
+
+                return _f
+
+        elif self.rddl.is_grounded and n > 0 and (op == '^' or op == '|'):
+            return self._compile_and_or_grounded(args, op, expr, objects)
+
+        sim._check_arity(args, 2, 'Logical operator', expr)
+
+    def _compile_and_or(self, args, op, expr, objects):
+        check_type = self._check_by_dtype(self.sim._check_type, bool, args)
+        lhs, rhs = args
+        if NumpyRDDLCompiler._is_simple(rhs):
+            lhs, rhs = rhs, lhs  # prioritize simple expressions
+        np_lhs = self._compile(lhs, objects)
+        np_rhs = self._compile(rhs, objects)
+        np_op = np.logical_and if op == '^' else np.logical_or
+        is_and = op == '^'
+        msg1 = f'Argument 1 of logical operator {op}'
+        msg2 = f'Argument 2 of logical operator {op}'
+
+        def _f(subs, rng):
+            lhs = np_lhs(subs, rng)
+            check_type(lhs, bool, msg1, expr)
+            if (is_and and not np.any(lhs)) or (not is_and and np.all(lhs)):
+                return lhs
+            rhs = np_rhs(subs, rng)
+            check_type(rhs, bool, msg2, expr)
+            return np_op(lhs, rhs)
+
+        return _f
+
+    def _compile_and_or_grounded(self, args, op, expr, objects):
+        check_type = self._check_by_dtype(self.sim._check_type, bool, args)
+
+        # go through simple expressions first, complex expressions last
+        indexed = list(enumerate(args))
+        indexed = [(i, arg) for i, arg in indexed
+                   if NumpyRDDLCompiler._is_simple(arg)] + \
+                  [(i, arg) for i, arg in indexed
+                   if not NumpyRDDLCompiler._is_simple(arg)]
+        np_args = [(f'Argument {i + 1} of logical operator {op}',
+                    self._compile(arg, objects))
+                   for i, arg in indexed]
+        is_and = op == '^'
+
+        def _f(subs, rng):
+            for msg, np_arg in np_args:
+                sample = np_arg(subs, rng)
+                check_type(sample, bool, msg, expr)
+                if bool(sample) != is_and:
+                    return np.asarray(not is_and)
+            return np.asarray(is_and)
+
+        return _f
+
+    # ===========================================================================
+    # aggregation
+    # ===========================================================================
+
+    def _compile_aggregation(self, expr, objects, out=None):
+        sim = self.sim
+        if self.rddl.is_grounded:
+            raise Exception(f'Aggregation {expr} in grounded domain.')
+
+        _, op = expr.etype
+        args = expr.args
+        valid_ops = sim.AGGREGATION_OPS
+        sim._check_op(op, valid_ops, 'Aggregation', expr)
+
+        # reduced axes are counted from the end to skip the batch axis
+        * pvars, arg = args
+        new_objects = objects + [p[1] for p in pvars]
+        axis = tuple(range(-len(pvars), 0))
+
+        # check for undefined types
+        bad_types = {p for _, p in new_objects if p not in self.rddl.objects}
+        if bad_types:
+            raise RDDLInvalidObjectError(
+                f'Type(s) {bad_types} are not defined, '
+                f'must be one of {set(self.rddl.objects.keys())}.\n' +
+                sim._print_stack_trace(expr))
+
+        # check for duplicated iteration variables
+        for _, (free_new, _) in pvars:
+            for free_old, _ in objects:
+                if free_new == free_old:
+                    raise RDDLInvalidObjectError(
+                        f'Iteration variable <{free_new}> is already defined '
+                        f'in outer scope.\n' +
+                        sim._print_stack_trace(expr))
+
+        # debug compiler info
+        self.tensors.write_debug_message(
+            f'compiling object info for aggregation:'
+                f'\n\toperator       ={op} {pvars}'
+                f'\n\tinput objects  ={new_objects}'
+                f'\n\toutput objects ={objects}'
+                f'\n\toperation      ={valid_ops[op]}, axes={axis}\n'
+        )
+
+        # aggregate over the nonzero entries of a sparse non-fluent (plans over
+        # whole objects do not apply inside a chunk or masked branch)
+        partial = self._chunk_sizes or self._mask_axes
+        if sim.sparse is not None and not partial:
+            sparse = sim.sparse.plan(expr, objects)
+            if sparse is not None:
+                return self._compile_sparse_aggregation(sparse, expr)
+
+        # contract the factors of a product with einsum
+        if sim.contraction is not None and not partial:
+            contraction = sim.contraction.plan(expr, objects)
+            if contraction is not None:
+                return self._compile_contraction(contraction)
+        
+        # evaluate an argument that does not fit in memory in chunks
+        if sim.chunking is not None and not self._mask_axes:
+            sizes = list(zip((var for (var, _) in new_objects),
+                             self._chunk_shape(new_objects)))
+            chunks = sim.chunking.plan(
+                sizes, len(objects), int(np.prod(self.batch_shape)))
+            if chunks is not None:
+                return self._compile_chunked_aggregation(
+                    chunks, arg, new_objects, axis, expr)
+
+        np_arg = self._compile(arg, new_objects)
+        np_op = valid_ops[op]
+        if out is not None:
+            return self._compile_reduction(np_op, np_arg, axis, arg, out, expr)
+
+        if op == 'forall' or op == 'exists':
+            check_type = self._check_by_dtype(sim._check_type, bool, [arg])
+            msg = f'Argument of aggregation {op}'
+
+            def _f(subs, rng):
+                arg = np_arg(subs, rng)
+                check_type(arg, bool, msg, expr)
+                return np_op(arg, axis=axis)
+
+        else:
+
+            def _f(subs, rng):
+                arg = numeric(np_arg(subs, rng))
+                return np_op(arg, axis=axis)
+
+        return _f
+    
+    def _compile_reduction(self, np_op, np_arg, axis, arg, out, expr):
+        
+        # an aggregation written into the buffer of a CPF, which must have the
+        # shape of the result, as reductions do not broadcast into their output
+        _, op = expr.etype
+        logical = op == 'forall' or op == 'exists'
+        check_type = self._check_by_dtype(self.sim._check_type, bool, [arg])
+        msg = f'Argument of aggregation {op}'
+        result_type, dtypes = NumpyRDDLCompiler._result_type, {}
+        
+        def _f(subs, rng):
+            arg = np_arg(subs, rng)
+            if logical:
+                check_type(arg, bool, msg, expr)
+            else:
+                arg = numeric(arg)
+            key = (arg.dtype,)
+            dtype = dtypes.get(key, None)
+            if dtype is None:
+                dtype = result_type(dtypes, np_op, key, axis=axis)
+            result = subs[out]
+            if result.dtype != dtype or result.shape != arg.shape[:-len(axis)]:
+                return np_op(arg, axis=axis)
+            return np_op(arg, axis=axis, out=result)
+        
+        return _f
+
+    def _compile_chunked_aggregation(self, chunks, arg, objects, axis, expr):
+        sim = self.sim
+        _, op = expr.etype
+        np_op = sim.AGGREGATION_OPS['sum' if op == 'avg' else op]
+        combine = RDDLChunking.COMBINE[op]
+        logical = op == 'forall' or op == 'exists'
+        check_type = self._check_by_dtype(sim._check_type, bool, [arg])
+        msg = f'Argument of aggregation {op}'
+        count = np.prod([len(self.rddl.objects[objects[i][1]]) for i in axis])
+        
+        # the argument is compiled once for every shape of chunk, i.e. with
+        # or without the last smaller chunk of each variable
+        variables = [var for (var, _, _) in chunks]
+        sizes = [{chunk, size % chunk} - {0} for (_, size, chunk) in chunks]
+        np_args = {}
+        outer = self._chunk_sizes
+        try:
+            for shape in itertools.product(*sizes):
+                self._chunk_sizes = {**outer, **dict(zip(variables, shape))}
+                np_args[shape] = self._compile(arg, objects)
+        finally:
+            self._chunk_sizes = outer
+        
+        offsets = self._chunk_offsets
+        plan = []
+        for chunk in RDDLChunking.chunks(chunks):
+            starts = {var: chunk[var].start for var in variables}
+            shape = tuple(chunk[var].stop - chunk[var].start for var in variables)
+            plan.append((starts, np_args[shape]))
+
+        def _f(subs, rng):
+            result = None
+            for (starts, np_arg) in plan:
+                offsets.update(starts)
+                arg = np_arg(subs, rng)
+                if logical:
+                    check_type(arg, bool, msg, expr)
+                else:
+                    arg = numeric(arg)
+                arg = np_op(arg, axis=axis)
+                result = arg if result is None else combine(result, arg)
+            if op == 'avg':
+                result = result / count
+            return result
+
+        return _f
+
+    def _compile_sparse_aggregation(self, sparse, expr):
+        if sparse.arg is None:
+
+            def _f(subs, rng):
+                return sparse.reduce(None)
+
+            return _f
+
+        np_arg = self._compile(sparse.arg, sparse.arg_objects)
+        check_type = self._check_by_dtype(self.sim._check_type)
+        logical = sparse.logical
+
+        def _f(subs, rng):
+            arg = np_arg(subs, rng)
+            if logical:
+                check_type(arg, bool, 'Argument 2 of logical operator ^', expr)
+            return sparse.reduce(arg)
+
+        return _f
+
+    def _compile_contraction(self, contraction):
+        np_factors = [self._compile(factor, f_objects)
+                      for (factor, f_objects) in zip(contraction.factors,
+                                                     contraction.factor_objects)]
+
+        def _f(subs, rng):
+            return contraction.contract(
+                [np_factor(subs, rng) for np_factor in np_factors])
+
+        return _f
+
+    # ===========================================================================
+    # function
+    # ===========================================================================
+
+    def _compile_func(self, expr, objects, out=None):
+        sim = self.sim
+        _, name = expr.etype
+        args = expr.args
+        if isinstance(args, type(expr)):
+            args = (args,)
+
+        if name in sim.UNARY:
+            sim._check_arity(args, 1, f'Unary function {name}', expr)
+            arg, = args
+            np_arg = self._compile(arg, objects)
+            np_op = sim.UNARY[name]
+            if out is not None and isinstance(np_op, np.ufunc):
+                return self._compile_ufunc(np_op, [np_arg], out)
+
+            def _f(subs, rng):
+                return np_op(numeric(np_arg(subs, rng)))
+
+            return _f
+
+        elif name in sim.BINARY:
+            sim._check_arity(args, 2, f'Binary function {name}', expr)
+            lhs, rhs = args
+            np_lhs = self._compile(lhs, objects)
+            np_rhs = self._compile(rhs, objects)
+            np_op = sim.BINARY[name]
+            if out is not None and isinstance(np_op, np.ufunc):
+                return self._compile_ufunc(np_op, [np_lhs, np_rhs], out)
+
+            def _f(subs, rng):
+                lhs = numeric(np_lhs(subs, rng))
+                rhs = numeric(np_rhs(subs, rng))
+                return np_op(lhs, rhs)
+
+            return _f
+
+        sim._raise_unsupported(f'Function {name}', expr)
+
+    # ===========================================================================
+    # control flow
+    # ===========================================================================
+
+    def _compile_control(self, expr, objects, out=None):
+        sim = self.sim
+        _, op = expr.etype
+        args = expr.args
+        sim._check_op(op, {'if'}, 'Control', expr)
+        sim._check_arity(args, 3, 'If then else', expr)
+        pred, arg1, arg2 = args
+        check_type = self._check_by_dtype(sim._check_type, bool, [pred])
+
+        np_pred = self._compile(pred, objects)
+        np_arg1 = self._compile(arg1, objects)
+        np_arg2 = self._compile(arg2, objects)
+        
+        # a branch selected at all elements writes into the buffer of the CPF
+        np_out1, np_out2 = np_arg1, np_arg2
+        if out is not None:
+            np_out1 = self._compile(arg1, objects, out)
+            np_out2 = self._compile(arg2, objects, out)
+        
+        # a branch selected at few elements is evaluated only at those elements
+        np_masked, shape, size, limit = None, None, 0, 0
+        if sim.mask_density > 0 and objects \
+        and not self._chunk_sizes and not self._mask_axes:
+            np_masked = self._compile_masked(
+                arg1, arg2, np_arg1, np_arg2, objects, out)
+            shape = self._sample_shape(objects)
+            size = int(np.prod(shape))
+            limit = sim.mask_density * size
+
+        buffer = NumpyRDDLCompiler._buffer
+
+        def _f(subs, rng):
+            pred = np_pred(subs, rng)
+            check_type(pred, bool, 'Predicate', expr)
+
+            count_true = np.sum(pred)
+            if count_true == pred.size:  # all elements of pred are true
+                return np_out1(subs, rng)
+            elif count_true == 0:  # all elements of pred are false
+                return np_out2(subs, rng)
+            elif np_masked is not None and pred.shape == shape:
+                if count_true <= limit:
+                    return np_masked(pred, True, subs, rng)
+                elif size - count_true <= limit:
+                    return np_masked(pred, False, subs, rng)
+            arg1 = np_arg1(subs, rng)
+            arg2 = np_arg2(subs, rng)
+            result = buffer(subs, out, np.result_type(arg1, arg2))
+            if result is None:
+                return np.where(pred, arg1, arg2)
+            np.copyto(result, arg2)
+            np.copyto(result, arg1, where=pred)
+            return result
+
+        return _f
+    
+    def _compile_masked(self, arg1, arg2, np_arg1, np_arg2, objects, out=None):
+        
+        # the gathered branches are compiled when they are first needed
+        args = (arg1, arg2)
+        np_args = (np_arg1, np_arg2)
+        np_gathered = {}
+        index = self._mask_index
+        buffer = NumpyRDDLCompiler._buffer
+        
+        def _gathered(i):
+            np_arg = np_gathered.get(i, None)
+            if np_arg is None:
+                self._mask_axes = len(objects)
+                try:
+                    np_arg = np_gathered[i] = self._compile(args[i], objects)
+                finally:
+                    self._mask_axes = 0
+            return np_arg
+        
+        # branches are evaluated in order, so random draws keep their order
+        def _f(pred, first, subs, rng):
+            coords = np.nonzero(pred if first else ~pred)
+            values = []
+            for i in (0, 1):
+                if (i == 0) == first:
+                    index[0] = coords
+                    values.append(_gathered(i)(subs, rng))
+                else:
+                    values.append(np_args[i](subs, rng))
+            sparse, dense = values if first else values[::-1]
+            dtype = np.result_type(sparse, dense)
+            result = buffer(subs, out, dtype)
+            if result is None or result.shape != pred.shape:
+                result = np.array(np.broadcast_to(dense, pred.shape), 
+                                  dtype=dtype)
+            else:
+                np.copyto(result, dense)
+            result[coords] = sparse
+            return result
+        
+        return _f
+
+    # ===========================================================================
+    # random variables
+    # ===========================================================================
+
+    def _compile_random(self, expr, objects):
+        _, name = expr.etype
+        if name == 'KronDelta':
+            return self._compile_kron_delta(expr, objects)
+        elif name == 'DiracDelta':
+            return self._compile_dirac_delta(expr, objects)
+        elif name == 'Uniform':
+            return self._compile_uniform(expr, objects)
+        elif name == 'Bernoulli':
+            return self._compile_bernoulli(expr, objects)
+        elif name == 'Normal':
+            return self._compile_normal(expr, objects)
+        elif name == 'Poisson':
+            return self._compile_poisson(expr, objects)
+        elif name == 'Exponential':
+            return self._compile_exponential(expr, objects)
+        elif name == 'Weibull':
+            return self._compile_weibull(expr, objects)
+        elif name == 'Gamma':
+            return self._compile_gamma(expr, objects)
+        elif name == 'Binomial':
+            return self._compile_binomial(expr, objects)
+        elif name == 'NegativeBinomial':
+            return self._compile_negative_binomial(expr, objects)
+        elif name == 'Beta':
+            return self._compile_beta(expr, objects)
+        elif name == 'Geometric':
+            return self._compile_geometric(expr, objects)
+        elif name == 'Pareto':
+            return self._compile_pareto(expr, objects)
+        elif name == 'Student':
+            return self._compile_student(expr, objects)
+        elif name == 'Gumbel':
+            return self._compile_gumbel(expr, objects)
+        elif name == 'Laplace':
+            return self._compile_laplace(expr, objects)
+        elif name == 'Cauchy':
+            return self._compile_cauchy(expr, objects)
+        elif name == 'Gompertz':
+            return self._compile_gompertz(expr, objects)
+        else:  # no support for enum
+            self.sim._raise_unsupported(f'Distribution {name}', expr)
+
+    def _compile_args(self, expr, objects, name, required):
+        args = expr.args
+        self.sim._check_arity(args, required, name, expr)
+        return [self._compile(arg, objects) for arg in args]
+    
+    def _compile_size(self, objects):
+        
+        # None lets numpy infer the size from the parameters, which also keeps
+        # the samples of scalar random variables as scalars
+        return self._sample_shape(objects) or None
+
+    def _compile_kron_delta(self, expr, objects):
+        np_arg, = self._compile_args(expr, objects, 'KronDelta', 1)
+        check_type_in = self._check_by_dtype(self.sim._check_type_in)
+        valid = {bool, RDDLTensors.INT}
+
+        def _f(subs, rng):
+            arg = np_arg(subs, rng)
+            check_type_in(arg, valid, 'Argument of KronDelta', expr)
+            return arg
+
+        return _f
+
+    def _compile_dirac_delta(self, expr, objects):
+        np_arg, = self._compile_args(expr, objects, 'DiracDelta', 1)
+        check_type = self._check_by_dtype(self.sim._check_type)
+
+        def _f(subs, rng):
+            arg = np_arg(subs, rng)
+            check_type(arg, RDDLTensors.REAL, 'Argument of DiracDelta', expr)
+            return arg
+
+        return _f
+
+    def _compile_uniform(self, expr, objects):
+        np_lb, np_ub = self._compile_args(expr, objects, 'Uniform', 2)
+        size = self._compile_size(objects)
+        check_bounds = self._check_deferred(self.sim._check_bounds)
+
+        def _f(subs, rng):
+            lb = np_lb(subs, rng)
+            ub = np_ub(subs, rng)
+            check_bounds(lb, ub, 'Uniform', expr)
+            return rng.uniform(lb, ub, size=size)
+
+        return _f
+
+    def _compile_bernoulli(self, expr, objects):
+        np_pr, = self._compile_args(expr, objects, 'Bernoulli', 1)
+        shape = self._sample_shape(objects)
+        check_range = self._check_deferred(self.sim._check_range)
+
+        def _f(subs, rng):
+            pr = np_pr(subs, rng)
+            check_range(pr, 0, 1, 'Bernoulli p', expr)
+            return rng.uniform(size=shape or np.shape(pr)) <= pr
+
+        return _f
+
+    def _compile_normal(self, expr, objects):
+        np_mean, np_var = self._compile_args(expr, objects, 'Normal', 2)
+        size = self._compile_size(objects)
+        check_positive = self._check_deferred(self.sim._check_positive)
+
+        def _f(subs, rng):
+            mean = np_mean(subs, rng)
+            var = np_var(subs, rng)
+            check_positive(var, False, 'Normal variance', expr)
+            return rng.normal(mean, np.sqrt(var), size=size)
+
+        return _f
+
+    def _compile_poisson(self, expr, objects):
+        np_rate, = self._compile_args(expr, objects, 'Poisson', 1)
+        size = self._compile_size(objects)
+        check_positive = self._check_deferred(self.sim._check_positive)
+
+        def _f(subs, rng):
+            rate = np_rate(subs, rng)
+            check_positive(rate, False, 'Poisson rate', expr)
+            return rng.poisson(rate, size=size)
+
+        return _f
+
+    def _compile_exponential(self, expr, objects):
+        np_scale, = self._compile_args(expr, objects, 'Exponential', 1)
+        size = self._compile_size(objects)
+        check_positive = self._check_deferred(self.sim._check_positive)
+
+        def _f(subs, rng):
+            scale = np_scale(subs, rng)
+            check_positive(scale, True, 'Exponential rate', expr)
+            return rng.exponential(scale, size=size)
+
+        return _f
+
+    def _compile_weibull(self, expr, objects):
+        np_shape, np_scale = self._compile_args(expr, objects, 'Weibull', 2)
+        size = self._compile_size(objects)
+        check_positive = self._check_deferred(self.sim._check_positive)
+
+        def _f(subs, rng):
+            shape = np_shape(subs, rng)
+            scale = np_scale(subs, rng)
+            check_positive(shape, True, 'Weibull shape', expr)
+            check_positive(scale, True, 'Weibull scale', expr)
+            return scale * rng.weibull(shape, size=size)
+
+        return _f
+
+    def _compile_gamma(self, expr, objects):
+        np_shape, np_scale = self._compile_args(expr, objects, 'Gamma', 2)
+        size = self._compile_size(objects)
+        check_positive = self._check_deferred(self.sim._check_positive)
+
+        def _f(subs, rng):
+            shape = np_shape(subs, rng)
+            scale = np_scale(subs, rng)
+            check_positive(shape, True, 'Gamma shape', expr)
+            check_positive(scale, True, 'Gamma scale', expr)
+            return rng.gamma(shape, scale, size=size)
+
+        return _f
+
+    def _compile_binomial(self, expr, objects):
+        np_count, np_pr = self._compile_args(expr, objects, 'Binomial', 2)
+        size = self._compile_size(objects)
+        check_type = self._check_by_dtype(self.sim._check_type)
+        check_positive = self._check_deferred(self.sim._check_positive)
+        check_range = self._check_deferred(self.sim._check_range)
+
+        def _f(subs, rng):
+            count = np_count(subs, rng)
+            pr = np_pr(subs, rng)
+            check_type(count, RDDLTensors.INT, 'Binomial count', expr)
+            check_positive(count, False, 'Binomial count', expr)
+            check_range(pr, 0, 1, 'Binomial p', expr)
+            return rng.binomial(count, pr, size=size)
+
+        return _f
+
+    def _compile_negative_binomial(self, expr, objects):
+        np_count, np_pr = self._compile_args(
+            expr, objects, 'NegativeBinomial', 2)
+        size = self._compile_size(objects)
+        check_positive = self._check_deferred(self.sim._check_positive)
+        check_range = self._check_deferred(self.sim._check_range)
+
+        def _f(subs, rng):
+            count = np_count(subs, rng)
+            pr = np_pr(subs, rng)
+            check_positive(count, True, 'NegativeBinomial r', expr)
+            check_range(pr, 0, 1, 'NegativeBinomial p', expr)
+            return rng.negative_binomial(count, pr, size=size)
+
+        return _f
+
+    def _compile_beta(self, expr, objects):
+        np_shape, np_rate = self._compile_args(expr, objects, 'Beta', 2)
+        size = self._compile_size(objects)
+        check_positive = self._check_deferred(self.sim._check_positive)
+
+        def _f(subs, rng):
+            shape = np_shape(subs, rng)
+            rate = np_rate(subs, rng)
+            check_positive(shape, True, 'Beta shape', expr)
+            check_positive(rate, True, 'Beta rate', expr)
+            return rng.beta(shape, rate, size=size)
+
+        return _f
+
+    def _compile_geometric(self, expr, objects):
+        np_pr, = self._compile_args(expr, objects, 'Geometric', 1)
+        size = self._compile_size(objects)
+        check_range = self._check_deferred(self.sim._check_range)
+
+        def _f(subs, rng):
+            pr = np_pr(subs, rng)
+            check_range(pr, 0, 1, 'Geometric p', expr)
+            return rng.geometric(pr, size=size)
+
+        return _f
+
+    def _compile_pareto(self, expr, objects):
+        np_shape, np_scale = self._compile_args(expr, objects, 'Pareto', 2)
+        size = self._compile_size(objects)
+        check_positive = self._check_deferred(self.sim._check_positive)
+
+        def _f(subs, rng):
+            shape = np_shape(subs, rng)
+            scale = np_scale(subs, rng)
+            check_positive(shape, True, 'Pareto shape', expr)
+            check_positive(scale, True, 'Pareto scale', expr)
+            return scale * rng.pareto(shape, size=size)
+
+        return _f
+
+    def _compile_student(self, expr, objects):
+        np_df, = self._compile_args(expr, objects, 'Student', 1)
+        size = self._compile_size(objects)
+        check_positive = self._check_deferred(self.sim._check_positive)
+
+        def _f(subs, rng):
+            df = np_df(subs, rng)
+            check_positive(df, True, 'Student df', expr)
+            return rng.standard_t(df, size=size)
+
+        return _f
+
+    def _compile_gumbel(self, expr, objects):
+        np_mean, np_scale = self._compile_args(expr, objects, 'Gumbel', 2)
+        size = self._compile_size(objects)
+        check_positive = self._check_deferred(self.sim._check_positive)
+
+        def _f(subs, rng):
+            mean = np_mean(subs, rng)
+            scale = np_scale(subs, rng)
+            check_positive(scale, True, 'Gumbel scale', expr)
+            return rng.gumbel(mean, scale, size=size)
+
+        return _f
+
+    def _compile_laplace(self, expr, objects):
+        np_mean, np_scale = self._compile_args(expr, objects, 'Laplace', 2)
+        size = self._compile_size(objects)
+        check_positive = self._check_deferred(self.sim._check_positive)
+
+        def _f(subs, rng):
+            mean = np_mean(subs, rng)
+            scale = np_scale(subs, rng)
+            check_positive(scale, True, 'Laplace scale', expr)
+            return rng.laplace(mean, scale, size=size)
+
+        return _f
+
+    def _compile_cauchy(self, expr, objects):
+        np_mean, np_scale = self._compile_args(expr, objects, 'Cauchy', 2)
+        shape = self._sample_shape(objects)
+        check_positive = self._check_deferred(self.sim._check_positive)
+
+        def _f(subs, rng):
+            mean = np_mean(subs, rng)
+            scale = np_scale(subs, rng)
+            check_positive(scale, True, 'Cauchy scale', expr)
+            sample = rng.standard_cauchy(size=shape or np.broadcast_shapes(
+                np.shape(mean), np.shape(scale)))
+            return mean + scale * sample
+
+        return _f
+
+    def _compile_gompertz(self, expr, objects):
+        np_shape, np_scale = self._compile_args(expr, objects, 'Gompertz', 2)
+        size = self._sample_shape(objects)
+        check_positive = self._check_deferred(self.sim._check_positive)
+
+        def _f(subs, rng):
+            shape = np_shape(subs, rng)
+            scale = np_scale(subs, rng)
+            check_positive(shape, True, 'Gompertz shape', expr)
+            check_positive(scale, True, 'Gompertz scale', expr)
+            U = rng.uniform(size=size or np.broadcast_shapes(
+                np.shape(shape), np.shape(scale)))
+            return np.log(1.0 - np.log1p(-U) / shape) / scale
+
+        return _f
@@ -0,0 +1,84 @@
+import itertools
+import numpy as np
+from typing import Dict, Iterable, List, Optional, Tuple
+
+Sizes = List[Tuple[str, int]]
+
+
+class RDDLChunking:
+    '''Splits aggregations whose argument tensor would take more than a given
+    number of bytes into chunks along the reduced axes.
+
+    The argument is evaluated for one chunk of objects of the leading reduced
+    variables at a time, reduced over all reduced axes, and the partial
+    results are combined with the binary operation of the aggregation (e.g.
+    addition for sum and avg, logical and for forall). Only one chunk of the
+    argument is held in memory at any time, so that the peak memory of the
+    aggregation stays within the budget at the cost of a loop over chunks.
+    Random variables in the argument are sampled chunk by chunk, so their
+    values follow the same distribution but not the same stream of draws as
+    when the argument is evaluated at once.
+    '''
+
+    ITEM_BYTES = 8
+
+    COMBINE = {
+        'sum': np.add,
+        'avg': np.add,
+        'prod': np.multiply,
+        'min': np.minimum,
+        'max': np.maximum,
+        'forall': np.logical_and,
+        'exists': np.logical_or
+    }
+
+    def __init__(self, max_bytes: int) -> None:
+        '''Creates a new chunking planner with the given memory budget.
+
+        :param max_bytes: the maximum number of bytes of the argument tensor
+        of an aggregation to evaluate at once
+        '''
+        self.max_bytes = max_bytes
+
+    def plan(self, sizes: Sizes, num_kept: int,
+             batch_size: int=1) -> Optional[List[Tuple[str, int, int]]]:
+        '''Returns the chunks of the aggregation as a list of tuples
+        (var, size, chunk) for every reduced variable var that is split into
+        chunks of at most chunk objects, or None if the argument fits in the
+        budget as a whole.
+
+        :param sizes: the list of tuples (var, size) of the objects of the
+        argument tensor, in which the first num_kept are not reduced
+        :param num_kept: the number of objects that are not reduced
+        :param batch_size: the number of elements of any leading batch axes
+        '''
+        outer = batch_size * RDDLChunking.ITEM_BYTES * int(np.prod(
+            [size for (_, size) in sizes[:num_kept]]))
+        reduced = sizes[num_kept:]
+        total = outer * int(np.prod([size for (_, size) in reduced]))
+        if total <= self.max_bytes:
+            return None
+
+        # split the leading reduced variables, one object at a time if the
+        # remaining axes still do not fit
+        chunks = []
+        for (i, (var, size)) in enumerate(reduced):
+            rest = outer * int(np.prod([n for (_, n) in reduced[i + 1:]]))
+            chunk = max(1, self.max_bytes // rest)
+            if chunk >= size:
+                break
+            chunks.append((var, size, chunk))
+            if chunk > 1 or rest <= self.max_bytes:
+                break
+        return chunks or None
+
+    @staticmethod
+    def chunks(plan: List[Tuple[str, int, int]]) -> Iterable[Dict[str, slice]]:
+        '''Iterates over the chunks of the given plan as dicts that map every
+        chunked variable to the slice of its objects in the chunk.'''
+        ranges = [[slice(start, min(start + chunk, size))
+                   for start in range(0, size, chunk)]
+                  for (_, size, chunk) in plan]
+        variables = [var for (var, _, _) in plan]
+        for slices in itertools.product(*ranges):
+            yield dict(zip(variables, slices))
@@ -0,0 +1,168 @@
+import numpy as np
+from string import ascii_letters
+from typing import List, Optional, Tuple
+
+from pyRDDLGym.Core.Compiler.RDDLModel import RDDLModel
+from pyRDDLGym.Core.Parser.expr import Expression
+from pyRDDLGym.Core.Simulator.RDDLSparse import RDDLSparse
+
+Objects = List[Tuple[str, str]]
+
+
+class Contraction:
+    '''A sum or avg aggregation whose argument is a product of deterministic
+    factors, such as sum_{?y} A(?x, ?y) * B(?y), evaluated as a single einsum.
+
+    Every factor is evaluated only over its own free variables, and einsum
+    multiplies and reduces them without building their product over the
+    cartesian product of all objects in scope. Contractions of more than two
+    factors, or over at least PATH_SIZE elements, follow an optimized
+    contraction path (which becomes a matrix product where possible), and
+    smaller ones are done in a single pass of einsum, which has much less
+    overhead. Nested sum aggregations directly under the aggregation are
+    merged into the same contraction.
+    '''
+
+    PATH_SIZE = 2 ** 16
+
+    def __init__(self, op: str, factors: List[Expression],
+                 factor_objects: List[Objects], objects: Objects,
+                 shapes: dict, count: int, multiplier: int) -> None:
+        self.op = op
+        self.factors = factors
+        self.factor_objects = factor_objects
+        self.count = count
+        self.multiplier = multiplier
+
+        # one letter per variable in scope, and batch axes as an ellipsis
+        letters = {}
+        for f_objects in factor_objects:
+            for (var, _) in f_objects:
+                if var not in letters:
+                    letters[var] = ascii_letters[len(letters)]
+        inputs = [''.join(letters[var] for (var, _) in f_objects)
+                  for f_objects in factor_objects]
+        kept = [var for (var, _) in objects if var in letters]
+        output = ''.join(letters[var] for var in kept)
+        self.subscripts = ','.join('...' + term for term in inputs) + \
+            '->...' + output
+        self._unbatched = ','.join(inputs) + '->' + output
+        self.size = int(np.prod([shapes[var] for var in letters]))
+
+        # broadcast of the result to the output objects
+        self.keep_shape = tuple(shapes[var] if var in letters else 1
+                                for (var, _) in objects)
+        self.out_shape = tuple(shapes[var] for (var, _) in objects)
+        self.num_kept = len(kept)
+        self._paths = {}
+
+    def contract(self, values: List[np.ndarray], gnp=np) -> np.ndarray:
+        '''Returns the aggregation given the values of the factors over their
+        factor_objects (with any leading batch axes), using the given numpy
+        or jax.numpy module.'''
+        operands = []
+        for value in values:
+            value = gnp.asarray(value)
+            if value.dtype == bool:
+                value = 1 * value
+            operands.append(value)
+
+        # the contraction path depends only on the shapes of the factors,
+        # and matrix products are only used for factors without batch axes
+        if gnp is np:
+            shapes = tuple(value.shape for value in operands)
+            plan = self._paths.get(shapes, None)
+            if plan is None:
+                plan = self._paths[shapes] = self._plan_path(operands)
+            subscripts, path = plan
+        else:
+            subscripts, path = self.subscripts, 'greedy'
+        result = gnp.einsum(subscripts, *operands, optimize=path)
+
+        # reduced variables that no factor depends on repeat every term
+        if self.multiplier != 1:
+            result = result * self.multiplier
+        if self.op == 'avg':
+            result = result / self.count
+        batch = result.shape[:result.ndim - self.num_kept]
+        result = gnp.reshape(result, batch + self.keep_shape)
+        return gnp.broadcast_to(result, batch + self.out_shape)
+
+    def _plan_path(self, operands):
+        batched = any(value.ndim > len(f_objects) for (value, f_objects)
+                      in zip(operands, self.factor_objects))
+        subscripts = self.subscripts if batched else self._unbatched
+        if len(operands) <= 2 and self.size < Contraction.PATH_SIZE:
+            return subscripts, False
+        path, _ = np.einsum_path(subscripts, *operands, optimize='greedy')
+        return subscripts, path
+
+
+class RDDLContraction:
+    '''Decides which aggregations of a lifted RDDL model are evaluated as a
+    Contraction: sum and avg aggregations (possibly over nested sums) whose
+    argument is a product of at least two factors that are deterministic.
+    '''
+
+    OPS = {'sum', 'avg'}
+
+    def __init__(self, rddl: RDDLModel) -> None:
+        '''Creates a new contraction planner for the given model.
+
+        :param rddl: the lifted RDDL model
+        '''
+        self.rddl = rddl
+
+    def plan(self, expr: Expression, objects: Objects) -> Optional[Contraction]:
+        '''Returns a Contraction for the given aggregation expression evaluated
+        over the given objects, or None if it must be evaluated as is.'''
+        _, op = expr.etype
+        if op not in RDDLContraction.OPS:
+            return None
+
+        # merge the variables of nested sums, leaving invalid scopes to the
+        # checks of the aggregation itself
+        scope, count, arg = dict(objects), None, expr
+        while True:
+            * pvars, arg = arg.args
+            for _, (var, ptype) in pvars:
+                if var in scope or ptype not in self.rddl.objects:
+                    return None
+                scope[var] = ptype
+            if count is None:
+                count = int(np.prod([len(self.rddl.objects[ptype])
+                                     for (_, (_, ptype)) in pvars]))
+            if arg.etype != ('aggregation', 'sum'):
+                break
+
+        factors = RDDLContraction._factors(arg)
+        if len(factors) < 2 or len(scope) > len(ascii_letters):
+            return None
+
+        # every factor is evaluated over its own free variables, so it must
+        # be deterministic
+        factor_objects, used = [], set()
+        for factor in factors:
+            free = RDDLSparse.free_variables(factor)
+            if free is None or not free.issubset(scope):
+                return None
+            factor_objects.append([(var, ptype) for (var, ptype) in scope.items()
+                                   if var in free])
+            used.update(free)
+
+        shapes = {var: len(self.rddl.objects[ptype])
+                  for (var, ptype) in scope.items()}
+        outer = {var for (var, _) in objects}
+        multiplier = int(np.prod([size for (var, size) in shapes.items()
+                                  if var not in used and var not in outer]))
+        return Contraction(op, factors, factor_objects, objects, shapes,
+                           count, multiplier)
+
+    @staticmethod
+    def _factors(expr):
+        if expr.etype == ('arithmetic', '*') and len(expr.args) == 2:
+            factors = []
+            for arg in expr.args:
+                factors.extend(RDDLContraction._factors(arg))
+            return factors
+        return [expr]
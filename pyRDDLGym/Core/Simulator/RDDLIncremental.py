@@ -0,0 +1,83 @@
+import numpy as np
+from typing import Dict, Set
+
+from pyRDDLGym.Core.Compiler.RDDLModel import RDDLModel
+from pyRDDLGym.Core.Parser.expr import Expression
+
+
+class RDDLIncremental:
+    '''Tracks which fluents changed value in the current step, so that a
+    deterministic CPF is evaluated again only if one of the fluents it
+    depends on (according to the call graph of the model) has changed, and
+    otherwise keeps its value from the previous step. CPFs that sample a
+    random variable are evaluated at every step.
+
+    Fluent values are assumed to change only through reset and step: any
+    other change to the values in the simulator requires a call to reset().
+    '''
+
+    DETERMINISTIC = {'KronDelta', 'DiracDelta'}
+
+    def __init__(self, rddl: RDDLModel, graph: Dict[str, Set[str]]) -> None:
+        '''Creates a new tracker for the CPFs of the given model.
+
+        :param rddl: the RDDL model
+        :param graph: the call graph of the CPFs, as computed by
+        RDDLLevelAnalysis.build_call_graph
+        '''
+        self.dependencies = graph
+        self.random = {cpf for (cpf, (_, expr)) in rddl.cpfs.items()
+                       if RDDLIncremental._is_random(expr)}
+        self.reset()
+
+    @staticmethod
+    def _is_random(expr):
+        stack = [expr]
+        while stack:
+            atom = stack.pop()
+            if isinstance(atom, Expression):
+                if atom.op_code == Expression.RANDOMVAR \
+                and atom.etype[1] not in RDDLIncremental.DETERMINISTIC:
+                    return True
+                if atom.op_code != Expression.CONSTANT \
+                and atom.op_code != Expression.PVAR:
+                    stack.append(atom.args)
+            elif isinstance(atom, (tuple, list)):
+                stack.extend(atom)
+        return False
+
+    def reset(self) -> None:
+        '''Marks all CPFs to be evaluated in the next step.'''
+        self.valid = False
+        self.changed = set()
+        self._states = set()
+        self._actions = {}
+
+    def begin(self, actions: Dict[str, np.ndarray]) -> None:
+        '''Starts a new step with the given action values.'''
+        changed = self.changed = self._states
+        self._states = set()
+        last_actions = self._actions
+        for var, value in actions.items():
+            last = last_actions.get(var, None)
+            if last is None or not np.array_equal(last, value):
+                changed.add(var)
+                last_actions[var] = np.array(value)
+
+    def is_dirty(self, cpf: str) -> bool:
+        '''Returns whether the given CPF must be evaluated in this step.'''
+        return not self.valid \
+            or cpf in self.random \
+            or not self.changed.isdisjoint(self.dependencies[cpf])
+
+    def update(self, cpf: str, old, new) -> None:
+        '''Records the new value of a CPF that was evaluated in this step.'''
+        if not self.valid or not np.array_equal(old, new):
+            self.changed.add(cpf)
+
+    def end(self, next_states: Dict[str, str]) -> None:
+        '''Ends the step, in which the given next-state fluents become the
+        values of their state fluents.'''
+        self._states = {state for (next_state, state) in next_states.items()
+                        if next_state in self.changed}
+        self.valid = True
@@ -0,0 +1,119 @@
+import json
+import os
+import time
+import numpy as np
+from typing import Dict
+
+
+class RDDLProfiler:
+    '''Records the wall time, number of calls and output size of every CPF,
+    level, constraint and phase (actions, cpfs, reward, expand, termination,
+    invariants, preconditions) evaluated by a simulator. A profiler is
+    attached by passing it to the simulator, or by setting its profiler
+    attribute; a simulator without a profiler performs no timing at all.
+
+    The statistics are exported with to_dict, and the individual calls with
+    to_chrome_trace in the Chrome trace event format, which can be opened in
+    chrome://tracing or https://ui.perfetto.dev.
+    '''
+
+    def __init__(self, trace: bool=True, max_events: int=1000000) -> None:
+        '''Creates a new profiler.
+
+        :param trace: whether to keep every call as an event for the Chrome
+        trace, in addition to the aggregate statistics
+        :param max_events: the largest number of events kept, after which
+        only the statistics are updated
+        '''
+        self.trace = trace
+        self.max_events = max_events
+        self.reset()
+
+    def reset(self) -> None:
+        '''Clears all statistics and events.'''
+        self.stats = {}
+        self.events = []
+        self._origin = time.perf_counter()
+
+    @staticmethod
+    def now() -> float:
+        return time.perf_counter()
+
+    def record(self, category: str, name: str, start: float,
+               value=None) -> None:
+        '''Records a call that started at the given time (as returned by now)
+        and has just ended.
+
+        :param category: the kind of call, e.g. cpf, level or phase
+        :param name: the name of the call, e.g. the name of the CPF
+        :param start: the time at which the call started
+        :param value: the output of the call, whose size is recorded
+        '''
+        end = time.perf_counter()
+        elapsed = end - start
+        size = 0 if value is None else int(np.size(value))
+        key = (category, name)
+        stats = self.stats.get(key, None)
+        if stats is None:
+            self.stats[key] = [1, elapsed, elapsed, size]
+        else:
+            stats[0] += 1
+            stats[1] += elapsed
+            stats[2] = max(stats[2], elapsed)
+            stats[3] = size
+        if self.trace and len(self.events) < self.max_events:
+            self.events.append((category, name, start, elapsed, size))
+
+    # ===========================================================================
+    # export
+    # ===========================================================================
+
+    def to_dict(self) -> Dict[str, Dict[str, Dict[str, float]]]:
+        '''Returns a dict mapping each category to a dict that maps each name
+        to its number of calls, total, mean and max time in seconds, and the
+        size of its last output.'''
+        result = {}
+        for (category, name), (calls, total, longest, size) in self.stats.items():
+            result.setdefault(category, {})[name] = {
+                'calls': calls,
+                'total_time': total,
+                'mean_time': total / calls,
+                'max_time': longest,
+                'size': size
+            }
+        return result
+
+    def to_chrome_trace(self) -> Dict[str, object]:
+        '''Returns the recorded calls in the Chrome trace event format.'''
+        pid = os.getpid()
+        events = [{
+            'name': name,
+            'cat': category,
+            'ph': 'X',
+            'ts': (start - self._origin) * 1e6,
+            'dur': elapsed * 1e6,
+            'pid': pid,
+            'tid': 0,
+            'args': {'size': size}
+        } for (category, name, start, elapsed, size) in self.events]
+        return {'traceEvents': events, 'displayTimeUnit': 'ms'}
+
+    def write_chrome_trace(self, path: str) -> None:
+        '''Writes the recorded calls to a JSON file in the Chrome trace event
+        format.'''
+        with open(path, 'w') as file:
+            json.dump(self.to_chrome_trace(), file)
+
+    def summary(self, category: str='cpf', top: int=10) -> str:
+        '''Returns a table of the calls of the given category that took the
+        most total time.'''
+        rows = sorted(self.to_dict().get(category, {}).items(),
+                      key=lambda item: -item[1]['total_time'])[:top]
+        lines = [f'{"name":30s} {"calls":>8s} {"total ms":>10s} '
+                 f'{"mean ms":>10s} {"size":>8s}']
+        for name, info in rows:
+            lines.append(f'{name:30s} {info["calls"]:8d} '
+                         f'{info["total_time"] * 1e3:10.3f} '
+                         f'{info["mean_time"] * 1e3:10.3f} '
+                         f'{info["size"]:8d}')
+        return '\n'.join(lines)
@@ -0,0 +1,154 @@
+import copy
+import math
+import numpy as np
+from typing import List
+
+
+class BlockGenerator:
+    '''A random number generator with the interface of np.random.Generator,
+    which draws uniform and standard normal numbers in large blocks from a
+    Philox counter-based bit generator and hands them out as requested.
+    Uniform, normal, Bernoulli and exponential samples are transformed from
+    these blocks, while all other distributions are sampled directly from
+    the underlying np.random.Generator.
+
+    The numbers drawn depend only on the seed, the block size and the
+    sequence of requests, so a simulator with its own BlockGenerator is
+    reproducible regardless of how many other simulators run alongside it.
+    '''
+
+    def __init__(self, bit_generator: np.random.BitGenerator=None,
+                 block_size: int=4096) -> None:
+        '''Creates a new block generator.
+
+        :param bit_generator: the bit generator to draw from, or None to
+        create a Philox bit generator seeded from fresh entropy
+        :param block_size: the number of uniform (or normal) numbers drawn
+        at once
+        '''
+        if bit_generator is None:
+            bit_generator = np.random.Philox()
+        self.bit_generator = bit_generator
+        self.generator = np.random.Generator(bit_generator)
+        self.block_size = block_size
+        empty = np.empty((0,))
+        self._blocks = {'uniform': (empty, 0), 'normal': (empty, 0)}
+
+    def __getattr__(self, name):
+        if name == 'generator':
+            raise AttributeError(name)
+        return getattr(self.generator, name)
+
+    def __deepcopy__(self, memo):
+        copied = BlockGenerator(copy.deepcopy(self.bit_generator, memo),
+                                self.block_size)
+        copied._blocks = self._blocks.copy()
+        return copied
+
+    def jumped(self, jumps: int=1) -> 'BlockGenerator':
+        '''Returns a new generator whose stream starts jumps * 2^128 numbers
+        ahead of this one, which is a cheap way to obtain independent
+        streams from a single seed.'''
+        return BlockGenerator(self.bit_generator.jumped(jumps), self.block_size)
+
+    @property
+    def state(self):
+        '''The state of the generator, including the unused part of its
+        current blocks.'''
+        return {'bit_generator': self.bit_generator.state,
+                'blocks': self._blocks.copy()}
+
+    @state.setter
+    def state(self, value):
+        self.bit_generator.state = value['bit_generator']
+        self._blocks = value['blocks'].copy()
+
+    # ===========================================================================
+    # block draws
+    # ===========================================================================
+
+    def _draw(self, kind, count):
+        if kind == 'uniform':
+            return self.generator.random(count)
+        else:
+            return self.generator.standard_normal(count)
+
+    def _take(self, kind, size):
+        if size is None:
+            shape, count = (), 1
+        else:
+            shape = tuple(size) if isinstance(size, (tuple, list)) else (size,)
+            count = math.prod(shape)
+
+        # requests larger than a block are drawn directly
+        if count > self.block_size:
+            return self._draw(kind, count).reshape(shape)
+
+        block, start = self._blocks[kind]
+        stop = start + count
+        if stop > block.size:
+            block = self._draw(kind, self.block_size)
+            start, stop = 0, count
+        self._blocks[kind] = (block, stop)
+        if size is None:
+            return float(block[start])
+        return block[start:stop].reshape(shape)
+
+    @staticmethod
+    def _size(size, *params):
+        if size is None:
+            shape = np.broadcast(*params).shape
+            if shape:
+                return shape
+        return size
+
+    def random(self, size=None):
+        return self._take('uniform', size)
+
+    def uniform(self, low=0.0, high=1.0, size=None):
+        sample = self._take('uniform', BlockGenerator._size(size, low, high))
+        if type(low) is float and type(high) is float \
+        and low == 0.0 and high == 1.0:
+            return sample
+        return low + (high - low) * sample
+
+    def standard_normal(self, size=None):
+        return self._take('normal', size)
+
+    def normal(self, loc=0.0, scale=1.0, size=None):
+        sample = self._take('normal', BlockGenerator._size(size, loc, scale))
+        return loc + scale * sample
+
+    def exponential(self, scale=1.0, size=None):
+        sample = self._take('uniform', BlockGenerator._size(size, scale))
+        return -scale * np.log1p(-sample)
+
+
+class RDDLRandom:
+    '''Creates independent random streams for simulators from a single seed,
+    by spawning child seeds from a np.random.SeedSequence. Each stream is a
+    BlockGenerator over its own Philox bit generator, so that for instance
+    the i-th of a set of parallel environments always receives the same
+    stream for a given seed.
+    '''
+
+    def __init__(self, seed=None, block_size: int=4096) -> None:
+        '''Creates a new source of random streams.
+
+        :param seed: the root seed (an int, a sequence of ints or a
+        np.random.SeedSequence), or None to use fresh entropy
+        :param block_size: the block size of the generators created
+        '''
+        if not isinstance(seed, np.random.SeedSequence):
+            seed = np.random.SeedSequence(seed)
+        self.seed_sequence = seed
+        self.block_size = block_size
+
+    def spawn(self, n: int) -> List[BlockGenerator]:
+        '''Returns n new independent generators.'''
+        return [BlockGenerator(np.random.Philox(child), self.block_size)
+                for child in self.seed_sequence.spawn(n)]
+
+    def generator(self) -> BlockGenerator:
+        '''Returns a new generator that is independent of all others.'''
+        return self.spawn(1)[0]
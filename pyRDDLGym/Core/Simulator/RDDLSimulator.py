@@ -1,6 +1,7 @@
+import copy
 import numpy as np
 np.seterr(all='raise')
-from typing import Dict, Union
+from typing import Dict, List, Union
 import warnings
 
 from pyRDDLGym.Core.ErrorHandling.RDDLException import RDDLActionPreconditionNotSatisfiedError
@@ -17,32 +18,156 @@ from pyRDDLGym.Core.Compiler.RDDLDecompiler import RDDLDecompiler
 from pyRDDLGym.Core.Compiler.RDDLLevelAnalysis import RDDLLevelAnalysis
 from pyRDDLGym.Core.Compiler.RDDLModel import RDDLModel
 from pyRDDLGym.Core.Parser.expr import Expression, Value
+from pyRDDLGym.Core.Simulator.NumbaRDDLCompiler import NumbaRDDLCompiler
+from pyRDDLGym.Core.Simulator.NumpyRDDLCompiler import NumpyRDDLCompiler
+from pyRDDLGym.Core.Simulator.RDDLChunking import RDDLChunking
+from pyRDDLGym.Core.Simulator.RDDLContraction import RDDLContraction
+from pyRDDLGym.Core.Simulator.RDDLIncremental import RDDLIncremental
+from pyRDDLGym.Core.Simulator.RDDLProfiler import RDDLProfiler
+from pyRDDLGym.Core.Simulator.RDDLRandom import BlockGenerator, RDDLRandom
+from pyRDDLGym.Core.Simulator.RDDLSparse import RDDLSparse
+from pyRDDLGym.Core.Simulator.ScalarRDDLCompiler import ScalarRDDLCompiler
+from pyRDDLGym.Core.Simulator.SourceRDDLCompiler import SourceRDDLCompiler
 from pyRDDLGym.Core.Simulator.RDDLTensors import RDDLTensors
+from pyRDDLGym.Core.Simulator.RDDLValidation import RDDLValidation, validated
 
 Args = Dict[str, Value]
 
+
+class RDDLSimulatorState:
+    '''The mutable state of a simulator, as returned by its snapshot method:
+    the values of the state and observ fluents and the state of the random
+    stream. Everything else (the model, compiled expressions, caches) stays
+    shared with the simulator.
+    '''
+    
+    __slots__ = ('values', 'rng')
+    
+    def __init__(self, values: Args, rng) -> None:
+        self.values = values
+        self.rng = rng
+
         
 class RDDLSimulator:
     
+    FLUENT_FORMATS = {'grounded', 'tensor', 'flat'}
+    COMPILERS = {'numpy': NumpyRDDLCompiler, 'numba': NumbaRDDLCompiler,
+                 'source': SourceRDDLCompiler, 'scalar': ScalarRDDLCompiler}
+    
     def __init__(self, rddl: RDDLModel,
                  allow_synchronous_state: bool=True,
-                 rng: np.random.Generator=np.random.default_rng(),
-                 debug: bool=False) -> None:
+                 rng: np.random.Generator=None,
+                 debug: bool=False,
+                 compiled: Union[bool, str]=False,
+                 fluent_format: str='grounded',
+                 levels: Dict[int, List[str]]=None,
+                 tensors: RDDLTensors=None,
+                 sparse_density: float=0.1,
+                 contraction: bool=True,
+                 aggregation_bytes: int=None,
+                 mask_density: float=None,
+                 checked: bool=True,
+                 preallocate: bool=False,
+                 incremental: bool=False,
+                 profiler: RDDLProfiler=None) -> None:
         '''Creates a new simulator for the given RDDL model.
         
         :param rddl: the RDDL model
         :param allow_synchronous_state: whether state-fluent can be synchronous
-        :param rng: the random number generator
+        :param rng: the random number generator, or None to create a new
+        generator with its own independent stream (see RDDLRandom)
         :param debug: whether to print compiler information
+        :param compiled: whether to compile all expressions into numpy closures
+        once when the simulator is created, rather than interpreting them at
+        every step (structural errors are then raised here instead of on first
+        evaluation), or the name of the compiler to use: 'numpy' (same as 
+        True for lifted models), 'numba' (see NumbaRDDLCompiler), 'source' 
+        (see SourceRDDLCompiler) or 'scalar' (same as True for grounded 
+        models, see ScalarRDDLCompiler)
+        :param fluent_format: how states, observations and actions are passed
+        to and from the simulator: 'grounded' uses dicts keyed by grounded
+        fluent names, 'tensor' uses dicts of arrays keyed by pvariable, and
+        'flat' uses a single float vector laid out as in state_layout,
+        observ_layout and action_layout
+        :param levels: the level ordering of the CPFs, or None to compute it
+        :param tensors: the tensor representation of the model, or None to
+        compute it (levels and tensors can be loaded from a RDDLModelCache)
+        :param sparse_density: sum, avg and exists aggregations over a
+        non-fluent whose fraction of nonzero entries is at most this value are
+        computed from its nonzero entries only (0 to always use dense tensors)
+        :param contraction: whether sum and avg aggregations over a product of
+        deterministic factors are computed as a single einsum of the factors,
+        without building their product over all objects in scope (see 
+        RDDLContraction)
+        :param aggregation_bytes: the maximum number of bytes of the argument
+        of an aggregation to evaluate at once, above which the argument is
+        evaluated and reduced in chunks along the reduced axes (see 
+        RDDLChunking), or None to always evaluate it at once (not supported
+        by the source and scalar compilers)
+        :param mask_density: an if-then-else whose predicate selects one of
+        its branches for at most this fraction of elements evaluates that
+        branch only at those elements, and the other branch in full (0 to 
+        always evaluate both branches in full), or None for 0.1 (the source 
+        and scalar compilers always evaluate both branches in full, and do not
+        support any other value)
+        :param checked: whether values are validated as they are computed, or
+        (for the numpy and numba compilers only) validated once per step: type
+        checks then run once for every dtype of value, and failed checks of
+        parameters and floating point errors are raised at the end of the step
+        in which they occurred (see RDDLValidation)
+        :param preallocate: whether to allocate one buffer for every action,
+        state, next-state, interm and observ tensor once, and write all new
+        values into these buffers in place (arrays returned by reset and step
+        are then overwritten by later steps); requires the numpy or numba 
+        compiler, whose CPFs write their last operation into their buffers
+        :param incremental: whether a deterministic CPF is evaluated again only
+        if a fluent it depends on changed in the current step, and otherwise
+        keeps its previous value (fluent values must then only be changed
+        through reset and step)
+        :param profiler: a RDDLProfiler that records the time spent in every
+        CPF, level, constraint and phase, or None to disable profiling
         '''
+        if compiled is True:
+            compiled = 'scalar' if rddl.is_grounded else 'numpy'
+        if compiled and compiled not in RDDLSimulator.COMPILERS:
+            raise RDDLValueOutOfRangeError(
+                f'Compiler <{compiled}> is not valid, '
+                f'must be one of {set(RDDLSimulator.COMPILERS.keys())}.')
+        if not checked and compiled not in {'numpy', 'numba'}:
+            raise RDDLNotImplementedError(
+                'Unchecked simulation requires the numpy or numba compiler.')
+        if preallocate and not rddl.is_grounded \
+        and compiled not in {'numpy', 'numba'}:
+            raise RDDLNotImplementedError(
+                'Preallocated buffers require the numpy or numba compiler.')
+        if aggregation_bytes is not None and compiled in {'source', 'scalar'}:
+            raise RDDLNotImplementedError(
+                f'Chunked aggregation is not supported by the '
+                f'<{compiled}> compiler.')
+        if mask_density is not None and compiled in {'source', 'scalar'}:
+            raise RDDLNotImplementedError(
+                f'Masked if-then-else evaluation is not supported by the '
+                f'<{compiled}> compiler.')
+        if fluent_format not in RDDLSimulator.FLUENT_FORMATS:
+            raise RDDLValueOutOfRangeError(
+                f'Fluent format <{fluent_format}> is not valid, '
+                f'must be one of {RDDLSimulator.FLUENT_FORMATS}.')
         self.rddl = rddl
+        if rng is None:
+            rng = RDDLRandom().generator()
         self.rng = rng
         self.debug = debug
+        self.profiler = profiler
         
-        # static analysis and compilation
-        self.static = RDDLLevelAnalysis(rddl, allow_synchronous_state)
-        self.levels = self.static.compute_levels()
-        self.tensors = RDDLTensors(rddl, debug=debug)
+        # static analysis and compilation, unless already done
+        self.static = None
+        if levels is None:
+            self.static = RDDLLevelAnalysis(rddl, allow_synchronous_state)
+            levels = self.static.compute_levels()
+        self.levels = levels
+        if tensors is None:
+            tensors = RDDLTensors(rddl, debug=debug)
+        self.tensors = tensors
         
         # initialize all fluent and non-fluent values
         self.init_values = self.tensors.init_values
@@ -61,6 +186,20 @@ class RDDLSimulator:
                 self.observ_fluents.append(name)
         self._pomdp = bool(self.observ_fluents)
         
+        # type of the values of every CPF, from the range of its pvariable
+        # (the CPFs of grounded models are named by their grounded fluents)
+        self.cpf_types = {
+            cpf: RDDLTensors.NUMPY_TYPES[rddl.variable_ranges[rddl.parse(cpf)[0]]]
+            for cpfs in self.levels.values() for cpf in cpfs}
+        
+        # layout of fluents in flat vectors, and buffers to hold them
+        self.fluent_format = fluent_format
+        self.state_layout = self.tensors.layout(self.next_states.values())
+        self.observ_layout = self.tensors.layout(self.observ_fluents)
+        self.action_layout = self.tensors.layout(self.noop_actions)
+        self._state_buffer = RDDLSimulator._allocate(self.state_layout)
+        self._observ_buffer = RDDLSimulator._allocate(self.observ_layout)
+        
         # basic operations
         self.ARITHMETIC_OPS = {
             '+': np.add,
@@ -121,10 +260,97 @@ class RDDLSimulator:
             'pow': np.power,
             'log': lambda x, y: np.log(x) / np.log(y)
         }
+        
+        # interpreter dispatch on expression op codes, and caches of values that
+        # depend only on the expression node and its free objects
+        self._samplers = {
+            Expression.CONSTANT: self._sample_constant,
+            Expression.PVAR: self._sample_pvar,
+            Expression.ARITHMETIC: self._sample_arithmetic,
+            Expression.RELATIONAL: self._sample_relational,
+            Expression.BOOLEAN: self._sample_logical,
+            Expression.AGGREGATION: self._sample_aggregation,
+            Expression.FUNC: self._sample_func,
+            Expression.CONTROL: self._sample_control,
+            Expression.RANDOMVAR: self._sample_random
+        }
+        self._cached_values = {}
+        self._cached_transforms = {}
+        self._cached_objects = {}
+        
+        # aggregations over sparse non-fluents
+        self.sparse = None
+        if sparse_density > 0 and not rddl.is_grounded:
+            self.sparse = RDDLSparse(rddl, self.tensors, sparse_density)
+        self._cached_sparse = {}
+        
+        # aggregations over products
+        self.contraction = None
+        if contraction and not rddl.is_grounded:
+            self.contraction = RDDLContraction(rddl)
+        self._cached_contractions = {}
+        
+        # aggregations whose argument does not fit in the memory budget, and
+        # the slices of the objects of chunked variables being evaluated
+        self.chunking = None
+        if aggregation_bytes is not None and not rddl.is_grounded:
+            self.chunking = RDDLChunking(aggregation_bytes)
+        self._chunks = {}
+        
+        # if-then-else branches evaluated only where they are selected, and
+        # the coordinates of the masked branch being evaluated
+        if mask_density is None:
+            mask_density = 0.1
+        self.mask_density = mask_density
+        self._mask = None
+        
+        # fixed buffers for all fluents that change during a rollout
+        self._buffers = None
+        if preallocate and not rddl.is_grounded:
+            self._buffers = self._plan_buffers()
+            self.subs.update(self._buffers)
+        
+        # tracking of changed fluents to skip CPFs whose inputs did not change
+        self.incremental = None
+        if incremental:
+            static = self.static
+            if static is None:
+                static = RDDLLevelAnalysis(rddl, allow_synchronous_state)
+            self.incremental = RDDLIncremental(rddl, static.build_call_graph())
+        
+        # validation of the values of a step at the end of the step
+        self.validation = None
+        self._check_value_type = RDDLSimulator._check_type
+        if not checked:
+            self._defer_validation()
+        
+        # compile expressions once
+        self.compiler = None
+        self._static_cpfs = frozenset()
+        if compiled:
+            self.compiler = RDDLSimulator.COMPILERS[compiled](self)
+            self.compiler.compile()
+            if not checked:
+                self._find_static_cpfs()
     
+    def _defer_validation(self):
+        self.validation = RDDLValidation()
+        self._check_value_type = RDDLValidation.by_dtype(RDDLSimulator._check_type)
+    
+    def _find_static_cpfs(self):
+        
+        # CPFs whose type is known to be valid at compile time are not checked
+        compiler, cpfs = self.compiler, self.rddl.cpfs
+        self._static_cpfs = frozenset(
+            cpf for (cpf, dtype) in self.cpf_types.items()
+            if np.can_cast(compiler.static_type(cpfs[cpf][1]) or object, dtype))
+        
     @property
     def states(self) -> Args:
-        return self.state.copy()
+        if self.fluent_format == 'grounded':
+            return self.state.copy()
+        else:
+            return self._ground_fluents(self.next_states.values())
 
     @property
     def isPOMDP(self) -> bool:
@@ -179,15 +405,14 @@ class RDDLSimulator:
     
     @staticmethod
     def _check_positive(value, strict, msg, expr):
-        if strict:
-            failed = not np.all(value > 0)
-            message = f'{msg} must be positive, got {value}.\n'
-        else:
-            failed = not np.all(value >= 0)
-            message = f'{msg} must be non-negative, got {value}.\n'
-        if failed:
+        if strict and not np.all(value > 0):
+            raise RDDLValueOutOfRangeError(
+                f'{msg} must be positive, got {value}.\n' + 
+                RDDLSimulator._print_stack_trace(expr))
+        elif not strict and not np.all(value >= 0):
             raise RDDLValueOutOfRangeError(
-                message + RDDLSimulator._print_stack_trace(expr))
+                f'{msg} must be non-negative, got {value}.\n' + 
+                RDDLSimulator._print_stack_trace(expr))
     
     @staticmethod
     def _check_bounds(lb, ub, msg, expr):
@@ -220,9 +445,123 @@ class RDDLSimulator:
     # main sampling routines
     # ===========================================================================
     
+    @staticmethod
+    def _allocate(layout):
+        size = max((stop for (_, stop, _) in layout.values()), default=0)
+        return np.zeros((size,), dtype=RDDLTensors.REAL)
+    
+    def _plan_buffers(self):
+        buffers = {}
+        for name, value in self.init_values.items():
+            if self.rddl.variable_types[name] != 'non-fluent':
+                buffers[name] = np.array(value)
+        for cpfs in self.levels.values():
+            for cpf in cpfs:
+                if cpf not in buffers:
+                    prange = self.rddl.variable_ranges[cpf]
+                    buffers[cpf] = np.zeros(
+                        shape=self.tensors.shape(self.rddl.param_types[cpf]),
+                        dtype=RDDLTensors.NUMPY_TYPES[prange])
+        return buffers
+    
+    def _update_subs(self, values):
+        subs = self.subs
+        if self._buffers is None:
+            subs.update(values)
+        else:
+            for name, value in values.items():
+                buffer = subs[name]
+                if value is not buffer:
+                    np.copyto(buffer, value)
+    
+    def _write_buffer(self, name, value):
+        
+        # interm and observ fluents keep the type of their values, as when
+        # values are not buffered, so their buffers are replaced on a change
+        buffer = self.subs[name]
+        dtype = np.result_type(value)
+        if dtype != buffer.dtype and name not in self.next_states:
+            buffer = np.empty(buffer.shape, dtype=dtype)
+            self.subs[name] = self._buffers[name] = buffer
+        np.copyto(buffer, value)
+    
+    def _ground_fluents(self, names):
+        subs = self.subs
+        if self.rddl.is_grounded:
+            return {var: subs[var] for var in names}
+        else:
+            values = {}
+            for var in names:
+                values.update(self.tensors.expand(var, subs[var]))
+            return values
+    
+    def _format_fluents(self, names, layout, buffer):
+        subs = self.subs
+        if self.fluent_format == 'tensor':
+            return {var: subs[var] for var in names}
+        elif self.fluent_format == 'flat':
+            for var, (start, stop, _) in layout.items():
+                buffer[start:stop] = np.ravel(subs[var])
+            return buffer
+        else:
+            return self._ground_fluents(names)
+    
+    def _unflatten_actions(self, actions):
+        actions = np.asarray(actions)
+        size = RDDLSimulator._allocate(self.action_layout).size
+        if actions.shape != (size,):
+            raise RDDLInvalidActionError(
+                f'Action vector must have shape {(size,)}, '
+                f'got {actions.shape}.')
+        
+        new_actions = {}
+        for var, (start, stop, shape) in self.action_layout.items():
+            value = np.reshape(actions[start:stop], shape)
+            dtype = np.result_type(self.noop_actions[var])
+            
+            # int and bool entries of the float vector are rounded, e.g. when
+            # sampled from the Box action space of the environment
+            if dtype != RDDLTensors.REAL:
+                value = np.round(value).astype(dtype)
+            new_actions[var] = value
+        return new_actions
+    
+    def _process_tensor_actions(self, actions):
+        new_actions = self.noop_actions.copy()
+        for var, value in actions.items():
+            if var not in self.noop_actions:
+                raise RDDLInvalidActionError(
+                    f'<{var}> is not a valid action-fluent.')
+                
+            noop = self.noop_actions[var]
+            value = np.asarray(value)
+            RDDLSimulator._check_type(
+                value, np.result_type(noop), f'Action-fluent <{var}>', '')
+            shape = np.shape(noop)
+            if value.shape != shape:
+                try:
+                    value = np.broadcast_to(value, shape)
+                except ValueError:
+                    raise RDDLInvalidActionError(
+                        f'Action-fluent <{var}> must have shape {shape}, '
+                        f'got {value.shape}.')
+            new_actions[var] = value
+        return new_actions
+    
     def _process_actions(self, actions):
-        new_actions = {action: np.copy(value) 
-                       for action, value in self.noop_actions.items()}
+        if self.fluent_format == 'flat':
+            return self._process_tensor_actions(self._unflatten_actions(actions))
+        elif self.fluent_format == 'tensor':
+            return self._process_tensor_actions(actions)
+        
+        if self._buffers is None:
+            new_actions = {action: np.copy(value) 
+                           for action, value in self.noop_actions.items()}
+        else:
+            new_actions = {}
+            for action, value in self.noop_actions.items():
+                new_actions[action] = buffer = self.subs[action]
+                np.copyto(buffer, value)
         
         for action, value in actions.items(): 
             if action not in self.rddl.actions:
@@ -240,135 +579,317 @@ class RDDLSimulator:
          
         return new_actions
     
+    @validated
     def check_state_invariants(self) -> None:
         '''Throws an exception if the state invariants are not satisfied.'''
+        profiler = self.profiler
+        if profiler is not None:
+            phase_start = profiler.now()
         for i, invariant in enumerate(self.rddl.invariants):
-            sample = self._sample(invariant, [], self.subs)
-            RDDLSimulator._check_type(
+            if profiler is not None:
+                start = profiler.now()
+            if self.compiler is None:
+                sample = self._sample(invariant, [], self.subs)
+            else:
+                sample = self.compiler.invariants[i](self.subs, self.rng)
+            if profiler is not None:
+                profiler.record('invariant', f'invariant {i + 1}', start, sample)
+            self._check_value_type(
                 sample, bool, f'Invariant {i + 1}', invariant)
             if not bool(sample):
                 raise RDDLStateInvariantNotSatisfiedError(
                     f'Invariant {i + 1} is not satisfied.\n' + 
                     RDDLSimulator._print_stack_trace(invariant))
+        if profiler is not None:
+            profiler.record('phase', 'invariants', phase_start)
     
+    @validated
     def check_action_preconditions(self, actions: Args) -> None:
         '''Throws an exception if the action preconditions are not satisfied.'''        
+        profiler = self.profiler
+        if profiler is not None:
+            phase_start = profiler.now()
         actions = self._process_actions(actions)
-        self.subs.update(actions)
+        self._update_subs(actions)
         
         for i, precond in enumerate(self.rddl.preconditions):
-            sample = self._sample(precond, [], self.subs)
-            RDDLSimulator._check_type(
+            if profiler is not None:
+                start = profiler.now()
+            if self.compiler is None:
+                sample = self._sample(precond, [], self.subs)
+            else:
+                sample = self.compiler.preconditions[i](self.subs, self.rng)
+            if profiler is not None:
+                profiler.record(
+                    'precondition', f'precondition {i + 1}', start, sample)
+            self._check_value_type(
                 sample, bool, f'Precondition {i + 1}', precond)
             if not bool(sample):
                 raise RDDLActionPreconditionNotSatisfiedError(
                     f'Precondition {i + 1} is not satisfied.\n' + 
                     RDDLSimulator._print_stack_trace(precond))
+        if profiler is not None:
+            profiler.record('phase', 'preconditions', phase_start)
     
+    @validated
     def check_terminal_states(self) -> bool:
         '''Return True if a terminal state has been reached.'''
+        profiler = self.profiler
+        if profiler is not None:
+            phase_start = profiler.now()
+        done = False
         for i, terminal in enumerate(self.rddl.terminals):
-            sample = self._sample(terminal, [], self.subs)
-            RDDLSimulator._check_type(
+            if profiler is not None:
+                start = profiler.now()
+            if self.compiler is None:
+                sample = self._sample(terminal, [], self.subs)
+            else:
+                sample = self.compiler.termination[i](self.subs, self.rng)
+            if profiler is not None:
+                profiler.record('termination', f'termination {i + 1}', start, sample)
+            self._check_value_type(
                 sample, bool, f'Termination {i + 1}', terminal)
             if bool(sample):
-                return True
-        return False
+                done = True
+                break
+        if profiler is not None:
+            profiler.record('phase', 'termination', phase_start)
+        return done
     
+    @validated
     def sample_reward(self) -> float:
         '''Samples the current reward given the current state and action.'''
-        sample = self._sample(self.rddl.reward, [], self.subs)
+        profiler = self.profiler
+        if profiler is not None:
+            start = profiler.now()
+        if self.compiler is None:
+            sample = self._sample(self.rddl.reward, [], self.subs)
+        else:
+            sample = self.compiler.reward(self.subs, self.rng)
+        if profiler is not None:
+            profiler.record('phase', 'reward', start, sample)
         return float(sample)    
     
+    @validated
     def reset(self) -> Union[Dict[str, None], Args]:
         '''Resets the state variables to their initial values.'''
-        subs = self.subs = self.init_values.copy()
-        
-        if self.rddl.is_grounded:
-            self.state = {var: subs[var] for var in self.next_states.values()}
-        else:
-            self.state = {}
-            for var in self.next_states.values():
-                self.state.update(self.tensors.expand(var, subs[var]))
+        self.subs = self.init_values.copy()
+        if self._buffers is not None:
+            for name, buffer in self._buffers.items():
+                if name in self.init_values:
+                    value = self.init_values[name]
+                    if np.result_type(value) != buffer.dtype:
+                        self._buffers[name] = np.array(value)
+                    else:
+                        np.copyto(buffer, value)
+            self.subs.update(self._buffers)
+        if self.incremental is not None:
+            self.incremental.reset()
+        self.state = self._format_fluents(
+            self.next_states.values(), self.state_layout, self._state_buffer)
             
         if self._pomdp:
-            obs = {var: None for var in self.observ_fluents}
+            if self.fluent_format == 'flat':
+                obs = self._observ_buffer
+                obs[:] = np.nan
+            else:
+                obs = {var: None for var in self.observ_fluents}
         else:
             obs = self.state
             
         done = self.check_terminal_states()
         return obs, done
     
+    @validated
     def step(self, actions: Args) -> Args:
         '''Samples and returns the next state from the CPF expressions.
         
-        :param actions: a dict mapping current action fluent to their values
+        :param actions: a dict mapping current action fluent to their values,
+        or a flat action vector if the fluent format is 'flat'
         '''
+        profiler = self.profiler
+        if profiler is not None:
+            step_start = start = profiler.now()
         actions = self._process_actions(actions)
+        self._update_subs(actions)
         subs = self.subs
-        subs.update(actions)
+        if profiler is not None:
+            profiler.record('phase', 'actions', start)
         
-        tensors, rddl = self.tensors, self.rddl
+        rddl, compiler = self.rddl, self.compiler
+        buffers, next_states = self._buffers, self.next_states
+        incremental, cpf_types = self.incremental, self.cpf_types
+        check_type, static_cpfs = self._check_value_type, self._static_cpfs
+        if incremental is not None:
+            incremental.begin(actions)
         
-        for cpfs in self.levels.values():
+        # the compiler evaluates all CPFs and the reward in one call, unless
+        # CPFs are tracked, timed or written to buffers one by one
+        fused = compiler is not None and compiler.step is not None \
+            and incremental is None and buffers is None and profiler is None
+        levels = self.levels
+        if fused:
+            reward = compiler.step(subs, self.rng)
+            levels = {}
+        
+        if profiler is not None:
+            cpfs_start = profiler.now()
+        for level, cpfs in levels.items():
+            if profiler is not None:
+                level_start = profiler.now()
             for cpf in cpfs:
+                
+                # a clean CPF keeps its previous value, which for a next-state
+                # is now held by its state
+                if incremental is not None and not incremental.is_dirty(cpf):
+                    if buffers is not None and cpf in next_states:
+                        np.copyto(subs[cpf], subs[next_states[cpf]])
+                    continue
+                
                 objects, expr = rddl.cpfs[cpf]
-                sample = self._sample(expr, objects, subs)
-                dtype = tensors.NUMPY_TYPES[rddl.variable_ranges[cpf]]
-                RDDLSimulator._check_type(sample, dtype, f'CPF <{cpf}>', expr)
-                subs[cpf] = sample
-        reward = self.sample_reward()
-        
-        if rddl.is_grounded:
-            for next_state, state in self.next_states.items():
-                subs[state] = subs[next_state]
-            self.state = {var: subs[var] for var in self.next_states.values()}
-        else:
-            self.state = {}
-            for next_state, state in self.next_states.items():
+                if profiler is not None:
+                    start = profiler.now()
+                if compiler is None:
+                    sample = self._sample(expr, objects, subs)
+                else:
+                    sample = compiler.cpfs[cpf](subs, self.rng)
+                if profiler is not None:
+                    profiler.record('cpf', cpf, start, sample)
+                if cpf not in static_cpfs:
+                    check_type(sample, cpf_types[cpf], f'CPF <{cpf}>', expr)
+                if incremental is not None:
+                    incremental.update(
+                        cpf, subs[next_states.get(cpf, cpf)], sample)
+                
+                # the compiler may have written the value into its buffer
+                if buffers is None:
+                    subs[cpf] = sample
+                elif sample is not subs[cpf]:
+                    self._write_buffer(cpf, sample)
+            if profiler is not None:
+                profiler.record('level', f'level {level}', level_start)
+        if profiler is not None:
+            profiler.record('phase', 'cpfs', cpfs_start)
+        if not fused:
+            reward = self.sample_reward()
+        if incremental is not None:
+            incremental.end(next_states)
+        
+        # with buffers, the state and next-state buffers are swapped, so that
+        # the next step writes the new next-state over the old state
+        for next_state, state in next_states.items():
+            if buffers is None:
                 subs[state] = subs[next_state]
-                self.state.update(tensors.expand(state, subs[state]))
+            else:
+                subs[state], subs[next_state] = subs[next_state], subs[state]
+        if profiler is not None:
+            start = profiler.now()
+        self.state = self._format_fluents(
+            self.next_states.values(), self.state_layout, self._state_buffer)
             
         if self._pomdp: 
-            if rddl.is_grounded:
-                obs = {var: subs[var] for var in self.observ_fluents}
-            else:
-                obs = {}
-                for var in self.observ_fluents:
-                    obs.update(tensors.expand(var, subs[var]))
+            obs = self._format_fluents(
+                self.observ_fluents, self.observ_layout, self._observ_buffer)
         else:
             obs = self.state
+        if profiler is not None:
+            profiler.record('phase', 'expand', start)
         
         done = self.check_terminal_states()        
+        if profiler is not None:
+            profiler.record('phase', 'step', step_start)
         return obs, reward, done
         
+    # ===========================================================================
+    # snapshots
+    # ===========================================================================
+    
+    def _get_rng_state(self):
+        rng = self.rng
+        if isinstance(rng, BlockGenerator):
+            return rng.state
+        return rng.bit_generator.state
+    
+    def _set_rng_state(self, state):
+        rng = self.rng
+        if isinstance(rng, BlockGenerator):
+            rng.state = state
+        else:
+            rng.bit_generator.state = state
+    
+    def snapshot(self) -> RDDLSimulatorState:
+        '''Returns the current state of the simulator, which can later be
+        passed to restore to continue from this state. Only the state and 
+        observ fluents and the state of the random stream are captured, since
+        all other fluents are computed again in the next step. Without 
+        preallocated buffers, fluent values are never changed in place, so
+        the snapshot only holds references to the current values.
+        '''
+        subs = self.subs
+        names = list(self.next_states.values()) + self.observ_fluents
+        if self._buffers is None:
+            values = {name: subs[name] for name in names}
+        else:
+            values = {name: np.copy(subs[name]) for name in names}
+        return RDDLSimulatorState(values, self._get_rng_state())
+    
+    def restore(self, snapshot: RDDLSimulatorState, rng: bool=True) -> None:
+        '''Returns the simulator to the state captured by snapshot.
+        
+        :param snapshot: a snapshot returned by this simulator (or a clone)
+        :param rng: whether to also restore the random stream, so that the 
+        next steps are sampled exactly as after the snapshot was taken (set
+        to False to sample new outcomes from the same state)
+        '''
+        if self._buffers is None:
+            self.subs.update(snapshot.values)
+        else:
+            for name, value in snapshot.values.items():
+                self._write_buffer(name, value)
+        if rng:
+            self._set_rng_state(snapshot.rng)
+        if self.incremental is not None:
+            self.incremental.reset()
+        self.state = self._format_fluents(
+            self.next_states.values(), self.state_layout, self._state_buffer)
+    
+    def clone(self) -> 'RDDLSimulator':
+        '''Returns a new simulator in the current state of this one, with its
+        own fluent values and a copy of its random stream, that shares the 
+        model, compiled expressions and caches with this simulator.
+        '''
+        sim = copy.copy(self)
+        sim._samplers = {op: getattr(sim, sampler.__name__)
+                         for (op, sampler) in self._samplers.items()}
+        sim.subs = self.subs.copy()
+        
+        # state and next-state buffers are swapped at every step, so the
+        # buffers currently in use are copied from subs
+        if self._buffers is not None:
+            sim._buffers = {name: np.copy(self.subs[name]) 
+                            for name in self._buffers}
+            sim.subs.update(sim._buffers)
+        sim._state_buffer = np.copy(self._state_buffer)
+        sim._observ_buffer = np.copy(self._observ_buffer)
+        sim.rng = copy.deepcopy(self.rng)
+        if self.incremental is not None:
+            sim.incremental = copy.copy(self.incremental)
+            sim.incremental.reset()
+        if self.state is not None:
+            sim.state = sim._format_fluents(
+                sim.next_states.values(), sim.state_layout, sim._state_buffer)
+        return sim
+    
     # ===========================================================================
     # start of sampling subroutines
     # ===========================================================================
     
     def _sample(self, expr, objects, subs):
-        etype, _ = expr.etype
-        if etype == 'constant':
-            return self._sample_constant(expr, objects, subs)
-        elif etype == 'pvar':
-            return self._sample_pvar(expr, objects, subs)
-        elif etype == 'arithmetic':
-            return self._sample_arithmetic(expr, objects, subs)
-        elif etype == 'relational':
-            return self._sample_relational(expr, objects, subs)
-        elif etype == 'boolean':
-            return self._sample_logical(expr, objects, subs)
-        elif etype == 'aggregation':
-            return self._sample_aggregation(expr, objects, subs)
-        elif etype == 'func':
-            return self._sample_func(expr, objects, subs)
-        elif etype == 'control':
-            return self._sample_control(expr, objects, subs)
-        elif etype == 'randomvar':
-            return self._sample_random(expr, objects, subs)
-        else:
+        sampler = self._samplers.get(expr.op_code, None)
+        if sampler is None:
             raise RDDLNotImplementedError(
                 f'Internal error: expression {expr} is not recognized.')
+        return sampler(expr, objects, subs)
                 
     # ===========================================================================
     # leaves
@@ -378,11 +899,19 @@ class RDDLSimulator:
         if self.rddl.is_grounded:
             return np.asarray(expr.args)
         
-        cached_value = getattr(expr, 'cached_value', None)
+        if self._mask is not None:
+            coords, axes = self._mask
+            shape = (len(coords[0]),) + self._chunk_shape(objects[axes:])
+            return np.full(shape=shape, fill_value=expr.args)
+        
+        key = (id(expr), tuple(objects))
+        if self._chunks:
+            key = key + (self._chunk_shape(objects),)
+        cached_value = self._cached_values.get(key, None)
         if cached_value is None:
-            shape = tuple(len(self.rddl.objects[ptype]) for _, ptype in objects)
+            shape = self._chunk_shape(objects)
             cached_value = np.full(shape=shape, fill_value=expr.args)
-            expr.cached_value = cached_value
+            self._cached_values[key] = cached_value
         return cached_value
     
     def _sample_pvar(self, expr, objects, subs):
@@ -408,13 +937,36 @@ class RDDLSimulator:
             return np.asarray(arg)
         
         # argument is reshaped to match the free variables "objects"
-        cached_transform = getattr(expr, 'cached_transform', None)
+        key = (id(expr), tuple(objects))
+        cached_transform = self._cached_transforms.get(key, None)
         if cached_transform is None:
             cached_transform = self.tensors.map(
                 var, pvars, objects,
                 msg=RDDLSimulator._print_stack_trace(expr))            
-            expr.cached_transform = cached_transform        
-        return cached_transform(arg)
+            self._cached_transforms[key] = cached_transform        
+        sample = cached_transform(arg)
+        
+        # only the objects at the coordinates of a masked branch are read
+        if self._mask is not None:
+            coords, _ = self._mask
+            sample = sample[coords]
+        
+        # only the objects of the chunk being evaluated are read
+        elif self._chunks:
+            index = tuple(self._chunks.get(var, slice(None)) 
+                          for (var, _) in objects)
+            sample = sample[(Ellipsis,) + index]
+        return sample
+    
+    def _chunk_shape(self, objects):
+        shape = []
+        for (var, ptype) in objects:
+            chunk = self._chunks.get(var, None)
+            if chunk is None:
+                shape.append(len(self.rddl.objects[ptype]))
+            else:
+                shape.append(chunk.stop - chunk.start)
+        return tuple(shape)
     
     # ===========================================================================
     # arithmetic
@@ -436,8 +988,8 @@ class RDDLSimulator:
                 return self._sample_product(args, objects, subs)
             else:
                 lhs, rhs = args
-                lhs = 1 * self._sample(lhs, objects, subs)
-                rhs = 1 * self._sample(rhs, objects, subs)
+                lhs = RDDLTensors.numeric(self._sample(lhs, objects, subs))
+                rhs = RDDLTensors.numeric(self._sample(rhs, objects, subs))
                 return valid_ops[op](lhs, rhs)
         
         elif self.rddl.is_grounded and n > 0:
@@ -454,7 +1006,7 @@ class RDDLSimulator:
         if rhs.is_constant_expression() or rhs.is_pvariable_expression():
             lhs, rhs = rhs, lhs
             
-        lhs = 1 * self._sample(lhs, objects, subs)
+        lhs = RDDLTensors.numeric(self._sample(lhs, objects, subs))
         if not np.any(lhs):
             return lhs
             
@@ -491,8 +1043,8 @@ class RDDLSimulator:
         RDDLSimulator._check_arity(args, 2, f'Relational operator {op}', expr)
         
         lhs, rhs = args
-        lhs = 1 * self._sample(lhs, objects, subs)
-        rhs = 1 * self._sample(rhs, objects, subs)
+        lhs = RDDLTensors.numeric(self._sample(lhs, objects, subs))
+        rhs = RDDLTensors.numeric(self._sample(rhs, objects, subs))
         return valid_ops[op](lhs, rhs)
     
     def _sample_logical(self, expr, objects, subs):
@@ -588,12 +1140,13 @@ class RDDLSimulator:
 
         # cache and read reduced axes tensor info for the aggregation
         * pvars, arg = args
-        cached_objects = getattr(expr, 'cached_objects', None)
+        key = (id(expr), tuple(objects))
+        cached_objects = self._cached_objects.get(key, None)
         if cached_objects is None:
             new_objects = objects + [p[1] for p in pvars]
-            reduced_axes = tuple(range(len(objects), len(new_objects)))             
+            reduced_axes = tuple(range(-len(pvars), 0))
             cached_objects = (new_objects, reduced_axes)
-            expr.cached_objects = cached_objects
+            self._cached_objects[key] = cached_objects
             
             # check for undefined types
             bad_types = {p for _, p in new_objects if p not in self.rddl.objects}
@@ -623,15 +1176,83 @@ class RDDLSimulator:
                             
         new_objects, axis = cached_objects
         
+        # aggregate over the nonzero entries of a sparse non-fluent (plans over
+        # whole objects do not apply inside a chunk or masked branch)
+        partial = self._chunks or self._mask is not None
+        sparse = False if partial else self._cached_sparse.get(key, None)
+        if sparse is None:
+            sparse = False
+            if self.sparse is not None:
+                sparse = self.sparse.plan(expr, objects) or False
+            self._cached_sparse[key] = sparse
+        if sparse:
+            return self._sample_sparse_aggregation(sparse, expr, subs)
+        
+        # contract the factors of a product with einsum
+        contraction = False if partial else \
+            self._cached_contractions.get(key, None)
+        if contraction is None:
+            contraction = False
+            if self.contraction is not None:
+                contraction = self.contraction.plan(expr, objects) or False
+            self._cached_contractions[key] = contraction
+        if contraction:
+            return contraction.contract(
+                [self._sample(factor, f_objects, subs)
+                 for (factor, f_objects) in zip(contraction.factors,
+                                                contraction.factor_objects)])
+        
+        # evaluate an argument that does not fit in memory in chunks
+        if self.chunking is not None and self._mask is None:
+            sizes = list(zip((var for (var, _) in new_objects),
+                             self._chunk_shape(new_objects)))
+            chunks = self.chunking.plan(sizes, len(objects))
+            if chunks is not None:
+                return self._sample_chunked_aggregation(
+                    chunks, arg, new_objects, axis, expr, subs)
+        
         # sample the argument and aggregate over the reduced axes
         arg = self._sample(arg, new_objects, subs)                
         if op == 'forall' or op == 'exists':
             RDDLSimulator._check_type(
                 arg, bool, f'Argument of aggregation {op}', expr)
         else:
-            arg = 1 * arg
+            arg = RDDLTensors.numeric(arg)
         return valid_ops[op](arg, axis=axis)
     
+    def _sample_chunked_aggregation(self, chunks, arg, objects, axis, expr, subs):
+        _, op = expr.etype
+        reduce = self.AGGREGATION_OPS['sum' if op == 'avg' else op]
+        combine = RDDLChunking.COMBINE[op]
+        outer = self._chunks
+        result = None
+        try:
+            for chunk in RDDLChunking.chunks(chunks):
+                self._chunks = {**outer, **chunk}
+                sample = self._sample(arg, objects, subs)
+                if op == 'forall' or op == 'exists':
+                    RDDLSimulator._check_type(
+                        sample, bool, f'Argument of aggregation {op}', expr)
+                else:
+                    sample = RDDLTensors.numeric(sample)
+                sample = reduce(sample, axis=axis)
+                result = sample if result is None else combine(result, sample)
+        finally:
+            self._chunks = outer
+        if op == 'avg':
+            count = np.prod([len(self.rddl.objects[objects[i][1]]) for i in axis])
+            result = result / count
+        return result
+    
+    def _sample_sparse_aggregation(self, sparse, expr, subs):
+        if sparse.arg is None:
+            return sparse.reduce(None)
+        arg = self._sample(sparse.arg, sparse.arg_objects, subs)
+        if sparse.logical:
+            RDDLSimulator._check_type(
+                arg, bool, 'Argument 2 of logical operator ^', expr)
+        return sparse.reduce(arg)
+    
     # ===========================================================================
     # function
     # ===========================================================================
@@ -645,14 +1266,14 @@ class RDDLSimulator:
         if name in self.UNARY:
             RDDLSimulator._check_arity(args, 1, f'Unary function {name}', expr)
             arg, = args
-            arg = 1 * self._sample(arg, objects, subs)
+            arg = RDDLTensors.numeric(self._sample(arg, objects, subs))
             return self.UNARY[name](arg)
         
         elif name in self.BINARY:
             RDDLSimulator._check_arity(args, 2, f'Binary function {name}', expr)
             lhs, rhs = args
-            lhs = 1 * self._sample(lhs, objects, subs)
-            rhs = 1 * self._sample(rhs, objects, subs)
+            lhs = RDDLTensors.numeric(self._sample(lhs, objects, subs))
+            rhs = RDDLTensors.numeric(self._sample(rhs, objects, subs))
             temp = self.BINARY[name](lhs, rhs)
             return temp
         
@@ -677,10 +1298,39 @@ class RDDLSimulator:
             return self._sample(arg1, objects, subs)
         elif count_true == 0:  # all elements of pred are false
             return self._sample(arg2, objects, subs)
-        else:
-            arg1 = self._sample(arg1, objects, subs)
-            arg2 = self._sample(arg2, objects, subs)
-            return np.where(pred, arg1, arg2)
+        
+        # a branch selected at few elements is evaluated only at those elements
+        if self.mask_density > 0 and objects and not self._chunks \
+        and self._mask is None and np.ndim(pred) == len(objects):
+            limit = self.mask_density * pred.size
+            if count_true <= limit:
+                return self._sample_masked(pred, True, args, objects, subs)
+            elif pred.size - count_true <= limit:
+                return self._sample_masked(pred, False, args, objects, subs)
+        arg1 = self._sample(arg1, objects, subs)
+        arg2 = self._sample(arg2, objects, subs)
+        return np.where(pred, arg1, arg2)
+    
+    def _sample_masked(self, pred, first, args, objects, subs):
+        _, arg1, arg2 = args
+        coords = np.nonzero(pred if first else ~pred)
+        
+        # branches are evaluated in order, so random draws keep their order
+        values = []
+        for (i, arg) in enumerate((arg1, arg2)):
+            if (i == 0) == first:
+                self._mask = (coords, len(objects))
+                try:
+                    values.append(self._sample(arg, objects, subs))
+                finally:
+                    self._mask = None
+            else:
+                values.append(self._sample(arg, objects, subs))
+        sparse, dense = values if first else values[::-1]
+        result = np.array(np.broadcast_to(dense, pred.shape),
+                          dtype=np.result_type(sparse, dense))
+        result[coords] = sparse
+        return result
         
     # ===========================================================================
     # random variables
@@ -0,0 +1,224 @@
+import numpy as np
+from typing import List, Optional, Set, Tuple
+
+from pyRDDLGym.Core.Compiler.RDDLModel import RDDLModel
+from pyRDDLGym.Core.Parser.expr import Expression
+from pyRDDLGym.Core.Simulator.RDDLTensors import RDDLTensors
+
+Objects = List[Tuple[str, str]]
+
+
+class SparseAggregation:
+    '''A sum, avg or exists aggregation over the nonzero entries of a sparse
+    non-fluent S, whose argument has the form S, S * g or S ^ g, and where
+    every iteration variable is a parameter of S.
+
+    The non-fluent is stored in coordinate (COO) form, the argument g is
+    evaluated only over its own free variables and gathered at the nonzero
+    coordinates of S, and the reduction is a segmented sum over the nonzeros
+    grouped by the remaining parameters of S. The dense tensor over the
+    cartesian product of all objects in scope is never built.
+    '''
+
+    def __init__(self, op: str, logical: bool,
+                 coords: List[np.ndarray], data: np.ndarray,
+                 params: List[str], reduced: Set[str],
+                 arg: Optional[Expression], arg_objects: Objects,
+                 objects: Objects, shapes: dict) -> None:
+        self.op = op
+        self.logical = logical
+        self.arg = arg
+        self.arg_objects = arg_objects
+
+        # group nonzeros by the parameters of S that are not reduced
+        kept = [i for i, var in enumerate(params) if var not in reduced]
+        kept_shape = tuple(shapes[params[i]] for i in kept)
+        rows = np.ravel_multi_index(
+            [coords[i] for i in kept], kept_shape) if kept else \
+            np.zeros(data.shape, dtype=np.int64)
+        order = np.argsort(rows, kind='stable')
+        self.rows, self.starts = np.unique(rows[order], return_index=True)
+        self.num_rows = int(np.prod(kept_shape))
+
+        # coordinates at which the argument is gathered
+        extra = [var for (var, _) in arg_objects if var not in params]
+        self.gather = tuple(coords[params.index(var)][order]
+                            for (var, _) in arg_objects if var in params)
+        self.data = np.reshape(data[order], (-1,) + (1,) * len(extra))
+        self.count = int(np.prod([shapes[var] for var in reduced]))
+
+        # permutation and broadcast of the result to the output objects
+        source = [params[i] for i in kept] + extra
+        self.source_shape = kept_shape + tuple(shapes[var] for var in extra)
+        target = [var for (var, _) in objects if var in source]
+        self.perm = [source.index(var) for var in target]
+        self.keep_shape = tuple(shapes[var] if var in source else 1
+                                for (var, _) in objects)
+        self.out_shape = tuple(shapes[var] for (var, _) in objects)
+
+    def reduce(self, arg: Optional[np.ndarray]) -> np.ndarray:
+        '''Returns the aggregation given the value of the argument g over the
+        arg_objects (with any leading batch axes), or None if there is no g.'''
+
+        # values of the summand at the nonzero coordinates
+        if arg is None:
+            values, batch = self.data, ()
+        else:
+            arg = np.asarray(arg)
+            nbatch = arg.ndim - len(self.arg_objects)
+            batch = arg.shape[:nbatch]
+            prefix = (slice(None),) * nbatch
+            if self.gather:
+                arg = arg[prefix + self.gather]
+            else:
+                arg = np.expand_dims(arg, nbatch)
+            if self.logical:
+                values = np.logical_and(self.data, arg)
+            else:
+                values = self.data * arg
+        nbatch = len(batch)
+
+        # segmented reduction over the nonzeros of each row
+        if self.op == 'exists':
+            reduce = np.logical_or.reduceat
+        else:
+            reduce = np.add.reduceat
+            values = RDDLTensors.numeric(values)
+        shape = batch + (self.num_rows,) + values.shape[nbatch + 1:]
+        result = np.zeros(shape, dtype=values.dtype)
+        if self.rows.size:
+            result[(slice(None),) * nbatch + (self.rows,)] = \
+                reduce(values, self.starts, axis=nbatch)
+        if self.op == 'avg':
+            result = result / self.count
+
+        # permute and broadcast to the output objects
+        result = np.reshape(result, batch + self.source_shape)
+        axes = tuple(range(nbatch)) + tuple(nbatch + i for i in self.perm)
+        result = np.transpose(result, axes)
+        result = np.reshape(result, batch + self.keep_shape)
+        return np.broadcast_to(result, batch + self.out_shape)
+
+
+class RDDLSparse:
+    '''Decides which aggregations of a lifted RDDL model are evaluated as
+    SparseAggregation. A non-fluent is stored sparsely if the fraction of its
+    nonzero entries in the initial values does not exceed the given density.
+    '''
+
+    OPS = {'sum', 'avg', 'exists'}
+
+    def __init__(self, rddl: RDDLModel, tensors: RDDLTensors,
+                 density: float) -> None:
+        '''Creates a new sparse aggregation planner for the given model.
+
+        :param rddl: the lifted RDDL model
+        :param tensors: the tensor representation of the model
+        :param density: the largest fraction of nonzero entries of a sparse
+        non-fluent
+        '''
+        self.rddl = rddl
+        self.tensors = tensors
+        self.density = density
+        self._coo = {}
+
+    def coo(self, var: str) -> Optional[Tuple[List[np.ndarray], np.ndarray]]:
+        '''Returns the coordinates and values of the nonzero entries of the
+        given non-fluent, or None if it is not sparse.'''
+        if var not in self._coo:
+            value = self.tensors.init_values.get(var, None)
+            result = None
+            if self.rddl.variable_types.get(var, None) == 'non-fluent' \
+            and np.ndim(value) > 0:
+                coords = np.nonzero(value)
+                if coords[0].size <= self.density * np.size(value):
+                    result = (list(coords), value[coords])
+            self._coo[var] = result
+        return self._coo[var]
+
+    def plan(self, expr: Expression, objects: Objects) -> Optional[SparseAggregation]:
+        '''Returns a SparseAggregation for the given aggregation expression
+        evaluated over the given objects, or None if it must be dense.'''
+        _, op = expr.etype
+        if op not in RDDLSparse.OPS:
+            return None
+        * pvars, arg = expr.args
+        scope = dict(objects + [p[1] for p in pvars])
+        reduced = {p[1][0] for p in pvars}
+
+        # find the sparse factor S and the other factor g
+        if arg.op_code == Expression.PVAR:
+            factors = [(arg, None)]
+            logical = False
+        elif arg.etype in (('arithmetic', '*'), ('boolean', '^')) \
+        and len(arg.args) == 2:
+            lhs, rhs = arg.args
+            factors = [(lhs, rhs), (rhs, lhs)]
+            logical = arg.etype[1] == '^'
+        else:
+            return None
+        if op == 'exists' and not (logical or len(factors) == 1):
+            return None
+
+        for (factor, other) in factors:
+            if factor.op_code != Expression.PVAR:
+                continue
+            var, params = factor.args
+            coo = self.coo(var)
+            if coo is None or not params:
+                continue
+            coords, data = coo
+            if len(set(params)) != len(params) \
+            or not set(params).issubset(scope) \
+            or not reduced.issubset(params):
+                continue
+            if (logical or op == 'exists') and data.dtype != bool:
+                continue
+
+            # g must be deterministic, since it is sampled only once per
+            # combination of its own free variables
+            if other is None:
+                arg_objects = []
+            else:
+                free = RDDLSparse.free_variables(other)
+                if free is None or not free.issubset(scope):
+                    continue
+                arg_objects = [(v, scope[v]) for v in params if v in free]
+                arg_objects += [(v, t) for (v, t) in objects
+                                if v in free and v not in params]
+            shapes = {v: len(self.rddl.objects[t]) for (v, t) in scope.items()}
+            return SparseAggregation(
+                op, logical, coords, data, list(params), reduced,
+                other, arg_objects, objects, shapes)
+        return None
+
+    @staticmethod
+    def free_variables(expr: Expression) -> Optional[Set[str]]:
+        '''Returns the variables that occur free in the given expression, or
+        None if the expression is random.'''
+        if expr.op_code == Expression.RANDOMVAR:
+            return None
+        elif expr.op_code == Expression.CONSTANT:
+            return set()
+        elif expr.op_code == Expression.PVAR:
+            _, params = expr.args
+            return {p for p in (params or []) if p.startswith('?')}
+
+        children = []
+        stack = [expr.args]
+        while stack:
+            atom = stack.pop()
+            if isinstance(atom, Expression):
+                children.append(atom)
+            elif isinstance(atom, (tuple, list)):
+                stack.extend(atom)
+        free = set()
+        for child in children:
+            child_free = RDDLSparse.free_variables(child)
+            if child_free is None:
+                return None
+            free.update(child_free)
+        if expr.op_code == Expression.AGGREGATION:
+            * pvars, _ = expr.args
+            free.difference_update(p[1][0] for p in pvars)
+        return free
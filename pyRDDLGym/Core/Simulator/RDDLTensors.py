@@ -1,6 +1,6 @@
 import datetime
 import numpy as np
-from typing import Callable, Iterable, List, Tuple
+from typing import Callable, Dict, Iterable, List, Tuple
 
 from pyRDDLGym.Core.ErrorHandling.RDDLException import RDDLInvalidNumberOfArgumentsError
 from pyRDDLGym.Core.ErrorHandling.RDDLException import RDDLInvalidObjectError
@@ -45,6 +45,18 @@ class RDDLTensors:
         
         self._cached_transforms = {}
 
+    @staticmethod
+    def numeric(value):
+        '''Casts a boolean value to INT so that it can be used in arithmetic,
+        and returns any other value as is, without the copy made by 1 * value.
+        '''
+        dtype = getattr(value, 'dtype', None)
+        if dtype is None:
+            return 1 * value
+        elif dtype == bool:
+            return value.astype(RDDLTensors.INT)
+        return value
+    
     def _compile_objects(self):
         grounded = {}
         for var, types in self.rddl.param_types.items():
@@ -142,6 +154,22 @@ class RDDLTensors:
                         f'must be one of {set(objects.keys())}.\n'
                         f'{msg}')
             
+    def layout(self, vars: Iterable[str]) -> Dict[str, Tuple[int, int, Tuple[int, ...]]]:
+        '''Assigns each pvariable a contiguous block of a flat vector, in the
+        given order. The output is a dict mapping each pvariable to a tuple
+        (start, stop, shape), such that the values of the pvariable are
+        read as np.reshape(vector[start:stop], shape).
+        
+        :param vars: the pvariables to lay out
+        '''
+        layout, start = {}, 0
+        for var in vars:
+            shape = np.shape(self.init_values[var])
+            stop = start + int(np.prod(shape, dtype=int))
+            layout[var] = (start, stop, shape)
+            start = stop
+        return layout
+    
     def write_debug_message(self, msg: str) -> None:
         if self.debug:
             fp = open(self.filename, 'a')
@@ -149,24 +177,21 @@ class RDDLTensors:
             fp.write(timestamp + ': ' + msg + '\n')
             fp.close()
         
-    def map(self, var: str,
-            obj_in: List[str],
-            sign_out: List[Tuple[str, str]],
-            gnp=np,
-            msg: str='') -> Callable[[np.ndarray], np.ndarray]:
-        '''Returns a function that transforms a pvariable value tensor to one
-        whose shape matches a desired output signature. This operation is
-        achieved by adding new dimensions to the value as needed, and performing
-        a combination of transposition/reshape/einsum operations to coerce the 
-        value to the desired shape.
+    def transform_info(self, var: str,
+                       obj_in: List[str],
+                       sign_out: List[Tuple[str, str]],
+                       msg: str='') -> Tuple:
+        '''Returns the steps of the transform of map() as a tuple
+        (in_shape, out_shape, new_axis, use_einsum, use_tr, subscripts): the
+        new axes to append to the value tensor and broadcast to out_shape, and
+        then the einsum subscripts or transpose axes (if use_einsum or use_tr)
+        that rearrange the axes to match the output signature.
         
         :param var: a string pvariable defined in the domain
         :param obj_in: a list of desired object quantifications, e.g. ?x, ?y at
         which var will be evaluated
         :param sign_out: a list of tuples (objecti, typei) representing the
             desired signature of the output pvariable tensor
-        :param gnp: the library in which to perform tensor arithmetic 
-        (either numpy or jax.numpy)
         :param msg: a stack trace to print for error handling
         '''
                 
@@ -227,20 +252,48 @@ class RDDLTensors:
         #     3a. in most cases, it suffices to use np.transform (cheaper)
         #     3b. in cases where we have a more complex contraction like 
         #         fluent(?x) = matrix(?x, ?x), we will use np.einsum
+        # new axes are counted from the end, so that any leading batch axes
+        # of the value tensor are left untouched by the transform
         in_shape = self.shape(types_in)
         out_shape = in_shape + tuple(new_dims)
-        new_axis = tuple(range(len(in_shape), len(out_shape)))
+        new_axis = tuple(range(-len(new_dims), 0))
          
         lhs = ''.join(valid_symbols[p] for p in permutation)        
         rhs = valid_symbols[:n_out]
         use_einsum = len(set(lhs)) != len(lhs)
         use_tr = lhs != rhs
         if use_einsum:
-            subscripts = lhs + '->' + rhs
+            subscripts = '...' + lhs + '->...' + rhs
         elif use_tr:
             subscripts = tuple(np.argsort(permutation))  # inverse permutation
         else:
             subscripts = None
+        return in_shape, out_shape, new_axis, use_einsum, use_tr, subscripts
+        
+    def map(self, var: str,
+            obj_in: List[str],
+            sign_out: List[Tuple[str, str]],
+            gnp=np,
+            msg: str='') -> Callable[[np.ndarray], np.ndarray]:
+        '''Returns a function that transforms a pvariable value tensor to one
+        whose shape matches a desired output signature. This operation is
+        achieved by adding new dimensions to the value as needed, and performing
+        a combination of transposition/reshape/einsum operations to coerce the 
+        value to the desired shape. Any leading axes of the value beyond those
+        of the pvariable (e.g. a batch axis) are preserved in the output.
+        
+        :param var: a string pvariable defined in the domain
+        :param obj_in: a list of desired object quantifications, e.g. ?x, ?y at
+        which var will be evaluated
+        :param sign_out: a list of tuples (objecti, typei) representing the
+            desired signature of the output pvariable tensor
+        :param gnp: the library in which to perform tensor arithmetic 
+        (either numpy or jax.numpy)
+        :param msg: a stack trace to print for error handling
+        '''
+        in_shape, out_shape, new_axis, use_einsum, use_tr, subscripts = \
+            self.transform_info(var, obj_in, sign_out, msg)
+        sign_in = tuple(zip(obj_in or [], self.rddl.param_types.get(var, [])))
         
         # check if the tensor transform with the given signature already exists
         # if so, just retrieve it from the cache
@@ -251,13 +304,20 @@ class RDDLTensors:
             
             def _transform(arg):
                 sample = arg
+                n_lead = gnp.ndim(sample) - len(in_shape)
                 if new_axis:
                     sample = gnp.expand_dims(sample, axis=new_axis)
-                    sample = gnp.broadcast_to(sample, shape=out_shape)
+                    lead_shape = gnp.shape(sample)[:n_lead]
+                    sample = gnp.broadcast_to(sample, shape=lead_shape + out_shape)
                 if use_einsum:
                     return gnp.einsum(subscripts, sample)
                 elif use_tr:
-                    return gnp.transpose(sample, axes=subscripts)
+                    if n_lead:
+                        axes = tuple(range(n_lead)) + tuple(
+                            n_lead + i for i in subscripts)
+                    else:
+                        axes = subscripts
+                    return gnp.transpose(sample, axes=axes)
                 else:
                     return sample
             
@@ -277,17 +337,26 @@ class RDDLTensors:
             
         return _transform
     
-    def expand(self, var: str, values: np.ndarray) -> Iterable[Tuple[str, Value]]:
+    def expand(self, var: str, values: np.ndarray,
+               batched: bool=False) -> Iterable[Tuple[str, Value]]:
         '''Produces a grounded representation of the pvariable var from its 
         tensor representation. The output is a dict whose keys are grounded
         representations of the var, and values are read from the tensor.
         
         :param var: the pvariable
         :param values: the tensor whose values correspond to those of var(?...)        
+        :param batched: whether the tensor has a leading batch axis, in which
+        case each grounded value is an array over the batch
         '''
         keys = self.grounded[var]
-        values = np.ravel(values)
-        if len(keys) != values.size:
+        if batched:
+            values = np.reshape(values, (np.shape(values)[0], -1))
+            size = values.shape[1]
+            values = values.T
+        else:
+            values = np.ravel(values)
+            size = values.size
+        if len(keys) != size:
             raise RDDLInvalidNumberOfArgumentsError(
                 f'Size of value array is not compatible with variable <{var}>.')
         return zip(keys, values)
@@ -0,0 +1,151 @@
+import functools
+import numpy as np
+from typing import Callable
+
+
+class RDDLValidation:
+    '''Validates the values computed by an unchecked simulator once per step,
+    rather than as they are computed.
+
+    Checks of the types of values run the first time each check is made with
+    a value of a given dtype, and are skipped for later values of the same
+    dtype, whose outcome is the same. The dtype is still looked up on every
+    call, since a branch taken for the first time in a later step can change
+    the type of the value of an expression; checks of expressions whose type
+    is known when they are compiled (e.g. relational expressions) are
+    skipped altogether. Checks of the parameters of
+    distributions and of other ranges only test their condition, and record
+    the values that failed it in an error mask for the step, in the same way
+    as the error codes of the Jax compiler. Floating point errors are not
+    raised by numpy as they occur, but passed to a callback that records
+    them for the step.
+
+    At the end of every step, the first recorded error is raised as the same
+    exception that a checked simulator would have raised.
+    '''
+
+    def __init__(self) -> None:
+        self._failed = []
+        self._depth = 0
+        self._errobj = None
+        
+        # the numpy error state of a step, which calls back on every error
+        with np.errstate(all='call', call=self._record_floating_point):
+            if hasattr(np, 'geterrobj'):
+                self._errobj = list(np.geterrobj())
+
+    # ===========================================================================
+    # checks
+    # ===========================================================================
+
+    @staticmethod
+    def by_dtype(check: Callable) -> Callable:
+        '''Returns a version of the given type check that only checks the
+        first value of every dtype for every distinct message.'''
+        checked = set()
+
+        def _check(value, valid, msg, expr):
+            key = (msg, getattr(value, 'dtype', type(value)))
+            if key not in checked:
+                check(value, valid, msg, expr)
+                checked.add(key)
+
+        return _check
+
+    @staticmethod
+    def skip(value, valid, msg, expr) -> None:
+        '''A type check of a value whose type is known to be valid.'''
+        pass
+
+    def positive(self, check: Callable) -> Callable:
+        '''Returns a deferred version of the given positivity check.'''
+        failed = self._failed
+
+        def _check(value, strict, msg, expr):
+            valid = np.all(value > 0) if strict else np.all(value >= 0)
+            if not valid:
+                failed.append((check, (np.copy(value), strict, msg, expr)))
+
+        return _check
+
+    def bounds(self, check: Callable) -> Callable:
+        '''Returns a deferred version of the given bounds check.'''
+        failed = self._failed
+
+        def _check(lb, ub, msg, expr):
+            if not np.all(lb <= ub):
+                failed.append((check, (np.copy(lb), np.copy(ub), msg, expr)))
+
+        return _check
+
+    def in_range(self, check: Callable) -> Callable:
+        '''Returns a deferred version of the given range check.'''
+        failed = self._failed
+
+        def _check(value, lb, ub, msg, expr):
+            if not np.all(np.logical_and(value >= lb, value <= ub)):
+                failed.append((check, (np.copy(value), lb, ub, msg, expr)))
+
+        return _check
+    
+    def _record_floating_point(self, error, flag):
+        self._failed.append((RDDLValidation._raise_floating_point, (error,)))
+    
+    @staticmethod
+    def _raise_floating_point(error):
+        raise FloatingPointError(
+            f'{error} encountered in a floating point operation.')
+
+    # ===========================================================================
+    # reporting
+    # ===========================================================================
+
+    def begin(self) -> object:
+        '''Starts recording the errors of a step, and returns the numpy error
+        state to restore when it ends.'''
+        self._failed.clear()
+        self._depth = 1
+        if self._errobj is None:
+            return (np.seterr(all='call'),
+                    np.seterrcall(self._record_floating_point))
+        errobj = np.geterrobj()
+        np.seterrobj(self._errobj)
+        return errobj
+    
+    def end(self, errobj: object) -> None:
+        '''Stops recording the errors of a step, and restores the given numpy
+        error state.'''
+        self._depth = 0
+        if self._errobj is None:
+            np.seterr(**errobj[0])
+            np.seterrcall(errobj[1])
+        else:
+            np.seterrobj(errobj)
+
+    def report(self) -> None:
+        '''Raises the first recorded error, if any.'''
+        failed = self._failed
+        if failed:
+            check, args = failed[0]
+            failed.clear()
+            check(*args)
+
+
+def validated(method: Callable) -> Callable:
+    '''Defers the validation of the values computed by the given method of a
+    simulator to the end of the method, if the simulator is unchecked.'''
+
+    @functools.wraps(method)
+    def _method(self, *args, **kwargs):
+        validation = self.validation
+        if validation is None or validation._depth:
+            return method(self, *args, **kwargs)
+        errobj = validation.begin()
+        try:
+            result = method(self, *args, **kwargs)
+        finally:
+            validation.end(errobj)
+        validation.report()
+        return result
+
+    return _method
@@ -0,0 +1,729 @@
+import hashlib
+import re
+
+import pyRDDLGym
+from pyRDDLGym.Core.ErrorHandling.RDDLException import RDDLNotImplementedError
+from pyRDDLGym.Core.ErrorHandling.RDDLException import RDDLUndefinedVariableError
+
+from pyRDDLGym.Core.Simulator.NumpyRDDLCompiler import NumpyRDDLCompiler
+from pyRDDLGym.Core.Simulator.RDDLTensors import RDDLTensors
+from pyRDDLGym.Core.Simulator.SourceRDDLCompiler import SourceRDDLCompiler
+
+HEADER = '''# Generated by pyRDDLGym {version} for domain <{domain}>, instance <{instance}>.
+# This file is a cache entry that is regenerated when the model changes.
+import math
+
+import numpy as np
+
+from pyRDDLGym.Core.Simulator.RDDLSimulator import RDDLSimulator as _RDDLSimulator
+from pyRDDLGym.Core.Simulator.RDDLSimulator import lngamma as _lngamma
+
+_check_type = _RDDLSimulator._check_type
+_check_type_in = _RDDLSimulator._check_type_in
+_check_positive = _RDDLSimulator._check_positive
+_check_bounds = _RDDLSimulator._check_bounds
+_check_range = _RDDLSimulator._check_range
+'''
+
+# static types of generated values, in order of promotion
+BOOL, INT, REAL = 'bool', 'int', 'real'
+TYPES = {bool: BOOL, RDDLTensors.INT: INT, RDDLTensors.REAL: REAL}
+CASTS = {BOOL: 'bool', INT: 'int', REAL: 'float'}
+DTYPES = {BOOL: 'bool', INT: 'np.int64', REAL: 'np.float64'}
+ORDER = {BOOL: 0, INT: 1, REAL: 2}
+
+# names, slots and literals, which are read more than once without a temporary
+ATOM = re.compile(r'[A-Za-z_]\w*|v\[\d+\]|[\d.e+-]+|\(-[\d.e+-]+\)|'
+                  r'float\("-?(nan|inf)"\)')
+
+
+def _promote(*types):
+    if None in types:
+        return None
+    return max(types, key=ORDER.get)
+
+
+def _numeric(vtype):
+    return INT if vtype == BOOL else vtype
+
+
+class ScalarRDDLCompiler(SourceRDDLCompiler):
+    '''Compiles a grounded RDDL model (from RDDLGrounder) into the source of a
+    Python module that evaluates every expression on Python scalars, without
+    numpy arrays.
+
+    In the step function, all ground fluents that are read or computed in a
+    step live in a flat list at integer slots that are fixed when the module
+    is generated: the states and actions read by the model are loaded from
+    subs once (and cast to the Python type of their range), every CPF is an
+    expression over slots that is written to its own slot, and the values
+    of the CPFs are copied back to subs before the reward is evaluated.
+    Non-fluents are inlined as literals. The CPF, reward and constraint
+    functions (used outside of the fused step) read subs directly.
+
+    Values have a static type (bool, int or real) that is known when the
+    source is generated, so that type checks are emitted only where a value
+    may not have the required type, and value checks of distributions are
+    guarded by a comparison before the checks of the simulator are called.
+    Pure sub-expressions are generated inline, while random draws and
+    short-circuit control flow become statements, so that the random draws
+    are done in the same order as in NumpyRDDLCompiler. Real sums are added
+    left to right, so they may differ from numpy in the last digits, and
+    invalid operations raise Python errors (such as ZeroDivisionError) rather
+    than FloatingPointError.
+    '''
+
+    VERSION = 1
+
+    ARITHMETIC = {'+': '+', '-': '-', '*': '*', '/': '/'}
+    RELATIONAL = {'>=': '>=', '<=': '<=', '<': '<', '>': '>', '==': '==',
+                  '~=': '!='}
+    LOGICAL = {'~': '({} != {})', '=>': '(not {} or {})', '<=>': '({} == {})'}
+
+    # the form and type (None if the type of the argument) of every function
+    UNARY = {
+        'abs': ('abs({})', None),
+        'sgn': ('(({0} > 0) - ({0} < 0))', INT),
+        'round': ('int(round({}))', INT),
+        'floor': ('math.floor({})', INT),
+        'ceil': ('math.ceil({})', INT),
+        'cos': ('math.cos({})', REAL),
+        'sin': ('math.sin({})', REAL),
+        'tan': ('math.tan({})', REAL),
+        'acos': ('math.acos({})', REAL),
+        'asin': ('math.asin({})', REAL),
+        'atan': ('math.atan({})', REAL),
+        'cosh': ('math.cosh({})', REAL),
+        'sinh': ('math.sinh({})', REAL),
+        'tanh': ('math.tanh({})', REAL),
+        'exp': ('math.exp({})', REAL),
+        'ln': ('math.log({})', REAL),
+        'sqrt': ('math.sqrt({})', REAL),
+        'lngamma': ('float(_lngamma({}))', REAL),
+        'gamma': ('math.exp(_lngamma({}))', REAL)
+    }
+    BINARY = {
+        'div': ('int({} // {})', INT),
+        'mod': ('int({} % {})', INT),
+        'min': ('min({}, {})', None),
+        'max': ('max({}, {})', None),
+        'pow': ('{} ** {}', REAL),
+        'log': ('(math.log({}) / math.log({}))', REAL)
+    }
+
+    # the parameters, value checks (as the condition under which the check
+    # of the simulator is called) and sample of every distribution
+    RANDOM = {
+        'KronDelta': (('arg',), [], '{arg}', None),
+        'DiracDelta': (('arg',), [], '{arg}', None),
+        'Uniform': (('lb', 'ub'), [
+            ("not {lb} <= {ub}", "_check_bounds({lb}, {ub}, 'Uniform', {expr})")],
+            'rng.uniform({lb}, {ub})', REAL),
+        'Bernoulli': (('pr',), [
+            ("not 0 <= {pr} <= 1",
+             "_check_range({pr}, 0, 1, 'Bernoulli p', {expr})")],
+            'rng.uniform() <= {pr}', BOOL),
+        'Normal': (('mean', 'var'), [
+            ("not {var} >= 0",
+             "_check_positive({var}, False, 'Normal variance', {expr})")],
+            'rng.normal({mean}, math.sqrt({var}))', REAL),
+        'Poisson': (('rate',), [
+            ("not {rate} >= 0",
+             "_check_positive({rate}, False, 'Poisson rate', {expr})")],
+            'rng.poisson({rate})', INT),
+        'Exponential': (('scale',), [
+            ("not {scale} > 0",
+             "_check_positive({scale}, True, 'Exponential rate', {expr})")],
+            'rng.exponential({scale})', REAL),
+        'Weibull': (('shape_', 'scale'), [
+            ("not {shape_} > 0",
+             "_check_positive({shape_}, True, 'Weibull shape', {expr})"),
+            ("not {scale} > 0",
+             "_check_positive({scale}, True, 'Weibull scale', {expr})")],
+            '{scale} * rng.weibull({shape_})', REAL),
+        'Gamma': (('shape_', 'scale'), [
+            ("not {shape_} > 0",
+             "_check_positive({shape_}, True, 'Gamma shape', {expr})"),
+            ("not {scale} > 0",
+             "_check_positive({scale}, True, 'Gamma scale', {expr})")],
+            'rng.gamma({shape_}, {scale})', REAL),
+        'Binomial': (('count', 'pr'), [
+            ("not {count} >= 0",
+             "_check_positive({count}, False, 'Binomial count', {expr})"),
+            ("not 0 <= {pr} <= 1",
+             "_check_range({pr}, 0, 1, 'Binomial p', {expr})")],
+            'rng.binomial({count}, {pr})', INT),
+        'NegativeBinomial': (('count', 'pr'), [
+            ("not {count} > 0",
+             "_check_positive({count}, True, 'NegativeBinomial r', {expr})"),
+            ("not 0 <= {pr} <= 1",
+             "_check_range({pr}, 0, 1, 'NegativeBinomial p', {expr})")],
+            'rng.negative_binomial({count}, {pr})', INT),
+        'Beta': (('shape_', 'rate'), [
+            ("not {shape_} > 0",
+             "_check_positive({shape_}, True, 'Beta shape', {expr})"),
+            ("not {rate} > 0",
+             "_check_positive({rate}, True, 'Beta rate', {expr})")],
+            'rng.beta({shape_}, {rate})', REAL),
+        'Geometric': (('pr',), [
+            ("not 0 <= {pr} <= 1",
+             "_check_range({pr}, 0, 1, 'Geometric p', {expr})")],
+            'rng.geometric({pr})', INT),
+        'Pareto': (('shape_', 'scale'), [
+            ("not {shape_} > 0",
+             "_check_positive({shape_}, True, 'Pareto shape', {expr})"),
+            ("not {scale} > 0",
+             "_check_positive({scale}, True, 'Pareto scale', {expr})")],
+            '{scale} * rng.pareto({shape_})', REAL),
+        'Student': (('df',), [
+            ("not {df} > 0",
+             "_check_positive({df}, True, 'Student df', {expr})")],
+            'rng.standard_t({df})', REAL),
+        'Gumbel': (('mean', 'scale'), [
+            ("not {scale} > 0",
+             "_check_positive({scale}, True, 'Gumbel scale', {expr})")],
+            'rng.gumbel({mean}, {scale})', REAL),
+        'Laplace': (('mean', 'scale'), [
+            ("not {scale} > 0",
+             "_check_positive({scale}, True, 'Laplace scale', {expr})")],
+            'rng.laplace({mean}, {scale})', REAL),
+        'Cauchy': (('mean', 'scale'), [
+            ("not {scale} > 0",
+             "_check_positive({scale}, True, 'Cauchy scale', {expr})")],
+            '{mean} + {scale} * rng.standard_cauchy()', REAL),
+        'Gompertz': (('shape_', 'scale'), [
+            ("not {shape_} > 0",
+             "_check_positive({shape_}, True, 'Gompertz shape', {expr})"),
+            ("not {scale} > 0",
+             "_check_positive({scale}, True, 'Gompertz scale', {expr})")],
+            'math.log(1.0 - math.log1p(-rng.uniform()) / {shape_}) / {scale}',
+            REAL)
+    }
+
+    def __init__(self, simulator, cache_dir: str=None,
+                 use_cache: bool=False) -> None:
+        '''Creates a new compiler for the grounded model of the given simulator.
+
+        :param simulator: the RDDLSimulator whose model is compiled
+        :param cache_dir: the directory of the cache, or None to use the
+        directory of RDDLModelCache
+        :param use_cache: whether to read and write the generated module in
+        the cache directory
+        '''
+        if not simulator.rddl.is_grounded:
+            raise RDDLNotImplementedError(
+                'The scalar compiler requires a grounded model.')
+        super().__init__(simulator, cache_dir=cache_dir, use_cache=use_cache)
+
+    def key(self) -> str:
+        '''Returns a hash of everything that determines the generated source,
+        including the values of the non-fluents (which are inlined).'''
+        digest = hashlib.sha256()
+        digest.update(f'scalar={ScalarRDDLCompiler.VERSION};'.encode('utf-8'))
+        digest.update(super().key().encode('utf-8'))
+        for name, value in self.sim.init_values.items():
+            if self._is_nonfluent(name):
+                digest.update(f'{name}={self._literal(value)}'.encode('utf-8'))
+                digest.update(b'\0')
+        return digest.hexdigest()
+
+    def _is_nonfluent(self, name):
+        var = self.rddl.parse(name)[0]
+        return self.rddl.variable_types.get(var, None) == 'non-fluent'
+
+    def _type_of(self, name):
+        var = self.rddl.parse(name)[0]
+        return TYPES[RDDLTensors.NUMPY_TYPES[self.rddl.variable_ranges[var]]]
+
+    # ===========================================================================
+    # code generation
+    # ===========================================================================
+
+    def generate(self) -> str:
+        '''Returns the source of the module of the model.'''
+        rddl = self.rddl
+        ast = rddl._AST
+        self._constants = []
+        self._traces = {}
+        self._names = set()
+        self._sparse = []
+        self._sites = []
+        self._contractions = []
+        self._contraction_sites = []
+
+        # the functions of the CPFs, reward and constraints read subs
+        self._slots = None
+        functions, cpf_names = [], {}
+        for cpfs in self.levels.values():
+            for cpf in cpfs:
+                _, expr = rddl.cpfs[cpf]
+                body, value = self._cpf_body(cpf, expr)
+                name = cpf_names[cpf] = self._function_name('cpf_' + cpf)
+                functions.append(self._function(name, body, value, cpf))
+
+        body, value = self._reward_body()
+        functions.append(self._function('reward', body, value, 'reward'))
+
+        constraints = {}
+        for prefix, exprs in (('invariant', rddl.invariants),
+                              ('precondition', rddl.preconditions),
+                              ('termination', rddl.terminals)):
+            constraints[prefix] = []
+            for i, expr in enumerate(exprs):
+                name = f'{prefix}_{i + 1}'
+                body, value, _ = self._function_body(expr)
+                functions.append(self._function(
+                    name, body, value, f'{prefix} {i + 1}'))
+                constraints[prefix].append(name)
+
+        # the step function reads and writes the slots of the fluents
+        self._slots, self._inputs = {}, []
+        cpf_lines = []
+        for level, cpfs in self.levels.items():
+            cpf_lines.extend(['', f'# level {level}'])
+            for cpf in cpfs:
+                _, expr = rddl.cpfs[cpf]
+                body, value = self._cpf_body(cpf, expr)
+                cpf_lines.append(f'# {cpf}')
+                cpf_lines.extend(body)
+                cpf_lines.append(f'{self._slot(cpf)} = {value}')
+        cpf_lines.extend(['', '# new values of the CPFs'])
+        for cpfs in self.levels.values():
+            for cpf in cpfs:
+                cpf_lines.append(f'subs[{repr(cpf)}] = {self._slot(cpf)}')
+        body, value = self._reward_body()
+        cpf_lines.extend(['', '# reward'])
+        cpf_lines.extend(body)
+        cpf_lines.append(f'return float({value})')
+
+        step = ['def step(subs, rng):',
+                "    '''Evaluates all CPFs in level order, and returns the "
+                "reward.'''",
+                f'    v = [None] * {len(self._slots)}',
+                '',
+                '    # states and actions']
+        for name, slot in self._inputs:
+            cast = CASTS[self._type_of(name)]
+            step.append(f'    v[{slot}] = {cast}(subs[{repr(name)}])')
+        step.extend('    ' + line if line else '' for line in cpf_lines)
+
+        lines = [HEADER.format(version=pyRDDLGym.__version__,
+                               domain=ast.domain.name,
+                               instance=ast.instance.name)]
+        lines.append('# expressions for error messages')
+        lines.extend(self._constants)
+        lines.append('')
+        for function in functions:
+            lines.extend(['', function])
+        lines.extend(['', '\n'.join(step), ''])
+        lines.append(f'CPFS = {repr(cpf_names)}')
+        lines.append(f'INVARIANTS = {repr(constraints["invariant"])}')
+        lines.append(f'PRECONDITIONS = {repr(constraints["precondition"])}')
+        lines.append(f'TERMINATIONS = {repr(constraints["termination"])}')
+        lines.append('SPARSE_SITES = []')
+        lines.append('SPARSE = None')
+        lines.append('CONTRACTION_SITES = []')
+        lines.append('CONTRACTIONS = None')
+        return '\n'.join(lines) + '\n'
+
+    def _cpf_body(self, cpf, expr):
+        body, value, vtype = self._function_body(expr)
+        dtype = self.sim.cpf_types[cpf]
+        if not self._castable(vtype, TYPES[dtype]):
+            body.append(f'_check_type({value}, '
+                        f'{SourceRDDLCompiler.NUMPY_TYPES[dtype]}, '
+                        f'{repr(f"CPF <{cpf}>")}, {self._trace(expr)})')
+        return body, value
+
+    def _reward_body(self):
+        body, value, _ = self._function_body(self.rddl.reward)
+        return body, value
+
+    def _function_body(self, expr):
+        self._temps = 0
+        self._lines = []
+        self._indent = ''
+        value, vtype = self._emit(expr)
+        return self._lines, value, vtype
+
+    def _slot(self, name):
+        slot = self._slots.get(name, None)
+        if slot is None:
+            slot = self._slots[name] = len(self._slots)
+        return f'v[{slot}]'
+
+    @staticmethod
+    def _castable(vtype, target):
+        return vtype is not None and ORDER[vtype] <= ORDER[target]
+
+    def _block(self, expr):
+        '''Emits the expression into a new list of statements, and returns the
+        statements, the value and the type of the expression.'''
+        lines = self._lines
+        self._lines = []
+        value, vtype = self._emit(expr)
+        block, self._lines = self._lines, lines
+        return block, value, vtype
+
+    def _extend(self, block, indent='    '):
+        self._lines.extend(indent + line for line in block)
+
+    def _atom(self, value):
+        '''Assigns the value to a temporary, unless it is a name, slot or
+        literal that can be read more than once at no cost.'''
+        if ATOM.fullmatch(value):
+            return value
+        return self._assign(value)
+
+    def _check_type(self, value, vtype, target, msg, expr):
+        if not self._castable(vtype, target):
+            self._line(f'_check_type({value}, {DTYPES[target]}, {repr(msg)}, '
+                       f'{self._trace(expr)})')
+
+    def _emit(self, expr):
+        etype, _ = expr.etype
+        if etype == 'constant':
+            return self._emit_constant(expr)
+        elif etype == 'pvar':
+            return self._emit_pvar(expr)
+        elif etype == 'arithmetic':
+            return self._emit_arithmetic(expr)
+        elif etype == 'relational':
+            return self._emit_relational(expr)
+        elif etype == 'boolean':
+            return self._emit_logical(expr)
+        elif etype == 'aggregation':
+            raise Exception(f'Aggregation {expr} in grounded domain.')
+        elif etype == 'func':
+            return self._emit_func(expr)
+        elif etype == 'control':
+            return self._emit_control(expr)
+        elif etype == 'randomvar':
+            return self._emit_random(expr)
+        else:
+            raise RDDLNotImplementedError(
+                f'Internal error: expression {expr} is not recognized.')
+
+    # ===========================================================================
+    # leaves
+    # ===========================================================================
+
+    @staticmethod
+    def _value_type(value):
+        value = getattr(value, 'item', lambda: value)()
+        if isinstance(value, bool):
+            return BOOL
+        elif isinstance(value, int):
+            return INT
+        elif isinstance(value, float):
+            return REAL
+        return None
+
+    @staticmethod
+    def _scalar_literal(value):
+        literal = SourceRDDLCompiler._literal(value)
+        if literal.startswith('-'):
+            literal = f'({literal})'
+        return literal, ScalarRDDLCompiler._value_type(value)
+
+    def _emit_constant(self, expr):
+        return ScalarRDDLCompiler._scalar_literal(expr.args)
+
+    def _emit_pvar(self, expr):
+        sim = self.sim
+        _, name = expr.etype
+        args = expr.args
+        sim._check_arity(args, 2, f'Variable <{name}>', expr)
+
+        var, _ = args
+        if var not in sim.init_values:
+            raise RDDLUndefinedVariableError(
+                f'Variable <{var}> is not defined in the instance.\n' +
+                sim._print_stack_trace(expr))
+        vtype = self._type_of(var)
+        if self._is_nonfluent(var):
+            return ScalarRDDLCompiler._scalar_literal(sim.init_values[var])
+        elif self._slots is None:
+            return f'{CASTS[vtype]}(subs[{repr(var)}])', vtype
+
+        # fluents that are not computed before they are read are loaded
+        if var not in self._slots:
+            self._inputs.append((var, len(self._slots)))
+        return self._slot(var), vtype
+
+    # ===========================================================================
+    # arithmetic
+    # ===========================================================================
+
+    def _emit_arithmetic(self, expr):
+        sim = self.sim
+        _, op = expr.etype
+        sim._check_op(op, sim.ARITHMETIC_OPS, 'Arithmetic', expr)
+
+        args = expr.args
+        n = len(args)
+        if n == 1 and op == '-':
+            arg, = args
+            value, vtype = self._emit(arg)
+            return f'(-{value})', _numeric(vtype)
+
+        elif n == 2:
+            if op == '*':
+                return self._emit_product(args)
+            lhs, rhs = args
+            lhs, ltype = self._emit(lhs)
+            rhs, rtype = self._emit(rhs)
+            vtype = REAL if op == '/' else _numeric(_promote(ltype, rtype))
+            symbol = ScalarRDDLCompiler.ARITHMETIC[op]
+            return f'({lhs} {symbol} {rhs})', vtype
+
+        elif n > 0:
+            if op == '*':
+                return self._emit_product_grounded(args)
+            elif op == '+':
+                values, types = zip(*(self._emit(arg) for arg in args))
+                return f'sum(({", ".join(values)},))', \
+                    _numeric(_promote(*types))
+
+        sim._check_arity(args, 2, 'Arithmetic operator', expr)
+
+    def _emit_product(self, args):
+        lhs, rhs = args
+        if NumpyRDDLCompiler._is_simple(rhs):
+            lhs, rhs = rhs, lhs
+        lhs, ltype = self._emit(lhs)
+        if ltype == BOOL:
+            lhs = f'int({lhs})'
+        lhs = self._atom(lhs)
+        block, rhs, rtype = self._block(rhs)
+        vtype = _numeric(_promote(ltype, rtype))
+        if not block:
+            return f'({lhs} * {rhs} if {lhs} else {lhs})', vtype
+        result = self._assign(lhs)
+        self._line(f'if {result}:')
+        self._extend(block)
+        self._line(f'    {result} = {result} * {rhs}')
+        return result, vtype
+
+    def _emit_product_grounded(self, args):
+
+        # go through simple expressions first, complex expressions last, and
+        # skip the remaining factors once the product is zero
+        simple = [arg for arg in args if NumpyRDDLCompiler._is_simple(arg)]
+        compound = [arg for arg in args if not NumpyRDDLCompiler._is_simple(arg)]
+        prod, types = self._temp(), [INT]
+        for i, arg in enumerate(simple + compound):
+            block, value, vtype = self._block(arg)
+            types.append(vtype)
+            if i == 0:
+                self._extend(block, '')
+                self._line(f'{prod} = 1 * {value}')
+            else:
+                self._line(f'if {prod} != 0:')
+                self._extend(block)
+                self._line(f'    {prod} *= {value}')
+        return prod, _numeric(_promote(*types))
+
+    # ===========================================================================
+    # boolean
+    # ===========================================================================
+
+    def _emit_relational(self, expr):
+        sim = self.sim
+        _, op = expr.etype
+        args = expr.args
+        sim._check_op(op, sim.RELATIONAL_OPS, 'Relational', expr)
+        sim._check_arity(args, 2, f'Relational operator {op}', expr)
+
+        lhs, rhs = args
+        lhs, _ = self._emit(lhs)
+        rhs, _ = self._emit(rhs)
+        symbol = ScalarRDDLCompiler.RELATIONAL[op]
+        return f'({lhs} {symbol} {rhs})', BOOL
+
+    def _emit_logical(self, expr):
+        sim = self.sim
+        _, op = expr.etype
+        args = expr.args
+        sim._check_op(op, sim.LOGICAL_OPS, 'Logical', expr)
+
+        n = len(args)
+        if n == 1 and op == '~':
+            arg, = args
+            value, vtype = self._emit(arg)
+            self._check_type(value, vtype, BOOL,
+                             f'Argument of logical operator {op}', expr)
+            return f'(not {value})', BOOL
+
+        elif n == 2:
+            if op == '^' or op == '|':
+                return self._emit_and_or(args, op, expr)
+            lhs, rhs = args
+            lhs, ltype = self._emit(lhs)
+            rhs, rtype = self._emit(rhs)
+            self._check_type(lhs, ltype, BOOL,
+                             f'Argument 1 of logical operator {op}', expr)
+            self._check_type(rhs, rtype, BOOL,
+                             f'Argument 2 of logical operator {op}', expr)
+            return ScalarRDDLCompiler.LOGICAL[op].format(lhs, rhs), BOOL
+
+        elif n > 0 and (op == '^' or op == '|'):
+            return self._emit_and_or_grounded(args, op, expr)
+
+        sim._check_arity(args, 2, 'Logical operator', expr)
+
+    def _emit_and_or(self, args, op, expr):
+        lhs, rhs = args
+        if NumpyRDDLCompiler._is_simple(rhs):
+            lhs, rhs = rhs, lhs  # prioritize simple expressions
+        lhs, ltype = self._emit(lhs)
+        self._check_type(lhs, ltype, BOOL,
+                         f'Argument 1 of logical operator {op}', expr)
+        block, rhs, rtype = self._block(rhs)
+        keyword = 'and' if op == '^' else 'or'
+        if not block and self._castable(rtype, BOOL):
+            return f'({lhs} {keyword} {rhs})', BOOL
+
+        result = self._assign(lhs)
+        self._line(f'if {result}:' if op == '^' else f'if not {result}:')
+        self._extend(block)
+        lines, self._lines = self._lines, []
+        self._check_type(rhs, rtype, BOOL,
+                         f'Argument 2 of logical operator {op}', expr)
+        check, self._lines = self._lines, lines
+        self._extend(check)
+        self._line(f'    {result} = {rhs}')
+        return result, BOOL
+
+    def _emit_and_or_grounded(self, args, op, expr):
+
+        # go through simple expressions first, complex expressions last, and
+        # skip the remaining arguments once the result is decided
+        indexed = list(enumerate(args))
+        indexed = [(i, arg) for i, arg in indexed
+                   if NumpyRDDLCompiler._is_simple(arg)] + \
+                  [(i, arg) for i, arg in indexed
+                   if not NumpyRDDLCompiler._is_simple(arg)]
+        blocks = []
+        for i, arg in indexed:
+            block, value, vtype = self._block(arg)
+            lines, self._lines = self._lines, []
+            self._check_type(value, vtype, BOOL,
+                             f'Argument {i + 1} of logical operator {op}', expr)
+            block.extend(self._lines)
+            self._lines = lines
+            blocks.append((block, value))
+        keyword = ' and ' if op == '^' else ' or '
+        if not any(block for block, _ in blocks):
+            return f'({keyword.join(value for _, value in blocks)})', BOOL
+
+        result = self._temp()
+        for j, (block, value) in enumerate(blocks):
+            if j == 0:
+                self._extend(block, '')
+                self._line(f'{result} = {value}')
+            else:
+                self._line(f'if {result}:' if op == '^'
+                           else f'if not {result}:')
+                self._extend(block)
+                self._line(f'    {result} = {value}')
+        return result, BOOL
+
+    # ===========================================================================
+    # function
+    # ===========================================================================
+
+    def _emit_func(self, expr):
+        sim = self.sim
+        _, name = expr.etype
+        args = expr.args
+        if isinstance(args, type(expr)):
+            args = (args,)
+
+        if name in ScalarRDDLCompiler.UNARY:
+            sim._check_arity(args, 1, f'Unary function {name}', expr)
+            arg, = args
+            value, vtype = self._emit(arg)
+            form, ftype = ScalarRDDLCompiler.UNARY[name]
+            if name == 'sgn':
+                value = self._atom(value)
+            return form.format(value), ftype or _numeric(vtype)
+
+        elif name in ScalarRDDLCompiler.BINARY:
+            sim._check_arity(args, 2, f'Binary function {name}', expr)
+            lhs, rhs = args
+            lhs, ltype = self._emit(lhs)
+            rhs, rtype = self._emit(rhs)
+            form, ftype = ScalarRDDLCompiler.BINARY[name]
+            if name == 'pow':
+                ftype = None  # negative integer powers are real
+            elif ftype is None:
+                ftype = _numeric(_promote(ltype, rtype))
+            return '(' + form.format(lhs, rhs) + ')', ftype
+
+        sim._raise_unsupported(f'Function {name}', expr)
+
+    # ===========================================================================
+    # control flow
+    # ===========================================================================
+
+    def _emit_control(self, expr):
+        sim = self.sim
+        _, op = expr.etype
+        args = expr.args
+        sim._check_op(op, {'if'}, 'Control', expr)
+        sim._check_arity(args, 3, 'If then else', expr)
+
+        # only the branch that is taken is evaluated
+        pred, arg1, arg2 = args
+        pred, ptype = self._emit(pred)
+        self._check_type(pred, ptype, BOOL, 'Predicate', expr)
+        block1, value1, type1 = self._block(arg1)
+        block2, value2, type2 = self._block(arg2)
+        vtype = _promote(type1, type2)
+        if not block1 and not block2:
+            return f'({value1} if {pred} else {value2})', vtype
+
+        result = self._temp()
+        self._line(f'if {pred}:')
+        self._extend(block1)
+        self._line(f'    {result} = {value1}')
+        self._line('else:')
+        self._extend(block2)
+        self._line(f'    {result} = {value2}')
+        return result, vtype
+
+    # ===========================================================================
+    # random variables
+    # ===========================================================================
+
+    def _emit_random(self, expr):
+        _, name = expr.etype
+        if name not in ScalarRDDLCompiler.RANDOM:  # no support for enum
+            self.sim._raise_unsupported(f'Distribution {name}', expr)
+
+        params, checks, sample, vtype = ScalarRDDLCompiler.RANDOM[name]
+        args = expr.args
+        self.sim._check_arity(args, len(params), name, expr)
+        values, types = {}, {}
+        for param, arg in zip(params, args):
+            value, types[param] = self._emit(arg)
+            values[param] = self._atom(value)
+        values['expr'] = self._trace(expr)
+        if name == 'Binomial' and not self._castable(types['count'], INT):
+            self._line(f"_check_type({values['count']}, np.int64, "
+                       f"'Binomial count', {values['expr']})")
+        for condition, check in checks:
+            self._line(f'if {condition.format(**values)}:')
+            self._line('    ' + check.format(**values))
+
+        # the argument of a delta is checked to have an integer or real type
+        atype = types.get('arg', None)
+        if name == 'KronDelta':
+            if not self._castable(atype, INT):
+                self._line(f"_check_type_in({values['arg']}, {{bool, np.int64}}, "
+                           f"'Argument of KronDelta', {values['expr']})")
+            return values['arg'], atype
+        elif name == 'DiracDelta':
+            return values['arg'], REAL if atype is None else atype
+        return self._assign(sample.format(**values)), vtype
@@ -0,0 +1,883 @@
+import hashlib
+import importlib.util
+import os
+import sys
+import tempfile
+import types
+
+import numpy as np
+
+import pyRDDLGym
+from pyRDDLGym.Core.ErrorHandling.RDDLException import RDDLInvalidObjectError
+from pyRDDLGym.Core.ErrorHandling.RDDLException import RDDLNotImplementedError
+from pyRDDLGym.Core.ErrorHandling.RDDLException import RDDLUndefinedVariableError
+
+from pyRDDLGym.Core.Compiler.RDDLDecompiler import RDDLDecompiler
+from pyRDDLGym.Core.Compiler.RDDLModelCache import RDDLModelCache
+from pyRDDLGym.Core.Parser.expr import Expression
+from pyRDDLGym.Core.Simulator.NumpyRDDLCompiler import NumpyRDDLCompiler
+from pyRDDLGym.Core.Simulator.RDDLTensors import RDDLTensors
+
+HEADER = '''# Generated by pyRDDLGym {version} for domain <{domain}>, instance <{instance}>.
+# This file is a cache entry that is regenerated when the model changes.
+import numpy as np
+
+from pyRDDLGym.Core.Simulator.RDDLSimulator import RDDLSimulator as _RDDLSimulator
+from pyRDDLGym.Core.Simulator.RDDLSimulator import lngamma as _lngamma
+from pyRDDLGym.Core.Simulator.RDDLTensors import RDDLTensors as _RDDLTensors
+
+_numeric = _RDDLTensors.numeric
+_check_type = _RDDLSimulator._check_type
+_check_type_in = _RDDLSimulator._check_type_in
+_check_positive = _RDDLSimulator._check_positive
+_check_bounds = _RDDLSimulator._check_bounds
+_check_range = _RDDLSimulator._check_range
+'''
+
+
+class SourceRDDLCompiler(NumpyRDDLCompiler):
+    '''Compiles a RDDL model into the source of a Python module, in which every
+    CPF, the reward and every constraint is a flat function of straight-line
+    numpy statements over temporaries, and a single step function evaluates
+    all CPFs in level order followed by the reward.
+
+    The generated code performs the same operations, value checks and random
+    draws in the same order as the closures of NumpyRDDLCompiler, so that both
+    produce the same results, but without a Python call per expression node.
+    Control flow that depends on values (short-circuit products and logical
+    operators, and if-then-else) becomes if statements, in which each operand
+    is evaluated at most once. The CPFs of every level are evaluated in
+    sorted order, so that the module does not depend on the iteration order
+    of the level sets (which can change between processes), and this order
+    is also given to the simulator.
+
+    The module is written to the cache directory under a hash of the model,
+    and later simulators of the same model import it from there (from its
+    compiled bytecode) without generating it again. Its source is also kept
+    in the source attribute for debugging. Aggregations over sparse
+    non-fluents call the reduce method of their plans, which are computed
+    again when the module is loaded (from the location of each aggregation
+    in the model, which is recorded in the module).
+    '''
+
+    VERSION = 2
+
+    NUMPY_TYPES = {RDDLTensors.INT: 'np.int64', RDDLTensors.REAL: 'np.float64',
+                   bool: 'bool'}
+
+    ARITHMETIC = {'+': 'np.add', '-': 'np.subtract', '*': 'np.multiply',
+                  '/': 'np.divide'}
+    RELATIONAL = {'>=': 'np.greater_equal', '<=': 'np.less_equal',
+                  '<': 'np.less', '>': 'np.greater', '==': 'np.equal',
+                  '~=': 'np.not_equal'}
+    LOGICAL = {'~': 'np.logical_xor({}, {})',
+               '=>': 'np.logical_or(np.logical_not({}), {})',
+               '<=>': 'np.equal({}, {})'}
+    AGGREGATION = {'sum': 'np.sum', 'avg': 'np.mean', 'prod': 'np.prod',
+                   'min': 'np.min', 'max': 'np.max', 'forall': 'np.all',
+                   'exists': 'np.any'}
+    UNARY = {
+        'abs': 'np.abs({})',
+        'sgn': 'np.sign({}).astype(np.int64)',
+        'round': 'np.round({}).astype(np.int64)',
+        'floor': 'np.floor({}).astype(np.int64)',
+        'ceil': 'np.ceil({}).astype(np.int64)',
+        'cos': 'np.cos({})',
+        'sin': 'np.sin({})',
+        'tan': 'np.tan({})',
+        'acos': 'np.arccos({})',
+        'asin': 'np.arcsin({})',
+        'atan': 'np.arctan({})',
+        'cosh': 'np.cosh({})',
+        'sinh': 'np.sinh({})',
+        'tanh': 'np.tanh({})',
+        'exp': 'np.exp({})',
+        'ln': 'np.log({})',
+        'sqrt': 'np.sqrt({})',
+        'lngamma': '_lngamma({})',
+        'gamma': 'np.exp(_lngamma({}))'
+    }
+    BINARY = {
+        'div': 'np.floor_divide({}, {}).astype(np.int64)',
+        'mod': 'np.mod({}, {}).astype(np.int64)',
+        'min': 'np.minimum({}, {})',
+        'max': 'np.maximum({}, {})',
+        'pow': 'np.power({}, {})',
+        'log': 'np.log({}) / np.log({})'
+    }
+
+    # the parameters, value checks and sample of every distribution, where
+    # size is the sample size (None for scalars) and shape the sample shape
+    RANDOM = {
+        'KronDelta': (('arg',), [
+            "_check_type_in({arg}, {{bool, np.int64}}, "
+            "'Argument of KronDelta', {expr})"],
+            '{arg}'),
+        'DiracDelta': (('arg',), [
+            "_check_type({arg}, np.float64, 'Argument of DiracDelta', {expr})"],
+            '{arg}'),
+        'Uniform': (('lb', 'ub'), [
+            "_check_bounds({lb}, {ub}, 'Uniform', {expr})"],
+            'rng.uniform({lb}, {ub}, size={size})'),
+        'Bernoulli': (('pr',), [
+            "_check_range({pr}, 0, 1, 'Bernoulli p', {expr})"],
+            'rng.uniform(size={shape}) <= {pr}'),
+        'Normal': (('mean', 'var'), [
+            "_check_positive({var}, False, 'Normal variance', {expr})"],
+            'rng.normal({mean}, np.sqrt({var}), size={size})'),
+        'Poisson': (('rate',), [
+            "_check_positive({rate}, False, 'Poisson rate', {expr})"],
+            'rng.poisson({rate}, size={size})'),
+        'Exponential': (('scale',), [
+            "_check_positive({scale}, True, 'Exponential rate', {expr})"],
+            'rng.exponential({scale}, size={size})'),
+        'Weibull': (('shape_', 'scale'), [
+            "_check_positive({shape_}, True, 'Weibull shape', {expr})",
+            "_check_positive({scale}, True, 'Weibull scale', {expr})"],
+            '{scale} * rng.weibull({shape_}, size={size})'),
+        'Gamma': (('shape_', 'scale'), [
+            "_check_positive({shape_}, True, 'Gamma shape', {expr})",
+            "_check_positive({scale}, True, 'Gamma scale', {expr})"],
+            'rng.gamma({shape_}, {scale}, size={size})'),
+        'Binomial': (('count', 'pr'), [
+            "_check_type({count}, np.int64, 'Binomial count', {expr})",
+            "_check_positive({count}, False, 'Binomial count', {expr})",
+            "_check_range({pr}, 0, 1, 'Binomial p', {expr})"],
+            'rng.binomial({count}, {pr}, size={size})'),
+        'NegativeBinomial': (('count', 'pr'), [
+            "_check_positive({count}, True, 'NegativeBinomial r', {expr})",
+            "_check_range({pr}, 0, 1, 'NegativeBinomial p', {expr})"],
+            'rng.negative_binomial({count}, {pr}, size={size})'),
+        'Beta': (('shape_', 'rate'), [
+            "_check_positive({shape_}, True, 'Beta shape', {expr})",
+            "_check_positive({rate}, True, 'Beta rate', {expr})"],
+            'rng.beta({shape_}, {rate}, size={size})'),
+        'Geometric': (('pr',), [
+            "_check_range({pr}, 0, 1, 'Geometric p', {expr})"],
+            'rng.geometric({pr}, size={size})'),
+        'Pareto': (('shape_', 'scale'), [
+            "_check_positive({shape_}, True, 'Pareto shape', {expr})",
+            "_check_positive({scale}, True, 'Pareto scale', {expr})"],
+            '{scale} * rng.pareto({shape_}, size={size})'),
+        'Student': (('df',), [
+            "_check_positive({df}, True, 'Student df', {expr})"],
+            'rng.standard_t({df}, size={size})'),
+        'Gumbel': (('mean', 'scale'), [
+            "_check_positive({scale}, True, 'Gumbel scale', {expr})"],
+            'rng.gumbel({mean}, {scale}, size={size})'),
+        'Laplace': (('mean', 'scale'), [
+            "_check_positive({scale}, True, 'Laplace scale', {expr})"],
+            'rng.laplace({mean}, {scale}, size={size})'),
+        'Cauchy': (('mean', 'scale'), [
+            "_check_positive({scale}, True, 'Cauchy scale', {expr})"],
+            '{mean} + {scale} * rng.standard_cauchy(size={shape})'),
+        'Gompertz': (('shape_', 'scale'), [
+            "_check_positive({shape_}, True, 'Gompertz shape', {expr})",
+            "_check_positive({scale}, True, 'Gompertz scale', {expr})"],
+            'np.log(1.0 - np.log1p(-rng.uniform(size={shape})) / {shape_}) '
+            '/ {scale}')
+    }
+
+    def __init__(self, simulator, cache_dir: str=None,
+                 use_cache: bool=True) -> None:
+        '''Creates a new compiler for the model of the given simulator.
+
+        :param simulator: the RDDLSimulator whose model is compiled
+        :param cache_dir: the directory of the cache, or None to use the
+        directory of RDDLModelCache
+        :param use_cache: whether to read and write the generated module in
+        the cache directory
+        '''
+        super().__init__(simulator)
+        self.levels = {level: sorted(cpfs)
+                       for (level, cpfs) in simulator.levels.items()}
+        if cache_dir is None:
+            cache_dir = RDDLModelCache().cache_dir
+        self.cache_dir = os.path.join(cache_dir, 'source')
+        self.use_cache = use_cache
+        self.source = None
+        self.path = None
+
+    def key(self) -> str:
+        '''Returns a hash of everything that determines the generated source:
+        the model expressions, the objects and types of all variables, the
+        level ordering of the CPFs and the version of the generator.'''
+        rddl = self.rddl
+        digest = hashlib.sha256()
+        header = (f'pyRDDLGym={pyRDDLGym.__version__};'
+                  f'python={sys.version_info[0]}.{sys.version_info[1]};'
+                  f'source={SourceRDDLCompiler.VERSION};'
+                  f'grounded={rddl.is_grounded};'
+                  f'contraction={self.sim.contraction is not None};')
+        parts = [header, str(rddl.objects), str(rddl.variable_ranges),
+                 str(rddl.param_types), str(sorted(self.sim.init_values)),
+                 str(self.levels), str(rddl.reward)]
+        for cpfs in self.levels.values():
+            for cpf in cpfs:
+                objects, expr = rddl.cpfs[cpf]
+                parts.extend((cpf, str(objects), str(expr)))
+        for constraints in (rddl.invariants, rddl.preconditions, rddl.terminals):
+            parts.append(str(len(constraints)))
+            parts.extend(str(expr) for expr in constraints)
+        
+        # the aggregations done over sparse non-fluents depend on their values
+        sparse = self.sim.sparse
+        if sparse is not None:
+            parts.append(f'sparse={sparse.density}')
+            for name, value in self.sim.init_values.items():
+                if rddl.variable_types[name] == 'non-fluent':
+                    parts.append(name + '=' + np.asarray(value).tobytes().hex())
+        for part in parts:
+            digest.update(part.encode('utf-8'))
+            digest.update(b'\0')
+        return digest.hexdigest()
+
+    def compile(self) -> None:
+        key = self.key()
+        path = os.path.join(self.cache_dir, f'rddl_{key}.py')
+        module = None
+        if self.use_cache and os.path.isfile(path):
+            module = self._import(key, path)
+            if module is not None:
+                module.SPARSE = self._plan_sparse(module.SPARSE_SITES)
+                module.CONTRACTIONS = self._plan_contractions(
+                    module.CONTRACTION_SITES)
+                if any(plan is None for plan in module.SPARSE) \
+                or any(plan is None for plan in module.CONTRACTIONS):
+                    module = None
+        if module is None:
+            self.source = self.generate()
+            module = self._exec(key, path, self.source)
+            module.SPARSE = self._sparse
+            module.CONTRACTIONS = self._contractions
+            if self.use_cache:
+                self._write(path, self.source)
+        else:
+            with open(path) as file:
+                self.source = file.read()
+        self.path = path
+
+        self.module = module
+        self.cpfs = {cpf: getattr(module, name)
+                     for (cpf, name) in module.CPFS.items()}
+        self.reward = module.reward
+        self.invariants = [getattr(module, name) for name in module.INVARIANTS]
+        self.preconditions = [getattr(module, name)
+                              for name in module.PRECONDITIONS]
+        self.termination = [getattr(module, name)
+                            for name in module.TERMINATIONS]
+        self.step = module.step
+        self.sim.levels = self.levels
+
+    # ===========================================================================
+    # loading and caching
+    # ===========================================================================
+
+    def _root(self, root):
+        kind, index = root
+        if kind == 'cpf':
+            return self.rddl.cpfs[index][1]
+        elif kind == 'reward':
+            return self.rddl.reward
+        return {'invariant': self.rddl.invariants,
+                'precondition': self.rddl.preconditions,
+                'termination': self.rddl.terminals}[kind][index]
+
+    @staticmethod
+    def _children(expr):
+        args = expr.args
+        if isinstance(args, Expression):
+            return [args]
+        elif isinstance(args, (list, tuple)):
+            return [arg for arg in args if isinstance(arg, Expression)]
+        return []
+
+    def _site(self, root, path):
+        expr = self._root(root)
+        for i in path:
+            expr = SourceRDDLCompiler._children(expr)[i]
+        return expr
+
+    def _plan_sparse(self, sites):
+        return [self.sim.sparse.plan(self._site(root, path), objects)
+                for (root, path, objects) in sites]
+
+    def _plan_contractions(self, sites):
+        return [self.sim.contraction.plan(self._site(root, path), objects)
+                for (root, path, objects) in sites]
+
+    @staticmethod
+    def _import(key, path):
+        try:
+            spec = importlib.util.spec_from_file_location(f'_rddl_{key}', path)
+            module = importlib.util.module_from_spec(spec)
+            spec.loader.exec_module(module)
+            return module
+        except Exception:
+            return None
+
+    @staticmethod
+    def _exec(key, path, source):
+        module = types.ModuleType(f'_rddl_{key}')
+        module.__file__ = path
+        exec(compile(source, path, 'exec'), module.__dict__)
+        return module
+
+    def _write(self, path, source):
+
+        # write to a temporary file and rename it, so that concurrent
+        # simulators never import a partially written module
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            fd, temp_path = tempfile.mkstemp(dir=self.cache_dir, suffix='.tmp')
+            try:
+                with os.fdopen(fd, 'w') as file:
+                    file.write(source)
+                os.replace(temp_path, path)
+            except Exception:
+                os.remove(temp_path)
+                raise
+        except OSError:
+            pass
+
+    # ===========================================================================
+    # code generation
+    # ===========================================================================
+
+    def generate(self) -> str:
+        '''Returns the source of the module of the model.'''
+        rddl = self.rddl
+        ast = rddl._AST
+        self._constants = []
+        self._traces = {}
+        self._names = set()
+        self._sparse = []
+        self._sites = []
+        self._contractions = []
+        self._contraction_sites = []
+
+        functions = []
+        step = ['def step(subs, rng):',
+                "    '''Evaluates all CPFs in level order, and returns the "
+                "reward.'''"]
+        cpf_names = {}
+        for level, cpfs in self.levels.items():
+            step.append('')
+            step.append(f'    # level {level}')
+            for cpf in cpfs:
+                objects, expr = rddl.cpfs[cpf]
+                body, value = self._function_body(expr, objects, ('cpf', cpf))
+                name = cpf_names[cpf] = self._function_name('cpf_' + cpf)
+                dtype = SourceRDDLCompiler.NUMPY_TYPES[self.sim.cpf_types[cpf]]
+                trace = self._trace(expr)
+                functions.append(self._function(name, body, value, cpf))
+                step.append(f'    # {cpf}')
+                step.extend('    ' + line for line in body)
+                step.append(f'    _check_type({value}, {dtype}, '
+                            f'{repr(f"CPF <{cpf}>")}, {trace})')
+                step.append(f'    subs[{repr(cpf)}] = {value}')
+
+        body, value = self._function_body(rddl.reward, [], ('reward', None))
+        functions.append(self._function('reward', body, value, 'reward'))
+        step.append('')
+        step.append('    # reward')
+        step.extend('    ' + line for line in body)
+        step.append(f'    return float({value})')
+
+        constraints = {}
+        for prefix, exprs in (('invariant', rddl.invariants),
+                              ('precondition', rddl.preconditions),
+                              ('termination', rddl.terminals)):
+            constraints[prefix] = []
+            for i, expr in enumerate(exprs):
+                name = f'{prefix}_{i + 1}'
+                body, value = self._function_body(expr, [], (prefix, i))
+                functions.append(self._function(
+                    name, body, value, f'{prefix} {i + 1}'))
+                constraints[prefix].append(name)
+
+        lines = [HEADER.format(version=pyRDDLGym.__version__,
+                               domain=ast.domain.name,
+                               instance=ast.instance.name)]
+        lines.append('# constants and expressions for error messages')
+        lines.extend(self._constants)
+        lines.append('')
+        for function in functions:
+            lines.extend(['', function])
+        lines.extend(['', '\n'.join(step), ''])
+        lines.append(f'CPFS = {repr(cpf_names)}')
+        lines.append(f'INVARIANTS = {repr(constraints["invariant"])}')
+        lines.append(f'PRECONDITIONS = {repr(constraints["precondition"])}')
+        lines.append(f'TERMINATIONS = {repr(constraints["termination"])}')
+        lines.append('')
+        lines.append('# locations of the aggregations over sparse non-fluents, '
+                     'whose plans are')
+        lines.append('# assigned to SPARSE when the module is loaded')
+        lines.append(f'SPARSE_SITES = {repr(self._sites)}')
+        lines.append('SPARSE = None')
+        lines.append('')
+        lines.append('# locations of the aggregations over products, whose '
+                     'contractions are')
+        lines.append('# assigned to CONTRACTIONS when the module is loaded')
+        lines.append(f'CONTRACTION_SITES = {repr(self._contraction_sites)}')
+        lines.append('CONTRACTIONS = None')
+        return '\n'.join(lines) + '\n'
+
+    def _function_name(self, name):
+        name = ''.join(c if c.isalnum() else '_' for c in name)
+        unique, i = name, 1
+        while unique in self._names:
+            i += 1
+            unique = f'{name}_{i}'
+        self._names.add(unique)
+        return unique
+
+    def _function(self, name, body, value, title):
+        lines = [f'def {name}(subs, rng):',
+                 f"    '''Evaluates {title}.'''"]
+        lines.extend('    ' + line for line in body)
+        lines.append(f'    return {value}')
+        return '\n'.join(lines)
+
+    def _function_body(self, expr, objects, root):
+        self._location = root
+        self._paths = {}
+        self._index_paths(expr, ())
+        self._temps = 0
+        self._lines = []
+        self._indent = ''
+        value = self._emit(expr, objects)
+        return self._lines, value
+
+    def _index_paths(self, expr, path):
+        self._paths[id(expr)] = path
+        for i, child in enumerate(SourceRDDLCompiler._children(expr)):
+            self._index_paths(child, path + (i,))
+
+    def _temp(self):
+        self._temps += 1
+        return f't{self._temps}'
+
+    def _line(self, line):
+        self._lines.append(self._indent + line)
+
+    def _assign(self, code):
+        temp = self._temp()
+        self._line(f'{temp} = {code}')
+        return temp
+
+    def _constant(self, code, prefix='C'):
+        name = f'{prefix}{len(self._constants) + 1}'
+        self._constants.append(f'{name} = {code}')
+        return name
+
+    def _trace(self, expr):
+        name = self._traces.get(id(expr), None)
+        if name is None:
+            trace = RDDLDecompiler().decompile_expr(expr)
+            name = self._traces[id(expr)] = self._constant(repr(trace), 'E')
+        return name
+
+    @staticmethod
+    def _literal(value):
+        value = getattr(value, 'item', lambda: value)()
+        if isinstance(value, float) and value != value:
+            return 'float("nan")'
+        elif isinstance(value, float) and abs(value) == float('inf'):
+            return f'float("{value}")'
+        return repr(value)
+
+    def _emit(self, expr, objects):
+        etype, _ = expr.etype
+        if etype == 'constant':
+            return self._emit_constant(expr, objects)
+        elif etype == 'pvar':
+            return self._emit_pvar(expr, objects)
+        elif etype == 'arithmetic':
+            return self._emit_arithmetic(expr, objects)
+        elif etype == 'relational':
+            return self._emit_relational(expr, objects)
+        elif etype == 'boolean':
+            return self._emit_logical(expr, objects)
+        elif etype == 'aggregation':
+            return self._emit_aggregation(expr, objects)
+        elif etype == 'func':
+            return self._emit_func(expr, objects)
+        elif etype == 'control':
+            return self._emit_control(expr, objects)
+        elif etype == 'randomvar':
+            return self._emit_random(expr, objects)
+        else:
+            raise RDDLNotImplementedError(
+                f'Internal error: expression {expr} is not recognized.')
+
+    # ===========================================================================
+    # leaves
+    # ===========================================================================
+
+    def _emit_constant(self, expr, objects):
+        value = SourceRDDLCompiler._literal(expr.args)
+        if self.rddl.is_grounded:
+            return self._constant(f'np.asarray({value})')
+        shape = tuple(len(self.rddl.objects[ptype]) for _, ptype in objects)
+        return self._constant(f'np.full(shape={shape}, fill_value={value})')
+
+    def _emit_pvar(self, expr, objects):
+        sim = self.sim
+        _, name = expr.etype
+        args = expr.args
+        sim._check_arity(args, 2, f'Variable <{name}>', expr)
+
+        var, pvars = args
+        if var not in sim.init_values:
+            raise RDDLUndefinedVariableError(
+                f'Variable <{var}> is not defined in the instance.\n' +
+                sim._print_stack_trace(expr))
+        value = f'subs[{repr(var)}]'
+        if self.rddl.is_grounded:
+            return self._assign(f'np.asarray({value})')
+
+        # argument is reshaped to match the free variables "objects"
+        _, out_shape, new_axis, use_einsum, use_tr, subscripts = \
+            self.tensors.transform_info(
+                var, pvars, objects, msg=sim._print_stack_trace(expr))
+        if new_axis:
+            value = (f'np.broadcast_to(np.expand_dims({value}, '
+                     f'axis={new_axis}), shape={out_shape})')
+        if use_einsum:
+            value = f'np.einsum({repr(subscripts)}, {value})'
+        elif use_tr:
+            axes = tuple(int(axis) for axis in subscripts)
+            value = f'np.transpose({value}, axes={axes})'
+        return self._assign(value)
+
+    # ===========================================================================
+    # arithmetic
+    # ===========================================================================
+
+    def _emit_arithmetic(self, expr, objects):
+        sim = self.sim
+        _, op = expr.etype
+        sim._check_op(op, sim.ARITHMETIC_OPS, 'Arithmetic', expr)
+
+        args = expr.args
+        n = len(args)
+        if n == 1 and op == '-':
+            arg, = args
+            return self._assign(f'-1 * {self._emit(arg, objects)}')
+
+        elif n == 2:
+            if op == '*':
+                return self._emit_product(args, objects)
+            lhs, rhs = args
+            lhs = self._emit(lhs, objects)
+            rhs = self._emit(rhs, objects)
+            np_op = SourceRDDLCompiler.ARITHMETIC[op]
+            return self._assign(f'{np_op}(_numeric({lhs}), _numeric({rhs}))')
+
+        elif self.rddl.is_grounded and n > 0:
+            if op == '*':
+                return self._emit_product_grounded(args, objects)
+            elif op == '+':
+                samples = [self._emit(arg, objects) for arg in args]
+                return self._assign(f'np.sum([{", ".join(samples)}], axis=0)')
+
+        sim._check_arity(args, 2, 'Arithmetic operator', expr)
+
+    def _emit_product(self, args, objects):
+        lhs, rhs = args
+        if NumpyRDDLCompiler._is_simple(rhs):
+            lhs, rhs = rhs, lhs
+        lhs = self._assign(f'_numeric({self._emit(lhs, objects)})')
+        result = self._temp()
+        self._line(f'if not np.any({lhs}):')
+        self._line(f'    {result} = {lhs}')
+        self._line('else:')
+        self._indent += '    '
+        rhs = self._emit(rhs, objects)
+        self._line(f'{result} = {lhs} * {rhs}')
+        self._indent = self._indent[:-4]
+        return result
+
+    def _emit_product_grounded(self, args, objects):
+
+        # go through simple expressions first, complex expressions last, and
+        # skip the remaining factors once the product is zero
+        simple = [arg for arg in args if NumpyRDDLCompiler._is_simple(arg)]
+        compound = [arg for arg in args if not NumpyRDDLCompiler._is_simple(arg)]
+        prod = self._assign('1')
+        for i, arg in enumerate(simple + compound):
+            if i > 0:
+                self._line(f'if {prod} != 0:')
+                self._indent += '    '
+            sample = self._emit(arg, objects)
+            self._line(f'{prod} *= {sample}.item()')
+            if i > 0:
+                self._indent = self._indent[:-4]
+        return self._assign(f'np.asarray({prod})')
+
+    # ===========================================================================
+    # boolean
+    # ===========================================================================
+
+    def _emit_relational(self, expr, objects):
+        sim = self.sim
+        _, op = expr.etype
+        args = expr.args
+        sim._check_op(op, sim.RELATIONAL_OPS, 'Relational', expr)
+        sim._check_arity(args, 2, f'Relational operator {op}', expr)
+
+        lhs, rhs = args
+        lhs = self._emit(lhs, objects)
+        rhs = self._emit(rhs, objects)
+        np_op = SourceRDDLCompiler.RELATIONAL[op]
+        return self._assign(f'{np_op}(_numeric({lhs}), _numeric({rhs}))')
+
+    def _check_type(self, value, valid, msg, expr):
+        self._line(f'_check_type({value}, {valid}, {repr(msg)}, '
+                   f'{self._trace(expr)})')
+
+    def _emit_logical(self, expr, objects):
+        sim = self.sim
+        _, op = expr.etype
+        args = expr.args
+        sim._check_op(op, sim.LOGICAL_OPS, 'Logical', expr)
+
+        n = len(args)
+        if n == 1 and op == '~':
+            arg, = args
+            arg = self._emit(arg, objects)
+            self._check_type(arg, 'bool', f'Argument of logical operator {op}',
+                             expr)
+            return self._assign(f'np.logical_not({arg})')
+
+        elif n == 2:
+            if op == '^' or op == '|':
+                return self._emit_and_or(args, op, expr, objects)
+            lhs, rhs = args
+            lhs = self._emit(lhs, objects)
+            rhs = self._emit(rhs, objects)
+            self._check_type(lhs, 'bool',
+                             f'Argument 1 of logical operator {op}', expr)
+            self._check_type(rhs, 'bool',
+                             f'Argument 2 of logical operator {op}', expr)
+            return self._assign(SourceRDDLCompiler.LOGICAL[op].format(lhs, rhs))
+
+        elif self.rddl.is_grounded and n > 0 and (op == '^' or op == '|'):
+            return self._emit_and_or_grounded(args, op, expr, objects)
+
+        sim._check_arity(args, 2, 'Logical operator', expr)
+
+    def _emit_and_or(self, args, op, expr, objects):
+        lhs, rhs = args
+        if NumpyRDDLCompiler._is_simple(rhs):
+            lhs, rhs = rhs, lhs  # prioritize simple expressions
+        lhs = self._emit(lhs, objects)
+        self._check_type(lhs, 'bool', f'Argument 1 of logical operator {op}',
+                         expr)
+        result = self._temp()
+        if op == '^':
+            self._line(f'if not np.any({lhs}):')
+        else:
+            self._line(f'if np.all({lhs}):')
+        self._line(f'    {result} = {lhs}')
+        self._line('else:')
+        self._indent += '    '
+        rhs = self._emit(rhs, objects)
+        self._check_type(rhs, 'bool', f'Argument 2 of logical operator {op}',
+                         expr)
+        np_op = 'np.logical_and' if op == '^' else 'np.logical_or'
+        self._line(f'{result} = {np_op}({lhs}, {rhs})')
+        self._indent = self._indent[:-4]
+        return result
+
+    def _emit_and_or_grounded(self, args, op, expr, objects):
+
+        # go through simple expressions first, complex expressions last, and
+        # skip the remaining arguments once the result is decided
+        indexed = list(enumerate(args))
+        indexed = [(i, arg) for i, arg in indexed
+                   if NumpyRDDLCompiler._is_simple(arg)] + \
+                  [(i, arg) for i, arg in indexed
+                   if not NumpyRDDLCompiler._is_simple(arg)]
+        is_and = op == '^'
+        result = self._assign(repr(is_and))
+        for j, (i, arg) in enumerate(indexed):
+            if j > 0:
+                self._line(f'if {result} == {is_and}:')
+                self._indent += '    '
+            sample = self._emit(arg, objects)
+            self._check_type(sample, 'bool',
+                             f'Argument {i + 1} of logical operator {op}', expr)
+            self._line(f'if bool({sample}) != {is_and}:')
+            self._line(f'    {result} = {not is_and}')
+            if j > 0:
+                self._indent = self._indent[:-4]
+        return self._assign(f'np.asarray({result})')
+
+    # ===========================================================================
+    # aggregation
+    # ===========================================================================
+
+    def _emit_aggregation(self, expr, objects):
+        sim = self.sim
+        if self.rddl.is_grounded:
+            raise Exception(f'Aggregation {expr} in grounded domain.')
+
+        _, op = expr.etype
+        args = expr.args
+        sim._check_op(op, sim.AGGREGATION_OPS, 'Aggregation', expr)
+
+        # reduced axes are counted from the end
+        * pvars, arg = args
+        new_objects = objects + [p[1] for p in pvars]
+        axis = tuple(range(-len(pvars), 0))
+
+        # check for undefined types
+        bad_types = {p for _, p in new_objects if p not in self.rddl.objects}
+        if bad_types:
+            raise RDDLInvalidObjectError(
+                f'Type(s) {bad_types} are not defined, '
+                f'must be one of {set(self.rddl.objects.keys())}.\n' +
+                sim._print_stack_trace(expr))
+
+        # check for duplicated iteration variables
+        for _, (free_new, _) in pvars:
+            for free_old, _ in objects:
+                if free_new == free_old:
+                    raise RDDLInvalidObjectError(
+                        f'Iteration variable <{free_new}> is already defined '
+                        f'in outer scope.\n' +
+                        sim._print_stack_trace(expr))
+
+        # aggregate over the nonzero entries of a sparse non-fluent
+        if sim.sparse is not None:
+            sparse = sim.sparse.plan(expr, objects)
+            if sparse is not None:
+                return self._emit_sparse_aggregation(sparse, expr, objects)
+
+        # contract the factors of a product with einsum
+        if sim.contraction is not None:
+            contraction = sim.contraction.plan(expr, objects)
+            if contraction is not None:
+                return self._emit_contraction(contraction, expr, objects)
+
+        arg = self._emit(arg, new_objects)
+        np_op = SourceRDDLCompiler.AGGREGATION[op]
+        if op == 'forall' or op == 'exists':
+            self._check_type(arg, 'bool', f'Argument of aggregation {op}', expr)
+            return self._assign(f'{np_op}({arg}, axis={axis})')
+        return self._assign(f'{np_op}(_numeric({arg}), axis={axis})')
+
+    def _emit_sparse_aggregation(self, sparse, expr, objects):
+        plan = f'SPARSE[{len(self._sparse)}]'
+        self._sparse.append(sparse)
+        self._sites.append(
+            (self._location, self._paths[id(expr)], list(objects)))
+        if sparse.arg is None:
+            return self._assign(f'{plan}.reduce(None)')
+
+        arg = self._emit(sparse.arg, sparse.arg_objects)
+        if sparse.logical:
+            self._check_type(arg, 'bool', 'Argument 2 of logical operator ^',
+                             expr)
+        return self._assign(f'{plan}.reduce({arg})')
+
+    def _emit_contraction(self, contraction, expr, objects):
+        plan = f'CONTRACTIONS[{len(self._contractions)}]'
+        self._contractions.append(contraction)
+        self._contraction_sites.append(
+            (self._location, self._paths[id(expr)], list(objects)))
+        factors = [self._emit(factor, f_objects)
+                   for (factor, f_objects) in zip(contraction.factors,
+                                                  contraction.factor_objects)]
+        return self._assign(f'{plan}.contract([{", ".join(factors)}])')
+
+    # ===========================================================================
+    # function
+    # ===========================================================================
+
+    def _emit_func(self, expr, objects):
+        sim = self.sim
+        _, name = expr.etype
+        args = expr.args
+        if isinstance(args, type(expr)):
+            args = (args,)
+
+        if name in SourceRDDLCompiler.UNARY:
+            sim._check_arity(args, 1, f'Unary function {name}', expr)
+            arg, = args
+            arg = self._emit(arg, objects)
+            return self._assign(
+                SourceRDDLCompiler.UNARY[name].format(f'_numeric({arg})'))
+
+        elif name in SourceRDDLCompiler.BINARY:
+            sim._check_arity(args, 2, f'Binary function {name}', expr)
+            lhs, rhs = args
+            lhs = self._emit(lhs, objects)
+            rhs = self._emit(rhs, objects)
+            return self._assign(SourceRDDLCompiler.BINARY[name].format(
+                f'_numeric({lhs})', f'_numeric({rhs})'))
+
+        sim._raise_unsupported(f'Function {name}', expr)
+
+    # ===========================================================================
+    # control flow
+    # ===========================================================================
+
+    def _emit_control(self, expr, objects):
+        sim = self.sim
+        _, op = expr.etype
+        args = expr.args
+        sim._check_op(op, {'if'}, 'Control', expr)
+        sim._check_arity(args, 3, 'If then else', expr)
+
+        # each branch is evaluated only if some element of pred selects it
+        pred, arg1, arg2 = args
+        pred = self._emit(pred, objects)
+        self._check_type(pred, 'bool', 'Predicate', expr)
+        count = self._assign(f'np.sum({pred})')
+        result = self._temp()
+        value1 = self._emit_block(f'if {count} != 0:', arg1, objects)
+        value2 = self._emit_block(f'if {count} != {pred}.size:', arg2, objects)
+        self._line(f'if {count} == {pred}.size:')
+        self._line(f'    {result} = {value1}')
+        self._line(f'elif {count} == 0:')
+        self._line(f'    {result} = {value2}')
+        self._line('else:')
+        self._line(f'    {result} = np.where({pred}, {value1}, {value2})')
+        return result
+
+    def _emit_block(self, header, expr, objects):
+        
+        # the block is omitted if the expression needs no statements
+        start = len(self._lines)
+        self._line(header)
+        self._indent += '    '
+        value = self._emit(expr, objects)
+        self._indent = self._indent[:-4]
+        if len(self._lines) == start + 1:
+            self._lines.pop()
+        return value
+
+    # ===========================================================================
+    # random variables
+    # ===========================================================================
+
+    def _emit_random(self, expr, objects):
+        _, name = expr.etype
+        if name not in SourceRDDLCompiler.RANDOM:  # no support for enum
+            self.sim._raise_unsupported(f'Distribution {name}', expr)
+
+        params, checks, sample = SourceRDDLCompiler.RANDOM[name]
+        args = expr.args
+        self.sim._check_arity(args, len(params), name, expr)
+        values = {param: self._emit(arg, objects)
+                  for (param, arg) in zip(params, args)}
+        shape = self._sample_shape(objects)
+        values['shape'] = repr(shape)
+        values['size'] = repr(shape or None)
+        values['expr'] = self._trace(expr)
+        for check in checks:
+            self._line(check.format(**values))
+        return self._assign(sample.format(**values))
@@ -83,9 +83,7 @@ def main():
     instance = EnvInfo.get_instance(0)
     
     rddltxt = RDDLReader(domain, instance).rddltxt
-    rddlparser = parser.RDDLParser()
-    rddlparser.build()
-    ast = rddlparser.parse(rddltxt)
+    ast = parser.RDDLParser.shared().parse(rddltxt)
     
     model = RDDLLiftedModel(ast)
     key = jax.random.PRNGKey(np.random.randint(0, 2 ** 31))
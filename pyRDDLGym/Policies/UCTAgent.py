@@ -0,0 +1,324 @@
+import itertools
+import math
+import time
+import numpy as np
+from gym.spaces import Discrete
+from typing import Dict, List
+
+from pyRDDLGym.Core.ErrorHandling.RDDLException import RDDLActionPreconditionNotSatisfiedError
+from pyRDDLGym.Core.ErrorHandling.RDDLException import RDDLNotImplementedError
+from pyRDDLGym.Core.ErrorHandling.RDDLException import RDDLValueOutOfRangeError
+
+from pyRDDLGym.Core.Env.RDDLEnv import RDDLEnv
+from pyRDDLGym.Core.Simulator.RDDLRandom import RDDLRandom
+from pyRDDLGym.Core.Simulator.RDDLSimulator import RDDLSimulator
+from pyRDDLGym.Policies.Agents import BaseAgent
+
+
+class _Node:
+
+    __slots__ = ('visits', 'total', 'children')
+
+    def __init__(self) -> None:
+        self.visits = 0
+        self.total = 0.0
+        self.children = {}
+
+
+class UCTAgent(BaseAgent):
+    '''An online planner that chooses every action by Monte-Carlo tree search
+    with the UCT rule, using the simulator of the environment as a model.
+
+    The search tree is open-loop: its nodes are sequences of actions, and the
+    states reached by a sequence are sampled anew in every iteration. Every
+    iteration restores a snapshot of the current state of the environment in
+    a private compiled simulator that shares the model and tensors of the
+    environment and passes fluents as tensors, descends the tree by UCB1 on
+    returns
+    normalized to [0, 1], expands one action, and completes the episode (up
+    to the search depth) with uniformly random actions.
+
+    The candidate actions are combinations of at most max-nondef-actions
+    non-default values of the bool and int action-fluents, which are sampled
+    when a node is expanded rather than enumerated up front. A node gets a new
+    child only while it has fewer than widening * sqrt(visits) children
+    (progressive widening), so that the search deepens even when there are
+    far more actions than iterations. Real-valued action-fluents keep their
+    default values unless the candidate actions are given explicitly. If the
+    environment enforces action constraints, actions whose preconditions do
+    not hold in the sampled state are skipped.
+    '''
+    
+    # the number of actions sampled to find an untried one when expanding
+    SAMPLES = 8
+
+    def __init__(self, env: RDDLEnv,
+                 iterations: int=None,
+                 time_limit: float=None,
+                 depth: int=None,
+                 exploration: float=math.sqrt(2),
+                 widening: float=1.0,
+                 actions: List[Dict]=None,
+                 seed: int=None) -> None:
+        '''Creates a new planner for the given environment.
+
+        :param env: the environment in which the agent acts (it is not
+        modified by the search)
+        :param iterations: the number of iterations of search per action
+        :param time_limit: the time in seconds of search per action (if both
+        iterations and time_limit are given, search stops at the first limit)
+        :param depth: the largest number of steps simulated in an iteration,
+        or None to simulate up to the horizon
+        :param exploration: the exploration constant of UCB1
+        :param widening: the number of children of a node is at most
+        widening times the square root of its number of visits, or None to
+        expand every candidate action before descending further
+        :param actions: the candidate actions (as dicts of grounded action
+        fluents with non-default values), or None to sample them from all
+        combinations of at most max-nondef-actions bool and int values
+        :param seed: the seed of the random rollout policy and of the
+        simulator used for search
+        '''
+        if iterations is None and time_limit is None:
+            raise RDDLValueOutOfRangeError(
+                'At least one of iterations or time_limit must be given.')
+        if env.fluent_format != 'grounded':
+            raise RDDLNotImplementedError(
+                'UCT search requires grounded fluents.')
+        self.env = env
+        self.iterations = iterations
+        self.time_limit = time_limit
+        self.depth = depth
+        self.exploration = exploration
+        self.widening = widening
+        self.rng = np.random.default_rng(seed)
+        self.actions = actions
+        
+        # the non-default values of every discrete action-fluent are sampled
+        # from its space, which is never enumerated
+        self._spaces = []
+        if actions is None:
+            for name, space in env.action_space.spaces.items():
+                if isinstance(space, Discrete) and space.n > 1:
+                    is_bool = env.model.actionsranges[name] == 'bool'
+                    self._spaces.append(
+                        (name, int(space.start), int(space.n),
+                         int(env.defaultAction[name]), is_bool))
+        self._max_actions = min(env.max_allowed_actions, len(self._spaces))
+        
+        # tensor fluents avoid grounding the state at every simulated step
+        sampler = env.sampler
+        self.sim = RDDLSimulator(
+            sampler.rddl, rng=RDDLRandom(seed).generator(), compiled=True,
+            fluent_format='tensor', levels=sampler.levels,
+            tensors=sampler.tensors)
+        self._candidates = {}
+        self.stats = {}
+        self._bounds = (math.inf, -math.inf)
+        self._deadline = math.inf
+
+    @staticmethod
+    def enumerate_actions(env: RDDLEnv) -> List[Dict]:
+        '''Returns all combinations of at most max-nondef-actions non-default
+        values of the bool and int action-fluents of the environment,
+        starting with the default action. The number of combinations grows
+        exponentially with max-nondef-actions, so this is only practical for
+        small action spaces.'''
+        values = []
+        for name, space in env.action_space.spaces.items():
+            if isinstance(space, Discrete):
+                default = env.defaultAction[name]
+                is_bool = env.model.actionsranges[name] == 'bool'
+                for value in range(space.start, space.start + space.n):
+                    if value != default:
+                        values.append(
+                            (name, bool(value) if is_bool else int(value)))
+
+        actions = [{}]
+        max_actions = min(env.max_allowed_actions, len(values))
+        for count in range(1, max_actions + 1):
+            for combination in itertools.combinations(values, count):
+                names = [name for (name, _) in combination]
+                if len(set(names)) == count:
+                    actions.append(dict(combination))
+        return actions
+
+    def _to_tensors(self, action):
+        rddl, sim = self.sim.rddl, self.sim
+        tensors = {}
+        for name, value in action.items():
+            var, objects = rddl.parse(name)
+            if var not in tensors:
+                tensors[var] = np.copy(sim.noop_actions[var])
+            if objects:
+                tensors[var][sim.tensors.coordinates(objects)] = value
+            else:
+                tensors[var] = np.asarray(value, dtype=tensors[var].dtype)
+        return tensors
+
+    # ===========================================================================
+    # search
+    # ===========================================================================
+
+    def _sample_action(self):
+        rng = self.rng
+        if self.actions is not None:
+            action = self.actions[rng.integers(len(self.actions))]
+        else:
+            action = {}
+            count = rng.integers(self._max_actions + 1)
+            spaces = self._spaces
+            for i in rng.choice(len(spaces), size=count, replace=False):
+                name, start, n, default, is_bool = spaces[i]
+                
+                # a uniform value of the space other than the default
+                if start <= default < start + n:
+                    value = start + rng.integers(n - 1)
+                    if value >= default:
+                        value += 1
+                else:
+                    value = start + rng.integers(n)
+                action[name] = bool(value) if is_bool else int(value)
+        return action
+    
+    def _sample_candidate(self):
+        action = self._sample_action()
+        key = tuple(sorted(action.items()))
+        if key not in self._candidates:
+            self._candidates[key] = (action, self._to_tensors(action))
+        return key
+
+    def _is_valid(self, tensors):
+        if not self.env.enforce_action_constraints:
+            return True
+        try:
+            self.sim.check_action_preconditions(tensors)
+            return True
+        except RDDLActionPreconditionNotSatisfiedError:
+            return False
+
+    def _can_widen(self, node):
+        if self.actions is not None and len(node.children) >= len(self.actions):
+            return False
+        if self.widening is None:
+            return True
+        return len(node.children) < self.widening * math.sqrt(node.visits + 1)
+
+    def _select(self, node):
+
+        # expand a new sampled action while the node can be widened; a few
+        # samples that are all tried already suggest that few are left
+        if self._can_widen(node):
+            for _ in range(UCTAgent.SAMPLES):
+                if time.perf_counter() >= self._deadline:
+                    return None
+                key = self._sample_candidate()
+                if key not in node.children \
+                and self._is_valid(self._candidates[key][1]):
+                    return key
+        if not node.children:
+            return None
+        
+        # otherwise, descend to the child with the highest UCB1 score
+        low, high = self._bounds
+        scale = high - low if high > low else 1.0
+        log_visits = math.log(max(node.visits, 1))
+        keys = list(node.children.keys())
+        scores = [
+            (child.total / max(child.visits, 1) - low) / scale +
+            self.exploration * math.sqrt(log_visits / max(child.visits, 1))
+            for child in node.children.values()]
+        for i in np.argsort(scores)[::-1]:
+            if self._is_valid(self._candidates[keys[i]][1]):
+                return keys[i]
+        return None
+
+    def _rollout(self, steps):
+        sim = self.sim
+        discount = self.env.discount
+        total, weight = 0.0, 1.0
+        for _ in range(steps):
+            if time.perf_counter() >= self._deadline:
+                break
+            action = self._to_tensors(self._sample_action())
+            if not self._is_valid(action):
+                action = {}
+            _, reward, done = sim.step(action)
+            total += weight * reward
+            weight *= discount
+            if done:
+                break
+        return total
+
+    def _iterate(self, root, snapshot, steps):
+        sim = self.sim
+        sim.restore(snapshot, rng=False)
+        discount = self.env.discount
+
+        # descend the tree by UCB1, and expand one node
+        path, rewards = [root], []
+        node, done = root, False
+        while len(rewards) < steps and not done:
+            key = self._select(node)
+            if key is None:
+                break
+            _, reward, done = sim.step(self._candidates[key][1])
+            rewards.append(reward)
+            expanded = key not in node.children
+            if expanded:
+                node.children[key] = _Node()
+            node = node.children[key]
+            path.append(node)
+            if expanded:
+                break
+
+        # complete the episode with random actions
+        future = 0.0
+        if not done and len(rewards) < steps:
+            future = self._rollout(steps - len(rewards))
+
+        # back up the discounted returns from every node of the path, and
+        # keep the bounds of the mean returns to normalize them in UCB1
+        low, high = self._bounds
+        value = future
+        for node, reward in zip(reversed(path[1:]), reversed(rewards)):
+            value = reward + discount * value
+            node.visits += 1
+            node.total += value
+            mean = node.total / node.visits
+            low, high = min(low, mean), max(high, mean)
+        self._bounds = (low, high)
+        root.visits += 1
+
+    def sample_action(self, state=None) -> Dict:
+        '''Returns the action chosen by search from the current state of the
+        environment (the state argument is ignored).'''
+        env = self.env
+        steps = env.horizon - env.currentH
+        if self.depth is not None:
+            steps = min(steps, self.depth)
+        snapshot = env.sampler.snapshot()
+
+        root = _Node()
+        self._bounds = (math.inf, -math.inf)
+        self._candidates = {}
+        iterations = 0
+        start = time.perf_counter()
+        self._deadline = math.inf
+        if self.time_limit is not None:
+            self._deadline = start + self.time_limit
+        while True:
+            if self.iterations is not None and iterations >= self.iterations:
+                break
+            if time.perf_counter() >= self._deadline:
+                break
+            self._iterate(root, snapshot, steps)
+            iterations += 1
+
+        self.stats = {'iterations': iterations,
+                      'time': time.perf_counter() - start,
+                      'children': len(root.children)}
+        if not root.children:
+            return {}
+        best = max(root.children.items(), key=lambda item: item[1].visits)[0]
+        return dict(self._candidates[best][0])
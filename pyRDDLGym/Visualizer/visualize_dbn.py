@@ -93,11 +93,8 @@ class RDDL2Graph:
         # Read and parse domain and instance
         reader = RDDLReader(domain, instance)
         domain = reader.rddltxt
-        parser = RDDLParser(None, False)
-        parser.build()
-
         # Parse RDDL file
-        rddl_ast = parser.parse(domain)
+        rddl_ast = RDDLParser.shared().parse(domain)
 
         # Ground domain
         grounder = RDDLGrounder(rddl_ast)
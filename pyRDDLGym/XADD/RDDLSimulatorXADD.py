@@ -2,6 +2,7 @@ from typing import cast, Union, Dict, Any
 import numpy as np
 
 from pyRDDLGym.Core.Simulator.RDDLSimulator import RDDLSimulatorWConstraints, RDDLSimulator
+from pyRDDLGym.Core.Simulator.RDDLRandom import RDDLRandom
 from pyRDDLGym.Core.Compiler.RDDLModel import PlanningModel
 from pyRDDLGym.Core.Parser.expr import Expression
 from pyRDDLGym.XADD.RDDLModelXADD import RDDLModelWXADD
@@ -11,11 +12,13 @@ from pyRDDLGym.XADD.RDDLLevelAnalysisXADD import RDDLLevelAnalysisWXADD
 class RDDLSimulatorWXADD(RDDLSimulatorWConstraints):
 
     def __init__(self, model: PlanningModel,
-                 rng: np.random.Generator=np.random.default_rng(),
+                 rng: np.random.Generator=None,
                  compute_levels: bool=True,
                  max_bound: float=np.inf) -> None:
         self._model = cast(RDDLModelWXADD, model)
         self.context = self._model._context
+        if rng is None:
+            rng = RDDLRandom().generator()
         self._rng = rng
         
         # perform a dependency analysis and topological sort to compute levels
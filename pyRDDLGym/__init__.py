@@ -1,2 +1,4 @@
+__version__ = '0.99.0'
+
 from pyRDDLGym.Core.Env import RDDLEnv as RDDLEnv
 from pyRDDLGym.Examples.ExampleManager import ExampleManager
@@ -0,0 +1,42 @@
+import os
+import tempfile
+import warnings
+
+from pyRDDLGym.Core.Compiler.RDDLModelCache import RDDLModelCache
+from pyRDDLGym.Examples.ExampleManager import ExampleManager
+
+
+def test_cache_round_trip():
+    env_info = ExampleManager.GetEnvInfo('Wildfire')
+    domain, instance = env_info.get_domain(), env_info.get_instance(0)
+    with tempfile.TemporaryDirectory() as cache_dir:
+        cache = RDDLModelCache(cache_dir)
+        model1, levels1, tensors1 = cache.load(domain, instance)
+        assert len(os.listdir(cache_dir)) == 1
+        
+        model2, levels2, tensors2 = cache.load(domain, instance)
+        assert model2 is not model1
+        assert levels1 == levels2
+        assert model1.cpfs.keys() == model2.cpfs.keys()
+        for name, value in tensors1.init_values.items():
+            assert (tensors2.init_values[name] == value).all()
+        
+        # a corrupt entry is reported and rebuilt
+        path = os.path.join(cache_dir, os.listdir(cache_dir)[0])
+        with open(path, 'wb') as file:
+            file.write(b'not a pickle')
+        with warnings.catch_warnings(record=True) as caught:
+            warnings.simplefilter('always')
+            model3, _, _ = cache.load(domain, instance)
+        assert any('rebuilding' in str(w.message) for w in caught)
+        assert model3.cpfs.keys() == model1.cpfs.keys()
+        
+        other_info = ExampleManager.GetEnvInfo('MarsRover')
+        cache.load(other_info.get_domain(), other_info.get_instance(0))
+        assert len(os.listdir(cache_dir)) == 2
+        cache.clear()
+        assert not os.listdir(cache_dir)
+
+
+if __name__ == "__main__":
+    test_cache_round_trip()
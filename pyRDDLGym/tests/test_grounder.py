@@ -0,0 +1,31 @@
+from pyRDDLGym.Core.Grounder.RDDLGrounder import RDDLGrounder
+from pyRDDLGym.Core.Parser.parser import RDDLParser
+from pyRDDLGym.Core.Parser.RDDLReader import RDDLReader
+from pyRDDLGym.Examples.ExampleManager import ExampleManager
+
+DOMAINS = ['Wildfire', 'Elevators', 'RecSim', 'Traffic']
+
+
+def _ground(env_name, lazy):
+    env_info = ExampleManager.GetEnvInfo(env_name)
+    reader = RDDLReader(env_info.get_domain(), env_info.get_instance(0))
+    rddl_ast = RDDLParser.shared().parse(reader.rddltxt)
+    return RDDLGrounder(rddl_ast, lazy=lazy).Ground()
+
+
+def test_lazy_matches_eager():
+    for env_name in DOMAINS:
+        eager = _ground(env_name, lazy=False)
+        lazy = _ground(env_name, lazy=True)
+        assert list(eager.cpfs) == list(lazy.cpfs), env_name
+        name = next(iter(lazy.cpfs))
+        assert not lazy.cpfs.is_grounded(name), env_name
+        for name in eager.cpfs:
+            assert str(eager.cpfs[name][1]) == str(lazy.cpfs[name][1]), \
+                (env_name, name)
+            assert lazy.cpfs.is_grounded(name), (env_name, name)
+        assert str(eager.reward) == str(lazy.reward), env_name
+
+
+if __name__ == "__main__":
+    test_lazy_matches_eager()
@@ -0,0 +1,55 @@
+import numpy as np
+import time
+
+from pyRDDLGym.Core.Env.RDDLEnv import RDDLEnv
+from pyRDDLGym.Examples.ExampleManager import ExampleManager
+from pyRDDLGym.Policies.UCTAgent import UCTAgent
+
+
+def _play(env, agent, steps):
+    env.reset()
+    total_reward = 0.0
+    for _ in range(steps):
+        state = env.sampler.snapshot().values
+        action = agent.sample_action(env.state)
+        for name, value in env.sampler.snapshot().values.items():
+            assert np.all(value == state[name]), name
+        _, reward, done, _ = env.step(action)
+        total_reward += reward
+        if done:
+            break
+    return total_reward
+
+
+def test_uct_beats_noop():
+    env_info = ExampleManager.GetEnvInfo('Wildfire')
+    env = RDDLEnv(env_info.get_domain(), env_info.get_instance(0), seed=0)
+    actions = UCTAgent.enumerate_actions(env)
+    assert actions[0] == {}
+    assert all(len(action) <= env.max_allowed_actions for action in actions)
+    
+    agent = UCTAgent(env, iterations=50, depth=5, seed=0)
+    uct_reward = _play(env, agent, 20)
+    assert agent.stats['iterations'] == 50
+    noop_reward = _play(env, UCTAgent(env, iterations=1, actions=[{}]), 20)
+    assert uct_reward > noop_reward
+
+
+def test_uct_respects_time_limit():
+    
+    # far too many combinations of actions to enumerate
+    env_info = ExampleManager.GetEnvInfo('Traffic')
+    env = RDDLEnv(env_info.get_domain(), env_info.get_instance(0), seed=0)
+    env.reset()
+    start = time.perf_counter()
+    agent = UCTAgent(env, time_limit=0.2, depth=5, seed=0)
+    action = agent.sample_action(env.state)
+    assert time.perf_counter() - start < 1.0
+    assert agent.stats['iterations'] > 0
+    assert len(action) <= env.max_allowed_actions
+    env.step(action)
+
+
+if __name__ == "__main__":
+    test_uct_beats_noop()
+    test_uct_respects_time_limit()
@@ -0,0 +1,29 @@
+import io
+import pathlib
+
+from pyRDDLGym.Core.Parser.RDDLReader import RDDLReader
+from pyRDDLGym.Examples.ExampleManager import ExampleManager
+
+
+def test_reader_sources_agree():
+    env_info = ExampleManager.GetEnvInfo('Wildfire')
+    domain, instance = env_info.get_domain(), env_info.get_instance(0)
+    with open(domain) as file:
+        domain_text = file.read()
+    with open(instance) as file:
+        instance_text = file.read()
+    expected = RDDLReader(domain, instance).rddltxt
+    
+    assert RDDLReader.from_text(domain_text, instance_text).rddltxt == expected
+    
+    chunks = (instance_text[i:i + 10] for i in range(0, len(instance_text), 10))
+    assert RDDLReader(io.StringIO(domain_text), chunks).rddltxt == expected
+    
+    paths = RDDLReader(pathlib.Path(domain), pathlib.Path(instance))
+    assert paths.rddltxt == expected
+    
+    assert '//' not in expected
+
+
+if __name__ == "__main__":
+    test_reader_sources_agree()
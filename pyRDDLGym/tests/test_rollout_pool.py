@@ -0,0 +1,27 @@
+import numpy as np
+
+from pyRDDLGym.Core.Env.RDDLRolloutPool import RDDLRolloutPool
+from pyRDDLGym.Examples.ExampleManager import ExampleManager
+from pyRDDLGym.Policies.Agents import NoOpAgent
+
+
+def _run(env_name, num_workers, episodes=6):
+    env_info = ExampleManager.GetEnvInfo(env_name)
+    with RDDLRolloutPool(env_info.get_domain(), env_info.get_instance(0),
+                         num_workers=num_workers, seed=42) as pool:
+        assert pool._shm.size > 1, env_name
+        results = pool.run(NoOpAgent(None), episodes)
+    assert sorted(results) == list(range(episodes)), env_name
+    return [results[i]['total_reward'] for i in range(episodes)]
+
+
+def test_results_independent_of_workers():
+    for env_name in ['Wildfire', 'Traffic']:
+        rewards1 = _run(env_name, 1)
+        rewards2 = _run(env_name, 3)
+        assert rewards1 == rewards2, env_name
+        assert np.unique(rewards1).size > 1, env_name
+
+
+if __name__ == "__main__":
+    test_results_independent_of_workers()
@@ -0,0 +1,604 @@
+import numpy as np
+import os
+import re
+import subprocess
+import sys
+import tempfile
+
+from pyRDDLGym.Core.Compiler.RDDLLiftedModel import RDDLLiftedModel
+from pyRDDLGym.Core.Compiler.RDDLOptimizer import RDDLOptimizer
+from pyRDDLGym.Core.Env.RDDLEnv import RDDLEnv
+from pyRDDLGym.Core.Env.RDDLVectorEnv import RDDLVectorEnv
+from pyRDDLGym.Core.ErrorHandling.RDDLException import RDDLNotImplementedError
+from pyRDDLGym.Core.ErrorHandling.RDDLException import RDDLTypeError
+from pyRDDLGym.Core.ErrorHandling.RDDLException import RDDLValueOutOfRangeError
+from pyRDDLGym.Core.Parser.parser import RDDLParser
+from pyRDDLGym.Core.Parser.RDDLReader import RDDLReader
+from pyRDDLGym.Core.Simulator.BatchedRDDLSimulator import BatchedRDDLSimulator
+from pyRDDLGym.Core.Simulator.NumbaRDDLCompiler import NumbaRDDLCompiler
+from pyRDDLGym.Core.Simulator.RDDLProfiler import RDDLProfiler
+from pyRDDLGym.Core.Simulator.RDDLRandom import RDDLRandom
+from pyRDDLGym.Core.Simulator.RDDLSimulator import RDDLSimulator
+from pyRDDLGym.Core.Simulator.RDDLSimulator import RDDLSimulatorWConstraints
+from pyRDDLGym.Core.Simulator.ScalarRDDLCompiler import ScalarRDDLCompiler
+from pyRDDLGym.Core.Simulator.SourceRDDLCompiler import SourceRDDLCompiler
+from pyRDDLGym.Examples.ExampleManager import ExampleManager
+from pyRDDLGym.tests.test_grounder import _ground
+
+DOMAINS = ['PowerGeneration', 'Wildfire', 'MarsRover', 'Elevators', 'RecSim']
+
+
+def _load_model(env_name, intern=False):
+    env_info = ExampleManager.GetEnvInfo(env_name)
+    reader = RDDLReader(env_info.get_domain(), env_info.get_instance(0))
+    parser = RDDLParser(None, False, intern=intern)
+    parser.build()
+    return RDDLLiftedModel(parser.parse(reader.rddltxt))
+
+
+def _load_text(domain):
+    
+    # an instance of the domain with no objects and non-fluents
+    name = re.search(r'domain\s+(\w+)', domain).group(1)
+    instance = f'''
+    non-fluents nf_{name} {{
+        domain = {name};
+    }}
+    instance {name}_inst {{
+        domain = {name};
+        non-fluents = nf_{name};
+        max-nondef-actions = 1;
+        horizon = 5;
+        discount = 1.0;
+    }}
+    '''
+    reader = RDDLReader.from_text(domain, instance)
+    return RDDLLiftedModel(RDDLParser.shared().parse(reader.rddltxt))
+
+
+def _action_bounds(model):
+    return RDDLSimulatorWConstraints(model).bounds
+
+
+def _random_actions(sim, bounds, rng):
+    
+    # at most max-nondef-actions grounded actions, each a value within the 
+    # bounds of the action and close to its default (so that the powers of
+    # MarsRover stay below MAX-POWER, whose branch divides by the power of
+    # every rover, and 0 / 0 raises for a rover that is not moving)
+    defaults = {}
+    for var, value in sim.noop_actions.items():
+        names = [var] if sim.rddl.is_grounded else sim.tensors.grounded[var]
+        defaults.update(zip(names, np.ravel(value)))
+    names = list(defaults)
+    count = rng.integers(min(sim.rddl.max_allowed_actions, len(names)) + 1)
+    actions = {}
+    for i in rng.choice(len(names), size=count, replace=False):
+        name = names[i]
+        default = defaults[name].item()
+        if isinstance(default, bool):
+            actions[name] = not default
+            continue
+        low, high = bounds[name]
+        width = 1 if isinstance(default, int) else 0.01
+        lower, upper = max(low, default - width), min(high, default + width)
+        if lower > upper:
+            lower, upper = low, high
+        if not np.isfinite(upper):
+            upper = lower + width
+        if not np.isfinite(lower):
+            lower = upper - width
+        if isinstance(default, int):
+            actions[name] = int(rng.integers(np.ceil(lower), 
+                                             np.floor(upper) + 1))
+        else:
+            actions[name] = float(rng.uniform(lower, upper))
+    return actions
+
+
+def _rollout(sim, bounds=None, steps=10, seed=0):
+    if bounds is None:
+        bounds = _action_bounds(sim.rddl)
+    rng = np.random.default_rng(seed)
+    rewards, states = [], []
+    sim.reset()
+    for _ in range(steps):
+        obs, reward, done = sim.step(_random_actions(sim, bounds, rng))
+        rewards.append(reward)
+        states.append(obs)
+        if done:
+            break
+    return rewards, states
+
+
+def _assert_same_rollouts(rollout1, rollout2, label, exact=True):
+    (rewards1, states1), (rewards2, states2) = rollout1, rollout2
+    
+    def equal(x, y):
+        if exact:
+            return np.array_equal(x, y)
+        return np.allclose(np.asarray(x, dtype=float), 
+                           np.asarray(y, dtype=float))
+    
+    assert equal(rewards1, rewards2), label
+    assert len(states1) == len(states2), label
+    for state1, state2 in zip(states1, states2):
+        assert state1.keys() == state2.keys(), label
+        for name in state1:
+            assert equal(state1[name], state2[name]), (label, name)
+
+
+def _assert_rollouts_match(model, options1, options2, label, model2=None,
+                           exact=True, episodes=1):
+    
+    # two simulators with the same seed and the same random actions, compared 
+    # on the last of their episodes
+    sim1 = RDDLSimulator(model, rng=np.random.default_rng(42), **options1)
+    sim2 = RDDLSimulator(model if model2 is None else model2,
+                         rng=np.random.default_rng(42), **options2)
+    bounds = _action_bounds(model)
+    for _ in range(episodes):
+        rollout1 = _rollout(sim1, bounds)
+        rollout2 = _rollout(sim2, bounds)
+    _assert_same_rollouts(rollout1, rollout2, label, exact=exact)
+    return sim1, sim2
+
+
+def test_compiled_matches_interpreted():
+    for env_name in DOMAINS:
+        _assert_rollouts_match(_load_model(env_name), {}, {'compiled': True},
+                               env_name)
+
+
+def test_interned_matches_plain():
+    for env_name in DOMAINS:
+        _assert_rollouts_match(_load_model(env_name), {}, {}, env_name,
+                               model2=_load_model(env_name, intern=True))
+
+
+def test_optimized_matches_original():
+    for env_name in DOMAINS + ['Traffic']:
+        model = _load_model(env_name)
+        optimizer = RDDLOptimizer(model)
+        optimized = optimizer.optimize()
+        assert optimizer.stats['nodes_after'] <= optimizer.stats['nodes_before']
+        for compiled in (False, True):
+            _assert_rollouts_match(model, {}, {'compiled': compiled},
+                                   env_name, model2=optimized)
+
+
+def test_sparse_matches_dense():
+    for env_name in ['Wildfire', 'Elevators', 'Traffic']:
+        model = _load_model(env_name)
+        for compiled in (False, True):
+            
+            # sums over nonzeros may round differently than dense sums
+            _, sparse = _assert_rollouts_match(
+                model, {'sparse_density': 0},
+                {'sparse_density': 1.0, 'compiled': compiled},
+                env_name, exact=False)
+        assert any(sparse.sparse.coo(var) is not None
+                   for var, vtype in model.variable_types.items()
+                   if vtype == 'non-fluent'), env_name
+
+
+def test_contraction_matches_dense():
+    for env_name in ['RecSim', 'Traffic', 'Wildfire']:
+        model = _load_model(env_name)
+        for compiled in (False, True):
+            
+            # einsum may add up the products in a different order
+            _, contracted = _assert_rollouts_match(
+                model, {'sparse_density': 0, 'contraction': False},
+                {'sparse_density': 0, 'compiled': compiled},
+                env_name, exact=False)
+            if not compiled:
+                assert any(contraction is not None for contraction
+                           in contracted._cached_contractions.values()), env_name
+
+
+def test_chunked_matches_dense():
+    for env_name in ['Wildfire', 'Elevators', 'Traffic']:
+        model = _load_model(env_name)
+        for compiled in (False, True):
+            
+            # a budget of a few numbers splits every aggregation
+            dense = {'compiled': compiled, 'sparse_density': 0, 
+                     'contraction': False}
+            _assert_rollouts_match(model, dense, 
+                                   {**dense, 'aggregation_bytes': 64},
+                                   env_name, exact=False)
+
+    # the source and scalar compilers evaluate every aggregation at once
+    for compiled in ('source', 'scalar'):
+        try:
+            RDDLSimulator(model, compiled=compiled, aggregation_bytes=64)
+            assert False, compiled
+        except RDDLNotImplementedError:
+            pass
+
+
+
+def test_masked_compiled_matches_interpreted():
+    for env_name in ['Wildfire', 'Elevators']:
+        
+        # every branch selected at some but not all elements is masked
+        model = _load_model(env_name)
+        _assert_rollouts_match(model, {'mask_density': 1.0},
+                               {'compiled': True, 'mask_density': 1.0},
+                               env_name)
+
+    # the source and scalar compilers always evaluate both branches in full
+    for compiled in ('source', 'scalar'):
+        try:
+            RDDLSimulator(model, compiled=compiled, mask_density=1.0)
+            assert False, compiled
+        except RDDLNotImplementedError:
+            pass
+
+
+
+def test_unchecked_matches_checked():
+    for env_name in DOMAINS + ['Traffic']:
+        _assert_rollouts_match(_load_model(env_name), {'compiled': True},
+                               {'compiled': True, 'checked': False}, env_name)
+    
+    # invalid parameters are still reported, at the end of the step
+    sim = RDDLSimulator(_load_model('PowerGeneration'), compiled=True,
+                        checked=False)
+    sim.reset()
+    sim.subs['TEMP-VARIANCE'] = -1.0
+    try:
+        sim.step({})
+    except RDDLValueOutOfRangeError:
+        pass
+    else:
+        assert False, 'negative variance was not reported'
+    
+    # a branch of the wrong type that is first taken in a later step
+    model = _load_text('''
+    domain late_branch {
+        pvariables {
+            t : { state-fluent, int, default = 0 };
+            on : { state-fluent, bool, default = false };
+            a : { action-fluent, bool, default = false };
+        };
+        cpfs {
+            t' = t + 1;
+            on' = if (t < 2) then true else 5;
+        };
+        reward = 0;
+    }
+    ''')
+    for checked in [True, False]:
+        sim = RDDLSimulator(model, compiled=True, checked=checked)
+        sim.reset()
+        sim.step({})
+        sim.step({})
+        try:
+            sim.step({})
+        except RDDLTypeError:
+            pass
+        else:
+            assert False, f'wrong type was not reported, checked={checked}'
+    
+    # a division by zero whose result is cast to an int
+    model = _load_text('''
+    domain divide {
+        pvariables {
+            z : { non-fluent, real, default = 0.0 };
+            x : { state-fluent, int, default = 0 };
+            a : { action-fluent, bool, default = false };
+        };
+        cpfs {
+            x' = floor[1.0 / z];
+        };
+        reward = 0;
+    }
+    ''')
+    for checked in [True, False]:
+        sim = RDDLSimulator(model, compiled=True, checked=checked)
+        sim.reset()
+        try:
+            sim.step({})
+        except FloatingPointError:
+            pass
+        else:
+            assert False, f'division by zero was not reported, checked={checked}'
+
+
+
+def test_preallocated_matches_plain():
+    for env_name in DOMAINS + ['Traffic']:
+        
+        # the second episode starts from the buffers written by the first
+        sim, _ = _assert_rollouts_match(
+            _load_model(env_name), {'compiled': True}, 
+            {'compiled': True, 'preallocate': True}, env_name, episodes=2)
+    
+    # the buffers are only written in place by the numpy and numba compilers
+    for compiled in (False, 'source'):
+        try:
+            RDDLSimulator(sim.rddl, compiled=compiled, preallocate=True)
+            assert False, compiled
+        except RDDLNotImplementedError:
+            pass
+
+
+def test_incremental_matches_plain():
+    for env_name in DOMAINS + ['Traffic']:
+        model = _load_model(env_name)
+        _assert_rollouts_match(model, {}, {'incremental': True}, env_name)
+        _assert_rollouts_match(
+            model, {'compiled': True}, 
+            {'compiled': True, 'incremental': True, 'preallocate': True},
+            env_name)
+
+
+def test_block_generator_streams():
+    for env_name in DOMAINS + ['Traffic']:
+        model = _load_model(env_name)
+        streams = RDDLRandom(seed=1).spawn(2) + RDDLRandom(seed=1).spawn(1)
+        interpreted = RDDLSimulator(model, rng=streams[0])
+        compiled = RDDLSimulator(model, rng=streams[2], compiled=True)
+        rewards1, _ = _rollout(interpreted)
+        rewards2, _ = _rollout(compiled)
+        assert rewards1 == rewards2, env_name
+    first, second = streams[0].jumped(), streams[1]
+    assert not np.array_equal(first.random(8), second.random(8))
+
+
+def test_streams_do_not_depend_on_hash_seed():
+    script = (
+        'import numpy as np\n'
+        'from pyRDDLGym.Core.Env.RDDLEnv import RDDLEnv\n'
+        'from pyRDDLGym.Examples.ExampleManager import ExampleManager\n'
+        'info = ExampleManager.GetEnvInfo("RecSim")\n'
+        'env = RDDLEnv(info.get_domain(), info.get_instance(0), seed=1)\n'
+        'env.reset()\n'
+        'for _ in range(10):\n'
+        '    state, _, _, _ = env.step({})\n'
+        'print(repr(sum(float(np.sum(v)) for v in state.values())))\n')
+    root = os.path.dirname(os.path.dirname(os.path.dirname(
+        os.path.abspath(__file__))))
+    outputs = set()
+    for hash_seed in range(4):
+        env = dict(os.environ, PYTHONHASHSEED=str(hash_seed),
+                   PYTHONPATH=root + os.pathsep + os.environ.get('PYTHONPATH', ''))
+        result = subprocess.run([sys.executable, '-c', script], env=env,
+                                capture_output=True, text=True, check=True)
+        outputs.add(result.stdout.strip().splitlines()[-1])
+    assert len(outputs) == 1, outputs
+
+
+def test_profiler_records_cpfs():
+    model = _load_model('Traffic')
+    profiler = RDDLProfiler()
+    sim = RDDLSimulator(model, rng=np.random.default_rng(42),
+                        profiler=profiler)
+    rewards, _ = _rollout(sim)
+    stats = profiler.to_dict()
+    assert set(stats['cpf'].keys()) == set(model.cpfs.keys())
+    for name, info in stats['cpf'].items():
+        assert info['calls'] == len(rewards), name
+    assert stats['phase']['step']['calls'] == len(rewards)
+    events = profiler.to_chrome_trace()['traceEvents']
+    assert len(events) == len(profiler.events)
+    assert all(event['ph'] == 'X' and event['dur'] >= 0 for event in events)
+
+
+def test_batch_of_one_matches_compiled():
+    for env_name in DOMAINS:
+        model = _load_model(env_name)
+        compiled = RDDLSimulator(model, rng=np.random.default_rng(42),
+                                 compiled=True)
+        batched = BatchedRDDLSimulator(model, 1, rng=np.random.default_rng(42))
+        rewards1, states1 = _rollout(compiled)
+        rewards2, states2 = _rollout(batched)
+        assert np.allclose(rewards1, np.concatenate(rewards2)), env_name
+        for state1, state2 in zip(states1, states2):
+            assert state1.keys() == state2.keys(), env_name
+            for name in state1:
+                assert np.all(state1[name] == state2[name][0]), (env_name, name)
+
+
+def test_batched_trajectories_are_independent():
+    model = _load_model('Wildfire')
+    batched = BatchedRDDLSimulator(model, 8, rng=np.random.default_rng(42))
+    batched.reset()
+    rewards = 0.0
+    for _ in range(20):
+        _, reward, _ = batched.step({})
+        rewards = rewards + reward
+    assert rewards.shape == (8,)
+    assert np.unique(rewards).size > 1
+    
+    # only grounded fluents carry a batch axis
+    for fmt in ['tensor', 'flat']:
+        try:
+            BatchedRDDLSimulator(model, 8, fluent_format=fmt)
+        except ValueError:
+            pass
+        else:
+            assert False, f'fluent format {fmt} was not rejected'
+
+
+def test_vector_env_resets_done_environments():
+    env_info = ExampleManager.GetEnvInfo('Wildfire')
+    env = RDDLVectorEnv(env_info.get_domain(), env_info.get_instance(0),
+                        num_envs=3, seed=42)
+    initial = env.reset()
+    for _ in range(env.horizon - 1):
+        obs, _, dones, infos = env.step({})
+        assert not np.any(dones)
+        assert 'final_observation' not in infos
+    
+    # the last step returns the initial observation of the new episode
+    obs, _, dones, infos = env.step({})
+    assert np.all(dones)
+    assert np.all(infos['_final_observation'])
+    for var in initial:
+        assert np.array_equal(obs[var], initial[var]), var
+    assert any(not np.array_equal(infos['final_observation'][var], initial[var])
+               for var in initial)
+    obs, _, dones, _ = env.step({})
+    assert not np.any(dones)
+
+
+def test_fluent_formats_match_grounded():
+    model = _load_model('Wildfire')
+    sims = {fmt: RDDLSimulator(model, rng=np.random.default_rng(42),
+                               fluent_format=fmt)
+            for fmt in RDDLSimulator.FLUENT_FORMATS}
+    for sim in sims.values():
+        sim.reset()
+    grounded = sims['grounded']
+
+    rng = np.random.default_rng(0)
+    for _ in range(10):
+        actions = {var: rng.uniform(size=np.shape(value)) < 0.3
+                   for var, value in grounded.noop_actions.items()}
+        flat = np.zeros((max(stop for (_, stop, _) in 
+                             grounded.action_layout.values()),))
+        for var, (start, stop, _) in grounded.action_layout.items():
+            flat[start:stop] = np.ravel(actions[var])
+        ground_actions = {}
+        for var, value in actions.items():
+            ground_actions.update(grounded.tensors.expand(var, value))
+        
+        obs1, reward1, _ = grounded.step(ground_actions)
+        obs2, reward2, _ = sims['tensor'].step(actions)
+        obs3, reward3, _ = sims['flat'].step(flat)
+        assert reward1 == reward2 == reward3
+        for var, (start, stop, _) in grounded.state_layout.items():
+            values = [obs1[name] for name in grounded.tensors.grounded[var]]
+            assert np.all(np.ravel(obs2[var]) == values), var
+            assert np.all(obs3[start:stop] == values), var
+
+
+def test_sampled_spaces_step_env():
+    for env_name in ['SupplyChain', 'PowerGeneration', 'UAV mixed', 
+                     'CartPole discrete', 'MarsRover', 'Traffic']:
+        env_info = ExampleManager.GetEnvInfo(env_name)
+        for fmt in ['tensor', 'flat']:
+            env = RDDLEnv(env_info.get_domain(), env_info.get_instance(0),
+                          fluent_format=fmt, seed=0)
+            env.action_space.seed(0)
+            obs = env.reset()
+            if not env.sampler.isPOMDP:
+                assert env.observation_space.contains(obs), (env_name, fmt)
+            for _ in range(3):
+                obs, _, _, _ = env.step(env.action_space.sample())
+                assert env.observation_space.contains(obs), (env_name, fmt)
+
+
+
+def _steps(sim, steps=5):
+    rewards, states = [], []
+    for _ in range(steps):
+        obs, reward, _ = sim.step({})
+        rewards.append(reward)
+        states.append({name: np.copy(value) for (name, value) in obs.items()})
+    return rewards, states
+
+
+def test_snapshot_restore_repeats_steps():
+    for env_name in DOMAINS + ['Traffic']:
+        model = _load_model(env_name)
+        for args in ({}, {'compiled': True}, 
+                     {'compiled': True, 'preallocate': True, 
+                      'incremental': True}):
+            sim = RDDLSimulator(model, rng=RDDLRandom(seed=1).generator(), 
+                                **args)
+            sim.reset()
+            _steps(sim, 3)
+            snapshot = sim.snapshot()
+            clone = sim.clone()
+            rewards1, states1 = _steps(sim)
+            sim.restore(snapshot)
+            rewards2, states2 = _steps(sim)
+            rewards3, states3 = _steps(clone)
+            assert rewards1 == rewards2 == rewards3, (env_name, args)
+            for state1, state2, state3 in zip(states1, states2, states3):
+                for name in state1:
+                    assert np.all(state1[name] == state2[name]), (env_name, name)
+                    assert np.all(state1[name] == state3[name]), (env_name, name)
+
+
+def test_numba_loops_match_numpy():
+
+    # the generated loop nests run as plain Python so numba is not required
+    for env_name in DOMAINS + ['Traffic']:
+        model = _load_model(env_name)
+        compiled = RDDLSimulator(model, rng=np.random.default_rng(42),
+                                 compiled=True)
+        rollout = _rollout(compiled)
+        
+        # the kernels write into the buffers of their CPFs, if there are any
+        for preallocate in (False, True):
+            loops = RDDLSimulator(model, rng=np.random.default_rng(42),
+                                  compiled=True, preallocate=preallocate)
+            loops.compiler = NumbaRDDLCompiler(loops, jit=False)
+            loops.compiler.compile()
+            assert loops.compiler.sources, env_name
+            _assert_same_rollouts(rollout, _rollout(loops), env_name,
+                                  exact=False)
+
+
+def test_source_matches_compiled():
+    with tempfile.TemporaryDirectory() as cache_dir:
+        for env_name in DOMAINS + ['Traffic']:
+            model = _load_model(env_name)
+            
+            # the second simulator imports the module written by the first
+            rollouts = []
+            for _ in range(2):
+                sim = RDDLSimulator(model, rng=np.random.default_rng(42))
+                sim.compiler = SourceRDDLCompiler(sim, cache_dir=cache_dir)
+                sim.compiler.compile()
+                assert os.path.isfile(sim.compiler.path), env_name
+                rollouts.append(_rollout(sim))
+            compiled = RDDLSimulator(model, rng=np.random.default_rng(42),
+                                     compiled=True, levels=sim.levels)
+            rollouts.append(_rollout(compiled))
+            
+            for rollout in rollouts[:-1]:
+                _assert_same_rollouts(rollouts[-1], rollout, env_name)
+
+
+def test_scalar_matches_interpreted():
+    for env_name in DOMAINS + ['Traffic']:
+        model = _ground(env_name, lazy=False)
+        sim = RDDLSimulator(model, rng=np.random.default_rng(42), compiled=True)
+        assert isinstance(sim.compiler, ScalarRDDLCompiler), env_name
+        interpreted = RDDLSimulator(model, rng=np.random.default_rng(42),
+                                    levels=sim.levels)
+        
+        # real sums are added in a different order than numpy
+        _assert_same_rollouts(_rollout(sim), _rollout(interpreted), env_name,
+                              exact=False)
+
+
+if __name__ == "__main__":
+    test_compiled_matches_interpreted()
+    test_interned_matches_plain()
+    test_optimized_matches_original()
+    test_sparse_matches_dense()
+    test_contraction_matches_dense()
+    test_chunked_matches_dense()
+    test_masked_compiled_matches_interpreted()
+    test_unchecked_matches_checked()
+    test_preallocated_matches_plain()
+    test_incremental_matches_plain()
+    test_block_generator_streams()
+    test_streams_do_not_depend_on_hash_seed()
+    test_profiler_records_cpfs()
+    test_batch_of_one_matches_compiled()
+    test_batched_trajectories_are_independent()
+    test_vector_env_resets_done_environments()
+    test_fluent_formats_match_grounded()
+    test_sampled_spaces_step_env()
+    test_snapshot_restore_repeats_steps()
+    test_numba_loops_match_numpy()
+    test_source_matches_compiled()
+    test_scalar_matches_interpreted()
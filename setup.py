@@ -12,11 +12,18 @@
 # You should have received a copy of the MIT License
 # along with pyRDDLGym. If not, see <https://opensource.org/licenses/MIT>.
 
+import os
+import re
+
 from setuptools import setup, find_packages
 
+# the version is defined once, in pyRDDLGym/__init__.py
+with open(os.path.join(os.path.dirname(__file__), 'pyRDDLGym', '__init__.py')) as file:
+    version = re.search(r"__version__ = '([^']+)'", file.read()).group(1)
+
 setup(
       name='pyRDDLGym',
-      version='0.99.0',
+      version=version,
       author="Ayal Taitler, Scott Sanner, Michael Gimelfarb, Jihwan Jeong, Sriram Gopalakrishnan, sgopal28@asu.edu, Martin Mladenov, jack liu",
       author_email="ataitler@gmail.com, ssanner@mie.utoronto.ca, mike.gimelfarb@mail.utoronto.ca, jhjeong@mie.utoronto.ca, sriram.gopalakrishnan@jpmchase.com, mmladenov@google.com, xiaotian.liu@mail.utoronto.ca",
       description="pyRDDLGym: RDDL automatic generation tool for OpenAI Gym",